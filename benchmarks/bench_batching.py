@@ -0,0 +1,89 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Microbenchmark of the data canal batching of the actors socket interface
+
+Reports are sent to a socket interface and received from it in the same process,
+the send and receive throughputs are measured for several batch sizes.
+
+usage: python benchmarks/bench_batching.py [--reports N] [--codec NAME]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from powerapi.actor import SocketInterface, get_codec
+from powerapi.report import PowerReport
+
+
+def bench(socket_interface, batch_size, number_of_reports):
+    """
+    :return: the number of reports sent per second and the number of reports received per second
+    """
+    socket_interface.batch_size = batch_size
+    report = PowerReport(datetime.now(), 'sensor', 'target', 42.42, {'socket': '0'})
+
+    begin = time.perf_counter()
+    for _ in range(number_of_reports):
+        socket_interface.send_data(report)
+    socket_interface.flush()
+    sent = time.perf_counter()
+    for _ in range(number_of_reports):
+        socket_interface.receive()
+    received = time.perf_counter()
+
+    return number_of_reports / (sent - begin), number_of_reports / (received - sent)
+
+
+def main():
+    """
+    Run the benchmark and print one line per batch size
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=50000)
+    parser.add_argument('--codec', default='pickle')
+    args = parser.parse_args()
+
+    socket_interface = SocketInterface('bench', 1000, codec=get_codec(args.codec))
+    socket_interface.setup()
+    socket_interface.connect_data()
+
+    print(f'{"batch size":>10}{"frames":>10}{"sent/s":>12}{"received/s":>12}')
+    for batch_size in [1, 8, 32, 128]:
+        send_rate, receive_rate = bench(socket_interface, batch_size, args.reports)
+        frames = -(-args.reports // batch_size)
+        print(f'{batch_size:>10}{frames:>10}{send_rate:>12.0f}{receive_rate:>12.0f}')
+
+    socket_interface.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Microbenchmark of the codecs used by the actors socket interface
+
+Compare the size of the encoded messages and the encode/decode throughput of
+each registered codec on the reports that travel through a formula pipeline.
+
+usage: python benchmarks/bench_codec.py [--iterations N] [--cores N]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+from powerapi.actor.codec import CODECS
+from powerapi.message import StartMessage
+from powerapi.report import HWPCReport, PowerReport, ProcfsReport, ColumnarHWPCReport
+
+EVENTS = ['CPU_CLK_THREAD_UNHALTED:REF_P', 'CPU_CLK_THREAD_UNHALTED:THREAD_P', 'INSTRUCTIONS_RETIRED', 'LLC_MISSES']
+
+
+def gen_hwpc_report(sockets, cores):
+    """
+    Generate an HWPC report with a rapl group and a core group holding random counter values
+    """
+    rand = random.Random(0)
+    groups = {
+        'rapl': {str(socket): {'0': {'RAPL_ENERGY_PKG': rand.randrange(2 ** 32), 'time_enabled': 500000000,
+                                     'time_running': 500000000}}
+                 for socket in range(sockets)},
+        'core': {str(socket): {str(core): {event: rand.randrange(2 ** 32) for event in EVENTS}
+                               for core in range(socket * cores, (socket + 1) * cores)}
+                 for socket in range(sockets)}
+    }
+    return HWPCReport(datetime.now(), 'sensor', 'system', groups, {'scope': 'cpu', 'socket': -1})
+
+
+def gen_messages(sockets, cores):
+    """
+    Generate one message of each kind
+    """
+    hwpc_report = gen_hwpc_report(sockets, cores)
+    return {
+        'HWPCReport': hwpc_report,
+        'ColumnarHWPC': ColumnarHWPCReport.from_hwpc_report(hwpc_report),
+        'PowerReport': PowerReport(datetime.now(), 'sensor', 'system', 42.42, {'scope': 'cpu', 'socket': '0'}),
+        'ProcfsReport': ProcfsReport(datetime.now(), 'sensor', ['firefox', 'emacs'], {'firefox': 8.36, 'emacs': 5.52},
+                                     27.61),
+        'StartMessage': StartMessage('system'),
+    }
+
+
+def bench(codec, msg, iterations):
+    """
+    :return: the size of the encoded message, and the number of encode + decode per second
+    """
+    data = codec.encode(msg)
+    begin = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(codec.encode(msg))
+    return len(data), iterations / (time.perf_counter() - begin)
+
+
+def main():
+    """
+    Run the benchmark and print one line per (message, codec)
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--sockets', type=int, default=2)
+    parser.add_argument('--cores', type=int, default=8, help='number of cores per socket')
+    args = parser.parse_args()
+
+    print(f'{"message":<14}{"codec":<8}{"bytes/msg":>10}{"msgs/s":>12}')
+    for msg_name, msg in gen_messages(args.sockets, args.cores).items():
+        for codec_name, codec_class in CODECS.items():
+            size, rate = bench(codec_class(), msg, args.iterations)
+            print(f'{msg_name:<14}{codec_name:<8}{size:>10}{rate:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
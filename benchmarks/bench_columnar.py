@@ -0,0 +1,125 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the dictionary and the columnar representations of HWPC reports
+
+For each representation, measure the memory used by buffered reports, the
+pickle size and pickle round trip throughput, and the time needed to sum an
+event counter over all the cores of a report (walking the dictionaries, or
+using the counter matrix with numpy when it is installed).
+
+usage: python benchmarks/bench_columnar.py [--reports N] [--sockets N] [--cores N]
+"""
+
+import argparse
+import pickle
+import time
+import tracemalloc
+
+from powerapi.report import ColumnarHWPCReport
+
+from bench_codec import gen_hwpc_report
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+EVENT = 'INSTRUCTIONS_RETIRED'
+
+
+def measure_memory(build, count):
+    """
+    :return: the number of bytes allocated per report when `count` reports built by `build` are kept in memory
+    """
+    tracemalloc.start()
+    reports = [build() for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del reports
+    return size / count
+
+
+def measure_rate(func, iterations):
+    """
+    :return: the number of calls of func per second
+    """
+    begin = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - begin)
+
+
+def dict_sum(report):
+    """
+    Sum the event counter over all the cores by walking the report groups
+    """
+    return sum(core[EVENT] for socket in report.groups['core'].values() for core in socket.values())
+
+
+def columnar_sum(report):
+    """
+    Sum the event counter over all the cores using the counter matrix
+    """
+    counters = report.counters['core']
+    if numpy is not None:
+        return int(counters.to_numpy()[:, counters.events.index(EVENT)].sum())
+    return sum(counters.column(EVENT))
+
+
+def main():
+    """
+    Run the benchmark and print one line per representation
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=10000)
+    parser.add_argument('--sockets', type=int, default=2)
+    parser.add_argument('--cores', type=int, default=16, help='number of cores per socket')
+    args = parser.parse_args()
+
+    report = gen_hwpc_report(args.sockets, args.cores)
+    representations = {
+        'dict': (lambda: gen_hwpc_report(args.sockets, args.cores), report, dict_sum),
+        'columnar': (lambda: ColumnarHWPCReport.from_hwpc_report(gen_hwpc_report(args.sockets, args.cores)),
+                     ColumnarHWPCReport.from_hwpc_report(report), columnar_sum),
+    }
+
+    print(f'numpy: {"yes" if numpy is not None else "no"}')
+    print(f'{"format":<10}{"bytes/report":>14}{"pickle bytes":>14}{"pickle rt/s":>13}{"sums/s":>12}')
+    for name, (build, sample, event_sum) in representations.items():
+        memory = measure_memory(build, args.reports)
+        pickle_size = len(pickle.dumps(sample))
+        pickle_rate = measure_rate(lambda: pickle.loads(pickle.dumps(sample)), args.reports)
+        sum_rate = measure_rate(lambda: event_sum(sample), args.reports)
+        print(f'{name:<10}{memory:>14.0f}{pickle_size:>14}{pickle_rate:>13.0f}{sum_rate:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
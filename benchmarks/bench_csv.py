@@ -0,0 +1,120 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmark of the CsvDB readers on a synthetic HWPC capture
+
+Generate a capture made of a core group file (one row per core and per
+timestamp) and a rapl group file (one row per socket and per timestamp),
+then read it with the line by line reader and with the chunked reader
+(with read calls and with a memory mapping of the files).
+
+usage: python benchmarks/bench_csv.py [--rows N] [--sockets N] [--cores N] [--directory PATH]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from powerapi.database import CsvDB
+from powerapi.report import HWPCReport
+
+CORE_EVENTS = ['CPU_CLK_THREAD_UNHALTED:REF_P', 'CPU_CLK_THREAD_UNHALTED:THREAD_P', 'INSTRUCTIONS_RETIRED',
+               'LLC_MISSES', 'time_enabled', 'time_running']
+RAPL_EVENTS = ['RAPL_ENERGY_DRAM', 'RAPL_ENERGY_PKG', 'time_enabled', 'time_running']
+
+
+def generate_capture(directory, rows, sockets, cores):
+    """
+    Write the capture files, the core file holds *rows* rows
+
+    :return: the paths of the core and rapl files
+    """
+    os.makedirs(directory, exist_ok=True)
+    core_path = os.path.join(directory, 'core.csv')
+    rapl_path = os.path.join(directory, 'rapl.csv')
+    rand = random.Random(0)
+    timestamps = rows // (sockets * cores)
+    with open(core_path, 'w') as core_file, open(rapl_path, 'w') as rapl_file:
+        core_file.write(','.join(['timestamp', 'sensor', 'target', 'socket', 'cpu'] + CORE_EVENTS) + '\n')
+        rapl_file.write(','.join(['timestamp', 'sensor', 'target', 'socket', 'cpu'] + RAPL_EVENTS) + '\n')
+        for i in range(timestamps):
+            timestamp = str(1539260664189 + i * 1000)
+            lines = []
+            for socket in range(sockets):
+                for core in range(cores):
+                    values = ','.join(str(rand.randrange(2 ** 32)) for _ in CORE_EVENTS)
+                    lines.append(f'{timestamp},sensor,system,{socket},{socket * cores + core},{values}\n')
+                values = ','.join(str(rand.randrange(2 ** 32)) for _ in RAPL_EVENTS)
+                rapl_file.write(f'{timestamp},sensor,system,{socket},0,{values}\n')
+            core_file.writelines(lines)
+    return [core_path, rapl_path]
+
+
+def bench(csvdb):
+    """
+    :return: the number of reports read and the time needed to read them
+    """
+    begin = time.perf_counter()
+    count = 0
+    for _ in csvdb.iter(False):
+        count += 1
+    return count, time.perf_counter() - begin
+
+
+def main():
+    """
+    Generate the capture, run the benchmark and print one line per reader
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000000, help='number of rows of the core group file')
+    parser.add_argument('--sockets', type=int, default=2)
+    parser.add_argument('--cores', type=int, default=16, help='number of cores per socket')
+    parser.add_argument('--directory', default='/tmp/powerapi_bench_csv')
+    parser.add_argument('--chunk-size', type=int, default=4 * 1024 * 1024)
+    args = parser.parse_args()
+
+    files = generate_capture(args.directory, args.rows, args.sockets, args.cores)
+    size = sum(os.path.getsize(path) for path in files)
+    print(f'capture: {args.rows} core rows, {size / 2 ** 20:.0f} MB')
+
+    readers = {
+        'line': CsvDB(HWPCReport, [], files=files),
+        'chunked': CsvDB(HWPCReport, [], files=files, chunk_size=args.chunk_size),
+        'chunked+mmap': CsvDB(HWPCReport, [], files=files, chunk_size=args.chunk_size, use_mmap=True),
+    }
+    print(f'{"reader":<14}{"reports":>10}{"seconds":>10}{"rows/s":>12}')
+    for name, csvdb in readers.items():
+        count, duration = bench(csvdb)
+        print(f'{name:<14}{count:>10}{duration:>10.2f}{args.rows / duration:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Microbenchmark of the dispatcher routing cost per report
+
+Reports of a synthetic sensor are routed by a FormulaDispatcherReportHandler to
+formulas that only count the reports they receive. The routing cost is measured
+with the routing cache and with dispatch rules that disable it.
+
+usage: python benchmarks/bench_dispatch.py [--reports N] [--sockets N] [--cores N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from powerapi.bench import ReportGenerator
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel, PowerDispatchRule, PowerDepthLevel
+from powerapi.dispatcher import RouteTable
+from powerapi.dispatcher.dispatcher_actor import DispatcherState
+from powerapi.dispatcher.handlers import FormulaDispatcherReportHandler
+from powerapi.report import HWPCReport, PowerReport
+
+
+class CountingFormula:
+    """
+    Formula that count the reports sent to it
+    """
+
+    def __init__(self, formula_id):
+        self.formula_id = formula_id
+        self.received = 0
+
+    def is_alive(self):
+        """
+        :return: always True
+        """
+        return True
+
+    def send_data(self, _):
+        """
+        count the report
+        """
+        self.received += 1
+
+
+class UncachedHWPCDispatchRule(HWPCDispatchRule):
+    """
+    HWPC dispatch rule whose reports are not cached by the dispatcher
+    """
+
+    def get_routing_key(self, report):
+        return None
+
+
+class UncachedPowerDispatchRule(PowerDispatchRule):
+    """
+    Power dispatch rule whose reports are not cached by the dispatcher
+    """
+
+    def get_routing_key(self, report):
+        return None
+
+
+def bench(hwpc_rule, power_rule, reports):
+    """
+    :return: the routing cost of one report, in microseconds
+    """
+    route_table = RouteTable()
+    route_table.dispatch_rule(HWPCReport, hwpc_rule)
+    route_table.dispatch_rule(PowerReport, power_rule)
+    handler = FormulaDispatcherReportHandler(DispatcherState(None, CountingFormula, route_table))
+
+    begin = time.perf_counter()
+    for report in reports:
+        handler.handle(report)
+    return (time.perf_counter() - begin) / len(reports) * 1e6
+
+
+def main():
+    """
+    Run the benchmark and print one line per dispatch depth
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=50000)
+    parser.add_argument('--sockets', type=int, default=2)
+    parser.add_argument('--cores', type=int, default=8)
+    args = parser.parse_args()
+
+    generator = ReportGenerator(HWPCReport, sockets=args.sockets, cores=args.cores)
+    hwpc_reports = [generator(index) for index in range(args.reports)]
+    power_reports = [PowerReport(datetime.now(), 'sensor-0', 'target', 42.0, {}) for _ in range(args.reports)]
+
+    print(f'{"depth":>8}{"report":>8}{"uncached us":>14}{"cached us":>12}{"speedup":>10}')
+    for depth in [HWPCDepthLevel.SOCKET, HWPCDepthLevel.CORE]:
+        for name, reports in [('hwpc', hwpc_reports), ('power', power_reports)]:
+            uncached = bench(UncachedHWPCDispatchRule(depth, primary=True),
+                             UncachedPowerDispatchRule(PowerDepthLevel.SENSOR), hwpc_reports[:1] + reports)
+            cached = bench(HWPCDispatchRule(depth, primary=True), PowerDispatchRule(PowerDepthLevel.SENSOR),
+                           hwpc_reports[:1] + reports)
+            print(f'{depth.name.lower():>8}{name:>8}{uncached:>14.2f}{cached:>12.2f}{uncached / cached:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
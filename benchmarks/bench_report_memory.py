@@ -0,0 +1,96 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measure the memory used by buffered reports
+
+For each report class, build N reports and print the number of bytes
+allocated per report. The values held by the reports (counter groups,
+metadata dictionaries read from the input, ...) are built before the
+measure, so only the memory used by the report objects themselves (and
+their copies of the input data) is counted.
+
+usage: python benchmarks/bench_report_memory.py [--reports N]
+"""
+
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from powerapi.report import HWPCReport, PowerReport, ProcfsReport, FormulaReport
+
+
+def gen_inputs(count):
+    """
+    :return: for each report class, a list of functions that build one report from already allocated values
+    """
+    timestamp = datetime(2023, 6, 1, 12, 37, 37)
+    groups = [{'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': i}}}} for i in range(count)]
+    metadata = [{'scope': 'cpu', 'socket': 0, 'formula': 'rapl'} for _ in range(count)]
+    usage = [{'firefox': 8.36, 'emacs': 5.52} for _ in range(count)]
+    return {
+        'HWPCReport': [lambda i=i: HWPCReport(timestamp, 'sensor', 'target', groups[i], metadata[i])
+                       for i in range(count)],
+        'PowerReport': [lambda i=i: PowerReport(timestamp, 'sensor', 'target', 42.42, metadata[i])
+                        for i in range(count)],
+        'ProcfsReport': [lambda i=i: ProcfsReport(timestamp, 'sensor', 'target', usage[i], 27.61, metadata[i])
+                         for i in range(count)],
+        'FormulaReport': [lambda i=i: FormulaReport(timestamp, 'sensor', 'target', metadata[i])
+                          for i in range(count)],
+        'PowerReport (no metadata)': [lambda: PowerReport(timestamp, 'sensor', 'target', 42.42)
+                                      for _ in range(count)],
+    }
+
+
+def measure(builders):
+    """
+    :return: the number of bytes allocated per report when all the reports built by the builders are kept in memory
+    """
+    tracemalloc.start()
+    reports = [build() for build in builders]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(reports)
+
+
+def main():
+    """
+    Run the benchmark and print one line per report class
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f'{"report":<28}{"bytes/report":>14}')
+    for name, builders in gen_inputs(args.reports).items():
+        print(f'{name:<28}{measure(builders):>14.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the startup time and the memory footprint of formula actors executed
+with the process runtime and with the thread runtime
+
+Each formula is launched by a supervisor like the dispatcher does, connected to
+a pusher, and receives one report before the measure.
+
+usage: python benchmarks/bench_runtime.py [--formulas N]
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from powerapi.actor import Supervisor, PROCESS_RUNTIME, THREAD_RUNTIME
+from powerapi.formula import FormulaActor
+from powerapi.formula.handlers import FormulaPoisonPillMessageHandler
+from powerapi.handler import Handler, StartHandler
+from powerapi.message import PoisonPillMessage, StartMessage
+from powerapi.pusher.simple.simple_pusher_actor import SimplePusherActor
+from powerapi.report import PowerReport, Report
+
+
+class IgnoreReportHandler(Handler):
+    """
+    Handler that drop the reports
+    """
+
+    def handle(self, msg):
+        pass
+
+
+class BenchFormulaActor(FormulaActor):
+    """
+    Formula that doesn't do anything
+    """
+
+    def setup(self):
+        FormulaActor.setup(self)
+        self.add_handler(Report, IgnoreReportHandler(self.state))
+        self.add_handler(PoisonPillMessage, FormulaPoisonPillMessageHandler(self.state))
+        self.add_handler(StartMessage, StartHandler(self.state))
+
+
+def pss_kb(pids):
+    """
+    :return: the sum of the proportional set size of the given processes, in kB
+    """
+    total = 0
+    for pid in pids:
+        with open(f'/proc/{pid}/smaps_rollup', encoding='utf-8') as smaps:
+            for line in smaps:
+                if line.startswith('Pss:'):
+                    total += int(line.split()[1])
+    return total
+
+
+def bench(runtime, number_of_formulas):
+    """
+    :return: the time needed to launch the formulas and the memory used by the formulas, in kB
+    """
+    supervisor = Supervisor()
+    pusher = SimplePusherActor('bench_pusher', number_of_reports_to_store=1)
+    supervisor.launch_actor(pusher)
+    rss_before = pss_kb([os.getpid()])
+
+    begin = time.perf_counter()
+    formulas = []
+    for i in range(number_of_formulas):
+        formula = BenchFormulaActor(f"('bench', 'sensor', '{i}')", pushers={'bench_pusher': pusher})
+        formula.set_runtime(runtime)
+        supervisor.launch_actor(formula)
+        formulas.append(formula)
+    for formula in formulas:
+        formula.send_data(PowerReport(datetime.now(), 'sensor', 'target', 42))
+    startup = time.perf_counter() - begin
+
+    pids = [os.getpid()] + [formula.pid for formula in formulas if formula.pid is not None]
+    memory = pss_kb(pids) - rss_before
+
+    supervisor.kill_actors()
+    for formula in formulas:
+        formula.close()
+    return startup, memory
+
+
+def main():
+    """
+    Run the benchmark and print one line per runtime
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--formulas', type=int, default=64)
+    args = parser.parse_args()
+
+    print(f'{"runtime":<10}{"formulas":>10}{"startup (s)":>14}{"memory (MB)":>14}')
+    for runtime in [PROCESS_RUNTIME, THREAD_RUNTIME]:
+        startup, memory = bench(runtime, args.formulas)
+        print(f'{runtime:<10}{args.formulas:>10}{startup:>14.2f}{memory / 1024:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
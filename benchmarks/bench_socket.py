@@ -0,0 +1,134 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Benchmark of the SocketDB ingestion path on one connection
+
+Send a stream of HWPC reports on one connection to a SocketDB and measure
+the number of reports per second read from its iterator, for each json
+framing (brace and ndjson) and json backend (json and, if installed,
+orjson), and for the binary protocol (by frames of --batch-size reports).
+
+usage: python benchmarks/bench_socket.py [--reports N] [--sockets N] [--cores N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from powerapi.database import SocketDB, BINARY_PROTOCOL_HEADER, encode_hwpc_frame
+from powerapi.report import HWPCReport
+from powerapi.utils import json_stream
+from powerapi.utils.json_stream import BRACE_FRAMING, NDJSON_FRAMING, JSON_BACKEND, ORJSON_BACKEND
+
+EVENTS = ['CPU_CLK_THREAD_UNHALTED:REF_P', 'CPU_CLK_THREAD_UNHALTED:THREAD_P', 'INSTRUCTIONS_RETIRED', 'LLC_MISSES']
+
+
+BINARY = 'binary'
+
+
+def gen_payload(reports, sockets, cores, framing, batch_size=100):
+    """
+    Generate the bytes sent on the connection: *reports* HWPC reports, as json documents with the given framing or
+    with the binary protocol
+    """
+    rand = random.Random(0)
+    documents = []
+    for i in range(reports):
+        groups = {
+            'rapl': {str(socket): {'0': {'RAPL_ENERGY_PKG': rand.randrange(2 ** 32)}} for socket in range(sockets)},
+            'core': {str(socket): {str(core): {event: rand.randrange(2 ** 32) for event in EVENTS}
+                                   for core in range(socket * cores, (socket + 1) * cores)}
+                     for socket in range(sockets)}
+        }
+        document = {'timestamp': str(1539260664000 + i * 1000), 'sensor': 'sensor', 'target': 'target', 'groups': groups}
+        documents.append(document)
+    if framing == BINARY:
+        reports = [HWPCReport.from_json(document) for document in documents]
+        return BINARY_PROTOCOL_HEADER + b''.join(encode_hwpc_frame(reports[i:i + batch_size])
+                                                 for i in range(0, len(reports), batch_size))
+    documents = [json.dumps(document).encode() for document in documents]
+    separator = b'\n' if framing == NDJSON_FRAMING else b''
+    return separator.join(documents) + separator
+
+
+async def bench(payload, reports, framing, backend):
+    """
+    :return: the number of reports read and the time needed to read them
+    """
+    database = SocketDB(HWPCReport, 0, framing=framing, json_backend=backend)
+    await database.connect()
+    port = database.server.sockets[0].getsockname()[1]
+    iterator = database.iter(False)
+    _, writer = await asyncio.open_connection('127.0.0.1', port)
+
+    begin = time.perf_counter()
+    writer.write(payload)
+    count = 0
+    while count < reports and await iterator.__anext__() is not None:
+        count += 1
+    duration = time.perf_counter() - begin
+
+    writer.close()
+    await writer.wait_closed()
+    # let the connection callback read the end of the stream before stopping the server
+    await asyncio.sleep(0.1)
+    await database.stop()
+    return count, duration
+
+
+def main():
+    """
+    Run the benchmark and print one line per framing and json backend
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=50000, help='number of reports sent on the connection')
+    parser.add_argument('--sockets', type=int, default=2)
+    parser.add_argument('--cores', type=int, default=2, help='number of cores per socket')
+    parser.add_argument('--batch-size', type=int, default=100, help='number of reports per binary frame')
+    args = parser.parse_args()
+
+    backends = [JSON_BACKEND]
+    if json_stream.orjson is not None:
+        backends.append(ORJSON_BACKEND)
+
+    print(f'{"framing":<10}{"backend":<10}{"reports":>10}{"seconds":>10}{"reports/s":>12}')
+    for framing in (BRACE_FRAMING, NDJSON_FRAMING):
+        payload = gen_payload(args.reports, args.sockets, args.cores, framing)
+        for backend in backends:
+            count, duration = asyncio.run(bench(payload, args.reports, framing, backend))
+            print(f'{framing:<10}{backend:<10}{count:>10}{duration:>10.2f}{count / duration:>12.0f}')
+    payload = gen_payload(args.reports, args.sockets, args.cores, BINARY, args.batch_size)
+    count, duration = asyncio.run(bench(payload, args.reports, BRACE_FRAMING, JSON_BACKEND))
+    print(f'{BINARY:<10}{"-":<10}{count:>10}{duration:>10.2f}{count / duration:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -27,8 +27,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.actor.socket_interface import SocketInterface, NotConnectedException
-from powerapi.actor.supervisor import Supervisor, ActorInitError, ActorAlreadySupervisedException
+from powerapi.actor.codec import Codec, PickleCodec, ReportCodec, UnknownCodecException, get_codec
+from powerapi.actor.socket_interface import SocketInterface, NotConnectedException, flush_batches, \
+    UnknownOverloadPolicyException, SocketInterfaceStats, BLOCK_POLICY, DROP_OLDEST_POLICY, SAMPLE_POLICY, \
+    OVERLOAD_POLICIES, DEFAULT_SAMPLE_RATE
+from powerapi.actor.supervisor import Supervisor, ActorInitError, ActorAlreadySupervisedException, \
+    ActorNotSupervisedException
 from powerapi.actor.supervisor import CrashConfigureError, FailConfigureError
 from powerapi.actor.state import State
-from powerapi.actor.actor import Actor, InitializationException
+from powerapi.actor.metrics import ActorMetrics, MetricsCollector, get_metrics_collector
+from powerapi.actor.actor import Actor, InitializationException, UnknownRuntimeException, PROCESS_RUNTIME, \
+    THREAD_RUNTIME
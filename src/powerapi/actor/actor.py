@@ -30,18 +30,28 @@
 # pylint: disable=c-extension-no-member
 
 import logging
+import os
 import signal
 import multiprocessing
 import sys
+import threading
+import time
 import traceback
 import setproctitle
 
 from powerapi.exception import PowerAPIExceptionWithMessage, UnknownMessageTypeException
-from powerapi.message import PoisonPillMessage
-from powerapi.handler import HandlerException
+from powerapi.message import PoisonPillMessage, ProfileMessage
+from powerapi.handler import HandlerException, ProfileMessageHandler
 
-from .socket_interface import SocketInterface
+from .socket_interface import SocketInterface, flush_batches, check_overload_policy, BLOCK_POLICY, DEFAULT_SAMPLE_RATE
 from .state import State
+from .metrics import ActorMetrics, DEFAULT_PUBLISH_INTERVAL, current_metrics, set_current_metrics
+
+#: Run the actor in its own process
+PROCESS_RUNTIME = 'process'
+#: Run the actor in a thread of the process that start it
+THREAD_RUNTIME = 'thread'
+RUNTIMES = [PROCESS_RUNTIME, THREAD_RUNTIME]
 
 
 class InitializationException(PowerAPIExceptionWithMessage):
@@ -50,6 +60,12 @@ class InitializationException(PowerAPIExceptionWithMessage):
     """
 
 
+class UnknownRuntimeException(PowerAPIExceptionWithMessage):
+    """
+    Exception raised when an actor runtime name is unknown
+    """
+
+
 class Actor(multiprocessing.Process):
     """
     Abstract class that exposes an interface to create, setup and handle actors
@@ -85,6 +101,9 @@ class Actor(multiprocessing.Process):
     +---------------------------------+--------------------------------------------------------------------------------------------+
     """
 
+    # thread running the actor when the thread runtime is used
+    _thread = None
+
     def __init__(self, name, level_logger=logging.WARNING, timeout=None):
         """
         Initialization and start of the process.
@@ -117,6 +136,11 @@ class Actor(multiprocessing.Process):
         #: (powerapi.State): Actor context
         self.state = State(self)
 
+        #: (str): Runtime used to execute the actor, process or thread
+        self.runtime = PROCESS_RUNTIME
+        self._thread_socket_interface = None
+        self._sentinel_pipe = None
+
         #: (powerapi.SocketInterface): Actor's SocketInterface
         self.socket_interface = SocketInterface(name, timeout)
 
@@ -126,11 +150,134 @@ class Actor(multiprocessing.Process):
         #: (List): list of exception that restart the actor it they are raised
         self.low_exception = []
 
+        #: (ActorMetrics): runtime metrics of the actor, None if they are
+        #:                 disabled
+        self.metrics = None
+
+    @property
+    def socket_interface(self):
+        """
+        (powerapi.SocketInterface): Actor's SocketInterface
+
+        When the actor run in a thread, the actor thread use its own copy of
+        the interface
+        """
+        if self._thread is not None and self._thread.ident == threading.get_ident():
+            return self._thread_socket_interface
+        return self._socket_interface
+
+    @socket_interface.setter
+    def socket_interface(self, socket_interface):
+        self._socket_interface = socket_interface
+
+    def set_runtime(self, runtime):
+        """
+        Set the runtime used to execute the actor
+
+        With the thread runtime, the actor run in a thread of the process that
+        start it instead of its own process. It still communicates through its
+        sockets, so the other actors can't tell the difference.
+
+        Must be called before starting the actor
+
+        :param str runtime: process or thread
+        :raise UnknownRuntimeException: if the runtime is unknown
+        """
+        if runtime not in RUNTIMES:
+            raise UnknownRuntimeException('unknown runtime ' + str(runtime) + ', available runtimes : ' +
+                                          ', '.join(RUNTIMES))
+        self.runtime = runtime
+
+    def start(self):
+        """
+        Start the actor in a new process or in a new thread, depending on its
+        runtime
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            multiprocessing.Process.start(self)
+            return
+
+        self._thread_socket_interface = self._socket_interface.server_copy()
+        self._sentinel_pipe = os.pipe()
+        self._thread = threading.Thread(target=self._run_thread, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run_thread(self):
+        try:
+            self.run()
+        finally:
+            # close the write end of the sentinel pipe to make it readable
+            os.close(self._sentinel_pipe[1])
+
+    @property
+    def sentinel(self):
+        """
+        A file descriptor that becomes ready when the actor ends
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            return multiprocessing.Process.sentinel.fget(self)
+        return self._sentinel_pipe[0]
+
+    def is_alive(self):
+        """
+        :return: True if the actor process or thread is alive
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            return multiprocessing.Process.is_alive(self)
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        """
+        Wait until the actor process or thread terminates
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            multiprocessing.Process.join(self, timeout)
+        elif self._thread is not None:
+            self._thread.join(timeout)
+
+    def terminate(self):
+        """
+        Terminate the actor
+
+        A thread can't be killed, a hard PoisonPillMessage is sent to an actor
+        running in a thread
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            multiprocessing.Process.terminate(self)
+        elif self.is_alive():
+            if self._socket_interface.control_socket is not None:
+                self.send_control(PoisonPillMessage(soft=False, sender_name='system'))
+            else:
+                self.state.alive = False
+
+    def kill(self):
+        """
+        Kill the actor
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            multiprocessing.Process.kill(self)
+        else:
+            self.terminate()
+
+    def close(self):
+        """
+        Release the resources used to run the actor
+        """
+        if self.runtime == PROCESS_RUNTIME:
+            multiprocessing.Process.close(self)
+        elif self._sentinel_pipe is not None:
+            os.close(self._sentinel_pipe[0])
+            self._sentinel_pipe = None
+
     def run(self):
         """
         Main code executed by the actor
         """
         self._setup()
+        set_current_metrics(self.metrics)
+        if self.metrics is not None and self.runtime == PROCESS_RUNTIME:
+            # don't wait for the collector to read the last publications when the process exits
+            self.metrics.queue.cancel_join_thread()
 
         while self.state.alive:
             try:
@@ -169,18 +316,25 @@ class Actor(multiprocessing.Process):
          - set the processus name
          - setup the socket interface
          - setup the signal handler
+         - add the ProfileMessage handler
+
+        The process name and the signal handler are not set when the actor run
+        in a thread
 
         This method is called before entering on the behaviour loop
         """
-        # Name process
-        setproctitle.setproctitle(self.name)
+        if self.runtime == PROCESS_RUNTIME:
+            # Name process
+            setproctitle.setproctitle(self.name)
 
         self.socket_interface.setup()
 
-        self.logger.debug(self.name + ' process created.')
+        self.logger.debug(self.name + ' ' + self.runtime + ' created.')
 
-        self._signal_handler_setup()
+        if self.runtime == PROCESS_RUNTIME:
+            self._signal_handler_setup()
 
+        self.add_handler(ProfileMessage, ProfileMessageHandler(self.state))
         self.setup()
 
     def setup(self):
@@ -201,6 +355,71 @@ class Actor(multiprocessing.Process):
         """
         self.state.add_handler(message_type, handler)
 
+    def set_codec(self, codec):
+        """
+        Set the codec used to serialize the messages sent to this actor
+
+        Must be called before starting the actor, as the codec is shared by the
+        actor process and the processes that connect to it
+
+        :param codec: the codec to use
+        :type codec: powerapi.actor.codec.Codec
+        """
+        self.socket_interface.codec = codec
+
+    def set_batching(self, batch_size, batch_delay=10):
+        """
+        Send the data messages to this actor by batches
+
+        Must be called before starting the actor
+
+        :param int batch_size: maximum number of messages in a batch, 1 disable
+                               batching
+        :param int batch_delay: maximum time in millisecond a message can wait
+                                in a batch before being sent
+        """
+        self.socket_interface.batch_size = batch_size
+        self.socket_interface.batch_delay = batch_delay
+
+    def set_overload_policy(self, hwm, overload_policy=BLOCK_POLICY, sample_rate=DEFAULT_SAMPLE_RATE):
+        """
+        Bound the queue of the data messages sent to this actor
+
+        Must be called before starting the actor
+
+        :param int hwm: maximum number of messages in the queues of the data
+                        canal, 0 for no limit
+        :param str overload_policy: what to do with a message when the queue
+                                    is full: block, drop_oldest or sample
+        :param int sample_rate: with the sample policy, one message out of
+                                sample_rate is sent when the queue is full
+        :raise UnknownOverloadPolicyException: if the overload policy is
+                                               unknown
+        """
+        check_overload_policy(overload_policy, hwm, sample_rate)
+        self.socket_interface.hwm = hwm
+        self.socket_interface.overload_policy = overload_policy
+        self.socket_interface.sample_rate = sample_rate
+
+    def enable_metrics(self, metrics_queue, interval=DEFAULT_PUBLISH_INTERVAL):
+        """
+        Measure the runtime metrics of this actor and publish them on the
+        given queue
+
+        Must be called before starting the actor. An actor without receive
+        timeout wakes up at each publication interval to publish its metrics
+
+        :param multiprocessing.Queue metrics_queue: queue where the metrics
+                                                    are published, read by a
+                                                    MetricsCollector
+        :param float interval: time (in seconds) between two publications
+        """
+        self.metrics = ActorMetrics(self.name, metrics_queue, interval)
+        if self.socket_interface.timeout is None:
+            self.socket_interface.timeout = max(1, int(interval * 1000))
+        if self.behaviour is Actor._initial_behaviour:
+            self.behaviour = Actor._measured_behaviour
+
     def set_behaviour(self, new_behaviour):
         """
         Set a new behaviour
@@ -224,18 +443,44 @@ class Actor(multiprocessing.Process):
             return
         # Message
         else:
-            try:
-                handler = self.state.get_corresponding_handler(msg)
-                handler.handle_message(msg)
-            except UnknownMessageTypeException:
-                self.logger.warning("UnknownMessageTypeException: " + str(msg))
-            except HandlerException:
-                self.logger.warning("HandlerException")
+            self._handle_message(msg)
+
+    def _measured_behaviour(self):
+        """
+        Behaviour of an actor with metrics enabled
+
+        Same as the initial behaviour, but measure the time spent waiting for
+        the message and handling it
+        """
+        metrics = self.metrics
+        begin = time.perf_counter()
+        msg = self.receive()
+        received = time.perf_counter()
+        metrics.receive_wait += received - begin
+        if msg is not None:
+            self._handle_message(msg)
+            metrics.message_handled(msg, time.perf_counter() - received)
+        metrics.publish(self.socket_interface)
+
+    def _handle_message(self, msg):
+        """
+        Handle the message with the corresponding handler
+        """
+        try:
+            handler = self.state.get_corresponding_handler(msg)
+            handler.handle_message(msg)
+        except UnknownMessageTypeException:
+            self.logger.warning("UnknownMessageTypeException: " + str(msg))
+        except HandlerException:
+            self.logger.warning("HandlerException")
 
     def _kill_process(self):
         """
         Kill the actor (close sockets)
         """
+        flush_batches()
+        if self.metrics is not None:
+            self.metrics.publish(self.socket_interface, force=True)
         self.socket_interface.close()
         self.logger.debug(self.name + ' teardown')
 
@@ -278,6 +523,9 @@ class Actor(multiprocessing.Process):
         :param Object msg: the message to send to this actor
         """
         self.socket_interface.send_data(msg)
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.message_sent(msg)
         self.logger.debug('Actor ' + self.name + ' send data [' + str(msg) + '] to ' + self.name)
 
     def receive(self):
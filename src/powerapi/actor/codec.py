@@ -0,0 +1,209 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pylint: disable=protected-access
+
+import marshal
+import pickle
+from array import array
+from datetime import datetime, timedelta
+
+from powerapi.exception import PowerAPIExceptionWithMessage
+from powerapi.report import HWPCReport, PowerReport, ProcfsReport, ColumnarHWPCReport, HWPCGroupCounters
+from powerapi.report.columnar_hwpc_report import COUNTER_TYPECODE, UNSIGNED_COUNTER_TYPECODE, FLOAT_COUNTER_TYPECODE
+
+#: Tag of a frame holding a pickled message
+PICKLE_TAG = 0
+#: Tag of a frame holding a binary encoded HWPCReport
+HWPC_REPORT_TAG = 1
+#: Tag of a frame holding a binary encoded PowerReport
+POWER_REPORT_TAG = 2
+#: Tag of a frame holding a binary encoded ProcfsReport
+PROCFS_REPORT_TAG = 3
+#: Tag of a frame holding a binary encoded ColumnarHWPCReport
+COLUMNAR_HWPC_REPORT_TAG = 4
+
+EPOCH = datetime(1970, 1, 1)
+
+# Typecodes of the counter matrices that are sent as raw bytes
+COUNTER_TYPECODES = (COUNTER_TYPECODE, UNSIGNED_COUNTER_TYPECODE, FLOAT_COUNTER_TYPECODE)
+
+
+class UnknownCodecException(PowerAPIExceptionWithMessage):
+    """
+    Exception raised when a codec name is not registered
+    """
+
+
+class Codec:
+    """
+    Convert the messages exchanged by the actors to bytes and back
+
+    The same codec instance is used by the sending side and the receiving side of a
+    :class:`SocketInterface <powerapi.actor.socket_interface.SocketInterface>`
+    """
+
+    #: (str): name used to select the codec from the configuration
+    name = None
+
+    def encode(self, msg) -> bytes:
+        """
+        :param Object msg: message to serialize
+        :return: the serialized message
+        """
+        raise NotImplementedError()
+
+    def decode(self, data: bytes):
+        """
+        :param bytes data: serialized message
+        :return: the deserialized message
+        """
+        raise NotImplementedError()
+
+
+class PickleCodec(Codec):
+    """
+    Serialize every message with pickle
+    """
+
+    name = 'pickle'
+
+    def encode(self, msg) -> bytes:
+        return pickle.dumps(msg)
+
+    def decode(self, data: bytes):
+        return pickle.loads(data)
+
+
+def _encode_timestamp(timestamp):
+    delta = timestamp - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _decode_timestamp(value):
+    if value is None:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _encode_counters(report):
+    if any(counters.values.typecode not in COUNTER_TYPECODES for counters in report.counters.values()):
+        raise ValueError('counter values are not 64 bits integers or floats')
+    return ({group_name: (counters.events, counters.rows, counters.values.typecode, counters.values.tobytes())
+             for group_name, counters in report.counters.items()},)
+
+
+def _decode_counters(encoded_counters):
+    return {group_name: HWPCGroupCounters(events, rows, array(typecode, values))
+            for group_name, (events, rows, typecode, values) in encoded_counters.items()}
+
+
+class ReportCodec(Codec):
+    """
+    Schema aware binary encoding of the reports travelling between the actors
+
+    :class:`HWPCReport <powerapi.report.HWPCReport>`, :class:`PowerReport <powerapi.report.PowerReport>`,
+    :class:`ProcfsReport <powerapi.report.ProcfsReport>` and
+    :class:`ColumnarHWPCReport <powerapi.report.ColumnarHWPCReport>` are encoded as a tuple of their fields, in a
+    fixed order, serialized with :mod:`marshal`. No class or attribute name is sent and timestamps are sent as an
+    integer number of microseconds. The counter matrices of a ColumnarHWPCReport are sent as raw bytes.
+
+    Every other message (control messages, report subclasses, reports holding values that marshal can't handle,
+    timezone aware timestamps, ...) is pickled. The first byte of each frame tells how the frame was encoded.
+    """
+
+    name = 'report'
+
+    def __init__(self):
+        self._encoders = {
+            HWPCReport: (HWPC_REPORT_TAG, lambda report: (report.groups,)),
+            PowerReport: (POWER_REPORT_TAG, lambda report: (report.power,)),
+            ProcfsReport: (PROCFS_REPORT_TAG, lambda report: (report.usage, report.global_cpu_usage)),
+            ColumnarHWPCReport: (COLUMNAR_HWPC_REPORT_TAG, _encode_counters),
+        }
+        self._decoders = {
+            HWPC_REPORT_TAG: lambda common, fields: HWPCReport(common[0], common[1], common[2], fields[0],
+                                                               common[3]),
+            POWER_REPORT_TAG: lambda common, fields: PowerReport(common[0], common[1], common[2], fields[0],
+                                                                 common[3]),
+            PROCFS_REPORT_TAG: lambda common, fields: ProcfsReport(common[0], common[1], common[2], fields[0],
+                                                                   fields[1], common[3]),
+            COLUMNAR_HWPC_REPORT_TAG: lambda common, fields: ColumnarHWPCReport(common[0], common[1], common[2],
+                                                                                _decode_counters(fields[0]),
+                                                                                common[3]),
+        }
+
+    def encode(self, msg) -> bytes:
+        encoder = self._encoders.get(type(msg))
+        if encoder is not None:
+            tag, extract_fields = encoder
+            timestamp = msg.timestamp
+            # only reports with naive datetime (or missing) timestamps are encoded. Report classes use __slots__, so
+            # a report of one of the encoded types can't hold other attributes than the encoded ones
+            if timestamp is None or (type(timestamp) is datetime and timestamp.tzinfo is None):
+                try:
+                    payload = marshal.dumps((None if timestamp is None else _encode_timestamp(timestamp), msg.sensor,
+                                             msg.target, msg._metadata, msg.sender_name, msg.dispatcher_report_id,
+                                             msg.trace, extract_fields(msg)))
+                    return bytes((tag,)) + payload
+                except ValueError:
+                    # the report holds values that marshal can't handle
+                    pass
+
+        return bytes((PICKLE_TAG,)) + pickle.dumps(msg)
+
+    def decode(self, data: bytes):
+        tag = data[0]
+        if tag == PICKLE_TAG:
+            return pickle.loads(memoryview(data)[1:])
+
+        timestamp, sensor, target, metadata, sender_name, dispatcher_report_id, trace, fields = \
+            marshal.loads(memoryview(data)[1:])
+        report = self._decoders[tag]((_decode_timestamp(timestamp), sensor, target, metadata), fields)
+        report.sender_name = sender_name
+        report.dispatcher_report_id = dispatcher_report_id
+        report.trace = trace
+        return report
+
+
+CODECS = {
+    PickleCodec.name: PickleCodec,
+    ReportCodec.name: ReportCodec,
+}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    :param str name: name of a registered codec
+    :return: a new instance of the codec
+    :raise UnknownCodecException: if no codec is registered with this name
+    """
+    if name not in CODECS:
+        raise UnknownCodecException('unknown codec ' + str(name) + ', available codecs : ' + ', '.join(CODECS))
+    return CODECS[name]()
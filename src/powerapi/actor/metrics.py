@@ -0,0 +1,445 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Runtime metrics of the actors
+
+An actor with metrics enabled counts the messages it receives and sends by type, measures the time spent handling
+them and waiting for them, and periodically publishes these metrics on a queue shared by all the actors. The
+:class:`MetricsCollector` of the main process reads this queue and exposes the last metrics of each actor on an HTTP
+endpoint in the Prometheus text format.
+
+Pushers also publish the latency added by each stage of the pipeline to the traced reports (see
+:meth:`Report.start_trace <powerapi.report.Report.start_trace>`), as percentiles computed on the last traced reports.
+"""
+
+import bisect
+import collections
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional
+
+from powerapi.report.report import PUSHER_STAGE
+
+#: (float): default time (in seconds) between two publications of the metrics of an actor
+DEFAULT_PUBLISH_INTERVAL = 1.0
+#: (tuple): upper bounds (in seconds) of the buckets of the handler latency histograms
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+#: (int): maximum number of metrics publications waiting to be read by the collector
+MAX_PENDING_PUBLICATIONS = 10000
+#: (int): number of latencies kept by stage to compute the stage latency percentiles
+LATENCY_WINDOW_SIZE = 1024
+#: (tuple): quantiles of the stage latencies
+STAGE_QUANTILES = (0.5, 0.9, 0.99)
+#: (str): name of the latency between the sensor timestamp of a report and its write in the database
+END_TO_END_STAGE = 'end_to_end'
+
+# metrics of the actor running in the current thread
+_CURRENT = threading.local()
+
+
+def current_metrics() -> Optional['ActorMetrics']:
+    """
+    :return: the metrics of the actor running in the current thread, None if its metrics are disabled
+    """
+    return getattr(_CURRENT, 'metrics', None)
+
+
+def set_current_metrics(metrics: Optional['ActorMetrics']):
+    """
+    Set the metrics of the actor running in the current thread, the messages sent by this thread are counted in them
+    """
+    _CURRENT.metrics = metrics
+
+
+def current_trace() -> Optional[tuple]:
+    """
+    :return: the trace of the report handled by the formula running in the current thread, None if it is not traced
+    """
+    return getattr(_CURRENT, 'trace', None)
+
+
+def set_current_trace(trace: Optional[tuple]):
+    """
+    Set the trace of the report handled by the formula running in the current thread, it is given to the reports sent
+    by this thread to the pushers
+    """
+    _CURRENT.trace = trace
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations, with the buckets of LATENCY_BUCKETS
+    """
+
+    def __init__(self):
+        #: (list): number of durations in each bucket, the last bucket holds the durations above the last bound
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        #: (float): sum of the durations (in seconds)
+        self.total = 0.0
+
+    def observe(self, duration: float):
+        """
+        Add a duration (in seconds) to the histogram
+        """
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.total += duration
+
+
+class StageLatencies:
+    """
+    Latency added by each stage of the pipeline to the traced reports written by a pusher
+
+    The latency of a stage is the time between the stamp of the previous stage and its own stamp, so it includes the
+    time the report waited in the input queue of the stage. The latency of the puller stage is measured from the
+    sensor timestamp of the report and the latency of the pusher stage ends when the report is written in the database.
+
+    Percentiles are computed on the last LATENCY_WINDOW_SIZE latencies of each stage. The latencies are added by the
+    thread writing in the database and read by the actor thread
+    """
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE):
+        """
+        :param int window_size: number of latencies kept by stage to compute the percentiles
+        """
+        self.window_size = window_size
+        #: (dict): last latencies (in seconds) of each stage, in pipeline order
+        self.windows = {}
+        #: (dict): number of latencies of each stage
+        self.counts = {}
+        #: (dict): sum of the latencies (in seconds) of each stage
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, stage: str, latency: float):
+        window = self.windows.get(stage)
+        if window is None:
+            window = self.windows[stage] = collections.deque(maxlen=self.window_size)
+            self.counts[stage] = 0
+            self.totals[stage] = 0.0
+        window.append(latency)
+        self.counts[stage] += 1
+        self.totals[stage] += latency
+
+    def observe_reports(self, reports, write_time: float):
+        """
+        Add the stage latencies of the traced reports of a batch written in the database, untraced reports are ignored
+
+        :param list reports: reports of the batch
+        :param float write_time: time (as returned by time.time) the batch was written
+        """
+        with self._lock:
+            for report in reports:
+                trace = report.trace
+                if not trace:
+                    continue
+                origin = trace[0][1] if report.timestamp is None else report.timestamp.timestamp()
+                previous = origin
+                for stage, stamp in trace:
+                    self._observe(stage, stamp - previous)
+                    previous = stamp
+                self._observe(PUSHER_STAGE, write_time - previous)
+                self._observe(END_TO_END_STAGE, write_time - origin)
+
+    def snapshot(self) -> dict:
+        """
+        :return: the STAGE_QUANTILES percentiles, the number and the sum of the latencies of each stage
+        """
+        with self._lock:
+            windows = {stage: sorted(window) for stage, window in self.windows.items()}
+            counts = dict(self.counts)
+            totals = dict(self.totals)
+        return {stage: ([window[min(int(quantile * len(window)), len(window) - 1)] for quantile in STAGE_QUANTILES],
+                        counts[stage], totals[stage])
+                for stage, window in windows.items()}
+
+    def __str__(self):
+        snapshot = self.snapshot()
+        if not snapshot:
+            return 'no traced report written'
+        quantile_names = '/'.join('p' + str(round(quantile * 100)) for quantile in STAGE_QUANTILES)
+        return 'stage latency ' + quantile_names + ' (ms): ' + ', '.join(
+            stage + ' ' + '/'.join(f'{latency * 1000:.2f}' for latency in latencies)
+            for stage, (latencies, _, _) in snapshot.items())
+
+
+class ActorMetrics:
+    """
+    Metrics of an actor, updated by the actor and published on the metrics queue
+    """
+
+    def __init__(self, actor_name: str, metrics_queue, interval: float = DEFAULT_PUBLISH_INTERVAL):
+        """
+        :param str actor_name: name of the actor
+        :param multiprocessing.Queue metrics_queue: queue where the metrics are published
+        :param float interval: time (in seconds) between two publications
+        """
+        self.actor_name = actor_name
+        self.queue = metrics_queue
+        self.interval = interval
+
+        #: (dict): number of received messages, by message type
+        self.received = {}
+        #: (dict): number of sent messages, by message type
+        self.sent = {}
+        #: (dict): LatencyHistogram of the time spent handling a message, by message type
+        self.handling_time = {}
+        #: (float): time spent waiting for a message (in seconds)
+        self.receive_wait = 0.0
+        #: (StageLatencies): latency added by each stage to the reports written by the actor, None if it is not a pusher
+        self.stage_latencies = None
+        self._next_publication = time.monotonic() + interval
+
+    def message_received(self, msg):
+        """
+        Count a message received by the actor
+        """
+        name = type(msg).__name__
+        self.received[name] = self.received.get(name, 0) + 1
+
+    def message_sent(self, msg):
+        """
+        Count a message sent by the actor
+        """
+        name = type(msg).__name__
+        self.sent[name] = self.sent.get(name, 0) + 1
+
+    def message_handled(self, msg, duration: float):
+        """
+        Count a message received and handled by the actor
+
+        :param float duration: time spent handling the message (in seconds)
+        """
+        self.message_received(msg)
+        histogram = self.handling_time.get(type(msg).__name__)
+        if histogram is None:
+            histogram = self.handling_time[type(msg).__name__] = LatencyHistogram()
+        histogram.observe(duration)
+
+    def snapshot(self, backlog: int) -> dict:
+        """
+        :param int backlog: estimated number of messages waiting to be received by the actor
+        :return: a picklable copy of the metrics
+        """
+        return {
+            'actor': self.actor_name,
+            'received': dict(self.received),
+            'sent': dict(self.sent),
+            'handling_time': {name: (list(histogram.counts), histogram.total)
+                              for name, histogram in self.handling_time.items()},
+            'receive_wait': self.receive_wait,
+            'backlog': backlog,
+            'stage_latency': self.stage_latencies.snapshot() if self.stage_latencies is not None else {},
+        }
+
+    def publish(self, socket_interface, force: bool = False):
+        """
+        Publish the metrics if the publication interval expired
+
+        :param SocketInterface socket_interface: interface of the actor, used to estimate its backlog
+        :param bool force: publish the metrics even if the publication interval didn't expire
+        """
+        now = time.monotonic()
+        if not force and now < self._next_publication:
+            return
+        self._next_publication = now + self.interval
+        try:
+            self.queue.put_nowait(self.snapshot(socket_interface.queue_depth if socket_interface is not None else 0))
+        except queue.Full:
+            pass
+
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class MetricsCollector:
+    """
+    Read the metrics published by the actors and expose them on an HTTP endpoint in the Prometheus text format
+
+    Must be created by the main process before starting the actors, so the actor processes inherit its queue
+    """
+
+    def __init__(self):
+        #: (multiprocessing.Queue): queue where the actors publish their metrics
+        self.queue = multiprocessing.Queue(MAX_PENDING_PUBLICATIONS)
+        #: (dict): last published metrics, by actor name
+        self.snapshots = {}
+        #: (int): port of the HTTP endpoint, None if it is not started
+        self.port = None
+        self._lock = threading.Lock()
+        self._server = None
+        self._threads = []
+        self._alive = False
+
+    def start(self, port: int, host: str = '127.0.0.1'):
+        """
+        Start the HTTP endpoint and the thread reading the metrics queue, do nothing if they are already started
+
+        :param int port: port of the HTTP endpoint, 0 to use a random port
+        :param str host: address of the HTTP endpoint
+        """
+        if self._server is not None:
+            return
+        collector = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            """
+            Answer to the requests with the metrics of the actors
+            """
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Send the metrics
+                """
+                body = collector.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._alive = True
+        self._threads = [threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True),
+                         threading.Thread(target=self._read_queue, name='metrics-collector', daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        logging.getLogger().info('actor metrics exposed on http://' + host + ':' + str(self.port) + '/metrics')
+
+    def stop(self):
+        """
+        Stop the HTTP endpoint and the thread reading the metrics queue
+        """
+        if self._server is None:
+            return
+        self._alive = False
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._server = None
+        self.port = None
+
+    def _read_queue(self):
+        while self._alive:
+            try:
+                snapshot = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self.add(snapshot)
+
+    def add(self, snapshot: dict):
+        """
+        Add metrics published by an actor, they replace its previous metrics
+        """
+        with self._lock:
+            self.snapshots[snapshot['actor']] = snapshot
+
+    def render(self) -> str:
+        """
+        :return: the last metrics of each actor in the Prometheus text format
+        """
+        with self._lock:
+            snapshots = [self.snapshots[name] for name in sorted(self.snapshots)]
+
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append('# HELP ' + name + ' ' + help_text)
+            lines.append('# TYPE ' + name + ' ' + metric_type)
+            for suffix, labels, value in samples:
+                label_text = ','.join(key + '="' + _escape_label(label) + '"' for key, label in labels)
+                lines.append(name + suffix + '{' + label_text + '} ' + repr(value))
+
+        add_metric('powerapi_actor_messages_received_total', 'counter', 'Number of messages received by the actor',
+                   [('', (('actor', snapshot['actor']), ('type', name)), count)
+                    for snapshot in snapshots for name, count in sorted(snapshot['received'].items())])
+        add_metric('powerapi_actor_messages_sent_total', 'counter', 'Number of messages sent by the actor',
+                   [('', (('actor', snapshot['actor']), ('type', name)), count)
+                    for snapshot in snapshots for name, count in sorted(snapshot['sent'].items())])
+
+        histogram_samples = []
+        for snapshot in snapshots:
+            for name, (counts, total) in sorted(snapshot['handling_time'].items()):
+                labels = (('actor', snapshot['actor']), ('type', name))
+                cumulated = 0
+                for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), counts):
+                    cumulated += count
+                    bound_text = bound if isinstance(bound, str) else _format_bound(bound)
+                    histogram_samples.append(('_bucket', labels + (('le', bound_text),), cumulated))
+                histogram_samples.append(('_sum', labels, total))
+                histogram_samples.append(('_count', labels, cumulated))
+        add_metric('powerapi_actor_handling_seconds', 'histogram', 'Time spent by the actor handling a message',
+                   histogram_samples)
+
+        add_metric('powerapi_actor_receive_wait_seconds_total', 'counter',
+                   'Time spent by the actor waiting for a message',
+                   [('', (('actor', snapshot['actor']),), snapshot['receive_wait']) for snapshot in snapshots])
+        add_metric('powerapi_actor_backlog', 'gauge', 'Estimated number of messages waiting to be received by the actor',
+                   [('', (('actor', snapshot['actor']),), snapshot['backlog']) for snapshot in snapshots])
+
+        summary_samples = []
+        for snapshot in snapshots:
+            for stage, (latencies, count, total) in snapshot['stage_latency'].items():
+                labels = (('actor', snapshot['actor']), ('stage', stage))
+                for quantile, latency in zip(STAGE_QUANTILES, latencies):
+                    summary_samples.append(('', labels + (('quantile', repr(quantile)),), latency))
+                summary_samples.append(('_sum', labels, total))
+                summary_samples.append(('_count', labels, count))
+        add_metric('powerapi_report_stage_latency_seconds', 'summary',
+                   'Latency added by each stage of the pipeline to the traced reports written by the pusher',
+                   summary_samples)
+        return '\n'.join(lines) + '\n'
+
+
+_COLLECTOR = None
+
+
+def get_metrics_collector() -> MetricsCollector:
+    """
+    :return: the metrics collector of the current process, created on the first call
+    """
+    global _COLLECTOR  # pylint: disable=global-statement
+    if _COLLECTOR is None:
+        _COLLECTOR = MetricsCollector()
+    return _COLLECTOR
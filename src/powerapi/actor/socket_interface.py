@@ -29,17 +29,85 @@
 
 # pylint: disable=no-self-use
 
-import pickle
 import logging
+import os
 import multiprocessing
 import ctypes
+import time
+import copy
+import threading
+from collections import deque
 
 import zmq
 
 from powerapi.exception import PowerAPIException
+from powerapi.actor.codec import Codec, PickleCodec
 
 LOCAL_ADDR = 'tcp://127.0.0.1'
 
+#: (str): overload policy that blocks the sender until the actor has room for the message
+BLOCK_POLICY = 'block'
+#: (str): overload policy that keeps the messages in a bounded buffer of the sender, dropping the oldest ones
+DROP_OLDEST_POLICY = 'drop_oldest'
+#: (str): overload policy that only sends one message out of sample_rate, dropping the others
+SAMPLE_POLICY = 'sample'
+OVERLOAD_POLICIES = (BLOCK_POLICY, DROP_OLDEST_POLICY, SAMPLE_POLICY)
+DEFAULT_SAMPLE_RATE = 10
+
+
+def _push_key():
+    """
+    Return the key used to store the push socket of the current thread
+    """
+    return os.getpid(), threading.get_ident()
+
+
+#: (dict): For each thread (see _push_key), deadline of the interfaces with a
+#:         batch of messages waiting to be sent by this thread
+_PENDING_BATCHES = {}
+
+
+def _forget_pending_batches():
+    """
+    Forget the batches of the father process in a forked child : they are
+    still sent by the father and must not be sent twice
+    """
+    _PENDING_BATCHES.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_pending_batches)
+
+
+def flush_expired_batches():
+    """
+    Send the batches of the current thread whose deadline expired
+
+    :return: time in millisecond before the next batch deadline, or None if no
+             batch is waiting to be sent
+    :rtype: int or None
+    """
+    pending = _PENDING_BATCHES.get(_push_key())
+    if not pending:
+        return None
+
+    now = time.monotonic()
+    for socket_interface, deadline in list(pending.items()):
+        if deadline <= now:
+            socket_interface.flush()
+
+    if not pending:
+        return None
+    return max(1, int((min(pending.values()) - now) * 1000))
+
+
+def flush_batches():
+    """
+    Send all the batches of the current thread waiting to be sent
+    """
+    for socket_interface in list(_PENDING_BATCHES.get(_push_key(), {})):
+        socket_interface.flush()
+
 
 class NotConnectedException(PowerAPIException):
     """
@@ -48,6 +116,51 @@ class NotConnectedException(PowerAPIException):
     """
 
 
+class UnknownOverloadPolicyException(PowerAPIException):
+    """
+    Exception raised when an unknown overload policy is given to a socket interface
+    """
+
+    def __init__(self, policy):
+        PowerAPIException.__init__(self)
+        self.policy = policy
+
+
+def check_overload_policy(policy: str, hwm: int, sample_rate: int):
+    """
+    Check the overload policy parameters of a socket interface
+
+    :raise UnknownOverloadPolicyException: if the policy is unknown
+    :raise ValueError: if the high water mark or the sample rate are not valid
+    """
+    if policy not in OVERLOAD_POLICIES:
+        raise UnknownOverloadPolicyException(policy)
+    if hwm < 0:
+        raise ValueError('high water mark must be positive')
+    if sample_rate < 1:
+        raise ValueError('sample rate must be greater than 0')
+
+
+class SocketInterfaceStats:
+    """
+    Statistics on the data messages sent to an actor by the current process
+    """
+
+    def __init__(self):
+        #: (int): number of sent messages
+        self.sent = 0
+        #: (int): number of messages dropped by the overload policy
+        self.dropped = 0
+        #: (int): number of times the actor had no room for a message
+        self.overloads = 0
+        #: (float): time spent waiting for room in the actor queue (in seconds)
+        self.blocked_time = 0.0
+
+    def __str__(self):
+        return (f'{self.sent} messages sent, {self.dropped} dropped, {self.overloads} overloads, '
+                f'blocked {self.blocked_time:.3f} s')
+
+
 class SocketInterface:
     """
     Interface to handle comunication to/from the actor
@@ -61,6 +174,7 @@ class SocketInterface:
     - :meth:`connect_data <powerapi.actor.socket_interface.SocketInterface.connect_data>`
     - :meth:`connect_control <powerapi.actor.socket_interface.SocketInterface.connect_control>`
     - :meth:`send_data <powerapi.actor.socket_interface.SocketInterface.send_data>`
+    - :meth:`flush <powerapi.actor.socket_interface.SocketInterface.flush>`
     - :meth:`close <powerapi.actor.socket_interface.SocketInterface.close>`
 
     server interface methods :
@@ -68,15 +182,90 @@ class SocketInterface:
     - :meth:`setup <powerapi.actor.socket_interface.SocketInterface.setup>`
     - :meth:`receive <powerapi.actor.socket_interface.SocketInterface.receive>`
     - :meth:`close <powerapi.actor.socket_interface.SocketInterface.close>`
+
+    When batching is enabled (``batch_size`` greater than 1), the messages sent
+    on the data canal are buffered by the sending thread and sent as the
+    frames of a single multipart message, when the batch is full or when its
+    oldest message waited more than ``batch_delay`` millisecond. The receiving
+    side returns the messages of a batch one by one.
+
+    Each thread sending messages on the data canal uses its own push socket,
+    opened on its first message if the interface was connected by another
+    thread.
+
+    The data canal is unbounded by default. With a high water mark (``hwm``),
+    the ZMQ queues of each push socket and of the pull socket hold at most
+    ``hwm`` messages (a batch is one message), and the overload policy
+    decides what happens to a message the actor has no room for:
+
+    - ``block``: the sender waits until the actor has room
+    - ``drop_oldest``: the message waits in a buffer of the sender, holding at
+      most ``hwm`` messages, the oldest messages of the buffer are dropped
+      when it is full
+    - ``sample``: one message out of ``sample_rate`` is sent (waiting for
+      room), the others are dropped
     """
 
-    def __init__(self, name, timeout):
+    def __init__(self, name, timeout, codec: Codec = None, batch_size: int = 1, batch_delay: int = 10, hwm: int = 0,
+                 overload_policy: str = BLOCK_POLICY, sample_rate: int = DEFAULT_SAMPLE_RATE):
         """
         :param str name: name of the actor using this interface
         :param int timeout: time in millisecond to wait for a message
+        :param Codec codec: codec used to serialize the messages sent to the actor, pickle is used if not defined
+        :param int batch_size: maximum number of data messages sent in a single batch, 1 disable batching
+        :param int batch_delay: maximum time in millisecond a data message can wait in a batch before being sent
+        :param int hwm: maximum number of messages in the queues of the data canal, 0 for no limit
+        :param str overload_policy: what to do with a message when the actor queue is full: block, drop_oldest or
+                                    sample
+        :param int sample_rate: with the sample policy, one message out of sample_rate is sent when the actor queue
+                                is full
+        :raise UnknownOverloadPolicyException: if the overload policy is unknown
         """
+        check_overload_policy(overload_policy, hwm, sample_rate)
         self.logger = logging.getLogger(name)
 
+        #: (Codec): Codec used to serialize the messages on both sides of the sockets
+        self.codec = PickleCodec() if codec is None else codec
+
+        #: (int): Maximum number of data messages sent in a single batch
+        self.batch_size = batch_size
+
+        #: (int): Maximum time in millisecond a data message can wait in a
+        #:        batch before being sent
+        self.batch_delay = batch_delay
+
+        # serialized messages waiting to be sent, for each thread connected
+        # to this actor (see _push_key)
+        self._batches = {}
+
+        # messages of a received batch not yet returned by receive
+        self._received = deque()
+
+        #: (int): Maximum number of messages in the queues of the data canal,
+        #:        0 for no limit
+        self.hwm = hwm
+
+        #: (str): Policy applied to the messages the actor has no room for
+        self.overload_policy = overload_policy
+
+        #: (int): With the sample policy, one message out of sample_rate is
+        #:        sent when the actor queue is full
+        self.sample_rate = sample_rate
+
+        #: (SocketInterfaceStats): statistics on the data messages sent by
+        #:                         the current process
+        self.stats = SocketInterfaceStats()
+
+        # messages waiting for room in the actor queue with the drop_oldest
+        # policy, for each thread connected to this actor (see _push_key)
+        self._overflows = {}
+
+        # number of data messages sent to the actor and received by it, shared
+        # by the processes to estimate the number of queued messages
+        self._sent_count = multiprocessing.RawValue(ctypes.c_long)
+        self._sent_count_lock = multiprocessing.Lock()
+        self._received_count = multiprocessing.RawValue(ctypes.c_long)
+
         #: (int): Time in millisecond to wait for a message before execute
         #:        timeout_handler
         self.timeout = timeout
@@ -96,11 +285,12 @@ class SocketInterface:
         #: (zmq.Socket): ZMQ Pair socket for receiving control message
         self.control_socket = None
 
-        # This socket is used to connect to the pull socket of this actor. It
-        # won't be created on the actor's process but on the process that want
-        # to connect to the pull socket of this actor
-        #: (zmq.Socket): ZMQ Push socket for sending message to this actor
-        self.push_socket = None
+        # These sockets are used to connect to the pull socket of this actor.
+        # They won't be created on the actor's process but on the process that
+        # want to connect to the pull socket of this actor, one per thread
+        # (indexed by process id and thread id, sockets inherited from a
+        # parent process can't be used after a fork)
+        self._push_sockets = {}
 
         # Shared memory used to communicate the port used to bind sockets
         self._pull_port = multiprocessing.Value(ctypes.c_int)
@@ -110,6 +300,45 @@ class SocketInterface:
         self._pull_port.value = -1
         self._ctrl_port.value = -1
 
+    @property
+    def push_socket(self):
+        """
+        (zmq.Socket): ZMQ Push socket of the current thread for sending message
+        to this actor
+        """
+        return self._push_sockets.get(_push_key())
+
+    def server_copy(self):
+        """
+        Return a copy of this interface, without any open socket, that can be
+        setup by an actor running in a thread of the process that hold this
+        interface
+
+        The copy share the port numbers with this interface, this interface
+        can be used to connect to the actor once the copy is setup
+        """
+        interface = copy.copy(self)
+        interface.poller = zmq.Poller()
+        interface.pull_socket = None
+        interface.control_socket = None
+        interface._push_sockets = {}
+        interface._batches = {}
+        interface._received = deque()
+        interface._overflows = {}
+        return interface
+
+    @property
+    def queue_depth(self):
+        """
+        (int): estimated number of data messages sent to this actor and not
+        yet received by it, including the messages waiting in the buffers of
+        the current process
+        """
+        pid = os.getpid()
+        waiting = sum(len(frames) for (owner, _), overflow in self._overflows.items() if owner == pid
+                      for frames in overflow)
+        return max(0, self._sent_count.value - self._received_count.value) + waiting
+
     def setup(self):
         """
         Initialize sockets and send the selected port number to the father
@@ -117,11 +346,11 @@ class SocketInterface:
         """
         # create the pull socket (to communicate with this actor, others
         # process have to connect a push socket to this socket)
-        self.pull_socket, pull_port = self._create_socket(zmq.PULL, -1)
+        self.pull_socket, pull_port = self._create_socket(zmq.PULL, -1, self.hwm)
 
         # create the control socket (to control this actor, a process have to
         # connect a pair socket to this socket with the `control` method)
-        self.control_socket, ctrl_port = self._create_socket(zmq.PAIR, 0)
+        self.control_socket, ctrl_port = self._create_socket(zmq.PAIR, 0, 0)
 
         self.pull_socket_address = LOCAL_ADDR + ':' + str(pull_port)
         self.control_socket_address = LOCAL_ADDR + ':' + str(ctrl_port)
@@ -130,7 +359,7 @@ class SocketInterface:
         self._ctrl_port.value = ctrl_port
         self._values_available.set()
 
-    def _create_socket(self, socket_type, linger_value):
+    def _create_socket(self, socket_type, linger_value, hwm):
         """
         Create a socket of the given type, bind it to a random port and
         register it to the poller
@@ -139,12 +368,13 @@ class SocketInterface:
         :param int linger_value: -1 mean wait for receive all msg and block
                                  closing 0 mean hardkill the socket even if msg
                                  are still here.
+        :param int hwm: high water mark of the socket, 0 for no limit
         :return (zmq.Socket, int): the initialized socket and the port where the
                                    socket is bound
         """
         socket = zmq.Context.instance().socket(socket_type)
         socket.setsockopt(zmq.LINGER, linger_value)
-        socket.set_hwm(0)
+        socket.set_hwm(hwm)
         port_number = socket.bind_to_random_port(LOCAL_ADDR)
         self.poller.register(socket, zmq.POLLIN)
         self.logger.debug("bind to " + LOCAL_ADDR + ':' + str(port_number))
@@ -158,7 +388,14 @@ class SocketInterface:
         :return: the list of received messages or None if timeout
         :rtype: a list of Object or None
         """
-        events = self.poller.poll(self.timeout)
+        if self._received:
+            # If there is control socket, he has the priority
+            for socket, _ in self.poller.poll(0):
+                if socket is not self.pull_socket:
+                    return self._recv_serialized(socket)
+            return self._received.popleft()
+
+        events = self._poll()
 
         # If there is control socket, he has the priority
         if len(events) == 2:
@@ -186,12 +423,42 @@ class SocketInterface:
 
         return self._recv_serialized(self.control_socket)
 
+    def _poll(self):
+        """
+        Poll the sockets of this interface until timeout
+
+        If batches of the current process are waiting to be sent, wake up to
+        send them when their deadline expire
+
+        :return: the list of socket events
+        """
+        flush_delay = flush_expired_batches()
+        if flush_delay is None:
+            return self.poller.poll(self.timeout)
+
+        end = None if self.timeout is None else time.monotonic() + self.timeout / 1000
+        while True:
+            remaining = None if end is None else max(0, int((end - time.monotonic()) * 1000))
+            if flush_delay is None:
+                return self.poller.poll(remaining)
+
+            events = self.poller.poll(flush_delay if remaining is None else min(flush_delay, remaining))
+            if events or (remaining is not None and remaining <= flush_delay):
+                return events
+            flush_delay = flush_expired_batches()
+
     def close(self):
         """
         Close all socket handle by this interface
         """
-        if self.push_socket is not None:
-            self.push_socket.close()
+        self.flush()
+        overflow = self._overflows.pop(_push_key(), None)
+        if overflow:
+            self.stats.dropped += sum(len(frames) for frames in overflow)
+        if self.stats.dropped or self.stats.overloads:
+            self.logger.warning('overloaded data canal: ' + str(self.stats))
+        for push_socket in self._push_sockets.values():
+            push_socket.close()
 
         if self.pull_socket is not None:
             self.pull_socket.close()
@@ -201,33 +468,42 @@ class SocketInterface:
 
     def _send_serialized(self, socket, msg):
         """
-        Send a serialized msg with pickle to the given socket
+        Send a msg serialized with the interface codec to the given socket
 
         :param zmq.Socket socket: socket used to send the message
         :param Object msg: message to send
         """
-        socket.send(pickle.dumps(msg))
+        socket.send(self.codec.encode(msg))
 
     def _recv_serialized(self, socket):
         """
         Wait for a message from the given socket and return its deserialized
-        value (using pickle)
+        value (using the interface codec)
+
+        If a batch of messages is received, the first one is returned and the
+        others are kept to be returned by the next calls to receive
 
         :param zmq.Socket socket: socket to wait for a reception
         :return Object: the received message
         """
-        msg = pickle.loads(socket.recv())
-        return msg
+        frames = socket.recv_multipart()
+        if socket is self.pull_socket:
+            self._received_count.value += len(frames)
+        for frame in frames[1:]:
+            self._received.append(self.codec.decode(frame))
+        return self.codec.decode(frames[0])
 
     def connect_data(self):
         """
         Connect to the pull socket of this actor
 
-        Open a push socket on the process that want to communicate with this
-        actor
+        Open a push socket on the thread that want to communicate with this
+        actor. If the thread is already connected, its push socket is reused
 
         this method shouldn't be called if socket interface was not initialized
         with the setup method
+
+        :return zmq.Socket: the opened push socket
         """
 
         if self.pull_socket_address is None:
@@ -235,11 +511,17 @@ class SocketInterface:
             self.pull_socket_address = LOCAL_ADDR + ':' + str(self._pull_port.value)
             self.control_socket_address = LOCAL_ADDR + ':' + str(self._ctrl_port.value)
 
-        self.push_socket = zmq.Context.instance().socket(zmq.PUSH)
-        self.push_socket.setsockopt(zmq.LINGER, -1)
-        self.push_socket.set_hwm(0)
-        self.push_socket.connect(self.pull_socket_address)
+        push_socket = self._push_sockets.get(_push_key())
+        if push_socket is not None:
+            return push_socket
+
+        push_socket = zmq.Context.instance().socket(zmq.PUSH)
+        push_socket.setsockopt(zmq.LINGER, -1)
+        push_socket.set_hwm(self.hwm)
+        push_socket.connect(self.pull_socket_address)
+        self._push_sockets[_push_key()] = push_socket
         self.logger.debug("connected data to %s" % (self.pull_socket_address))
+        return push_socket
 
     def connect_control(self):
         """
@@ -269,6 +551,9 @@ class SocketInterface:
 
         if self.control_socket is None:
             raise NotConnectedException()
+        # data messages sent before this control message must not be delayed
+        # after it
+        self.flush()
         self._send_serialized(self.control_socket, msg)
 
     def send_data(self, msg):
@@ -277,6 +562,103 @@ class SocketInterface:
 
         :param Object msg: message to send
         """
-        if self.push_socket is None:
-            raise NotConnectedException()
-        self._send_serialized(self.push_socket, msg)
+        key = _push_key()
+        push_socket = self._push_sockets.get(key)
+        if push_socket is None:
+            if not self._push_sockets:
+                raise NotConnectedException()
+            push_socket = self.connect_data()
+
+        if self.batch_size <= 1:
+            self._send_frames(push_socket, [self.codec.encode(msg)])
+            return
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = []
+            _PENDING_BATCHES.setdefault(key, {})[self] = time.monotonic() + self.batch_delay / 1000
+        batch.append(self.codec.encode(msg))
+
+        if len(batch) >= self.batch_size or time.monotonic() >= _PENDING_BATCHES[key][self]:
+            self.flush()
+
+    def flush(self):
+        """
+        Send the batch of data messages waiting to be sent by the current
+        thread
+        """
+        key = _push_key()
+        batch = self._batches.pop(key, None)
+        pending = _PENDING_BATCHES.get(key, {})
+        pending.pop(self, None)
+        if batch:
+            self._send_frames(self._push_sockets[key], batch)
+        elif self._overflows.get(key):
+            self._send_overflow(self._push_sockets[key], self._overflows[key])
+
+        if self._overflows.get(key):
+            # retry to send the buffered messages later, as for a batch
+            _PENDING_BATCHES.setdefault(key, {})[self] = time.monotonic() + self.batch_delay / 1000
+
+    def _count_sent(self, count):
+        self.stats.sent += count
+        with self._sent_count_lock:
+            self._sent_count.value += count
+
+    def _send_overflow(self, push_socket, overflow):
+        """
+        Send the buffered messages until the actor queue is full
+
+        :return: True if all the buffered messages were sent
+        """
+        while overflow:
+            try:
+                push_socket.send_multipart(overflow[0], zmq.NOBLOCK)
+            except zmq.Again:
+                return False
+            self._count_sent(len(overflow.popleft()))
+        return True
+
+    def _send_frames(self, push_socket, frames):
+        """
+        Send a data message made of the given frames (a batch or a single
+        message), applying the overload policy if the actor queue is full
+
+        :param zmq.Socket push_socket: socket used to send the message
+        :param list frames: serialized messages to send
+        """
+        if self.hwm == 0:
+            if len(frames) == 1:
+                push_socket.send(frames[0])
+            else:
+                push_socket.send_multipart(frames)
+            self._count_sent(len(frames))
+            return
+
+        overflow = self._overflows.get(_push_key())
+        if not overflow or self._send_overflow(push_socket, overflow):
+            try:
+                push_socket.send_multipart(frames, zmq.NOBLOCK)
+                self._count_sent(len(frames))
+                return
+            except zmq.Again:
+                pass
+
+        self.stats.overloads += 1
+        if self.overload_policy == DROP_OLDEST_POLICY:
+            if overflow is None:
+                overflow = self._overflows[_push_key()] = deque()
+            if len(overflow) >= self.hwm:
+                self.stats.dropped += len(overflow.popleft())
+            overflow.append(frames)
+            _PENDING_BATCHES.setdefault(_push_key(), {}).setdefault(
+                self, time.monotonic() + self.batch_delay / 1000)
+
+        elif self.overload_policy == SAMPLE_POLICY and self.stats.overloads % self.sample_rate != 0:
+            self.stats.dropped += len(frames)
+
+        else:
+            begin = time.monotonic()
+            push_socket.send_multipart(frames)
+            self.stats.blocked_time += time.monotonic() - begin
+            self._count_sent(len(frames))
@@ -27,10 +27,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
 import multiprocessing
+from typing import Dict
 
 from powerapi.exception import PowerAPIException
-from powerapi.message import StartMessage, ErrorMessage
+from powerapi.message import StartMessage, ErrorMessage, OKMessage, ProfileMessage
+
+from powerapi.utils.profiler import DEFAULT_SAMPLING_INTERVAL, profile_path
 
 
 class ActorInitError(PowerAPIException):
@@ -72,7 +76,22 @@ class ActorAlreadyLaunchedException(PowerAPIException):
     """
 
 
+class ActorNotSupervisedException(PowerAPIException):
+    """
+    Exception raised when an actor that is not supervised is designated by
+    its name
+    """
+
+    def __init__(self, actor_name):
+        super().__init__()
+
+        #: (str): name of the designated actor
+        self.actor_name = actor_name
+
+
 SUPERVISOR_NAME = 'powerapi_supervisor'
+#: (int): time (in ms) to wait for an actor to answer a ProfileMessage
+PROFILE_ANSWER_TIMEOUT = 2000
 
 
 class Supervisor:
@@ -147,3 +166,40 @@ class Supervisor:
             if not actor.is_alive():
                 return False
         return True
+
+    def profile_actors(self, duration: float, output_directory: str, actor_name: str = None,
+                       interval: float = DEFAULT_SAMPLING_INTERVAL) -> Dict[str, str]:
+        """
+        Ask the supervised actors, or only the one with the given name, to
+        sample their call stacks during the given duration and to write them in
+        the output directory in the collapsed stack format. The profiled actors
+        also profile the actors they supervise (the formulas of a dispatcher)
+
+        :param float duration: time (in seconds) during which the call stacks
+                               are sampled
+        :param str output_directory: directory where the profiles are written
+        :param str actor_name: name of the profiled actor, all the supervised
+                               actors are profiled if None
+        :param float interval: time (in seconds) between two samples
+        :return: path of the profile of each actor that started profiling, by
+                 actor name. The profiles are written once the duration elapsed
+        :raise ActorNotSupervisedException: if no supervised actor has the
+                                            given name
+        """
+        actors = [actor for actor in self.supervised_actors if actor_name is None or actor.name == actor_name]
+        if actor_name is not None and not actors:
+            raise ActorNotSupervisedException(actor_name)
+        actors = [actor for actor in actors if actor.is_alive()]
+
+        for actor in actors:
+            actor.send_control(ProfileMessage(SUPERVISOR_NAME, duration, output_directory, interval))
+
+        paths = {}
+        for actor in actors:
+            msg = actor.receive_control(PROFILE_ANSWER_TIMEOUT)
+            if isinstance(msg, OKMessage):
+                paths[actor.name] = profile_path(output_directory, actor.name)
+            else:
+                reason = msg.error_message if isinstance(msg, ErrorMessage) else 'no answer'
+                logging.getLogger().warning('cannot profile the actor ' + actor.name + ' : ' + reason)
+        return paths
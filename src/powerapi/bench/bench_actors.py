@@ -0,0 +1,187 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import resource
+import time
+from typing import Dict
+
+from powerapi.actor.metrics import StageLatencies
+from powerapi.formula import FormulaActor
+from powerapi.formula.handlers import FormulaPoisonPillMessageHandler
+from powerapi.handler import Handler, PoisonPillMessageHandler, StartHandler
+from powerapi.message import Message, PoisonPillMessage, StartMessage
+from powerapi.pusher import PusherActor
+from powerapi.pusher.simple.simple_pusher_actor import SimplePusherActor, SimplePusherState
+from powerapi.pusher.simple.simple_pusher_handlers import SimplePusherHandler, SimplePusherStartHandler
+from powerapi.report import Report
+from powerapi.report.report import FORMULA_STAGE
+
+
+class BenchmarkResultMessage(Message):
+    """
+    Message sent by a BenchPusherActor on its control canal once it received all the expected reports
+    """
+
+    __slots__ = ('reports', 'duration', 'stage_latency', 'max_rss')
+
+    def __init__(self, sender_name: str, reports: int, duration: float, stage_latency: Dict, max_rss: int):
+        """
+        :param str sender_name: name of the pusher
+        :param int reports: number of received reports
+        :param float duration: time (in seconds) between the first stamp of the first report and the reception of the
+                               last report
+        :param dict stage_latency: snapshot of the StageLatencies of the received reports
+        :param int max_rss: peak resident set size of the pusher process (in kB)
+        """
+        Message.__init__(self, sender_name)
+        self.reports = reports
+        self.duration = duration
+        self.stage_latency = stage_latency
+        self.max_rss = max_rss
+
+    def __str__(self):
+        return 'BenchmarkResultMessage : ' + str(self.reports) + ' reports in ' + str(self.duration) + 's'
+
+
+class BenchFormulaReportHandler(Handler):
+    """
+    Forward the received report to the pushers, with a stamp of the formula
+    """
+
+    def handle(self, msg: Report):
+        """
+        Stamp the report and send it to the pushers
+
+        :param powerapi.Report msg: Received report
+        """
+        msg.stamp(FORMULA_STAGE)
+        for _, actor_pusher in self.state.pushers.items():
+            actor_pusher.send_data(msg)
+
+
+class BenchFormulaActor(FormulaActor):
+    """
+    Formula that forwards the received reports of any type to its pushers, like the SimpleFormulaActor, with a stamp
+    of the formula
+    """
+
+    def __init__(self, name, pushers: Dict[str, PusherActor], level_logger=logging.WARNING, timeout=None):
+        FormulaActor.__init__(self, name, pushers, level_logger, timeout)
+
+    def setup(self):
+        """
+        Initialize Handler
+        """
+        FormulaActor.setup(self)
+        self.add_handler(PoisonPillMessage, FormulaPoisonPillMessageHandler(self.state))
+        self.add_handler(Report, BenchFormulaReportHandler(self.state))
+        self.add_handler(StartMessage, StartHandler(self.state))
+
+
+class BenchPusherState(SimplePusherState):
+    """
+    State of a BenchPusherActor, counts the received reports instead of storing them
+    """
+
+    def __init__(self, actor, number_of_reports_to_store: int):
+        """
+        :param Actor actor: The actor related to the state
+        :param int number_of_reports_to_store: number of reports to receive before sending the results
+        """
+        SimplePusherState.__init__(self, actor, number_of_reports_to_store)
+
+        #: (int): number of received reports
+        self.received = 0
+        #: (float): first stamp of the first received traced report
+        self.first_stamp = None
+        #: (float): reception time of the last report
+        self.last_reception = None
+        #: (StageLatencies): latency added by each stage to the received reports
+        self.stage_latencies = StageLatencies(window_size=max(number_of_reports_to_store, 1))
+
+
+class BenchPusherHandler(SimplePusherHandler):
+    """
+    Measure the stage latencies of the received reports instead of storing them, and send the results on the control
+    canal once the expected number of reports is received
+    """
+
+    def handle(self, report: Report):
+        """
+        Add the stage latencies of the report and send the results if it is the last expected report
+        """
+        self.save_report(report)
+        self.send_results_if_required()
+
+    def save_report(self, report: Report):
+        reception_time = time.time()
+        if self.state.first_stamp is None and report.trace:
+            self.state.first_stamp = report.trace[0][1]
+        self.state.received += 1
+        self.state.last_reception = reception_time
+        self.state.stage_latencies.observe_reports((report,), reception_time)
+
+    def send_results_if_required(self):
+        """
+        Send the results once the expected number of reports is received
+
+        The actor keeps running until the benchmark kills it: its control socket doesn't linger, the results could be
+        dropped if the actor closed it right after sending them
+        """
+        if self.state.received != self.state.number_of_reports_to_store:
+            return
+        first_stamp = self.state.first_stamp if self.state.first_stamp is not None else self.state.last_reception
+        self.state.actor.send_control(BenchmarkResultMessage(self.state.actor.name, self.state.received,
+                                                             self.state.last_reception - first_stamp,
+                                                             self.state.stage_latencies.snapshot(),
+                                                             resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+
+class BenchPusherActor(SimplePusherActor):
+    """
+    SimplePusherActor that measures the latency added by each stage of the pipeline to the received traced reports
+    """
+
+    def __init__(self, name: str, number_of_reports_to_store: int, level_logger: int = logging.WARNING):
+        """
+        :param str name: Actor name
+        :param int number_of_reports_to_store: number of reports to receive before sending the results
+        :param int level_logger: Define the level of the logger
+        """
+        SimplePusherActor.__init__(self, name, number_of_reports_to_store, level_logger)
+        self.state = BenchPusherState(self, number_of_reports_to_store)
+
+    def setup(self):
+        """
+        Defines StartMessage handler, PoisonPillMessage handler and a handler for the reports of any type
+        """
+        self.add_handler(StartMessage, SimplePusherStartHandler(self.state))
+        self.add_handler(PoisonPillMessage, PoisonPillMessageHandler(self.state))
+        self.add_handler(Report, BenchPusherHandler(self.state))
@@ -0,0 +1,115 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+powerapi-bench: measure the throughput, the latency and the memory footprint of the report pipeline on synthetic
+reports
+
+The results of each run are printed as a table, or as one json object by line with --json, to be appended to a file
+for trend tracking.
+"""
+
+import argparse
+import json
+import sys
+
+from powerapi.actor import PROCESS_RUNTIME, THREAD_RUNTIME
+from powerapi.actor.codec import CODECS
+from powerapi.report import HWPCReport, ProcfsReport
+
+from .pipeline import PipelineBenchmark, DEFAULT_TIMEOUT, BenchmarkTimeoutException, BenchmarkFailureException
+from .report_generator import ReportGenerator
+
+REPORT_TYPES = {'hwpc': HWPCReport, 'procfs': ProcfsReport}
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='powerapi-bench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--report-type', choices=sorted(REPORT_TYPES), default='hwpc', help='type of the reports')
+    parser.add_argument('--reports', type=int, default=10000, help='number of reports sent by the puller')
+    parser.add_argument('--sockets', type=int, default=2, help='number of sockets of the HWPC reports')
+    parser.add_argument('--cores', type=int, default=4, help='number of cores by socket of the HWPC reports')
+    parser.add_argument('--events', type=int, default=4, help='number of events by core of the HWPC reports')
+    parser.add_argument('--targets', type=int, default=10, help='number of targets (HWPC) or cgroups (Procfs)')
+    parser.add_argument('--sensors', type=int, default=1, help='number of sensors')
+    parser.add_argument('--rate', type=float, help='number of reports sent by second, as fast as possible if omitted')
+    parser.add_argument('--runtime', action='append', choices=[PROCESS_RUNTIME, THREAD_RUNTIME],
+                        help='runtime of the actors, can be repeated to compare runtimes (default: process)')
+    parser.add_argument('--codec', action='append', choices=sorted(CODECS),
+                        help='codec of the reports sent to the dispatcher and the pusher, can be repeated '
+                             '(default: pickle)')
+    parser.add_argument('--repeat', type=int, default=1, help='number of runs of each configuration')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='maximum duration of a run (in s)')
+    parser.add_argument('--json', action='store_true', help='print the results as json lines')
+    return parser
+
+
+def _format_text(result: dict) -> str:
+    config = result['config']
+    latency = result['latency_s']
+    lines = [f"{config['report_type']} x {config['reports']}, runtime {config['runtime']}, "
+             f"codec {config['codec'] or 'pickle'}: {result['throughput_reports_per_s']:.0f} reports/s, "
+             f"latency p50/p99 {latency.get('p50', 0) * 1000:.2f}/{latency.get('p99', 0) * 1000:.2f} ms"]
+    for stage, quantiles in result['stage_latency_s'].items():
+        lines.append(f"  {stage:<12} p50 {quantiles['p50'] * 1000:>9.3f} ms   p99 {quantiles['p99'] * 1000:>9.3f} ms")
+    for actor_name, rss in result['peak_rss_kb'].items():
+        lines.append(f"  {actor_name:<40} {'?' if rss is None else format(rss / 1024, '.1f')} MB")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    """
+    Run the benchmarks described by the command line arguments
+
+    :return: the exit status
+    """
+    args = _parser().parse_args(argv)
+    try:
+        generators = [ReportGenerator(REPORT_TYPES[args.report_type], args.sockets, args.cores, args.events,
+                                      args.targets, args.sensors, args.rate) for _ in range(args.repeat)]
+    except ValueError as exn:
+        print('powerapi-bench: ' + str(exn), file=sys.stderr)
+        return 2
+
+    for runtime in args.runtime or [PROCESS_RUNTIME]:
+        for codec in args.codec or [None]:
+            for generator in generators:
+                benchmark = PipelineBenchmark(generator, args.reports, runtime, codec, args.timeout)
+                try:
+                    result = benchmark.run()
+                except BenchmarkTimeoutException:
+                    print('powerapi-bench: the pipeline did not deliver all the reports in ' + str(args.timeout) +
+                          's', file=sys.stderr)
+                    return 1
+                except BenchmarkFailureException as exn:
+                    print('powerapi-bench: ' + exn.msg, file=sys.stderr)
+                    return 1
+                print(json.dumps(result, sort_keys=True) if args.json else _format_text(result), flush=True)
+    return 0
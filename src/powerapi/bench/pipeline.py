@@ -0,0 +1,285 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Throughput and latency benchmark of the puller -> dispatcher -> formula -> pusher pipeline
+
+A SimplePullerActor sends synthetic reports to a DispatcherActor, that routes them to BenchFormulaActor (one formula
+by socket for HWPC reports, one by sensor for Procfs reports), that forward them to a BenchPusherActor. The reports
+are traced, so the pusher measures the latency added by each stage of the pipeline.
+
+Each benchmark runs in a new process started with the spawn method, so the actors don't inherit the threads, the
+sockets or the zmq context of the calling process and the measured memory is the memory of the pipeline only.
+"""
+
+import multiprocessing
+import os
+import platform
+import queue
+import time
+import traceback
+from datetime import datetime
+from typing import Dict, Optional
+
+from powerapi import __version__ as powerapi_version
+from powerapi.actor import Supervisor, PROCESS_RUNTIME, get_codec
+from powerapi.actor.metrics import STAGE_QUANTILES, END_TO_END_STAGE
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel, ProcfsDispatchRule, ProcfsDepthLevel
+from powerapi.dispatcher import DispatcherActor, RouteTable
+from powerapi.exception import PowerAPIException, PowerAPIExceptionWithMessage
+from powerapi.filter import Filter
+from powerapi.message import SimplePullerSendReportsMessage
+from powerapi.puller.simple.simple_puller_actor import SimplePullerActor
+from powerapi.report import HWPCReport, ProcfsReport
+
+from .bench_actors import BenchFormulaActor, BenchPusherActor, BenchmarkResultMessage
+from .report_generator import ReportGenerator
+
+BENCH_PULLER_NAME = 'bench_puller'
+BENCH_DISPATCHER_NAME = 'bench_dispatcher'
+BENCH_PUSHER_NAME = 'bench_pusher'
+#: (float): default maximum time (in seconds) to wait for the pusher to receive all the reports
+DEFAULT_TIMEOUT = 300.0
+#: (float): maximum time (in seconds) to start the benchmark process and to stop its actors
+PROCESS_MARGIN = 60.0
+
+
+class BenchmarkTimeoutException(PowerAPIException):
+    """
+    Exception raised when the pusher didn't receive all the reports before the benchmark timeout
+    """
+
+
+class BenchmarkFailureException(PowerAPIExceptionWithMessage):
+    """
+    Exception raised when the benchmark process failed or died without sending its result
+    """
+
+
+def _run_in_process(benchmark, results):
+    """
+    Run the benchmark and put its result in the results queue, as a (status, value) tuple
+    """
+    # the spawned process inherits the start method of its parent, the actors must be forked from this clean process
+    multiprocessing.set_start_method('fork', force=True)
+    try:
+        results.put(('ok', benchmark.run_pipeline()))
+    except BenchmarkTimeoutException:
+        results.put(('timeout', None))
+    except Exception:  # pylint: disable=broad-exception-caught
+        results.put(('error', traceback.format_exc()))
+
+
+def peak_rss_kb(pid: int) -> Optional[int]:
+    """
+    :return: the peak resident set size of the given process (in kB), None if it can't be read
+    """
+    try:
+        with open('/proc/' + str(pid) + '/status', encoding='utf-8') as status_file:
+            for line in status_file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def child_processes(pid: int) -> Dict[int, str]:
+    """
+    :return: the name of the child processes of the given process (the actor name for actor processes), by pid
+    """
+    children = {}
+    if not os.path.isdir('/proc'):
+        return children
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/' + entry + '/stat', encoding='utf-8') as stat_file:
+                # the process name is between parentheses and may contain spaces
+                parent_pid = int(stat_file.read().rsplit(')', 1)[1].split()[1])
+            if parent_pid != pid:
+                continue
+            with open('/proc/' + entry + '/cmdline', encoding='utf-8') as cmdline_file:
+                children[int(entry)] = cmdline_file.read().split('\0')[0]
+        except (OSError, IndexError, ValueError):
+            continue
+    return children
+
+
+def _quantiles(latencies) -> Dict[str, float]:
+    return {'p' + str(round(quantile * 100)): latency for quantile, latency in zip(STAGE_QUANTILES, latencies)}
+
+
+class PipelineBenchmark:
+    """
+    Run the pipeline on synthetic reports and measure its throughput, its latency and the memory used by its actors
+    """
+
+    def __init__(self, generator: ReportGenerator, reports: int = 10000, runtime: str = PROCESS_RUNTIME,
+                 codec: str = None, timeout: float = DEFAULT_TIMEOUT):
+        """
+        :param ReportGenerator generator: generator of the reports sent by the puller
+        :param int reports: number of reports sent by the puller
+        :param str runtime: runtime of the actors and of the formulas, process or thread
+        :param str codec: if defined, codec used to send the reports to the dispatcher and to the pusher
+        :param float timeout: maximum time (in seconds) to wait for the pusher to receive all the reports
+        """
+        self.generator = generator
+        self.reports = reports
+        self.runtime = runtime
+        self.codec = codec
+        self.timeout = timeout
+
+    def _route_table(self) -> RouteTable:
+        route_table = RouteTable()
+        if self.generator.report_type is HWPCReport:
+            route_table.dispatch_rule(HWPCReport, HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True))
+        else:
+            route_table.dispatch_rule(ProcfsReport, ProcfsDispatchRule(ProcfsDepthLevel.SENSOR, primary=True))
+        return route_table
+
+    def _fan_out(self) -> int:
+        """
+        :return: number of formulas receiving each report
+        """
+        return self.generator.sockets if self.generator.report_type is HWPCReport else 1
+
+    def _memory(self, puller, dispatcher, result_message: BenchmarkResultMessage) -> Dict[str, int]:
+        if self.runtime != PROCESS_RUNTIME:
+            # the actors run in the benchmark process and can't be told apart
+            return {'benchmark': peak_rss_kb(os.getpid())}
+        memory = {puller.name: peak_rss_kb(puller.pid), dispatcher.name: peak_rss_kb(dispatcher.pid)}
+        # the formulas are processes started by the dispatcher
+        for pid, name in child_processes(dispatcher.pid).items():
+            memory[name] = peak_rss_kb(pid)
+        memory[result_message.sender_name] = result_message.max_rss
+        return memory
+
+    def run(self) -> dict:
+        """
+        Run the benchmark in a new process started with the spawn method
+
+        :return: the configuration and the measures of the benchmark, as a json serializable dictionary
+        :raise BenchmarkTimeoutException: if the pusher didn't receive all the reports before the timeout
+        :raise BenchmarkFailureException: if the benchmark process failed
+        """
+        context = multiprocessing.get_context('spawn')
+        results = context.Queue()
+        process = context.Process(target=_run_in_process, args=(self, results), name='powerapi-bench')
+        process.start()
+        try:
+            deadline = time.monotonic() + self.timeout + PROCESS_MARGIN
+            while True:
+                try:
+                    status, value = results.get(timeout=1)
+                    break
+                except queue.Empty as exn:
+                    if time.monotonic() > deadline:
+                        raise BenchmarkTimeoutException() from exn
+                    if not process.is_alive() and results.empty():
+                        raise BenchmarkFailureException('the benchmark process died with exit code ' +
+                                                        str(process.exitcode)) from exn
+        finally:
+            process.join(PROCESS_MARGIN)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+        if status == 'timeout':
+            raise BenchmarkTimeoutException()
+        if status == 'error':
+            raise BenchmarkFailureException(value)
+        return value
+
+    def run_pipeline(self) -> dict:
+        """
+        Run the benchmark in the current process
+
+        :return: the configuration and the measures of the benchmark, as a json serializable dictionary
+        :raise BenchmarkTimeoutException: if the pusher didn't receive all the reports before the timeout
+        """
+        supervisor = Supervisor()
+        pusher = BenchPusherActor(BENCH_PUSHER_NAME, self.reports * self._fan_out())
+        dispatcher = DispatcherActor(BENCH_DISPATCHER_NAME, formula_init_function=BenchFormulaActor,
+                                     route_table=self._route_table(), pushers={BENCH_PUSHER_NAME: pusher},
+                                     formula_runtime=self.runtime)
+        report_filter = Filter()
+        report_filter.filter(lambda _: True, dispatcher)
+        puller = SimplePullerActor(BENCH_PULLER_NAME, self.reports, self.generator.report_type, report_filter,
+                                   report_generator=self.generator, trace=True)
+        actors = [pusher, dispatcher, puller]
+        for actor in actors:
+            actor.set_runtime(self.runtime)
+        if self.codec is not None:
+            pusher.set_codec(get_codec(self.codec))
+            dispatcher.set_codec(get_codec(self.codec))
+
+        try:
+            for actor in actors:
+                supervisor.launch_actor(actor)
+
+            puller.send_data(SimplePullerSendReportsMessage('system', BENCH_PULLER_NAME))
+            deadline = time.monotonic() + self.timeout
+            result_message = None
+            while result_message is None:
+                if time.monotonic() > deadline:
+                    raise BenchmarkTimeoutException()
+                msg = pusher.receive_control(1000)
+                if isinstance(msg, BenchmarkResultMessage):
+                    result_message = msg
+            memory = self._memory(puller, dispatcher, result_message)
+        finally:
+            supervisor.kill_actors()
+
+        stage_latency = {stage: _quantiles(latencies)
+                         for stage, (latencies, _, _) in result_message.stage_latency.items()}
+        return {
+            'date': datetime.now().isoformat(),
+            'powerapi_version': powerapi_version,
+            'python_version': platform.python_version(),
+            'config': {
+                'report_type': self.generator.report_type.__name__,
+                'reports': self.reports,
+                'sockets': self.generator.sockets,
+                'cores': self.generator.cores,
+                'events': len(self.generator.events),
+                'targets': len(self.generator.targets),
+                'sensors': len(self.generator.sensors),
+                'rate': self.generator.rate,
+                'runtime': self.runtime,
+                'codec': self.codec,
+            },
+            'received_reports': result_message.reports,
+            'duration_s': result_message.duration,
+            'throughput_reports_per_s': self.reports / result_message.duration if result_message.duration > 0 else None,
+            'latency_s': stage_latency.get(END_TO_END_STAGE, {}),
+            'stage_latency_s': stage_latency,
+            'peak_rss_kb': memory,
+        }
@@ -0,0 +1,120 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+import time
+from datetime import datetime
+from typing import Type
+
+from powerapi.report import Report, HWPCReport, ProcfsReport
+
+#: (list): name of the first events of the synthetic HWPC reports, the next ones are named EVENT_<index>
+HWPC_EVENTS = ['CPU_CLK_THREAD_UNHALTED:REF_P', 'CPU_CLK_THREAD_UNHALTED:THREAD_P', 'INSTRUCTIONS_RETIRED',
+               'LLC_MISSES']
+#: (str): name of the RAPL event of the synthetic HWPC reports
+RAPL_EVENT = 'RAPL_ENERGY_PKG'
+
+
+class ReportGenerator:
+    """
+    Generate synthetic HWPCReport or ProcfsReport with the shape of the reports of a real sensor
+
+    A HWPC report holds a ``rapl`` group with one RAPL counter by socket and a ``core`` group with *events* counters
+    for each of the *cores* cores of each of the *sockets* sockets. A Procfs report holds the cpu usage of *targets*
+    cgroups. The i-th report is generated by the sensor ``sensor-<i % sensors>`` and, for HWPC reports, is about the
+    target ``target-<i % targets>``. Counter values are drawn from a seeded random generator, so two generators with
+    the same parameters generate the same values.
+
+    The report timestamp is the generation time. If a rate is given, the generator waits before generating a report
+    that would be ahead of this rate.
+    """
+
+    def __init__(self, report_type: Type[Report] = HWPCReport, sockets: int = 2, cores: int = 4, events: int = 4,
+                 targets: int = 10, sensors: int = 1, rate: float = None, seed: int = 0):
+        """
+        :param Type[Report] report_type: HWPCReport or ProcfsReport
+        :param int sockets: number of sockets of the HWPC reports
+        :param int cores: number of cores by socket of the HWPC reports
+        :param int events: number of events by core of the HWPC reports
+        :param int targets: number of targets (HWPC reports) or monitored cgroups (Procfs reports)
+        :param int sensors: number of sensors generating the reports
+        :param float rate: maximum number of reports generated by second, no limit if None
+        :param int seed: seed of the counter values
+        :raise ValueError: if the report type is not handled or a parameter is not positive
+        """
+        if report_type not in (HWPCReport, ProcfsReport):
+            raise ValueError('cannot generate ' + report_type.__name__ + ', only HWPCReport and ProcfsReport are handled')
+        if min(sockets, cores, events, targets, sensors) < 1:
+            raise ValueError('sockets, cores, events, targets and sensors must be positive')
+        self.report_type = report_type
+        self.sockets = sockets
+        self.cores = cores
+        self.events = [HWPC_EVENTS[index] if index < len(HWPC_EVENTS) else 'EVENT_' + str(index)
+                       for index in range(events)]
+        self.targets = ['target-' + str(index) for index in range(targets)]
+        self.sensors = ['sensor-' + str(index) for index in range(sensors)]
+        self.rate = rate
+        self._random = random.Random(seed)
+        self._start_time = None
+
+    def _counter(self) -> int:
+        return self._random.randrange(1 << 32)
+
+    def _hwpc_groups(self) -> dict:
+        rapl_group = {}
+        core_group = {}
+        for socket in range(self.sockets):
+            first_core = socket * self.cores
+            rapl_group[str(socket)] = {str(first_core): {RAPL_EVENT: self._counter(), 'time_enabled': 1000000,
+                                                         'time_running': 1000000}}
+            core_group[str(socket)] = {
+                str(core): dict({event: self._counter() for event in self.events},
+                                time_enabled=1000000, time_running=1000000)
+                for core in range(first_core, first_core + self.cores)}
+        return {'rapl': rapl_group, 'core': core_group}
+
+    def generate(self, index: int) -> Report:
+        """
+        :return: the index-th report
+        """
+        if self.rate is not None:
+            if self._start_time is None:
+                self._start_time = time.monotonic()
+            delay = self._start_time + index / self.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        sensor = self.sensors[index % len(self.sensors)]
+        if self.report_type is ProcfsReport:
+            usage = {target: self._random.uniform(0, 100) for target in self.targets}
+            return ProcfsReport(datetime.now(), sensor, list(self.targets), usage, sum(usage.values()))
+        return HWPCReport(datetime.now(), sensor, self.targets[index % len(self.targets)], self._hwpc_groups())
+
+    def __call__(self, index: int) -> Report:
+        return self.generate(index)
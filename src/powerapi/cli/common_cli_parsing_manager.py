@@ -32,6 +32,13 @@ import sys
 from powerapi.cli.parsing_manager import RootConfigParsingManager, SubgroupConfigParsingManager
 from powerapi.cli.config_parser import store_true
 from powerapi.cli.config_parser import MissingValueException
+from powerapi.actor import BLOCK_POLICY, DEFAULT_SAMPLE_RATE
+from powerapi.database.influx_line_writer import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES
+from powerapi.database.opentsdb import DEFAULT_BULK_SIZE
+from powerapi.database.socket_db import DEFAULT_QUEUE_SIZE
+from powerapi.utils.json_stream import BRACE_FRAMING, JSON_BACKEND
+from powerapi.database.influxdb2 import SYNCHRONOUS_WRITE_MODE, DEFAULT_WRITE_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, \
+    DEFAULT_JITTER_INTERVAL
 from powerapi.database.prometheus_db import DEFAULT_METRIC_DESCRIPTION, DEFAULT_MODEL_VALUE, DEFAULT_PUSHER_NAME, \
     DEFAULT_ADDRESS
 from powerapi.exception import BadTypeException, BadContextException, UnknownArgException
@@ -43,6 +50,18 @@ POWERAPI_PRE_PROCESSOR_ENVIRONMENT_VARIABLE_PREFIX = POWERAPI_ENVIRONMENT_VARIAB
 POWERAPI_POST_PROCESSOR_ENVIRONMENT_VARIABLE_PREFIX = POWERAPI_ENVIRONMENT_VARIABLE_PREFIX + 'POST_PROCESSOR'
 
 TAGS_ARGUMENT_HELP_TEXT = 'specify report tags'
+CODEC_ARGUMENT_HELP_TEXT = 'specify the codec used to serialize the reports sent to the pusher (pickle or report)'
+BATCH_SIZE_ARGUMENT_HELP_TEXT = 'specify the maximum number of reports sent to the pusher in a single batch'
+MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT = 'if defined, write the reports in database from a background thread, with at most ' \
+                                   'this number of batches waiting to be written'
+LATENESS_ARGUMENT_HELP_TEXT = 'if defined, reorder the reports by timestamp before writing them, waiting at most this ' \
+                              'delay (ms) for late reports'
+BATCH_DELAY_ARGUMENT_HELP_TEXT = 'specify the maximum time (ms) a report can wait in a batch before being sent to the pusher'
+HWM_ARGUMENT_HELP_TEXT = 'if defined, maximum number of messages (reports or batches) waiting to be read by the pusher'
+OVERLOAD_POLICY_ARGUMENT_HELP_TEXT = 'specify what to do with a report when the pusher queue is full (only used with hwm): ' \
+                                     'block the sender, drop_oldest or sample'
+SAMPLE_RATE_ARGUMENT_HELP_TEXT = 'with the sample overload policy, only send one report out of this number when the ' \
+                                 'pusher queue is full'
 
 
 def extract_file_names(arg, val, args, acc):
@@ -99,6 +118,41 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             default_value=False,
             help_text="enable stream mode",
         )
+        self.add_argument(
+            "runtime",
+            help_text="specify how the pullers, the pushers, the dispatcher and the formulas are executed : process "
+                      "(one process per actor) or thread (threads of the process that starts them)",
+        )
+        self.add_argument(
+            "formula_codec",
+            help_text="specify the codec used to serialize the reports sent by the dispatcher to the formulas "
+                      "(pickle or report)",
+        )
+        self.add_argument(
+            "formula_batch_size",
+            help_text="specify the maximum number of reports sent by the dispatcher to a formula in a single batch",
+            argument_type=int,
+        )
+        self.add_argument(
+            "formula_batch_delay",
+            help_text="specify the maximum time (ms) a report can wait in a batch before being sent by the dispatcher "
+                      "to a formula",
+            argument_type=int,
+        )
+        self.add_argument(
+            "metrics_port",
+            help_text="if defined, expose the runtime metrics of the actors (messages, handling time, backlog) on this "
+                      "port of the local host, in the Prometheus text format",
+            argument_type=int,
+        )
+        self.add_argument(
+            "trace",
+            help_text="trace the pulled reports to measure the latency added by each stage of the pipeline, the "
+                      "latencies are logged by the pushers and exposed with the runtime metrics",
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
 
         subparser_mongo_input = SubgroupConfigParsingManager("mongodb")
         subparser_mongo_input.add_argument("u", "uri", help_text="specify MongoDB uri")
@@ -113,6 +167,19 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_mongo_input.add_argument(
             "n", "name", help_text="specify puller name", default_value="puller_mongodb"
         )
+        subparser_mongo_input.add_argument(
+            "read_batch_size",
+            help_text="specify the number of documents read at once (documents are read one by one if not defined)",
+            argument_type=int,
+        )
+        subparser_mongo_input.add_argument(
+            "change_stream",
+            help_text="read the documents from a change stream of the collection in stream mode "
+                      "(only used with read_batch_size)",
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
         subparser_mongo_input.add_argument(
             "m",
             "model",
@@ -137,6 +204,24 @@ class CommonCLIParsingManager(RootConfigParsingManager):
             help_text="specify data type that will be sent through the socket",
             default_value="HWPCReport",
         )
+        subparser_socket_input.add_argument(
+            "framing",
+            help_text="specify how the json reports are delimited: brace (by their braces) or ndjson (one report per "
+                      "line)",
+            default_value=BRACE_FRAMING,
+        )
+        subparser_socket_input.add_argument(
+            "json_backend",
+            help_text="specify the json library used to decode the reports: json or orjson (if installed)",
+            default_value=JSON_BACKEND,
+        )
+        subparser_socket_input.add_argument(
+            "queue_size",
+            help_text="specify the maximum number of received reports waiting to be read, the sensors are slowed down "
+                      "when it is reached (0 for no limit)",
+            argument_type=int,
+            default_value=DEFAULT_QUEUE_SIZE,
+        )
         self.add_subgroup_parser(
             subgroup_name="input",
             subgroup_parser=subparser_socket_input
@@ -159,6 +244,18 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_csv_input.add_argument(
             "n", "name", help_text="specify puller name", default_value="puller_csv"
         )
+        subparser_csv_input.add_argument(
+            "chunk_size",
+            help_text="read the input files by blocks of this size (in bytes) instead of line by line",
+            argument_type=int,
+        )
+        subparser_csv_input.add_argument(
+            "mmap",
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+            help_text="read the input files through a memory mapping (with --chunk_size)",
+        )
         self.add_subgroup_parser(
             subgroup_name="input",
             subgroup_parser=subparser_csv_input
@@ -191,6 +288,16 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_file_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_filedb"
         )
+        subparser_file_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_file_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_file_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_file_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_file_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                           default_value=BLOCK_POLICY)
+        subparser_file_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                           default_value=DEFAULT_SAMPLE_RATE)
+        subparser_file_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_file_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_file_output
@@ -226,6 +333,16 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_virtiofs_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_virtiofs"
         )
+        subparser_virtiofs_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_virtiofs_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_virtiofs_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_virtiofs_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_virtiofs_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                               default_value=BLOCK_POLICY)
+        subparser_virtiofs_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                               default_value=DEFAULT_SAMPLE_RATE)
+        subparser_virtiofs_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_virtiofs_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_virtiofs_output
@@ -249,6 +366,16 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_mongo_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_mongodb"
         )
+        subparser_mongo_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_mongo_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_mongo_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_mongo_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_mongo_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                            default_value=BLOCK_POLICY)
+        subparser_mongo_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                            default_value=DEFAULT_SAMPLE_RATE)
+        subparser_mongo_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_mongo_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_mongo_output
@@ -280,6 +407,29 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_prometheus_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value=DEFAULT_PUSHER_NAME
         )
+        subparser_prometheus_output.add_argument(
+            "collector",
+            help_text="store the last value of each series and build the metric only when prometheus scrapes it",
+            is_flag=True,
+            action=store_true,
+            default_value=False,
+        )
+        subparser_prometheus_output.add_argument(
+            "series_ttl",
+            help_text="specify the time (in seconds) after which a series that is not updated is removed "
+                      "(only used with collector)",
+            argument_type=int,
+        )
+        subparser_prometheus_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_prometheus_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_prometheus_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_prometheus_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_prometheus_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                                 default_value=BLOCK_POLICY)
+        subparser_prometheus_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                                 default_value=DEFAULT_SAMPLE_RATE)
+        subparser_prometheus_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_prometheus_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_prometheus_output
@@ -302,6 +452,36 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_csv_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_csv"
         )
+        subparser_csv_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_csv_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_csv_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_csv_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_csv_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                          default_value=BLOCK_POLICY)
+        subparser_csv_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                          default_value=DEFAULT_SAMPLE_RATE)
+        subparser_csv_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_csv_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_csv_output.add_argument(
+            "max_open_files",
+            help_text="specify the maximum number of output files kept open between two writes",
+            argument_type=int,
+        )
+        subparser_csv_output.add_argument(
+            "rotation_size",
+            help_text="specify the size (in bytes) from which a new segment of an output file is started",
+            argument_type=int,
+        )
+        subparser_csv_output.add_argument(
+            "rotation_interval",
+            help_text="specify the duration (in seconds) after which a new segment of an output file is started",
+            argument_type=int,
+        )
+        subparser_csv_output.add_argument(
+            "compression",
+            help_text="specify the compression algorithm of the closed segments (gzip or zstd), needs rotation_size "
+                      "or rotation_interval",
+        )
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_csv_output
@@ -325,6 +505,35 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_influx_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_influxdb"
         )
+        subparser_influx_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_influx_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                             default_value=BLOCK_POLICY)
+        subparser_influx_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                             default_value=DEFAULT_SAMPLE_RATE)
+        subparser_influx_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx_output.add_argument(
+            "line_protocol",
+            help_text="write reports in line protocol with gzipped HTTP requests instead of using the influxdb client",
+            is_flag=True,
+            action=store_true,
+            default_value=False
+        )
+        subparser_influx_output.add_argument(
+            "write_concurrency",
+            help_text="maximum number of write requests in flight (line protocol mode)",
+            argument_type=int,
+            default_value=DEFAULT_MAX_CONCURRENCY
+        )
+        subparser_influx_output.add_argument(
+            "write_retries",
+            help_text="number of times a failed write request is retried (line protocol mode)",
+            argument_type=int,
+            default_value=DEFAULT_MAX_RETRIES
+        )
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_influx_output
@@ -348,6 +557,36 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_opentsdb_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_opentsdb"
         )
+        subparser_opentsdb_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_opentsdb_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_opentsdb_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_opentsdb_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_opentsdb_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                               default_value=BLOCK_POLICY)
+        subparser_opentsdb_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                               default_value=DEFAULT_SAMPLE_RATE)
+        subparser_opentsdb_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_opentsdb_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_opentsdb_output.add_argument(
+            "http_bulk",
+            help_text="post the datapoints by chunks to the HTTP api (/api/put) instead of sending them one by one",
+            is_flag=True,
+            action=store_true,
+            default_value=False
+        )
+        subparser_opentsdb_output.add_argument(
+            "bulk_size",
+            help_text="maximum number of datapoints posted in one request (http bulk mode)",
+            argument_type=int,
+            default_value=DEFAULT_BULK_SIZE
+        )
+        subparser_opentsdb_output.add_argument(
+            "compress",
+            help_text="gzip the requests sent to the HTTP api (http bulk mode)",
+            is_flag=True,
+            action=store_true,
+            default_value=False
+        )
         self.add_subgroup_parser(
             subgroup_name="output",
             subgroup_parser=subparser_opentsdb_output
@@ -376,6 +615,59 @@ class CommonCLIParsingManager(RootConfigParsingManager):
         subparser_influx2_output.add_argument(
             "n", "name", help_text="specify pusher name", default_value="pusher_influxdb2"
         )
+        subparser_influx2_output.add_argument("codec", help_text=CODEC_ARGUMENT_HELP_TEXT)
+        subparser_influx2_output.add_argument("batch_size", help_text=BATCH_SIZE_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx2_output.add_argument("batch_delay", help_text=BATCH_DELAY_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx2_output.add_argument("hwm", help_text=HWM_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx2_output.add_argument("overload_policy", help_text=OVERLOAD_POLICY_ARGUMENT_HELP_TEXT,
+                                              default_value=BLOCK_POLICY)
+        subparser_influx2_output.add_argument("sample_rate", help_text=SAMPLE_RATE_ARGUMENT_HELP_TEXT, argument_type=int,
+                                              default_value=DEFAULT_SAMPLE_RATE)
+        subparser_influx2_output.add_argument("max_in_flight", help_text=MAX_IN_FLIGHT_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx2_output.add_argument("lateness", help_text=LATENESS_ARGUMENT_HELP_TEXT, argument_type=int)
+        subparser_influx2_output.add_argument(
+            "line_protocol",
+            help_text="write reports in line protocol with gzipped HTTP requests instead of using the influxdb client",
+            is_flag=True,
+            action=store_true,
+            default_value=False
+        )
+        subparser_influx2_output.add_argument(
+            "write_concurrency",
+            help_text="maximum number of write requests in flight (line protocol mode)",
+            argument_type=int,
+            default_value=DEFAULT_MAX_CONCURRENCY
+        )
+        subparser_influx2_output.add_argument(
+            "write_retries",
+            help_text="number of times a failed write request is retried",
+            argument_type=int,
+            default_value=DEFAULT_MAX_RETRIES
+        )
+        subparser_influx2_output.add_argument(
+            "write_mode",
+            help_text="specify how the client writes the reports: synchronous (each write waits for the server) or "
+                      "batching (reports are written from a background thread)",
+            default_value=SYNCHRONOUS_WRITE_MODE
+        )
+        subparser_influx2_output.add_argument(
+            "write_batch_size",
+            help_text="number of reports written in one request (batching mode)",
+            argument_type=int,
+            default_value=DEFAULT_WRITE_BATCH_SIZE
+        )
+        subparser_influx2_output.add_argument(
+            "flush_interval",
+            help_text="time in ms after which a non full batch is written (batching mode)",
+            argument_type=int,
+            default_value=DEFAULT_FLUSH_INTERVAL
+        )
+        subparser_influx2_output.add_argument(
+            "jitter_interval",
+            help_text="maximum random delay in ms added to each write (batching mode)",
+            argument_type=int,
+            default_value=DEFAULT_JITTER_INTERVAL
+        )
 
         self.add_subgroup_parser(
             subgroup_name="output",
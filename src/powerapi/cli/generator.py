@@ -32,8 +32,15 @@ import os
 import sys
 from typing import Dict, Type, Callable
 
-from powerapi.actor import Actor
-from powerapi.database.influxdb2 import InfluxDB2
+from powerapi.actor import Actor, get_codec, UnknownOverloadPolicyException, BLOCK_POLICY, DEFAULT_SAMPLE_RATE, \
+    get_metrics_collector
+from powerapi.database.influxdb2 import InfluxDB2, SYNCHRONOUS_WRITE_MODE, DEFAULT_WRITE_BATCH_SIZE, \
+    DEFAULT_FLUSH_INTERVAL, DEFAULT_JITTER_INTERVAL
+from powerapi.database.influx_line_writer import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES
+from powerapi.database.opentsdb import DEFAULT_BULK_SIZE
+from powerapi.database.socket_db import DEFAULT_QUEUE_SIZE
+from powerapi.utils.json_stream import BRACE_FRAMING, JSON_BACKEND
+from powerapi.database.csvdb import DEFAULT_MAX_OPEN_FILES
 from powerapi.exception import PowerAPIException, ModelNameAlreadyUsed, DatabaseNameDoesNotExist, ModelNameDoesNotExist, \
     DatabaseNameAlreadyUsed, ProcessorTypeDoesNotExist, ProcessorTypeAlreadyUsed, MonitorTypeDoesNotExist
 from powerapi.filter import Filter
@@ -42,8 +49,9 @@ from powerapi.processor.pre.k8s.k8s_pre_processor_actor import K8sPreProcessorAc
     TIMEOUT_QUERY_DEFAULT_VALUE
 from powerapi.processor.pre.libvirt.libvirt_pre_processor_actor import LibvirtPreProcessorActor
 from powerapi.report import HWPCReport, PowerReport, ControlReport, ProcfsReport, Report, FormulaReport
+from powerapi.dispatcher import DispatcherActor
 from powerapi.database import MongoDB, CsvDB, InfluxDB, OpenTSDB, SocketDB, PrometheusDB, \
-    VirtioFSDB, FileDB
+    VirtioFSDB, FileDB, PrometheusCollectorDB
 from powerapi.puller import PullerActor
 from powerapi.pusher import PusherActor
 
@@ -57,6 +65,14 @@ COMPONENT_DB_COLLECTION_KEY = 'collection'
 COMPONENT_DB_MANAGER_KEY = 'db_manager'
 COMPONENT_DB_MAX_BUFFER_SIZE_KEY = 'max_buffer_size'
 COMPONENT_URI_KEY = 'uri'
+COMPONENT_CODEC_KEY = 'codec'
+COMPONENT_BATCH_SIZE_KEY = 'batch_size'
+COMPONENT_BATCH_DELAY_KEY = 'batch_delay'
+COMPONENT_HWM_KEY = 'hwm'
+COMPONENT_OVERLOAD_POLICY_KEY = 'overload_policy'
+COMPONENT_SAMPLE_RATE_KEY = 'sample_rate'
+COMPONENT_MAX_IN_FLIGHT_KEY = 'max_in_flight'
+COMPONENT_LATENESS_KEY = 'lateness'
 
 ACTOR_NAME_KEY = 'actor_name'
 TARGET_ACTORS_KEY = 'target_actors'
@@ -73,6 +89,12 @@ LISTENER_ACTOR_KEY = 'listener_actor'
 
 GENERAL_CONF_STREAM_MODE_KEY = 'stream'
 GENERAL_CONF_VERBOSE_KEY = 'verbose'
+GENERAL_CONF_RUNTIME_KEY = 'runtime'
+GENERAL_CONF_METRICS_PORT_KEY = 'metrics_port'
+GENERAL_CONF_TRACE_KEY = 'trace'
+GENERAL_CONF_FORMULA_CODEC_KEY = 'formula_codec'
+GENERAL_CONF_FORMULA_BATCH_SIZE_KEY = 'formula_batch_size'
+GENERAL_CONF_FORMULA_BATCH_DELAY_KEY = 'formula_batch_delay'
 
 MONITOR_NAME_SUFFIX = '_monitor'
 MONITOR_KEY = 'monitor'
@@ -138,6 +160,20 @@ def gen_tag_list(db_config: dict):
     return db_config['tags'].split(',')
 
 
+def gen_prometheus_db(db_config: dict):
+    """
+    Generate a PrometheusCollectorDB if the collector mode is enabled, a PrometheusDB otherwise
+    """
+    if db_config.get('collector', False):
+        return PrometheusCollectorDB(report_type=db_config['model'], port=db_config['port'], address=db_config['uri'],
+                                     metric_name=db_config['metric_name'],
+                                     metric_description=db_config['metric_description'],
+                                     tags=gen_tag_list(db_config), series_ttl=db_config.get('series_ttl'))
+    return PrometheusDB(report_type=db_config['model'], port=db_config['port'], address=db_config['uri'],
+                        metric_name=db_config['metric_name'], metric_description=db_config['metric_description'],
+                        tags=gen_tag_list(db_config))
+
+
 class BaseGenerator(Generator):
     """
     Generate an Actor and Start message from config
@@ -180,28 +216,52 @@ class DBActorGenerator(BaseGenerator):
 
         self.db_factory = {
             'mongodb': lambda db_config: MongoDB(report_type=db_config['model'], uri=db_config['uri'],
-                                                 db_name=db_config['db'], collection_name=db_config['collection']),
-            'socket': lambda db_config: SocketDB(report_type=db_config['model'], port=db_config['port']),
+                                                 db_name=db_config['db'], collection_name=db_config['collection'],
+                                                 batch_size=db_config.get('read_batch_size'),
+                                                 change_stream=db_config.get('change_stream', False)),
+            'socket': lambda db_config: SocketDB(report_type=db_config['model'], port=db_config['port'],
+                                                 framing=db_config.get('framing', BRACE_FRAMING),
+                                                 json_backend=db_config.get('json_backend', JSON_BACKEND),
+                                                 queue_size=db_config.get('queue_size', DEFAULT_QUEUE_SIZE)),
             'csv': lambda db_config: CsvDB(report_type=db_config['model'], tags=gen_tag_list(db_config),
                                            current_path=os.getcwd() if 'directory' not in db_config else db_config[
                                                'directory'],
-                                           files=[] if 'files' not in db_config else db_config['files']),
+                                           files=[] if 'files' not in db_config else db_config['files'],
+                                           chunk_size=db_config.get('chunk_size'),
+                                           use_mmap=db_config.get('mmap', False),
+                                           max_open_files=db_config.get('max_open_files', DEFAULT_MAX_OPEN_FILES),
+                                           rotation_size=db_config.get('rotation_size'),
+                                           rotation_interval=db_config.get('rotation_interval'),
+                                           compression=db_config.get('compression')),
             'influxdb': lambda db_config: InfluxDB(report_type=db_config['model'], uri=db_config['uri'],
                                                    port=db_config['port'], db_name=db_config['db'],
-                                                   tags=gen_tag_list(db_config)),
+                                                   tags=gen_tag_list(db_config),
+                                                   line_protocol=db_config.get('line_protocol', False),
+                                                   max_concurrency=db_config.get('write_concurrency',
+                                                                                 DEFAULT_MAX_CONCURRENCY),
+                                                   max_retries=db_config.get('write_retries', DEFAULT_MAX_RETRIES)),
             'influxdb2': lambda db_config: InfluxDB2(report_type=db_config['model'], url=db_config['uri'],
                                                      org=db_config['org'],
                                                      bucket_name=db_config['db'], token=db_config['token'],
                                                      tags=gen_tag_list(db_config),
-                                                     port=None if 'port' not in db_config else db_config['port']),
+                                                     port=None if 'port' not in db_config else db_config['port'],
+                                                     line_protocol=db_config.get('line_protocol', False),
+                                                     max_concurrency=db_config.get('write_concurrency',
+                                                                                   DEFAULT_MAX_CONCURRENCY),
+                                                     max_retries=db_config.get('write_retries', DEFAULT_MAX_RETRIES),
+                                                     write_mode=db_config.get('write_mode', SYNCHRONOUS_WRITE_MODE),
+                                                     write_batch_size=db_config.get('write_batch_size',
+                                                                                    DEFAULT_WRITE_BATCH_SIZE),
+                                                     flush_interval=db_config.get('flush_interval',
+                                                                                  DEFAULT_FLUSH_INTERVAL),
+                                                     jitter_interval=db_config.get('jitter_interval',
+                                                                                   DEFAULT_JITTER_INTERVAL)),
             'opentsdb': lambda db_config: OpenTSDB(report_type=db_config['model'], host=db_config['uri'],
-                                                   port=db_config['port'], metric_name=db_config['metric_name']),
-            'prometheus': lambda db_config: PrometheusDB(report_type=db_config['model'],
-                                                         port=db_config['port'],
-                                                         address=db_config['uri'],
-                                                         metric_name=db_config['metric_name'],
-                                                         metric_description=db_config['metric_description'],
-                                                         tags=gen_tag_list(db_config)),
+                                                   port=db_config['port'], metric_name=db_config['metric_name'],
+                                                   http_bulk=db_config.get('http_bulk', False),
+                                                   bulk_size=db_config.get('bulk_size', DEFAULT_BULK_SIZE),
+                                                   compress=db_config.get('compress', False)),
+            'prometheus': gen_prometheus_db,
             'virtiofs': lambda db_config: VirtioFSDB(report_type=db_config['model'],
                                                      vm_name_regexp=db_config['vm_name_regexp'],
                                                      root_directory_name=db_config['root_directory_name'],
@@ -257,6 +317,31 @@ class DBActorGenerator(BaseGenerator):
         component_config[COMPONENT_DB_MANAGER_KEY] = database_manager
 
         actor = self._actor_factory(actor_name, main_config, component_config)
+        if main_config.get(GENERAL_CONF_RUNTIME_KEY) is not None:
+            actor.set_runtime(main_config[GENERAL_CONF_RUNTIME_KEY])
+        if main_config.get(GENERAL_CONF_METRICS_PORT_KEY) is not None:
+            metrics_collector = get_metrics_collector()
+            metrics_collector.start(main_config[GENERAL_CONF_METRICS_PORT_KEY])
+            actor.enable_metrics(metrics_collector.queue)
+        if component_config.get(COMPONENT_CODEC_KEY) is not None:
+            actor.set_codec(get_codec(component_config[COMPONENT_CODEC_KEY]))
+        if component_config.get(COMPONENT_BATCH_SIZE_KEY) is not None:
+            batch_delay = component_config.get(COMPONENT_BATCH_DELAY_KEY)
+            actor.set_batching(component_config[COMPONENT_BATCH_SIZE_KEY],
+                               actor.socket_interface.batch_delay if batch_delay is None else batch_delay)
+        if component_config.get(COMPONENT_HWM_KEY) is not None:
+            try:
+                actor.set_overload_policy(component_config[COMPONENT_HWM_KEY],
+                                          component_config.get(COMPONENT_OVERLOAD_POLICY_KEY, BLOCK_POLICY),
+                                          component_config.get(COMPONENT_SAMPLE_RATE_KEY, DEFAULT_SAMPLE_RATE))
+            except UnknownOverloadPolicyException as exn:
+                msg = 'Configuration error : overload policy ' + str(exn.policy) + ' unknown'
+                print(msg, file=sys.stderr)
+                raise PowerAPIException(msg) from exn
+            except ValueError as exn:
+                msg = 'Configuration error : ' + str(exn)
+                print(msg, file=sys.stderr)
+                raise PowerAPIException(msg) from exn
         return actor
 
 
@@ -273,7 +358,8 @@ class PullerGenerator(DBActorGenerator):
         return PullerActor(name=actor_name, database=component_config[COMPONENT_DB_MANAGER_KEY],
                            report_filter=self.report_filter, stream_mode=main_config[GENERAL_CONF_STREAM_MODE_KEY],
                            report_model=component_config[COMPONENT_MODEL_KEY],
-                           level_logger=logging.DEBUG if main_config[GENERAL_CONF_VERBOSE_KEY] else logging.INFO)
+                           level_logger=logging.DEBUG if main_config[GENERAL_CONF_VERBOSE_KEY] else logging.INFO,
+                           trace=main_config.get(GENERAL_CONF_TRACE_KEY, False))
 
 
 COMPONENT_NUMBER_OF_REPORTS_TO_SEND_KEY = 'number_of_reports_to_send'
@@ -313,11 +399,15 @@ class PusherGenerator(DBActorGenerator):
         if 'max_buffer_size' in component_config.keys():
             return PusherActor(name=actor_name, report_model=component_config[COMPONENT_MODEL_KEY],
                                database=component_config[COMPONENT_DB_MANAGER_KEY],
-                               max_size=component_config[COMPONENT_DB_MAX_BUFFER_SIZE_KEY])
+                               max_size=component_config[COMPONENT_DB_MAX_BUFFER_SIZE_KEY],
+                               max_in_flight=component_config.get(COMPONENT_MAX_IN_FLIGHT_KEY),
+                               lateness=component_config.get(COMPONENT_LATENESS_KEY))
 
         return PusherActor(name=actor_name, report_model=component_config[COMPONENT_MODEL_KEY],
                            database=component_config[COMPONENT_DB_MANAGER_KEY],
-                           level_logger=logging.DEBUG if main_config[GENERAL_CONF_VERBOSE_KEY] else logging.INFO)
+                           level_logger=logging.DEBUG if main_config[GENERAL_CONF_VERBOSE_KEY] else logging.INFO,
+                           max_in_flight=component_config.get(COMPONENT_MAX_IN_FLIGHT_KEY),
+                           lateness=component_config.get(COMPONENT_LATENESS_KEY))
 
 
 class SimplePusherGenerator(BaseGenerator):
@@ -471,3 +561,25 @@ class MonitorGenerator(Generator):
                     LISTENER_ACTOR_KEY: processor}
 
         return self.generate(main_config=monitors_config)
+
+
+def configure_dispatcher(dispatcher: DispatcherActor, main_config: dict):
+    """
+    Apply the options of the configuration about the dispatcher and the formulas to a dispatcher created by a formula
+
+    Must be called before starting the dispatcher
+
+    :param DispatcherActor dispatcher: the dispatcher to configure
+    :param dict main_config: the configuration
+    """
+    if main_config.get(GENERAL_CONF_RUNTIME_KEY) is not None:
+        dispatcher.set_runtime(main_config[GENERAL_CONF_RUNTIME_KEY])
+        dispatcher.formula_runtime = main_config[GENERAL_CONF_RUNTIME_KEY]
+    if main_config.get(GENERAL_CONF_FORMULA_CODEC_KEY) is not None:
+        dispatcher.set_formula_codec(get_codec(main_config[GENERAL_CONF_FORMULA_CODEC_KEY]))
+    if main_config.get(GENERAL_CONF_FORMULA_BATCH_SIZE_KEY) is not None:
+        if main_config.get(GENERAL_CONF_FORMULA_BATCH_DELAY_KEY) is None:
+            dispatcher.set_formula_batching(main_config[GENERAL_CONF_FORMULA_BATCH_SIZE_KEY])
+        else:
+            dispatcher.set_formula_batching(main_config[GENERAL_CONF_FORMULA_BATCH_SIZE_KEY],
+                                            main_config[GENERAL_CONF_FORMULA_BATCH_DELAY_KEY])
@@ -28,12 +28,14 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from powerapi.database.base_db import BaseDB, IterDB, DBError
 from powerapi.database.csvdb import CsvDB, CsvBadFilePathError
-from powerapi.database.csvdb import CsvBadCommonKeysError, HeaderAreNotTheSameError
+from powerapi.database.csvdb import CsvBadCommonKeysError, HeaderAreNotTheSameError, CsvCompressionError
 from powerapi.database.mongodb import MongoDB, MongoBadDBError
-from powerapi.database.opentsdb import OpenTSDB, CantConnectToOpenTSDBException
+from powerapi.database.opentsdb import OpenTSDB, CantConnectToOpenTSDBException, OpenTSDBWriteError
 from powerapi.database.influxdb import InfluxDB, CantConnectToInfluxDBException
-from powerapi.database.influxdb2 import InfluxDB2
-from powerapi.database.prometheus_db import PrometheusDB
+from powerapi.database.influxdb2 import InfluxDB2, InfluxWriteModeError
+from powerapi.database.influx_line_writer import InfluxLineWriter, InfluxWriteError
+from powerapi.database.prometheus_db import PrometheusDB, PrometheusCollectorDB
 from powerapi.database.virtiofs_db import VirtioFSDB
-from powerapi.database.socket_db import SocketDB
+from powerapi.database.socket_db import SocketDB, SocketConnectionStats
+from powerapi.database.binary_protocol import BinaryProtocolError, encode_hwpc_frame, BINARY_PROTOCOL_HEADER
 from powerapi.database.file_db import FileDB
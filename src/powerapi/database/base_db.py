@@ -26,6 +26,7 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import logging
 from typing import List, Type
 from powerapi.report import Report
 from powerapi.exception import PowerAPIExceptionWithMessage
@@ -77,6 +78,9 @@ class BaseDB:
         self.asynchrone = False
         self.exceptions = []
         self.report_type = report_type
+        #: (logging.Logger): logger used to report the errors that happen outside of the calls to the database
+        #: methods (ex: asynchronous writes), replaced by the logger of the actor that use the database
+        self.logger = logging.getLogger()
 
     def connect(self):
         """
@@ -109,3 +113,10 @@ class BaseDB:
         :param reports: Batch of Serialized Report
         """
         raise NotImplementedError()
+
+    def close(self):
+        """
+        Write the pending data and release the resources (files, connections) used by the database
+
+        Do nothing by default
+        """
@@ -0,0 +1,304 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Length-prefixed binary protocol used by the sensors to send HWPC reports to a SocketDB
+
+A binary connection starts with a header (the BINARY_PROTOCOL_MAGIC bytes then the version byte), that tells the
+SocketDB to not read the connection as a json stream. The header is followed by frames, each frame is an unsigned
+32 bits length followed by a payload holding a batch of reports. All integers are in network byte order.
+
+The reports of a frame are grouped in blocks of consecutive reports that share the same sensor, metadata and group
+layout (groups, events, sockets and cpus). The layout is sent once per block, then each report is a fixed size
+record, so a whole block is decoded with a single struct call.
+
+Payload (version 1)::
+
+    u16 block count, then for each block:
+      str sensor
+      u16 metadata count, then for each metadata: str key, str value
+      u16 target count, then the target names (str)
+      u16 group count, then for each group:
+        str group name
+        u8 value type (0: i64, 1: f64)
+        u16 event count, then the event names (str)
+        u16 socket count, then for each socket: u16 socket id, u16 cpu count, then the cpu ids (u16)
+      u32 report count, then for each report:
+        i64 timestamp (ms since epoch)
+        u16 target index in the target names
+        the values of each cpu of each group, in the layout order, one value per event
+
+    str: u16 length followed by the utf-8 encoded string
+"""
+
+import struct
+from datetime import datetime
+from typing import List
+
+from powerapi.report import HWPCReport
+from .base_db import DBError
+
+BINARY_PROTOCOL_MAGIC = b'PAPI'
+BINARY_PROTOCOL_VERSION = 1
+BINARY_PROTOCOL_HEADER = BINARY_PROTOCOL_MAGIC + bytes((BINARY_PROTOCOL_VERSION,))
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+INT_VALUES = 0
+FLOAT_VALUES = 1
+_VALUES_FORMATS = {INT_VALUES: 'q', FLOAT_VALUES: 'd'}
+
+_U16 = struct.Struct('!H')
+_U32 = struct.Struct('!I')
+
+
+class BinaryProtocolError(DBError):
+    """
+    Exception raised when a binary connection sends data that doesn't follow the protocol
+    """
+
+
+def _encode_str(value) -> bytes:
+    encoded = str(value).encode()
+    return _U16.pack(len(encoded)) + encoded
+
+
+def _report_layout(report: HWPCReport) -> tuple:
+    """
+    :return: the layout of the groups of a report: a tuple of (group name, value type, events, sockets) where sockets
+             is a tuple of (socket id, cpu ids)
+    :raise ValueError: if the cpus of a group don't hold the same events
+    """
+    layout = []
+    for name, sockets in report.groups.items():
+        cpus_values = [cpu_values for cpus in sockets.values() for cpu_values in cpus.values()]
+        events = tuple(cpus_values[0]) if cpus_values else ()
+        if any(tuple(cpu_values) != events for cpu_values in cpus_values):
+            raise ValueError('all the cpus of group ' + name + ' must hold the same events')
+        value_type = INT_VALUES
+        if any(type(value) is not int for cpu_values in cpus_values for value in cpu_values.values()):
+            value_type = FLOAT_VALUES
+        layout.append((name, value_type, events, tuple((socket_id, tuple(cpus)) for socket_id, cpus in sockets.items())))
+    return tuple(layout)
+
+
+def _record_struct(layout: tuple) -> struct.Struct:
+    value_formats = ''.join(_VALUES_FORMATS[value_type] * (len(events) * sum(len(cpus) for _, cpus in sockets))
+                            for _, value_type, events, sockets in layout)
+    return struct.Struct('!qH' + value_formats)
+
+
+def _encode_block(sensor: str, metadata: dict, layout: tuple, reports: List[HWPCReport]) -> bytes:
+    targets = list(dict.fromkeys(report.target for report in reports))
+    target_indexes = {target: index for index, target in enumerate(targets)}
+    chunks = [_encode_str(sensor), _U16.pack(len(metadata))]
+    chunks.extend(_encode_str(key) + _encode_str(value) for key, value in metadata.items())
+    chunks.append(_U16.pack(len(targets)))
+    chunks.extend(_encode_str(target) for target in targets)
+    chunks.append(_U16.pack(len(layout)))
+    for name, value_type, events, sockets in layout:
+        chunks.append(_encode_str(name) + bytes((value_type,)) + _U16.pack(len(events)))
+        chunks.extend(_encode_str(event) for event in events)
+        chunks.append(_U16.pack(len(sockets)))
+        for socket_id, cpus in sockets:
+            chunks.append(struct.pack('!HH' + 'H' * len(cpus), int(socket_id), len(cpus), *map(int, cpus)))
+
+    record_struct = _record_struct(layout)
+    chunks.append(_U32.pack(len(reports)))
+    for report in reports:
+        values = [value for sockets in report.groups.values() for cpus in sockets.values()
+                  for cpu_values in cpus.values() for value in cpu_values.values()]
+        chunks.append(record_struct.pack(round(report.timestamp.timestamp() * 1000), target_indexes[report.target],
+                                         *values))
+    return b''.join(chunks)
+
+
+def encode_hwpc_frame(reports: List[HWPCReport]) -> bytes:
+    """
+    Encode a batch of HWPC reports into a frame (with its length prefix)
+
+    :raise ValueError: if a report can't be encoded (socket or cpu ids that are not integers, cpus of a group that
+                       don't hold the same events)
+    :raise struct.error: if a value doesn't fit in 64 bits
+    """
+    blocks = []
+    for report in reports:
+        metadata = report._metadata  # pylint: disable=protected-access
+        key = (report.sensor, tuple(metadata.items()), _report_layout(report))
+        if blocks and blocks[-1][0] == key:
+            blocks[-1][1].append(report)
+        else:
+            blocks.append((key, [report]))
+    payload = _U16.pack(len(blocks)) + b''.join(_encode_block(sensor, dict(metadata), layout, block_reports)
+                                                for (sensor, metadata, layout), block_reports in blocks)
+    return _U32.pack(len(payload)) + payload
+
+
+class _FrameReader:
+    """
+    Read the fields of a frame payload
+    """
+
+    def __init__(self, buffer: bytes):
+        self.buffer = buffer
+        self.offset = 0
+
+    def unpack(self, struct_format: struct.Struct) -> tuple:
+        values = struct_format.unpack_from(self.buffer, self.offset)
+        self.offset += struct_format.size
+        return values
+
+    def u16(self) -> int:
+        value, = _U16.unpack_from(self.buffer, self.offset)
+        self.offset += 2
+        return value
+
+    def str(self) -> str:
+        length = self.u16()
+        end = self.offset + length
+        if end > len(self.buffer):
+            raise struct.error('string out of the frame')
+        value = self.buffer[self.offset:end].decode()
+        self.offset = end
+        return value
+
+    def strs(self) -> List[str]:
+        return [self.str() for _ in range(self.u16())]
+
+
+def _decode_block(reader: _FrameReader) -> List[HWPCReport]:
+    sensor = reader.str()
+    metadata = {}
+    for _ in range(reader.u16()):
+        key = reader.str()
+        metadata[key] = reader.str()
+    targets = reader.strs()
+
+    # layout of the groups: (group name, events, [(socket key, [(cpu key, first value, last value)])])
+    layout = []
+    formats = ['!qH']
+    position = 2
+    for _ in range(reader.u16()):
+        name = reader.str()
+        value_type, = reader.unpack(struct.Struct('!B'))
+        if value_type not in _VALUES_FORMATS:
+            raise struct.error('unknown value type ' + str(value_type))
+        events = tuple(reader.strs())
+        group_start = position
+        sockets = []
+        for _ in range(reader.u16()):
+            socket_id, cpu_count = reader.unpack(struct.Struct('!HH'))
+            cpus = []
+            for cpu_id in reader.unpack(struct.Struct('!' + 'H' * cpu_count)):
+                cpus.append((str(cpu_id), position, position + len(events)))
+                position += len(events)
+            sockets.append((str(socket_id), cpus))
+        formats.append(_VALUES_FORMATS[value_type] * (position - group_start))
+        layout.append((name, events, sockets))
+    record_struct = struct.Struct(''.join(formats))
+
+    report_count, = reader.unpack(_U32)
+    end = reader.offset + report_count * record_struct.size
+    if end > len(reader.buffer):
+        raise struct.error('reports out of the frame')
+    reports = []
+    for record in record_struct.iter_unpack(memoryview(reader.buffer)[reader.offset:end]):
+        groups = {name: {socket_key: {cpu_key: dict(zip(events, record[first:last])) for cpu_key, first, last in cpus}
+                         for socket_key, cpus in sockets}
+                  for name, events, sockets in layout}
+        reports.append(HWPCReport(datetime.fromtimestamp(record[0] / 1000), sensor, targets[record[1]], groups,
+                                  metadata))
+    reader.offset = end
+    return reports
+
+
+def decode_hwpc_frame(payload: bytes) -> List[HWPCReport]:
+    """
+    Decode the payload of a frame (without its length prefix)
+
+    :raise BinaryProtocolError: if the payload is malformed
+    """
+    reader = _FrameReader(payload)
+    reports = []
+    try:
+        for _ in range(reader.u16()):
+            reports.extend(_decode_block(reader))
+        if reader.offset != len(payload):
+            raise struct.error('unexpected bytes at the end of the frame')
+    except (struct.error, UnicodeDecodeError, IndexError) as exn:
+        raise BinaryProtocolError('malformed frame: ' + str(exn)) from exn
+    return reports
+
+
+class BinaryStreamDecoder:
+    """
+    Incremental decoder of a binary connection, starting with the protocol header
+
+    The received data is appended to a buffer read from an offset, the bytes already read are dropped from the buffer
+    once they are more than the unread ones, so that each byte is moved a bounded number of times
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offset = 0
+        self._header_read = False
+
+    def feed(self, data: bytes) -> List[HWPCReport]:
+        """
+        Add data received from the connection
+
+        :return: the reports of the frames completed by the data
+        :raise BinaryProtocolError: if the header or a frame is invalid
+        """
+        buffer = self._buffer
+        buffer += data
+        if not self._header_read:
+            if len(buffer) < len(BINARY_PROTOCOL_HEADER):
+                return []
+            if buffer[:len(BINARY_PROTOCOL_HEADER)] != BINARY_PROTOCOL_HEADER:
+                raise BinaryProtocolError('unsupported binary protocol header ' + repr(bytes(buffer[:5])))
+            self._header_read = True
+            self._offset = len(BINARY_PROTOCOL_HEADER)
+
+        reports = []
+        position = self._offset
+        while len(buffer) - position >= 4:
+            length, = _U32.unpack_from(buffer, position)
+            if length > MAX_FRAME_SIZE:
+                raise BinaryProtocolError('frame of ' + str(length) + ' bytes exceeds the maximum frame size')
+            end = position + 4 + length
+            if end > len(buffer):
+                break
+            reports.extend(decode_hwpc_frame(buffer[position + 4:end]))
+            position = end
+
+        if position > len(buffer) - position:
+            del buffer[:position]
+            position = 0
+        self._offset = position
+        return reports
@@ -27,10 +27,25 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import csv
+import gzip
+import heapq
+import logging
+import mmap
 import os
-
-from typing import List, Type
+import shutil
+from collections import deque, OrderedDict
+from datetime import datetime
+
+from typing import List, Tuple, Type
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+    logging.getLogger().info("zstandard is not installed.")
+
+from powerapi.report import HWPCReport, BadInputData
 from powerapi.report.report import Report, CSV_HEADER_COMMON
+from powerapi.report.hwpc_report import CSV_HEADER_HWPC, SOCKET_KEY, CPU_KEY
 from powerapi.database.base_db import BaseDB, IterDB
 from powerapi.exception import PowerAPIException
 from powerapi.utils import utils
@@ -38,6 +53,24 @@ from powerapi.utils import utils
 # Array of field that will not be considered as a group
 COMMON_ROW = ['timestamp', 'sensor', 'target', 'socket', 'cpu']
 
+#: (int): Default size (in bytes) of the blocks read by the chunked reader
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+#: (int): Default number of reports built at once by the chunked reader
+DEFAULT_REPORT_BATCH_SIZE = 1024
+
+#: (int): Default maximum number of files kept open by the CsvDB writer
+DEFAULT_MAX_OPEN_FILES = 128
+
+#: (dict): Extension added to the name of the compressed segments, by compression algorithm
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+#: (str): Suffix of the index file of the segments of a rotated csv file
+SEGMENT_INDEX_SUFFIX = '.index.csv'
+
+#: (list): Columns of the segment index files
+SEGMENT_INDEX_HEADER = ['segment', 'first_timestamp', 'last_timestamp']
+
 
 class CsvBadFilePathError(PowerAPIException):
     """
@@ -57,6 +90,68 @@ class HeaderAreNotTheSameError(PowerAPIException):
     """
 
 
+class CsvCompressionError(PowerAPIException):
+    """
+    Error raised when a compression algorithm is unknown or not installed
+    """
+
+
+def _check_compression(compression: str):
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise CsvCompressionError('unknown compression algorithm ' + str(compression))
+    if compression == 'zstd' and zstandard is None:
+        raise CsvCompressionError('zstandard is not installed')
+
+
+def open_csv_file(filename: str, binary: bool = False):
+    """
+    Open a csv file for reading, compressed segments are decompressed on the fly
+
+    :param str filename: path to the file
+    :param bool binary: open the file in binary mode instead of text mode
+    """
+    mode = 'rb' if binary else 'rt'
+    if filename.endswith(COMPRESSION_EXTENSIONS['gzip']):
+        return gzip.open(filename, mode)
+    if filename.endswith(COMPRESSION_EXTENSIONS['zstd']):
+        _check_compression('zstd')
+        return zstandard.open(filename, mode)
+    return open(filename, mode)
+
+
+def compress_file(filename: str, compression: str) -> str:
+    """
+    Compress a file and remove it
+
+    :param str filename: path to the file
+    :param str compression: compression algorithm (gzip or zstd)
+    :return: path to the compressed file
+    """
+    _check_compression(compression)
+    compressed_filename = filename + COMPRESSION_EXTENSIONS[compression]
+    compressed_open = gzip.open if compression == 'gzip' else zstandard.open
+    with open(filename, 'rb') as source, compressed_open(compressed_filename, 'wb') as destination:
+        shutil.copyfileobj(source, destination, DEFAULT_CHUNK_SIZE)
+    os.remove(filename)
+    return compressed_filename
+
+
+def read_segment_index(filename: str) -> List[Tuple[str, int, int]]:
+    """
+    Read the index of the segments of a rotated csv file
+
+    :param str filename: path to the rotated csv file (not to its index)
+    :return: path, first and last timestamp (in milliseconds) of each segment, from the oldest to the newest
+    """
+    directory = os.path.dirname(filename)
+    try:
+        with open(filename[:-len('.csv')] + SEGMENT_INDEX_SUFFIX) as index_file:
+            return [(os.path.join(directory, row['segment']), int(row['first_timestamp']),
+                     int(row['last_timestamp'])) for row in csv.DictReader(index_file)]
+    except FileNotFoundError:
+        return []
+
+
 class CsvIterDB(IterDB):
     """
     IterDB class
@@ -90,7 +185,7 @@ class CsvIterDB(IterDB):
         # Open all files with csv and read first line
         for filename in self.filenames:
             try:
-                self.tmp_read[filename]['file'] = open(filename)
+                self.tmp_read[filename]['file'] = open_csv_file(filename)
                 self.tmp_read[filename]['reader'] = csv.DictReader(self.tmp_read[filename]['file'])
             except FileNotFoundError as error:
                 raise CsvBadFilePathError(error) from error
@@ -185,6 +280,538 @@ class CsvIterDB(IterDB):
         return report
 
 
+def _parse_timestamp(value: str):
+    """
+    Convert a timestamp read in a csv file (millisecond timestamp or date string) to a datetime
+    """
+    try:
+        return utils.timestamp_to_datetime(int(value))
+    except ValueError:
+        return Report._extract_timestamp(value)
+
+
+def _timestamp_order(value: str):
+    """
+    Return a value that can be compared to order the timestamps read in csv files
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return utils.datetime_to_timestamp(Report._extract_timestamp(value))
+
+
+class CsvChunkReader:
+    """
+    Read a csv file by blocks of lines
+
+    The file is read in blocks of *chunk_size* bytes (or through a memory mapping of the file) and each block is
+    parsed at once. Rows are returned as lists of values, in the order of the :attr:`header` columns. Fields can't
+    contain line breaks.
+    """
+
+    def __init__(self, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False):
+        """
+        :param str filename: path to the csv file
+        :param int chunk_size: size (in bytes) of the blocks read from the file
+        :param bool use_mmap: read the file through a memory mapping instead of read calls (compressed files are
+                              always read with read calls)
+        :raise CsvBadFilePathError: if the file doesn't exist
+        :raise CsvBadCommonKeysError: if the file header doesn't contain the common csv columns
+        """
+        self.filename = filename
+        self.chunk_size = chunk_size
+
+        #: (str): name of the file, without its directory
+        self.basename = filename.split('/')[-1]
+
+        try:
+            self._file = open_csv_file(filename, binary=True)
+        except FileNotFoundError as error:
+            raise CsvBadFilePathError(error) from error
+
+        self._mmap = None
+        compressed = filename.endswith(tuple(COMPRESSION_EXTENSIONS.values()))
+        if use_mmap and not compressed and os.fstat(self._file.fileno()).st_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._position = 0
+        self._remainder = b''
+
+        header_line = self._readline()
+        self.header = next(csv.reader([header_line])) if header_line else []
+        for key in CSV_HEADER_COMMON:
+            if key not in self.header:
+                self.close()
+                raise CsvBadCommonKeysError("Wrong columns keys")
+
+        #: (int): index of the timestamp column
+        self.timestamp_index = self.header.index('timestamp')
+        #: (int): index of the target column
+        self.target_index = self.header.index('target')
+
+    def _read_block(self) -> bytes:
+        if self._mmap is not None:
+            block = self._mmap[self._position:self._position + self.chunk_size]
+        else:
+            block = self._file.read(self.chunk_size)
+        self._position += len(block)
+        return block
+
+    def _readline(self) -> str:
+        while b'\n' not in self._remainder:
+            block = self._read_block()
+            if not block:
+                break
+            self._remainder += block
+        line, _, self._remainder = self._remainder.partition(b'\n')
+        return line.decode()
+
+    def read_rows(self):
+        """
+        Read the next block of the file
+
+        :return: the rows of the block (empty if the block only holds blank lines), or None if the end of the file
+                 is reached
+        """
+        while True:
+            block = self._read_block()
+            if not block:
+                if not self._remainder:
+                    return None
+                lines, self._remainder = self._remainder, b''
+            else:
+                end = block.rfind(b'\n')
+                if end == -1:
+                    self._remainder += block
+                    continue
+                lines = self._remainder + block[:end]
+                self._remainder = block[end + 1:]
+            return [row for row in csv.reader(lines.decode().splitlines()) if row]
+
+    def row_groups(self):
+        """
+        Generator of the groups of consecutive rows that share the same timestamp and target
+
+        :return: tuples (timestamp order, timestamp, target, rows)
+        """
+        timestamp_index = self.timestamp_index
+        target_index = self.target_index
+        current_key = None
+        current_rows = []
+        while True:
+            rows = self.read_rows()
+            if rows is None:
+                break
+            for row in rows:
+                key = (row[timestamp_index], row[target_index])
+                if key != current_key:
+                    if current_rows:
+                        yield _timestamp_order(current_key[0]), current_key[0], current_key[1], current_rows
+                    current_key = key
+                    current_rows = []
+                current_rows.append(row)
+        if current_rows:
+            yield _timestamp_order(current_key[0]), current_key[0], current_key[1], current_rows
+
+    def close(self):
+        """
+        Close the file
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+
+class CsvChunkIterDB(IterDB):
+    """
+    IterDB that read csv files by blocks
+
+    Each file is read with a :class:`CsvChunkReader`. The files are merged by timestamp with a k-way merge and the
+    rows of all files that share the same timestamp and target are gathered in the same report. As with
+    :class:`CsvIterDB`, a report is only created if the first file contains rows for its timestamp and target.
+
+    Reports are built by batches of *report_batch_size* reports. HWPCReport are built directly from the parsed rows,
+    other report types are built with their *from_csv_lines* method.
+    """
+
+    def __init__(self, db, filenames, report_type, stream_mode, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 use_mmap: bool = False, report_batch_size: int = DEFAULT_REPORT_BATCH_SIZE):
+        """
+        :param int chunk_size: size (in bytes) of the blocks read from the files
+        :param bool use_mmap: read the files through a memory mapping
+        :param int report_batch_size: number of reports built at once
+        """
+        super().__init__(db, report_type, stream_mode)
+
+        self.filenames = filenames
+        self.report_batch_size = report_batch_size
+
+        self.readers = []
+        try:
+            for filename in filenames:
+                self.readers.append(CsvChunkReader(filename, chunk_size, use_mmap))
+        except (CsvBadFilePathError, CsvBadCommonKeysError):
+            self._close_file()
+            raise
+
+        self._row_groups = heapq.merge(*[self._tag_row_groups(index, reader)
+                                         for index, reader in enumerate(self.readers)])
+        self._pending = None
+        self._reports = deque()
+        self._hwpc_layouts = {}
+
+    @staticmethod
+    def _tag_row_groups(index, reader):
+        for timestamp_order, timestamp, target, rows in reader.row_groups():
+            # the file index is the second element so that, for a same timestamp, the first file come first and
+            # the rows are never compared
+            yield timestamp_order, index, timestamp, target, rows
+
+    def __iter__(self):
+        return self
+
+    def _close_file(self):
+        for reader in self.readers:
+            reader.close()
+
+    def _next_timestamp(self):
+        """
+        :return: the row groups of the next timestamp, gathered by target ({target: [(file index, rows)]}), or None
+                 if all the files were read
+        """
+        if self._pending is None:
+            self._pending = next(self._row_groups, None)
+            if self._pending is None:
+                return None
+
+        timestamp_order = self._pending[0]
+        targets = {}
+        while self._pending is not None and self._pending[0] == timestamp_order:
+            _, index, timestamp, target, rows = self._pending
+            targets.setdefault(target, []).append((index, timestamp, rows))
+            self._pending = next(self._row_groups, None)
+        return targets
+
+    def _hwpc_layout(self, index):
+        """
+        :return: the group name and the index of the sensor, socket, cpu and event columns of the given file
+        """
+        layout = self._hwpc_layouts.get(index)
+        if layout is None:
+            reader = self.readers[index]
+            for key in (SOCKET_KEY, CPU_KEY):
+                if key not in reader.header:
+                    raise BadInputData('missing field ' + key + ' in csv file ' + reader.basename, reader.header)
+            group_name = reader.basename[:-4] if reader.basename.endswith('.csv') else reader.basename
+            events = [(i, name) for i, name in enumerate(reader.header) if name not in CSV_HEADER_HWPC]
+            layout = (group_name, reader.header.index('sensor'), reader.header.index(SOCKET_KEY),
+                      reader.header.index(CPU_KEY), events)
+            self._hwpc_layouts[index] = layout
+        return layout
+
+    def _build_hwpc_report(self, row_groups) -> HWPCReport:
+        groups = {}
+        _, timestamp, first_rows = row_groups[0]
+        sensor = None
+        for index, _, rows in row_groups:
+            group_name, sensor_index, socket_index, cpu_index, events = self._hwpc_layout(index)
+            if sensor is None:
+                sensor = rows[0][sensor_index]
+
+            group = groups.setdefault(group_name, {})
+            for row in rows:
+                if row[sensor_index] != sensor:
+                    raise BadInputData('csv line with different sensor name are mixed into one report', row)
+                try:
+                    group.setdefault(row[socket_index], {})[row[cpu_index]] = {name: int(row[i]) for i, name in events}
+                except ValueError as exn:
+                    raise BadInputData(exn.args[0], row) from exn
+
+        try:
+            report_timestamp = _parse_timestamp(timestamp)
+        except ValueError as exn:
+            raise BadInputData(exn.args[0], first_rows[0]) from exn
+        return HWPCReport(report_timestamp, sensor, first_rows[0][self.readers[0].target_index], groups)
+
+    def _build_report(self, row_groups) -> Report:
+        if self.report_type is HWPCReport:
+            return self._build_hwpc_report(row_groups)
+
+        lines = []
+        for index, _, rows in row_groups:
+            reader = self.readers[index]
+            lines.extend((reader.basename, dict(zip(reader.header, row))) for row in rows)
+        return self.report_type.from_csv_lines(lines)
+
+    def next_batch(self) -> List[Report]:
+        """
+        Build the next reports
+
+        :return: a list of at most *report_batch_size* reports, empty if all the files were read
+        """
+        reports = []
+        while len(reports) < self.report_batch_size:
+            targets = self._next_timestamp()
+            if targets is None:
+                break
+            for row_groups in targets.values():
+                # only the timestamps and targets present in the first file give a report
+                if row_groups[0][0] == 0:
+                    reports.append(self._build_report(row_groups))
+        return reports
+
+    def __next__(self) -> Report:
+        """
+        Allow to get the next data
+        """
+        if not self._reports:
+            self._reports.extend(self.next_batch())
+            if not self._reports:
+                self._close_file()
+                raise StopIteration()
+        return self._reports.popleft()
+
+
+class CsvSegmentIterDB(IterDB):
+    """
+    Browse the segments of a rotated csv file, from the oldest to the current one
+
+    Only the segments whose time range overlaps [begin, end] are read
+    """
+
+    def __init__(self, db, filename: str, report_type, stream_mode, begin: datetime = None, end: datetime = None):
+        """
+        :param str filename: path to the rotated csv file
+        :param begin: if defined, skip the reports older than this date
+        :param end: if defined, skip the reports newer than this date
+        """
+        IterDB.__init__(self, db, report_type, stream_mode)
+        self.begin = None if begin is None else utils.datetime_to_timestamp(begin)
+        self.end = None if end is None else utils.datetime_to_timestamp(end)
+
+        segments = [path for path, first, last in read_segment_index(filename)
+                    if (self.begin is None or last >= self.begin) and (self.end is None or first <= self.end)]
+        if os.path.exists(filename) and os.path.getsize(filename) > 0:
+            segments.append(filename)
+        self._segments = iter(segments)
+        self._current = None
+
+    def __iter__(self):
+        """
+        """
+        return self
+
+    def __next__(self) -> Report:
+        """
+        Allow to get the next data
+        """
+        while True:
+            if self._current is None:
+                self._current = CsvIterDB(self.db, [next(self._segments)], self.report_type, False)
+            try:
+                report = next(self._current)
+            except StopIteration:
+                self._current = None
+                continue
+            timestamp = utils.datetime_to_timestamp(report.timestamp)
+            if (self.begin is None or timestamp >= self.begin) and (self.end is None or timestamp <= self.end):
+                return report
+
+
+class CsvFileCache:
+    """
+    Keep the files written by a CsvDB open between two writes
+
+    The header of each written file is read (or written) only once, and the
+    least recently used file is closed when more than max_open_files are open
+    """
+
+    def __init__(self, max_open_files: int = DEFAULT_MAX_OPEN_FILES):
+        """
+        :param int max_open_files: Maximum number of files kept open at the same time
+        """
+        self.max_open_files = max_open_files
+        #: (OrderedDict): opened files by path, from the least to the most recently used
+        self._files = OrderedDict()
+        #: (dict): header of each file already written or checked
+        self._headers = {}
+
+    def _open(self, path):
+        csvfile = self._files.get(path)
+        if csvfile is not None:
+            self._files.move_to_end(path)
+            return csvfile
+
+        if not os.path.exists(path):
+            self._headers.pop(path, None)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        csvfile = open(path, 'a')
+        self._files[path] = csvfile
+        if len(self._files) > self.max_open_files:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+        return csvfile
+
+    def _read_header(self, path):
+        if path in self._headers:
+            return self._headers[path]
+        try:
+            with open(path) as csvfile:
+                header = next(csv.reader(csvfile), None)
+        except FileNotFoundError:
+            return None
+        if header is not None:
+            self._headers[path] = header
+        return header
+
+    def write_rows(self, path: str, header: List[str], rows: List[dict]):
+        """
+        Append rows to a csv file, write the header first if the file is new
+
+        :param path: Path of the csv file
+        :param header: Fields of the rows
+        :param rows: Rows to write
+        :raise HeaderAreNotTheSameError: if the file already has another header
+        """
+        csvfile = self._open(path)
+        file_header = self._read_header(path)
+        if file_header is not None and file_header != header:
+            raise HeaderAreNotTheSameError("Header are not the same in " + path)
+
+        writer = csv.DictWriter(csvfile, header)
+        if file_header is None:
+            writer.writeheader()
+            self._headers[path] = header
+        writer.writerows(rows)
+
+    def flush(self):
+        """
+        Flush all the opened files
+        """
+        for csvfile in self._files.values():
+            csvfile.flush()
+
+    def close(self):
+        """
+        Close all the opened files
+        """
+        for csvfile in self._files.values():
+            csvfile.close()
+        self._files.clear()
+
+
+class RotatingCsvFileCache(CsvFileCache):
+    """
+    CsvFileCache that closes the written files when they are too big or too old
+
+    A closed segment is renamed with its time range, compressed if a compression algorithm is given, and added to
+    the index file of the csv file (see :func:`read_segment_index`)
+    """
+
+    def __init__(self, max_open_files: int = DEFAULT_MAX_OPEN_FILES, rotation_size: int = None,
+                 rotation_interval: int = None, compression: str = None):
+        """
+        :param int max_open_files: Maximum number of files kept open at the same time
+        :param int rotation_size: if defined, close a segment when its size (in bytes) reaches this value
+        :param int rotation_interval: if defined, close a segment when a row is more than rotation_interval
+                                      milliseconds newer than the first row of the segment
+        :param str compression: if defined, compression algorithm of the closed segments (gzip or zstd)
+        """
+        CsvFileCache.__init__(self, max_open_files)
+        if compression is not None:
+            _check_compression(compression)
+        self.rotation_size = rotation_size
+        self.rotation_interval = rotation_interval
+        self.compression = compression
+        #: (dict): first and last timestamp of the current segment of each file
+        self._ranges = {}
+
+    def _first_timestamp(self, path):
+        try:
+            with open(path) as csvfile:
+                row = next(csv.DictReader(csvfile), None)
+        except FileNotFoundError:
+            return None
+        return None if row is None else int(row['timestamp'])
+
+    def _segment_range(self, path, timestamps):
+        first, last = self._ranges.get(path, (None, None))
+        if first is None:
+            first = self._first_timestamp(path)
+        first = min(timestamps) if first is None else min(first, *timestamps)
+        last = max(timestamps) if last is None else max(last, *timestamps)
+        return first, last
+
+    def _write_segment_rows(self, path, header, rows):
+        if not rows:
+            return
+        segment_range = self._segment_range(path, [int(row['timestamp']) for row in rows])
+        CsvFileCache.write_rows(self, path, header, rows)
+        self._ranges[path] = segment_range
+
+        if self.rotation_size is not None and self._files[path].tell() >= self.rotation_size:
+            self.rotate(path)
+
+    def write_rows(self, path: str, header: List[str], rows: List[dict]):
+        """
+        Append rows to a csv file, and close its current segment if needed
+
+        :param path: Path of the csv file
+        :param header: Fields of the rows
+        :param rows: Rows to write
+        :raise HeaderAreNotTheSameError: if the file already has another header
+        """
+        if self.rotation_interval is None:
+            self._write_segment_rows(path, header, rows)
+            return
+
+        begin = 0
+        window_start = None
+        for index, row in enumerate(rows):
+            timestamp = int(row['timestamp'])
+            if window_start is None:
+                window_start, _ = self._segment_range(path, [timestamp])
+            if timestamp >= window_start + self.rotation_interval:
+                self._write_segment_rows(path, header, rows[begin:index])
+                if path in self._ranges:
+                    self.rotate(path)
+                begin = index
+                window_start = timestamp
+        self._write_segment_rows(path, header, rows[begin:])
+
+    def rotate(self, path: str):
+        """
+        Close the current segment of a csv file
+
+        :param path: Path of the csv file
+        """
+        csvfile = self._files.pop(path, None)
+        if csvfile is not None:
+            csvfile.close()
+        self._headers.pop(path, None)
+        if path not in self._ranges or not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        first, last = self._ranges.pop(path)
+
+        base = path[:-len('.csv')]
+        segment = base + '.' + str(first) + '-' + str(last) + '.csv'
+        suffix = 1
+        while os.path.exists(segment) or os.path.exists(segment + COMPRESSION_EXTENSIONS.get(self.compression, '')):
+            segment = base + '.' + str(first) + '-' + str(last) + '.' + str(suffix) + '.csv'
+            suffix += 1
+        os.rename(path, segment)
+        if self.compression is not None:
+            segment = compress_file(segment, self.compression)
+
+        index_path = base + SEGMENT_INDEX_SUFFIX
+        new_index = not os.path.exists(index_path)
+        with open(index_path, 'a') as index_file:
+            writer = csv.writer(index_file)
+            if new_index:
+                writer.writerow(SEGMENT_INDEX_HEADER)
+            writer.writerow([os.path.basename(segment), first, last])
+
+
 class CsvDB(BaseDB):
     """
     CsvDB class herited from BaseDB
@@ -193,9 +820,23 @@ class CsvDB(BaseDB):
     a CsvDB instance can be define by its current path
     """
 
-    def __init__(self, report_type: Type[Report], tags: List[str], current_path="/tmp/csvdbtest", files=[]):
+    def __init__(self, report_type: Type[Report], tags: List[str], current_path="/tmp/csvdbtest", files=[],
+                 chunk_size: int = None, use_mmap: bool = False, max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+                 rotation_size: int = None, rotation_interval: int = None, compression: str = None):
         """
         :param current_path: Current path where read/write files
+        :param int chunk_size: If defined, files are read by blocks of this size (in bytes) with a
+                               :class:`CsvChunkIterDB` instead of line by line
+        :param bool use_mmap: Read the files through a memory mapping (only used when reading by blocks)
+        :param int max_open_files: Maximum number of output files kept open between two writes
+        :param int rotation_size: If defined, start a new segment of an output file when it reaches this size (in
+                                  bytes)
+        :param int rotation_interval: If defined, start a new segment of an output file every rotation_interval
+                                      seconds (of report time)
+        :param str compression: If defined, compress the closed segments with this algorithm (gzip or zstd), needs
+                                rotation_size or rotation_interval
+        :raise CsvCompressionError: if the compression algorithm is unknown or not installed, or if a compression
+                                    algorithm is given without rotation
         """
         BaseDB.__init__(self, report_type)
 
@@ -210,6 +851,21 @@ class CsvDB(BaseDB):
         self.saved_timestamp = utils.timestamp_to_datetime(0)
         self.tags = tags
 
+        #: (int): size of the blocks read by the chunked reader, None to read the files line by line
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+
+        #: (CsvFileCache): output files kept open between two writes
+        if rotation_size is None and rotation_interval is None:
+            if compression is not None:
+                raise CsvCompressionError('only closed segments are compressed, compression needs rotation_size or '
+                                          'rotation_interval')
+            self.file_cache = CsvFileCache(max_open_files)
+        else:
+            self.file_cache = RotatingCsvFileCache(max_open_files, rotation_size,
+                                                   None if rotation_interval is None else rotation_interval * 1000,
+                                                   compression)
+
         self.add_files(files)
 
     ##################
@@ -250,8 +906,24 @@ class CsvDB(BaseDB):
         """
         Create the iterator for get the data
         """
+        if self.chunk_size is not None:
+            return CsvChunkIterDB(self, self.filenames, self.report_type, stream_mode, self.chunk_size, self.use_mmap)
         return CsvIterDB(self, self.filenames, self.report_type, stream_mode)
 
+    def iter_segments(self, filename: str, begin: datetime = None, end: datetime = None) -> CsvSegmentIterDB:
+        """
+        Create an iterator on the reports of a rotated output file, between two dates
+
+        The segment index is used to only read the segments that overlap the given time range
+
+        :param filename: Path to the rotated file (it can be relative or absolute path)
+        :param begin: If defined, skip the reports older than this date
+        :param end: If defined, skip the reports newer than this date
+        """
+        if filename[0] != '/':
+            filename = self.current_path + filename
+        return CsvSegmentIterDB(self, filename, self.report_type, False, begin, end)
+
     def connect(self):
         """
         Override from BaseDB.
@@ -259,53 +931,51 @@ class CsvDB(BaseDB):
         Nothing to do with CSV, because it's just files operations.
         """
 
-    def save(self, report: Report):
+    def close(self):
         """
-        Allow to save a serialized_report in the db
+        Close the output files
+        """
+        self.file_cache.close()
 
-        :param report: Report
+    def _group_rows(self, report: Report, batch: dict):
+        """
+        Add the rows of a report to the rows to write, grouped by output file and header
         """
         csv_header, data = self.report_type.to_csv_lines(report, self.tags)
-
-        # If the repository doesn't exist, create it
         rep_path = self.current_path + report.sensor + "-" + report.target
-        try:
-            os.makedirs(rep_path)
-        except FileExistsError:
-            pass
 
         for filename, values in data.items():
-            rep_path_with_file = rep_path + '/' + filename + '.csv'
-            # Get the header and check if it's ok
+            runs = batch.setdefault(rep_path + '/' + filename + '.csv', [])
             for value in values:
-                header = csv_header + sorted(list(set([event_key for event_key, _ in value.items()]) - set(csv_header)))
-                header_exist = False
-                try:
-                    with open(rep_path_with_file) as csvfile:
-                        reader = csv.DictReader(csvfile)
-                        if reader.fieldnames:
-                            header_exist = True
-
-                        if header != reader.fieldnames:
-                            raise HeaderAreNotTheSameError("Header are not the same in " + rep_path_with_file)
-                        csvfile.flush()
-                        csvfile.close()
-                except FileNotFoundError:
-                    pass
-
-                # Write
-                with open(rep_path_with_file, 'a') as csvfile:
-                    writer = csv.DictWriter(csvfile, header)
-                    if not header_exist:
-                        writer.writeheader()
-                    writer.writerow(value)
-                    csvfile.close()
+                header = csv_header + sorted(set(value) - set(csv_header))
+                if runs and runs[-1][0] == header:
+                    runs[-1][1].append(value)
+                else:
+                    runs.append((header, [value]))
+
+    def save(self, report: Report):
+        """
+        Allow to save a serialized_report in the db
+
+        :param report: Report
+        """
+        self.save_many([report])
 
     def save_many(self, reports: List[Report]):
         """
         Allow to save a batch of report
 
+        The rows of the batch are grouped by output file and written in bulk
+
         :param reports: Batch of report.
         """
+        batch = {}
         for report in reports:
-            self.save(report)
+            self._group_rows(report, batch)
+
+        try:
+            for path, runs in batch.items():
+                for header, rows in runs:
+                    self.file_cache.write_rows(path, header, rows)
+        finally:
+            self.file_cache.flush()
@@ -0,0 +1,180 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .base_db import DBError
+
+DEFAULT_BATCH_LINES = 5000
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.1
+MAX_RETRY_DELAY = 10.0
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class InfluxWriteError(DBError):
+    """
+    Exception raised when a batch of lines can't be written in the influx database
+    """
+
+
+class InfluxLineWriter:
+    """
+    Write line protocol batches to an influxdb write endpoint with plain HTTP requests
+
+    Lines are split into batches of batch_lines lines, each batch is gzipped and posted by a pool of max_concurrency
+    threads. When max_concurrency requests are in flight, write blocks until one of them ends. A request that fails
+    with a connection error or a retryable status code (429, 5xx) is retried max_retries times with an exponential
+    backoff (or the delay given by the Retry-After header). The first failure of a batch is raised by the next call to
+    write, flush or close
+    """
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES, retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+                 batch_lines: int = DEFAULT_BATCH_LINES, compress: bool = True, timeout: float = 10.0):
+        """
+        :param url: URL of the write endpoint, with its query parameters
+        :param headers: headers added to each request (ex: the authorization token)
+        :param max_concurrency: maximum number of requests in flight
+        :param max_retries: number of times a failed request is retried
+        :param retry_backoff: delay (in seconds) before the first retry, doubled for each following retry
+        :param batch_lines: maximum number of lines sent in one request
+        :param compress: if True, the request bodies are gzipped
+        :param timeout: timeout (in seconds) of one request
+        """
+        self.url = url
+        self.headers = {'Content-Type': 'text/plain; charset=utf-8'}
+        if compress:
+            self.headers['Content-Encoding'] = 'gzip'
+        self.headers.update(headers or {})
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.batch_lines = batch_lines
+        self.compress = compress
+        self.timeout = timeout
+
+        self.requests_sent = 0
+        self.retries = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='influx-writer')
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._error = None
+
+    def _raise_error(self):
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def write(self, lines: List[str]):
+        """
+        Send the given lines, the requests are sent in background
+
+        :param lines: line protocol entries, without trailing newlines
+        :raise InfluxWriteError: if a previous batch can't be written
+        """
+        self._raise_error()
+        for start in range(0, len(lines), self.batch_lines):
+            body = '\n'.join(lines[start:start + self.batch_lines]).encode()
+            self._slots.acquire()  # pylint: disable=consider-using-with
+            future = self._executor.submit(self._send, body)
+            with self._lock:
+                self._pending.add(future)
+            future.add_done_callback(self._request_done)
+
+    def _request_done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+            if future.exception() is not None and self._error is None:
+                self._error = future.exception()
+        self._slots.release()
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        return min(self.retry_backoff * 2 ** attempt, MAX_RETRY_DELAY)
+
+    def _send(self, body: bytes):
+        if self.compress:
+            body = gzip.compress(body, compresslevel=5)
+        attempt = 0
+        while True:
+            request = urllib.request.Request(self.url, data=body, headers=self.headers, method='POST')
+            retry_after = None
+            try:
+                self.requests_sent += 1
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    response.read()
+                return
+            except urllib.error.HTTPError as exn:
+                message = exn.read().decode(errors='replace')
+                if exn.code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    raise InfluxWriteError('write request failed with status ' + str(exn.code) + ': ' + message) from exn
+                retry_after = exn.headers.get('Retry-After')
+            except (urllib.error.URLError, OSError) as exn:
+                if attempt >= self.max_retries:
+                    raise InfluxWriteError('write request failed: ' + str(exn)) from exn
+            time.sleep(self._retry_delay(attempt, retry_after))
+            attempt += 1
+            self.retries += 1
+
+    def flush(self):
+        """
+        Wait until all the sent batches are written
+
+        :raise InfluxWriteError: if a batch can't be written
+        """
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            for future in pending:
+                future.exception()
+        self._raise_error()
+
+    def close(self):
+        """
+        Write the remaining batches and stop the request threads
+
+        :raise InfluxWriteError: if a batch can't be written
+        """
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
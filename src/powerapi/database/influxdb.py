@@ -28,6 +28,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import urllib.error
+import urllib.parse
+import urllib.request
 from typing import List, Type
 try:
     from influxdb import InfluxDBClient
@@ -37,6 +40,7 @@ except ImportError:
 
 from powerapi.report import Report
 from .base_db import BaseDB, DBError
+from .influx_line_writer import InfluxLineWriter, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES
 
 
 class CantConnectToInfluxDBException(DBError):
@@ -52,7 +56,9 @@ class InfluxDB(BaseDB):
     Allow to handle a InfluxDB database in reading or writing.
     """
 
-    def __init__(self, report_type: Type[Report], uri: str, port, db_name: str, tags: List[str]):
+    def __init__(self, report_type: Type[Report], uri: str, port, db_name: str, tags: List[str],
+                 line_protocol: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
         """
         :param url:             URL of the InfluxDB server
         :param port:            port of the InfluxDB server
@@ -63,14 +69,22 @@ class InfluxDB(BaseDB):
         :param report_type:        Type of the report handled by this database
         :param tags: metadata used to tag metric
 
+        :param line_protocol:   if True, reports are encoded in line protocol and written with gzipped HTTP requests
+                                instead of using the influxdb client
+        :param max_concurrency: maximum number of write requests in flight (line protocol mode)
+        :param max_retries:     number of times a failed write request is retried (line protocol mode)
         """
         BaseDB.__init__(self, report_type)
         self.uri = uri
         self.port = port
         self.db_name = db_name
         self.tags = tags
+        self.line_protocol = line_protocol
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
 
         self.client = None
+        self.writer = None
 
     def __iter__(self):
         raise NotImplementedError()
@@ -81,6 +95,26 @@ class InfluxDB(BaseDB):
         else:
             self.client.request(url="ping", method='GET', expected_response_code=204)
 
+    def _base_url(self) -> str:
+        uri = self.uri if '://' in self.uri else 'http://' + self.uri
+        return uri + ':' + str(self.port)
+
+    def _connect_line_protocol(self):
+        base_url = self._base_url()
+        try:
+            with urllib.request.urlopen(base_url + '/ping', timeout=10) as response:
+                response.read()
+            query = urllib.parse.urlencode({'q': 'CREATE DATABASE "' + self.db_name + '"'}).encode()
+            with urllib.request.urlopen(base_url + '/query', data=query, timeout=10) as response:
+                response.read()
+        except (urllib.error.URLError, OSError, ValueError) as exn:
+            raise CantConnectToInfluxDBException('connexion error') from exn
+
+        if self.writer is not None:
+            self.writer.close()
+        write_url = base_url + '/write?' + urllib.parse.urlencode({'db': self.db_name, 'precision': 'ns'})
+        self.writer = InfluxLineWriter(write_url, max_concurrency=self.max_concurrency, max_retries=self.max_retries)
+
     def connect(self):
         """
         Override from BaseDB.
@@ -90,6 +124,10 @@ class InfluxDB(BaseDB):
         been created without failure.
 
         """
+        if self.line_protocol:
+            self._connect_line_protocol()
+            return
+
         # close connection if reload
         if self.client is not None:
             self.client.close()
@@ -112,6 +150,9 @@ class InfluxDB(BaseDB):
 
         :param report: Report to save
         """
+        if self.writer is not None:
+            self.save_many([report])
+            return
         data = self.report_type.to_influxdb(report, self.tags)
         for tag in data['tags']:
             data['tags'][tag] = str(data['tags'][tag])
@@ -123,6 +164,20 @@ class InfluxDB(BaseDB):
 
         :param reports: Batch of data.
         """
+        if self.writer is not None:
+            self.writer.write([self.report_type.to_influxdb_line(report, self.tags) for report in reports])
+            return
 
         data_list = list(map(lambda r: self.report_type.to_influxdb(r, self.tags), reports))
         self.client.write_points(data_list)
+
+    def close(self):
+        """
+        Write the pending line protocol batches and close the connection
+        """
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.client is not None:
+            self.client.close()
+            self.client = None
@@ -29,16 +29,23 @@
 
 import logging
 from typing import List, Type
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlencode
 try:
     from influxdb_client import InfluxDBClient, WriteOptions
-    from influxdb_client.client.write_api import SYNCHRONOUS
+    from influxdb_client.client.write_api import SYNCHRONOUS, WriteType
 except ImportError:
     logging.getLogger().info("influx-client2 is not installed.")
 
 from powerapi.report import Report
-from powerapi.exception import MissingArgumentException
+from powerapi.exception import MissingArgumentException, PowerAPIException
 from .base_db import BaseDB, DBError
+from .influx_line_writer import InfluxLineWriter, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES
+
+SYNCHRONOUS_WRITE_MODE = 'synchronous'
+BATCHING_WRITE_MODE = 'batching'
+DEFAULT_WRITE_BATCH_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 1000
+DEFAULT_JITTER_INTERVAL = 0
 
 
 class CantConnectToInfluxDBException(DBError):
@@ -47,6 +54,12 @@ class CantConnectToInfluxDBException(DBError):
     """
 
 
+class InfluxWriteModeError(PowerAPIException):
+    """
+        Exception raised when the write mode of an InfluxDB2 database is unknown
+    """
+
+
 class InfluxDB2(BaseDB):
     """
         InfluxDB2 class is a subclass of BaseDB
@@ -55,7 +68,10 @@ class InfluxDB2(BaseDB):
     """
 
     def __init__(self, report_type: Type[Report], url: str, org: str, bucket_name: str, token: str, tags: List[str],
-                 port=None):
+                 port=None, line_protocol: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES, write_mode: str = SYNCHRONOUS_WRITE_MODE,
+                 write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE, flush_interval: int = DEFAULT_FLUSH_INTERVAL,
+                 jitter_interval: int = DEFAULT_JITTER_INTERVAL):
         """
             :param report_type:     Type of the report handled by this database
             :param url:             URL of the InfluxDB2 server
@@ -65,6 +81,16 @@ class InfluxDB2(BaseDB):
             :param token:           Access token for readings and writings on database
             :param tags:            metadata used to tag metric
             :param port:            port of the InfluxDB2 server (if not specified in the url)
+            :param line_protocol:   if True, reports are encoded in line protocol and written with gzipped HTTP
+                                    requests instead of using the write api of the client
+            :param max_concurrency: maximum number of write requests in flight (line protocol mode)
+            :param max_retries:     number of times a failed write request is retried
+            :param write_mode:      synchronous (each save waits for the server) or batching (points are written
+                                    by the client from a background thread). Ignored in line protocol mode
+            :param write_batch_size: number of points written in one request (batching mode)
+            :param flush_interval:  time (in ms) after which a non full batch is written (batching mode)
+            :param jitter_interval: maximum random delay (in ms) added to each write (batching mode)
+            :raise InfluxWriteModeError: if the write mode is unknown
         """
         BaseDB.__init__(self, report_type)
         self.uri = url
@@ -80,8 +106,18 @@ class InfluxDB2(BaseDB):
         self.token = token
         self.bucket_name = bucket_name
         self.tags = tags
+        self.line_protocol = line_protocol
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        if write_mode not in (SYNCHRONOUS_WRITE_MODE, BATCHING_WRITE_MODE):
+            raise InfluxWriteModeError('unknown write mode ' + str(write_mode))
+        self.write_mode = write_mode
+        self.write_batch_size = write_batch_size
+        self.flush_interval = flush_interval
+        self.jitter_interval = jitter_interval
 
         self.client = None
+        self.writer = None
         self.buckets_api = None
         self.write_api = None
         self.query_api = None
@@ -95,6 +131,25 @@ class InfluxDB2(BaseDB):
         # else:
         #    self.client.request(url="ping", method='GET', expected_response_code=204)
 
+    def _write_options(self):
+        if self.write_mode == SYNCHRONOUS_WRITE_MODE:
+            return WriteOptions(write_type=SYNCHRONOUS)
+        return WriteOptions(write_type=WriteType.batching, batch_size=self.write_batch_size,
+                            flush_interval=self.flush_interval, jitter_interval=self.jitter_interval,
+                            max_retries=self.max_retries)
+
+    def _write_error(self, conf, _, exception):
+        """
+            Called by the client when a batch can't be written (batching mode)
+        """
+        self.logger.error('cannot write a batch in bucket ' + str(conf[0]) + ': ' + str(exception))
+
+    def _write_retry(self, conf, _, exception):
+        """
+            Called by the client when the write of a batch is retried (batching mode)
+        """
+        self.logger.warning('retry to write a batch in bucket ' + str(conf[0]) + ': ' + str(exception))
+
     def connect(self):
         """
             Override from BaseDB.
@@ -105,6 +160,8 @@ class InfluxDB2(BaseDB):
 
         """
         # close connection if reload
+        if self.write_api is not None:
+            self.write_api.close()
         if self.client is not None:
             self.client.close()
 
@@ -117,9 +174,18 @@ class InfluxDB2(BaseDB):
 
         # get apis to working with the database
         self.buckets_api = self.client.buckets_api()
-        self.write_api = self.client.write_api(WriteOptions(write_type=SYNCHRONOUS))
+        self.write_api = self.client.write_api(self._write_options(), error_callback=self._write_error,
+                                               retry_callback=self._write_retry)
         self.query_api = self.client.query_api()
 
+        if self.line_protocol:
+            if self.writer is not None:
+                self.writer.close()
+            write_url = self.uri + '/api/v2/write?' + urlencode({'org': self.org, 'bucket': self.bucket_name,
+                                                                 'precision': 'ns'})
+            self.writer = InfluxLineWriter(write_url, headers={'Authorization': 'Token ' + self.token},
+                                           max_concurrency=self.max_concurrency, max_retries=self.max_retries)
+
         # A bucket is created only if it does not exist
         if self.buckets_api.find_bucket_by_name(self.bucket_name) is not None:
             return
@@ -149,5 +215,23 @@ class InfluxDB2(BaseDB):
 
             :param reports: Batch of data.
         """
+        if self.writer is not None:
+            self.writer.write([self.report_type.to_influxdb_line(report, self.tags) for report in reports])
+            return
         data_list = list(map(lambda r: self.report_type.to_influxdb(r, self.tags), reports))
         self.write_api.write(bucket=self.bucket_name, record=data_list)
+
+    def close(self):
+        """
+            Write the pending line protocol batches and close the connection
+        """
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.write_api is not None:
+            # write the batches still buffered by the client
+            self.write_api.close()
+            self.write_api = None
+        if self.client is not None:
+            self.client.close()
+            self.client = None
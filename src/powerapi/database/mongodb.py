@@ -32,10 +32,15 @@ try:
 except ImportError:
     logging.getLogger().info("PyMongo is not installed.")
 
+from collections import deque
+from itertools import islice
 from typing import List, Type
 from powerapi.database.base_db import BaseDB, DBError, IterDB
 from powerapi.report import Report
 
+#: (str): Name of the collection where the change stream resume tokens are stored
+RESUME_TOKEN_COLLECTION = 'powerapi_resume_tokens'
+
 
 class MongoBadDBError(DBError):
     """
@@ -85,6 +90,101 @@ class MongoIterDB(IterDB):
         return self.report_type.from_mongodb(json)
 
 
+class MongoBatchIterDB(IterDB):
+    """
+    MongoBatchIterDB class
+
+    Class for iterating in a MongoDB class by batches of documents ordered by timestamp
+
+    In stream mode, the documents are read from a change stream of the collection if the database use change
+    streams and if the server supports them. Otherwise, they are read then deleted by batches.
+
+    The resume token of a batch read from the change stream is saved when the next batch is read, once all the
+    reports of the batch were returned and handed off by the puller : after a restart, the reports of the last batch
+    can be read again but are never lost.
+    """
+
+    def __init__(self, db, report_type, stream_mode, batch_size: int):
+        """
+        :param int batch_size: Number of documents read at once
+        """
+        IterDB.__init__(self, db, report_type, stream_mode)
+        self.batch_size = batch_size
+
+        #: (deque): documents read but not returned yet
+        self.documents = deque()
+
+        #: (pymongo.Cursor): Cursor which return data in non stream mode
+        self.cursor = None
+
+        #: (pymongo.change_stream.CollectionChangeStream): Change stream which return data in stream mode
+        self.change_stream = None
+
+        #: (bson.RawBSONDocument): Resume token of the documents read from the change stream, saved once they were
+        #:                          all returned and handed off
+        self.resume_token = None
+
+        if not self.stream_mode:
+            self.cursor = self.db.collection.find({}).sort('timestamp', pymongo.ASCENDING).batch_size(batch_size)
+        elif self.db.change_stream:
+            self.change_stream = self._watch()
+
+    def _watch(self):
+        try:
+            return self.db.collection.watch([{'$match': {'operationType': 'insert'}}], batch_size=self.batch_size,
+                                            resume_after=self.db.load_resume_token())
+        except pymongo.errors.OperationFailure as exn:
+            logging.getLogger().warning('change streams are not available on %s (%s), documents will be read and '
+                                        'deleted by batches', self.db.uri, exn)
+            return None
+
+    def _read_cursor(self):
+        return list(islice(self.cursor, self.batch_size))
+
+    def _read_and_delete(self):
+        documents = list(self.db.collection.find({}).sort('timestamp', pymongo.ASCENDING).limit(self.batch_size))
+        if documents:
+            self.db.collection.delete_many({'_id': {'$in': [document['_id'] for document in documents]}})
+        return documents
+
+    def _read_change_stream(self):
+        documents = []
+        while len(documents) < self.batch_size:
+            change = self.change_stream.try_next()
+            if change is None:
+                break
+            documents.append(change['fullDocument'])
+        if documents:
+            self.resume_token = self.change_stream.resume_token
+        return documents
+
+    def __iter__(self):
+        """
+        """
+        return self
+
+    def __next__(self) -> Report:
+        """
+        Allow to get the next data
+        :raise: StopIteration when no report was found
+        """
+        if not self.documents:
+            if not self.stream_mode:
+                self.documents.extend(self._read_cursor())
+            elif self.change_stream is not None:
+                # the reports of the previous batch were handed off before this call
+                if self.resume_token is not None:
+                    self.db.save_resume_token(self.resume_token)
+                    self.resume_token = None
+                self.documents.extend(self._read_change_stream())
+            else:
+                self.documents.extend(self._read_and_delete())
+            if not self.documents:
+                raise StopIteration()
+
+        return self.report_type.from_mongodb(self.documents.popleft())
+
+
 class MongoDB(BaseDB):
     """
     MongoDB class herited from BaseDB
@@ -92,7 +192,8 @@ class MongoDB(BaseDB):
     Allow to handle a MongoDB database in reading or writing.
     """
 
-    def __init__(self, report_type: Type[Report], uri: str, db_name: str, collection_name: str):
+    def __init__(self, report_type: Type[Report], uri: str, db_name: str, collection_name: str,
+                 batch_size: int = None, change_stream: bool = False):
         """
         :param report_type:        Type of the report handled by this database
         :param uri:             URI of the MongoDB server
@@ -102,6 +203,14 @@ class MongoDB(BaseDB):
 
         :param collection_name: collection name in the mongodb
                                     (ex: "sensor")
+
+        :param batch_size:      if defined, read the documents by batches of this size, ordered by timestamp
+                                (see :class:`MongoBatchIterDB`)
+
+        :param change_stream:   in stream mode, read the documents inserted in the collection from a change stream
+                                instead of deleting them (only used if batch_size is defined). The change stream
+                                resumes after the last batch handed off before a restart, the reports of a batch
+                                being read are read again (at-least-once delivery).
         """
         BaseDB.__init__(self, report_type)
 
@@ -121,6 +230,12 @@ class MongoDB(BaseDB):
         #: targeted collection
         self.collection = None
 
+        #: (int): Number of documents read at once, None to read them one by one
+        self.batch_size = batch_size
+
+        #: (bool): Read the documents from a change stream in stream mode
+        self.change_stream = change_stream
+
         self.exceptions = [pymongo.errors.PyMongoError]
 
     def connect(self):
@@ -145,13 +260,33 @@ class MongoDB(BaseDB):
             raise MongoBadDBError(self.uri) from exn
 
         self.collection = self.mongo_client[self.db_name][self.collection_name]
+        if self.batch_size is not None:
+            self.collection.create_index('timestamp')
 
     def iter(self, stream_mode: bool) -> MongoIterDB:
         """
         Create the iterator for get the data
         """
+        if self.batch_size is not None:
+            return MongoBatchIterDB(self, self.report_type, stream_mode, self.batch_size)
         return MongoIterDB(self, self.report_type, stream_mode)
 
+    def load_resume_token(self):
+        """
+        :return: the resume token of the change stream of the collection, None if it was never saved
+        """
+        document = self.mongo_client[self.db_name][RESUME_TOKEN_COLLECTION].find_one({'_id': self.collection_name})
+        return None if document is None else document['token']
+
+    def save_resume_token(self, token):
+        """
+        Save the resume token of the change stream of the collection
+
+        :param token: resume token of the last read change
+        """
+        self.mongo_client[self.db_name][RESUME_TOKEN_COLLECTION].replace_one(
+            {'_id': self.collection_name}, {'_id': self.collection_name, 'token': token}, upsert=True)
+
     def save(self, report: Report):
         """
         Override from BaseDB
@@ -32,11 +32,16 @@ try:
 except ImportError:
     logging.getLogger().info("opentsdb-py is not installed.")
 
+import gzip
+import http.client
+import json
 from typing import List, Type
 
 from powerapi.report import PowerReport, Report
 from .base_db import BaseDB, DBError
 
+DEFAULT_BULK_SIZE = 500
+
 
 class CantConnectToOpenTSDBException(DBError):
     """
@@ -44,6 +49,12 @@ class CantConnectToOpenTSDBException(DBError):
     """
 
 
+class OpenTSDBWriteError(DBError):
+    """
+    Exception raised when the datapoints can't be written with the HTTP api
+    """
+
+
 class OpenTSDB(BaseDB):
     """
     OpenTSDB class herited from BaseDB
@@ -51,7 +62,8 @@ class OpenTSDB(BaseDB):
     Allow to handle an OpenTSDB database to save PowerReport.
     """
 
-    def __init__(self, report_type: Type[Report], host: str, port, metric_name: str):
+    def __init__(self, report_type: Type[Report], host: str, port, metric_name: str, http_bulk: bool = False,
+                 bulk_size: int = DEFAULT_BULK_SIZE, compress: bool = False):
         """
         :param host:             host of the OpenTSDB server
         :param port:            port of the OpenTSDB server
@@ -61,17 +73,71 @@ class OpenTSDB(BaseDB):
 
         :param report_type:        type of report handled by this database
 
+        :param http_bulk:       if True, datapoints are posted by chunks to the /api/put endpoint of the HTTP api,
+                                with a single kept alive connection, instead of being sent one by one by the client
+        :param bulk_size:       maximum number of datapoints posted in one request (http bulk mode)
+        :param compress:        if True, the request bodies are gzipped (http bulk mode)
         """
         BaseDB.__init__(self, report_type)
         self.host = host
         self.port = port
         self.metric_name = metric_name
+        self.http_bulk = http_bulk
+        self.bulk_size = bulk_size
+        self.compress = compress
 
         self.client = None
+        self.connection = None
 
     def __iter__(self):
         raise NotImplementedError()
 
+    def _connect_http(self):
+        if self.connection is not None:
+            self.connection.close()
+        self.connection = http.client.HTTPConnection(self.host, self.port, timeout=10)
+        try:
+            self._request('GET', '/api/version', None, {})
+        except (OSError, http.client.HTTPException, OpenTSDBWriteError) as exn:
+            raise CantConnectToOpenTSDBException('connexion error') from exn
+
+    def _request(self, method: str, path: str, body, headers) -> http.client.HTTPResponse:
+        """
+        Send a request on the kept alive connection, the connection is opened again (once) if the server closed it
+        """
+        for attempt in range(2):
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                content = response.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, BrokenPipeError,
+                    ConnectionResetError):
+                self.connection.close()
+                if attempt == 1:
+                    raise
+        if response.status >= 300:
+            raise OpenTSDBWriteError('request ' + path + ' failed with status ' + str(response.status) + ': ' +
+                                     content.decode(errors='replace'))
+        return response
+
+    def _datapoint(self, report: PowerReport) -> dict:
+        return {'metric': self.metric_name, 'timestamp': int(report.timestamp.timestamp()), 'value': report.power,
+                'tags': {'host': report.target}}
+
+    def _put(self, reports: List[PowerReport]):
+        headers = {'Content-Type': 'application/json'}
+        for start in range(0, len(reports), self.bulk_size):
+            body = json.dumps([self._datapoint(report) for report in reports[start:start + self.bulk_size]],
+                              separators=(',', ':')).encode()
+            if self.compress:
+                body = gzip.compress(body, compresslevel=5)
+                headers['Content-Encoding'] = 'gzip'
+            try:
+                self._request('POST', '/api/put', body, headers)
+            except (OSError, http.client.HTTPException) as exn:
+                raise OpenTSDBWriteError('cannot write datapoints: ' + str(exn)) from exn
+
     def connect(self):
         """
         Override from BaseDB.
@@ -81,6 +147,10 @@ class OpenTSDB(BaseDB):
         been created without failure.
 
         """
+        if self.http_bulk:
+            self._connect_http()
+            return
+
         # close connection if reload
         if self.client is not None:
             self.client.close()
@@ -97,6 +167,9 @@ class OpenTSDB(BaseDB):
 
         :param report: Report to save
         """
+        if self.connection is not None:
+            self._put([report])
+            return
         self.client.send(self.metric_name, report.power, timestamp=int(report.timestamp.timestamp()),
                          host=report.target)
 
@@ -106,6 +179,21 @@ class OpenTSDB(BaseDB):
 
         :param reports: Batch of data.
         """
+        if self.connection is not None:
+            self._put(reports)
+            return
 
         for report in reports:
             self.save(report)
+
+    def close(self):
+        """
+        Close the connection to the OpenTSDB server
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        if self.client is not None:
+            self.client.close()
+            self.client.wait()
+            self.client = None
@@ -28,10 +28,13 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import threading
+import time
 from typing import List, Type
 
 try:
-    from prometheus_client import start_http_server, Gauge
+    from prometheus_client import start_http_server, Gauge, REGISTRY
+    from prometheus_client.core import GaugeMetricFamily
 except ImportError:
     logging.getLogger().info("prometheus-client is not installed.")
 
@@ -160,3 +163,123 @@ class PrometheusDB(BasePrometheusDB):
         """
         for report in reports:
             self.save(report)
+
+
+class SeriesCollector:
+    """
+    Prometheus collector that keeps the last value of each series of a gauge
+
+    Values are stored in a table indexed by the label values of the series, and the metric is only built when
+    prometheus scrapes it. Series that were not updated for *series_ttl* seconds are removed at scrape time.
+    """
+
+    def __init__(self, metric_name: str, metric_description: str, label_names: List[str], series_ttl: float = None):
+        """
+        :param metric_name: the name of the metric
+        :param metric_description: short sentence that describe the metric
+        :param label_names: name of the labels of the series
+        :param series_ttl: if defined, remove the series that were not updated for series_ttl seconds
+        """
+        self.metric_name = metric_name
+        self.metric_description = metric_description
+        self.label_names = label_names
+        self.series_ttl = series_ttl
+
+        #: (dict): value and update time of each series, by label values
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def update(self, samples):
+        """
+        Update the value of series
+
+        :param samples: label values and value of each series to update
+        """
+        now = time.monotonic()
+        with self._lock:
+            for label_values, value in samples:
+                self.series[label_values] = (value, now)
+
+    def describe(self):
+        """
+        Describe the metric without building it
+        """
+        return [GaugeMetricFamily(self.metric_name, self.metric_description, labels=self.label_names)]
+
+    def collect(self):
+        """
+        Build the metric with the current value of each series, called by prometheus_client at scrape time
+        """
+        with self._lock:
+            if self.series_ttl is not None:
+                oldest_update = time.monotonic() - self.series_ttl
+                self.series = {label_values: sample for label_values, sample in self.series.items()
+                               if sample[1] >= oldest_update}
+            series = list(self.series.items())
+
+        metric = GaugeMetricFamily(self.metric_name, self.metric_description, labels=self.label_names)
+        for label_values, (value, _) in series:
+            metric.add_metric([str(label_value) for label_value in label_values], value)
+        yield metric
+
+
+class PrometheusCollectorDB(BasePrometheusDB):
+    """
+    Database that expose received raw power estimations as metrics in order to be scrapped by a prometheus instance
+
+    Unlike :class:`PrometheusDB`, the last value of each series is stored in a :class:`SeriesCollector` and the metric
+    is only built when prometheus scrapes it. Series are removed when they are not updated for *series_ttl* seconds.
+    It can only be used with a pusher actor
+    """
+
+    def __init__(self, report_type: Type[Report], port: int, address: str, metric_name: str, metric_description: str,
+                 tags: List[str], series_ttl: float = None):
+        """
+        :param address: address that exposes the metric
+        :param port: port used to expose the metric
+        :param metric_name: the name of the metric
+        :param metric_description:  short sentence that describe the metric
+        :param tags: metadata used to tag metric
+        :param series_ttl: if defined, remove the series that were not updated for series_ttl seconds
+        """
+        BasePrometheusDB.__init__(self,
+                                  report_type=report_type,
+                                  port=port,
+                                  address=address,
+                                  metric_name=metric_name,
+                                  metric_description=metric_description,
+                                  tags=tags)
+        self.series_ttl = series_ttl
+        self.collector = None
+
+    def __iter__(self):
+        raise NotImplementedError()
+
+    def _init_metrics(self):
+        if self.collector is None:
+            self.collector = SeriesCollector(self.metric_name, self.metric_description,
+                                             [SENSOR_TAG, TARGET_TAG] + self.tags, self.series_ttl)
+            REGISTRY.register(self.collector)
+
+    def save(self, report: Report):
+        """
+        Override from BaseDB
+
+        :param report: Report to save
+        """
+        self.save_many([report])
+
+    def save_many(self, reports: List[Report]):
+        """
+        Save a batch of data
+
+        :param reports: Batch of data.
+        """
+        if not reports:
+            return
+        if self.tags is None or not self.tags:
+            self.tags = list(reports[0].metadata.keys())
+        self._init_metrics()
+
+        to_sample = self.report_type.to_prometheus_sample
+        self.collector.update([to_sample(report, self.tags) for report in reports])
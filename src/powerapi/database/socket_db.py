@@ -28,32 +28,104 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import asyncio
+import time
+from collections import deque
 from typing import Type, List
-import json
 
 
-from powerapi.utils import JsonStream
-from powerapi.report import Report
+from powerapi.utils.json_stream import BRACE_FRAMING, FRAMINGS, JSON_BACKEND, JsonStreamDecoder, check_json_backend
+from powerapi.report import Report, HWPCReport, BadInputData
 from .base_db import IterDB, BaseDB, DBError
+from .binary_protocol import BINARY_PROTOCOL_MAGIC, BinaryStreamDecoder, BinaryProtocolError
 
-BUFFER_SIZE = 4096
+BUFFER_SIZE = 65536
 SOCKET_TIMEOUT = 0.5
+#: (float): time (in seconds) the iterator waits for a report before returning None
+READ_TIMEOUT = 2
+#: (int): default maximum number of received reports waiting to be read, 0 for no limit
+DEFAULT_QUEUE_SIZE = 10000
+#: (int): maximum number of reports taken from the queue at once by the iterator
+DRAIN_SIZE = 1000
+
+JSON_PROTOCOL = 'json'
+BINARY_PROTOCOL = 'binary'
+
+
+class SocketConnectionStats:
+    """
+    Statistics on a connection of a sensor to a SocketDB
+    """
+
+    def __init__(self, address, protocol: str = JSON_PROTOCOL):
+        #: (tuple): address (host, port) of the sensor
+        self.address = address
+        #: (str): protocol used by the connection (json or binary)
+        self.protocol = protocol
+        #: (int): number of received bytes
+        self.bytes = 0
+        #: (int): number of received reports
+        self.reports = 0
+        #: (float): time spent waiting for space in the queue (in seconds)
+        self.blocked_time = 0.0
+        #: (float): time of the connection (monotonic clock)
+        self.connected_at = time.monotonic()
+
+    def throughput(self) -> float:
+        """
+        :return: the mean number of reports received per second since the connection
+        """
+        duration = time.monotonic() - self.connected_at
+        return self.reports / duration if duration > 0 else 0.0
+
+    def __str__(self):
+        return (f'{self.address}: {self.protocol} connection, {self.reports} reports ({self.bytes} bytes) '
+                f'received at {self.throughput():.1f} reports/s, blocked {self.blocked_time:.3f} s by a full queue')
 
 
 class SocketDB(BaseDB):
     """
     Database that act as a server that expose a socket where data source will push data
+
+    Each connection sends either a json stream, or HWPC reports encoded with the binary protocol (see
+    :mod:`powerapi.database.binary_protocol`) if it starts with the binary protocol header
+
+    The received reports wait in a queue bounded by *queue_size*. When the queue is full, the connections are not
+    read until the iterator makes room, so the sensors are slowed down by the TCP flow control instead of filling
+    the memory. The connections take turns to fill the queue.
     """
 
-    def __init__(self, report_type: Type[Report], port: int):
+    def __init__(self, report_type: Type[Report], port: int, framing: str = BRACE_FRAMING,
+                 json_backend: str = JSON_BACKEND, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        :param report_type: type of the received reports
+        :param port: port of the socket
+        :param framing: framing of the json reports sent on the socket, brace (reports delimited by their braces) or
+                        ndjson (one report per line)
+        :param json_backend: json library used to decode the reports (json or orjson)
+        :param queue_size: maximum number of received reports waiting to be read, 0 for no limit
+        :raise DBError: if the framing or the json backend is unknown, or if the json backend is not installed
+        """
         BaseDB.__init__(self, report_type)
+        if framing not in FRAMINGS:
+            raise DBError('unknown json framing ' + str(framing))
+        try:
+            check_json_backend(json_backend)
+        except ValueError as exn:
+            raise DBError(str(exn)) from exn
+        if queue_size < 0:
+            raise DBError('queue size must be positive')
         self.asynchrone = True
         self.queue = None
         self.port = port
+        self.framing = framing
+        self.json_backend = json_backend
+        self.queue_size = queue_size
         self.server = None
+        #: (List[SocketConnectionStats]): statistics of the open connections
+        self.connection_stats = []
 
     async def connect(self):
-        self.queue = asyncio.Queue()
+        self.queue = asyncio.Queue(self.queue_size)
         self.server = await asyncio.start_server(self._gen_server_callback(), host='127.0.0.1', port=self.port)
 
     async def stop(self):
@@ -64,26 +136,66 @@ class SocketDB(BaseDB):
         await self.server.wait_closed()
 
     def iter(self, stream_mode):
-        return IterSocketDB(self.report_type, stream_mode, self.queue)
+        return IterSocketDB(self.report_type, stream_mode, self.queue, self)
+
+    async def _put(self, items: list, stats: SocketConnectionStats):
+        """
+        Put the items received by a connection in the queue, wait for space in the queue if it is full
+        """
+        put_nowait = self.queue.put_nowait
+        for item in items:
+            try:
+                put_nowait(item)
+            except asyncio.QueueFull:
+                begin = time.monotonic()
+                await self.queue.put(item)
+                stats.blocked_time += time.monotonic() - begin
+        stats.reports += len(items)
 
     def _gen_server_callback(self):
-        async def callback(stream_reader, _):
-            stream = JsonStream(stream_reader)
-            count = 0  # If 10 times in a row we don't have a full message we stop
-            while True:
-                json_str = await stream.read_json_object()
-                if json_str is None:
-                    if count > 10:
-                        break
-                    count += 1
-                    continue
-                count = 0
-                await self.queue.put(json_str)
-
-                # self.queue.put(json_str)
+        async def callback(stream_reader, stream_writer):
+            stats = SocketConnectionStats(stream_writer.get_extra_info('peername'))
+            self.connection_stats.append(stats)
+            try:
+                await self._read_connection(stream_reader, stream_writer, stats)
+            finally:
+                self.connection_stats.remove(stats)
+                self.logger.debug('connection closed, ' + str(stats))
 
         return callback
 
+    async def _read_connection(self, stream_reader, stream_writer, stats: SocketConnectionStats):
+        data = await stream_reader.read(BUFFER_SIZE)
+        # read the whole header before choosing the protocol of the connection
+        while data and len(data) < len(BINARY_PROTOCOL_MAGIC) and BINARY_PROTOCOL_MAGIC.startswith(data):
+            next_data = await stream_reader.read(BUFFER_SIZE)
+            if not next_data:
+                break
+            data += next_data
+
+        if data.startswith(BINARY_PROTOCOL_MAGIC):
+            if self.report_type is not HWPCReport:
+                self.logger.error('binary connection refused, the binary protocol only handle HWPC reports')
+                stream_writer.close()
+                return
+            stats.protocol = BINARY_PROTOCOL
+            decoder = BinaryStreamDecoder()
+        else:
+            decoder = JsonStreamDecoder(self.framing, self.json_backend)
+
+        while data:
+            stats.bytes += len(data)
+            try:
+                items = decoder.feed(data)
+            except BinaryProtocolError as error:
+                self.logger.error('binary connection closed: ' + error.msg)
+                stream_writer.close()
+                return
+            await self._put(items, stats)
+            # let the other connections and the iterator run, reading a buffered connection doesn't give them a turn
+            await asyncio.sleep(0)
+            data = await stream_reader.read(BUFFER_SIZE)
+
     def __iter__(self):
         raise DBError('Socket db don\'t support __iter__ method')
 
@@ -97,25 +209,56 @@ class SocketDB(BaseDB):
 class IterSocketDB(IterDB):
     """
     iterator connected to a socket that receive report from a sensor
+
+    The received reports are taken from the queue by batches of at most DRAIN_SIZE reports
     """
 
-    def __init__(self, report_type, stream_mode, queue):
+    def __init__(self, report_type, stream_mode, queue, db=None):
         """
         """
-        IterDB.__init__(self, None, report_type, stream_mode)
+        IterDB.__init__(self, db, report_type, stream_mode)
 
         self.queue = queue
+        self._reports = deque()
 
     def __aiter__(self):
         return self
 
+    async def next_batch(self) -> List[Report]:
+        """
+        Wait for received reports and take all of them from the queue (at most DRAIN_SIZE)
+
+        :return: the received reports, an empty list if no report is received before READ_TIMEOUT
+        """
+        if self.queue.empty():
+            try:
+                items = [await asyncio.wait_for(self.queue.get(), READ_TIMEOUT)]
+            except asyncio.TimeoutError:
+                return []
+        else:
+            # let the connections fill the queue before draining it
+            await asyncio.sleep(0)
+            items = []
+        get_nowait = self.queue.get_nowait
+        while len(items) < DRAIN_SIZE and not self.queue.empty():
+            items.append(get_nowait())
+
+        reports = []
+        for item in items:
+            if isinstance(item, Report):
+                # received with the binary protocol
+                reports.append(item)
+                continue
+            try:
+                reports.append(self.report_type.from_json(item))
+            except BadInputData as error:
+                if self.db is not None:
+                    self.db.logger.warning('received report dropped: ' + str(error.msg))
+        return reports
+
     async def __anext__(self):
-        try:
-            json_str = await asyncio.wait_for(self.queue.get(), 2)
-            # json = self.queue.get_nowait()
-            # self.queue.get()
-            report = self.report_type.from_json(json.loads(json_str))
-            return report
-        # except Empty:
-        except asyncio.TimeoutError:
-            return None
+        if not self._reports:
+            self._reports.extend(await self.next_batch())
+            if not self._reports:
+                return None
+        return self._reports.popleft()
@@ -45,3 +45,14 @@ class DispatchRule:
         :rtype: ([tuple]) a list formula identifier
         """
         raise NotImplementedError()
+
+    def get_routing_key(self, report):
+        """
+        return a key identifying the formulas the received report must be sent to. Reports of the same type with
+        the same routing key are sent to the same formulas, so the dispatcher can cache their routing
+
+        :param report:
+        :type report: powerapi.report.report.Report
+        :rtype: (Hashable) the routing key, or None if the routing of the report can't be cached
+        """
+        return None
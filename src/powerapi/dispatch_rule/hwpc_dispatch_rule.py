@@ -29,6 +29,7 @@
 
 from enum import IntEnum
 
+from powerapi.report import ColumnarHWPCReport
 from .dispatch_rule import DispatchRule
 
 
@@ -90,6 +91,24 @@ class HWPCDispatchRule(DispatchRule):
 
         return []
 
+    def get_routing_key(self, report):
+        """
+        See :meth:`DispatchRule.get_routing_key <powerapi.dispatch_rule.dispatch_rule.DispatchRule.get_routing_key>`
+
+        For the socket and core depths, the key is the sensor and the topology signature of the report, its sockets
+        and their cores
+        """
+        if self.depth == HWPCDepthLevel.TARGET:
+            return report.target
+
+        if self.depth == HWPCDepthLevel.ROOT:
+            return report.sensor
+
+        non_shared_group = _extract_non_shared_group(report)
+        if self.depth == HWPCDepthLevel.SOCKET:
+            return report.sensor, tuple(non_shared_group)
+        return report.sensor, tuple((socket, tuple(cores)) for socket, cores in non_shared_group.items())
+
 
 def _number_of_core_per_socket(group):
     """
@@ -98,7 +117,7 @@ def _number_of_core_per_socket(group):
     :type group: Dict
     :rtype: int : the number of core per socket in this group
     """
-    return len(list(group.values())[0])
+    return len(next(iter(group.values())))
 
 
 def _extract_non_shared_group(report):
@@ -109,9 +128,15 @@ def _extract_non_shared_group(report):
 
     :rtype:{str:HWPCReportSocket}: a group containing ReportSocket
     """
+    if isinstance(report, ColumnarHWPCReport):
+        # only the sockets and cores are needed, don't build the counter dictionaries
+        groups = {group_name: counters.layout() for group_name, counters in report.counters.items()}
+    else:
+        groups = report.groups
+
     biggest_group = None
     maximum_number_of_core = -1
-    for _, group in report.groups.items():
+    for _, group in groups.items():
         number_of_core = _number_of_core_per_socket(group)
         if number_of_core > maximum_number_of_core:
             maximum_number_of_core = number_of_core
@@ -83,3 +83,6 @@ class PowerDispatchRule(DispatchRule):
 
     def get_formula_id(self, report):
         return [extract_id_from_report(report, self.depth)]
+
+    def get_routing_key(self, report):
+        return extract_id_from_report(report, self.depth)
@@ -75,3 +75,6 @@ class ProcfsDispatchRule(DispatchRule):
 
     def get_formula_id(self, report):
         return [extract_id_from_report(report, self.depth)]
+
+    def get_routing_key(self, report):
+        return extract_id_from_report(report, self.depth)
@@ -54,3 +54,9 @@ class SimpleDispatchRule(DispatchRule):
             :param report: Report to send
         """
         return [(self.formula_name, report.__class__.__name__)]
+
+    def get_routing_key(self, report):
+        """
+            :param report: Report to send
+        """
+        return self.formula_name
@@ -28,3 +28,4 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from powerapi.dispatcher.dispatcher_actor import DispatcherActor, RouteTable
 from powerapi.dispatcher.handlers import extract_formula_id
+from powerapi.dispatcher.formula_worker import FormulaWorkerActor
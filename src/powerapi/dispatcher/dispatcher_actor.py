@@ -28,16 +28,21 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import os
 from typing import Literal, Callable
 
-from powerapi.actor import Actor, State
+from powerapi.actor import Actor, State, PROCESS_RUNTIME, flush_batches
+from powerapi.dispatcher.formula_worker import FormulaWorkerActor, FormulaWorkerProxy
 from powerapi.dispatcher.handlers import FormulaDispatcherReportHandler, DispatcherPoisonPillMessageHandler
 from powerapi.dispatcher.route_table import RouteTable
 from powerapi.exception import PowerAPIException
 from powerapi.handler import StartHandler
 from powerapi.report import Report
 from powerapi.message import PoisonPillMessage, StartMessage
-from powerapi.utils import Tree
+from powerapi.utils import Tree, ConsistentHashRing
+
+#: (int): Maximum number of routes kept in the dispatcher routing cache
+ROUTING_CACHE_SIZE = 4096
 
 
 class NoPrimaryDispatchRuleRuleException(PowerAPIException):
@@ -95,11 +100,17 @@ class DispatcherState(State):
 
         self.route_table = route_table
 
+        #: (dict): Formulas the reports are sent to, by (report type, routing key)
+        self.routing_cache = {}
+
     def add_formula(self, formula_id):
         """
         Create a formula corresponding to the given formula id
         and add it in memory
 
+        The routing cache is invalidated as the new formula can match the
+        formula ids of already routed reports
+
         :param tuple formula_id: Define the key corresponding to
                                  a specific Formula
         """
@@ -107,6 +118,31 @@ class DispatcherState(State):
         formula = self.formula_factory(formula_id)
         self.formula_dict[formula_id] = formula
         self.formula_tree.add(list(formula_id), formula)
+        self.routing_cache.clear()
+
+    def get_cached_route(self, route_key):
+        """
+        Get the formulas the reports with the given route key were sent to
+
+        :param tuple route_key: (report type, routing key) of a report
+        :return: the formulas, or None if the route is not cached
+        :rtype: list(Formula) or None
+        """
+        return self.routing_cache.get(route_key)
+
+    def cache_route(self, route_key, formulas):
+        """
+        Store the formulas the reports with the given route key are sent to
+
+        The cache is emptied when it is full, it is refilled by the next
+        routed reports
+
+        :param tuple route_key: (report type, routing key) of a report
+        :param list formulas: the formulas the reports are sent to
+        """
+        if len(self.routing_cache) >= ROUTING_CACHE_SIZE:
+            self.routing_cache.clear()
+        self.routing_cache[route_key] = formulas
 
     def get_direct_formula(self, formula_id):
         """
@@ -157,7 +193,8 @@ class DispatcherActor(Actor):
     """
 
     def __init__(self, name: str, formula_init_function: Callable, pushers: [], route_table: RouteTable,
-                 level_logger: Literal = logging.WARNING, timeout=None):
+                 level_logger: Literal = logging.WARNING, timeout=None, formula_runtime: str = PROCESS_RUNTIME,
+                 sharded: bool = False, formula_workers: int = None):
         """
         :param str name: Actor name
         :param func formula_init_function: Function for creating Formula
@@ -165,9 +202,37 @@ class DispatcherActor(Actor):
         :param int level_logger: Define the level of the logger
         :param bool timeout: Define the time in millisecond to wait for a
                              message before run timeout_handler
+        :param str formula_runtime: Runtime used to execute the formulas, process
+                                    or thread (formulas run in the dispatcher
+                                    process)
+        :param bool sharded: If True, formulas are hosted by a fixed size pool
+                             of workers instead of one actor per formula
+        :param int formula_workers: Number of workers used in sharded mode
+                                    (default: number of CPU)
         """
         Actor.__init__(self, name, level_logger, timeout)
 
+        #: (str): Runtime used to execute the formulas
+        self.formula_runtime = formula_runtime
+
+        #: (bool): True if the formulas are hosted by a pool of workers
+        self.sharded = sharded
+
+        #: (utils.ConsistentHashRing): Map formula ids on the worker indexes
+        self.formula_workers_ring = ConsistentHashRing(range(formula_workers or os.cpu_count()))
+
+        #: (dict): Launched workers, by index
+        self.formula_workers = {}
+
+        #: (Codec): Codec of the reports sent to the formulas, None to use the default codec
+        self.formula_codec = None
+
+        #: (int): Maximum number of reports sent in a single batch to a formula, None to disable batching
+        self.formula_batch_size = None
+
+        #: (int): Maximum time in millisecond a report can wait in a batch before being sent to a formula
+        self.formula_batch_delay = None
+
         # (func): Function for creating Formula
         self.formula_init_function = formula_init_function
 
@@ -189,6 +254,42 @@ class DispatcherActor(Actor):
         self.add_handler(PoisonPillMessage, DispatcherPoisonPillMessageHandler(self.state))
         self.add_handler(StartMessage, StartHandler(self.state))
 
+    def set_formula_codec(self, codec):
+        """
+        Set the codec used to serialize the reports sent to the formulas (or to the workers in sharded mode)
+
+        Must be called before starting the actor
+
+        :param codec: the codec to use
+        :type codec: powerapi.actor.codec.Codec
+        """
+        self.formula_codec = codec
+
+    def set_formula_batching(self, batch_size, batch_delay=10):
+        """
+        Send the reports to the formulas (or to the workers in sharded mode) by batches
+
+        Must be called before starting the actor
+
+        :param int batch_size: maximum number of reports in a batch, 1 disable batching
+        :param int batch_delay: maximum time in millisecond a report can wait in a batch before being sent
+        """
+        self.formula_batch_size = batch_size
+        self.formula_batch_delay = batch_delay
+
+    def _configure_formula(self, formula: Actor):
+        """
+        Apply the runtime, the codec, the batching and the metrics of the formulas to a formula (or a worker) before
+        launching it
+        """
+        formula.set_runtime(self.formula_runtime)
+        if self.formula_codec is not None:
+            formula.set_codec(self.formula_codec)
+        if self.formula_batch_size is not None:
+            formula.set_batching(self.formula_batch_size, self.formula_batch_delay)
+        if self.metrics is not None:
+            formula.enable_metrics(self.metrics.queue, self.metrics.interval)
+
     def _create_factory(self, pushers: []):
         """
         Create the full Formula Factory
@@ -198,13 +299,44 @@ class DispatcherActor(Actor):
         """
         formula_init_function = self.formula_init_function
 
+        if self.sharded:
+            return self._create_sharded_factory(pushers)
+
         def factory(formula_id):
             formula = formula_init_function(name=str((self.name,) + formula_id), pushers=pushers)
+            self._configure_formula(formula)
+            # send the pending batches before forking the formula, that would
+            # otherwise inherit them
+            flush_batches()
             self.state.supervisor.launch_actor(formula, start_message=False)
             return formula
 
         return factory
 
+    def _create_sharded_factory(self, pushers: []):
+        """
+        Create a Formula Factory that map formula ids on the workers. Workers
+        are launched the first time a formula is mapped on them
+
+        :return: Formula Factory
+        :rtype: func(formula_id) -> FormulaWorkerProxy
+        """
+        formula_init_function = self.formula_init_function
+
+        def factory(formula_id):
+            index = self.formula_workers_ring.get_node(formula_id)
+            worker = self.formula_workers.get(index)
+            if worker is None:
+                worker = FormulaWorkerActor(self.name + '_worker_' + str(index), formula_init_function, pushers,
+                                            self.name, self.logger.level)
+                self._configure_formula(worker)
+                flush_batches()
+                self.state.supervisor.launch_actor(worker)
+                self.formula_workers[index] = worker
+            return FormulaWorkerProxy(worker, formula_id, self.name)
+
+        return factory
+
     def update_state_formula_factory(self):
         """
         Update the formula_factory function of the state by using the pusher list
@@ -0,0 +1,183 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+from typing import Callable, Dict, Literal
+
+from powerapi.actor import Actor, State
+from powerapi.actor.metrics import set_current_trace
+from powerapi.exception import UnknownMessageTypeException
+from powerapi.handler import Handler, PoisonPillMessageHandler, StartHandler
+from powerapi.message import FormulaReportMessage, PoisonPillMessage, StartMessage
+
+
+class FormulaWorkerState(State):
+    """
+    State of a formula worker, store the formulas hosted by the worker
+    """
+
+    def __init__(self, actor, formula_init_function: Callable, pushers: Dict, dispatcher_name: str):
+        """
+        :param actor: Actor linked to the state
+        :param func formula_init_function: Function for creating Formula
+        :param dict pushers: Pushers given to the created formulas
+        :param str dispatcher_name: Name of the dispatcher that use this worker
+        """
+        State.__init__(self, actor)
+
+        #: (func): Function for creating Formula
+        self.formula_init_function = formula_init_function
+
+        #: (dict): Pushers given to the created formulas
+        self.pushers = pushers
+
+        #: (str): Name of the dispatcher that use this worker, used to name the formulas
+        self.dispatcher_name = dispatcher_name
+
+        #: (dict): Store the hosted formulas by id
+        self.formulas = {}
+
+    def get_formula(self, formula_id: tuple):
+        """
+        Get the formula corresponding to the given formula id or create it if
+        it didn't exist
+
+        The formula is not launched, its handlers are called directly by the
+        worker
+
+        :param tuple formula_id: Key corresponding to a Formula
+        :return: a Formula
+        """
+        formula = self.formulas.get(formula_id)
+        if formula is None:
+            formula = self.formula_init_function(name=str((self.dispatcher_name,) + formula_id), pushers=self.pushers)
+            formula.setup()
+            self.formulas[formula_id] = formula
+        return formula
+
+
+class FormulaWorkerReportHandler(Handler):
+    """
+    Forward the received reports to the hosted formula they are addressed to
+    """
+
+    def handle(self, msg: FormulaReportMessage):
+        """
+        Handle the report with the handler of the formula corresponding to
+        the message formula id
+
+        :param powerapi.message.FormulaReportMessage msg: Report and formula id
+        """
+        formula = self.state.get_formula(msg.formula_id)
+        # the reports sent to the pushers while handling a traced report inherit its trace
+        set_current_trace(getattr(msg.report, 'trace', None))
+        try:
+            formula.state.get_corresponding_handler(msg.report).handle_message(msg.report)
+        except UnknownMessageTypeException:
+            self.state.actor.logger.warning("UnknownMessageTypeException: " + str(msg.report))
+        finally:
+            set_current_trace(None)
+
+
+class FormulaWorkerPoisonPillMessageHandler(PoisonPillMessageHandler):
+    """
+    Teardown the hosted formulas before stopping the worker
+    """
+
+    def teardown(self, soft=False):
+        for formula in self.state.formulas.values():
+            try:
+                formula.state.get_corresponding_handler(PoisonPillMessage()).teardown(soft=soft)
+            except UnknownMessageTypeException:
+                pass
+
+
+class FormulaWorkerActor(Actor):
+    """
+    Actor that host many formulas in the same process
+
+    Each received report is handled by the formula designated by its formula
+    id. Formulas are created the first time a report is addressed to them
+    """
+
+    def __init__(self, name: str, formula_init_function: Callable, pushers: Dict, dispatcher_name: str,
+                 level_logger: Literal = logging.WARNING, timeout=None):
+        """
+        :param str name: Actor name
+        :param func formula_init_function: Function for creating Formula
+        :param dict pushers: Pushers given to the created formulas
+        :param str dispatcher_name: Name of the dispatcher that use this worker
+        :param int level_logger: Define the level of the logger
+        :param int timeout: Define the time in millisecond to wait for a
+                            message before run timeout_handler
+        """
+        Actor.__init__(self, name, level_logger, timeout)
+        self.state = FormulaWorkerState(self, formula_init_function, pushers, dispatcher_name)
+
+    def setup(self):
+        """
+        Define StartMessage, PoisonPillMessage and FormulaReportMessage handlers
+        """
+        Actor.setup(self)
+        self.add_handler(FormulaReportMessage, FormulaWorkerReportHandler(self.state))
+        self.add_handler(PoisonPillMessage, FormulaWorkerPoisonPillMessageHandler(self.state))
+        self.add_handler(StartMessage, StartHandler(self.state))
+
+
+class FormulaWorkerProxy:
+    """
+    Stand for a formula hosted by a formula worker on the dispatcher side
+
+    Expose the part of the actor interface used by the dispatcher to send
+    reports to a formula
+    """
+
+    def __init__(self, worker: FormulaWorkerActor, formula_id: tuple, sender_name: str):
+        """
+        :param FormulaWorkerActor worker: Worker hosting the formula
+        :param tuple formula_id: Identifier of the formula
+        :param str sender_name: Name of the actor that send reports to the formula
+        """
+        self.worker = worker
+        self.formula_id = formula_id
+        self.sender_name = sender_name
+
+    def is_alive(self):
+        """
+        Return True if the worker hosting the formula is alive
+        """
+        return self.worker.is_alive()
+
+    def send_data(self, msg):
+        """
+        Send the given report to the formula
+
+        :param powerapi.report.Report msg: report to send
+        """
+        self.worker.send_data(FormulaReportMessage(self.sender_name, self.formula_id, msg))
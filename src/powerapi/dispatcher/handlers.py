@@ -29,6 +29,7 @@
 
 from powerapi.handler import InitHandler, PoisonPillMessageHandler
 from powerapi.exception import PowerAPIException
+from powerapi.report.report import DISPATCHER_STAGE
 
 
 def _clean_list(id_list):
@@ -131,20 +132,41 @@ class FormulaDispatcherReportHandler(InitHandler):
                  that identitfy the formula_actor
         :rtype:  list(tuple(formula_id, report))
         """
+        msg.stamp(DISPATCHER_STAGE)
         dispatch_rule = self.state.route_table.get_dispatch_rule(msg)
+
+        routing_key = dispatch_rule.get_routing_key(msg)
+        if routing_key is None:
+            formulas = self._resolve_formulas(msg, dispatch_rule)
+        else:
+            route_key = (msg.__class__, routing_key)
+            formulas = self.state.get_cached_route(route_key)
+            if formulas is None:
+                formulas = self._resolve_formulas(msg, dispatch_rule)
+                self.state.cache_route(route_key, formulas)
+
+        for formula in formulas:
+            if formula.is_alive():
+                formula.send_data(msg)
+            else:
+                raise DispatcherSendMessageToDeadFormulaError()
+
+    def _resolve_formulas(self, msg, dispatch_rule):
+        """
+        Get the formulas the given report must be sent to, the missing
+        formulas matching a primary formula id are created
+
+        :param powerapi.Report msg: Report to route
+        :param powerapi.DispatchRule dispatch_rule: Dispatch rule of the report
+        :rtype: list(Formula)
+        """
         primary_dispatch_rule = self.state.route_table.primary_dispatch_rule
+        primary_rule_fields = primary_dispatch_rule.fields
 
+        formulas = []
         for formula_id in extract_formula_id(msg, dispatch_rule, primary_dispatch_rule):
-            primary_rule_fields = primary_dispatch_rule.fields
             if len(formula_id) == len(primary_rule_fields):
-                formula = self.state.get_direct_formula(formula_id)
-                if formula.is_alive():
-                    formula.send_data(msg)
-                else:
-                    raise DispatcherSendMessageToDeadFormulaError()
+                formulas.append(self.state.get_direct_formula(formula_id))
             else:
-                for formula in self.state.get_corresponding_formula(list(formula_id)):
-                    if formula.is_alive():
-                        formula.send_data(msg)
-                    else:
-                        raise DispatcherSendMessageToDeadFormulaError()
+                formulas.extend(self.state.get_corresponding_formula(list(formula_id)))
+        return formulas
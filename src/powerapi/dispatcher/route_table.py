@@ -48,6 +48,8 @@ class RouteTable:
         self.route_table = []
         #: (powerapi.DispatchRule): Allow to define how to create the Formula id
         self.primary_dispatch_rule = None
+        #: (dict): Dispatch rule already found for a message type
+        self.dispatch_rule_cache = {}
 
     def get_dispatch_rule(self, msg):
         """
@@ -60,11 +62,19 @@ class RouteTable:
         :raise: UnknowMessageTypeException if no group by rule is mapped to the
                 received message type
         """
+        msg_type = msg.__class__
+        try:
+            return self.dispatch_rule_cache[msg_type]
+        except KeyError:
+            pass
+
+        found_rule = None
         for (report_class, dispatch_rule) in self.route_table:
             if isinstance(msg, report_class):
-                return dispatch_rule
-
-        return None
+                found_rule = dispatch_rule
+                break
+        self.dispatch_rule_cache[msg_type] = found_rule
+        return found_rule
 
     def dispatch_rule(self, report_class, dispatch_rule):
         """
@@ -81,3 +91,4 @@ class RouteTable:
             self.primary_dispatch_rule = dispatch_rule
 
         self.route_table.append((report_class, dispatch_rule))
+        self.dispatch_rule_cache.clear()
@@ -33,6 +33,7 @@ import re
 from typing import Dict
 
 from powerapi.actor import Actor, State
+from powerapi.actor.metrics import set_current_trace
 from powerapi.pusher import PusherActor
 
 
@@ -90,3 +91,18 @@ class FormulaActor(Actor):
         """
         for _, pusher in self.state.pushers.items():
             pusher.connect_data()
+
+    def _handle_message(self, msg):
+        """
+        Handle the message with the corresponding handler, the reports sent to the pushers while handling a traced
+        report inherit its trace
+        """
+        trace = getattr(msg, 'trace', None)
+        if trace is None:
+            Actor._handle_message(self, msg)
+            return
+        set_current_trace(trace)
+        try:
+            Actor._handle_message(self, msg)
+        finally:
+            set_current_trace(None)
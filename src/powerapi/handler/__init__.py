@@ -30,3 +30,4 @@
 from powerapi.handler.handler import Handler, InitHandler, HandlerException
 from powerapi.handler.poison_pill_message_handler import PoisonPillMessageHandler
 from powerapi.handler.start_handler import StartHandler
+from powerapi.handler.profile_message_handler import ProfileMessageHandler
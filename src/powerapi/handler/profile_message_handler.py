@@ -0,0 +1,74 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import threading
+
+from powerapi.utils.profiler import SamplingProfiler, profile_path
+from powerapi.message import ProfileMessage, OKMessage, ErrorMessage
+from .handler import Handler
+
+
+class ProfileMessageHandler(Handler):
+    """
+    Start a sampling profiler of the actor, then forward the message to the actors it supervises
+    """
+
+    def __init__(self, state):
+        """
+        :param state: Actor state
+        """
+        Handler.__init__(self, state)
+
+        #: (SamplingProfiler): last started profiler
+        self.profiler = None
+
+    def handle(self, msg: ProfileMessage):
+        """
+        Start profiling the actor and answer on the control canal. When the actor runs in its own process, all the
+        threads of the process are sampled, otherwise only the actor thread is sampled
+
+        :param powerapi.message.ProfileMessage msg: duration and output directory of the profile
+        """
+        actor = self.state.actor
+        if self.profiler is not None and self.profiler.is_alive():
+            actor.send_control(ErrorMessage(actor.name, 'the actor is already profiled'))
+            return
+        if not os.path.isdir(msg.output_directory):
+            actor.send_control(ErrorMessage(actor.name, 'profile directory ' + msg.output_directory + ' not found'))
+            return
+
+        # an actor running in a thread shares its process with other actors
+        thread_ids = None if threading.current_thread() is threading.main_thread() else {threading.get_ident()}
+        self.profiler = SamplingProfiler(profile_path(msg.output_directory, actor.name), msg.duration, msg.interval,
+                                         thread_ids, actor.logger)
+        self.profiler.start()
+        actor.send_control(OKMessage(actor.name))
+
+        self.state.supervisor.profile_actors(msg.duration, msg.output_directory, interval=msg.interval)
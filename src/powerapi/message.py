@@ -43,6 +43,8 @@ class Message:
     Abstract Message class
     """
 
+    __slots__ = ('sender_name',)
+
     def __init__(self, sender_name: str):
         self.sender_name = sender_name
 
@@ -55,6 +57,8 @@ class OKMessage(Message):
     Message sends to acknowledge last received message
     """
 
+    __slots__ = ()
+
     def __init__(self, sender_name: str):
         Message.__init__(self, sender_name)
 
@@ -67,6 +71,8 @@ class ErrorMessage(Message):
     Message used to indicate that an error as occuried
     """
 
+    __slots__ = ('error_message',)
+
     def __init__(self, sender_name: str, error_message: str):
         """
         :param str error_code: message associated to the error
@@ -83,6 +89,8 @@ class StartMessage(Message):
     Message that asks the actor to launch its initialisation process
     """
 
+    __slots__ = ()
+
     def __init__(self, sender_name: str):
         Message.__init__(self, sender_name)
 
@@ -95,6 +103,8 @@ class EndMessage(Message):
     Message sent by actor to its parent when it terminates itself
     """
 
+    __slots__ = ()
+
     def __init__(self, sender_name: str):
         Message.__init__(self, sender_name)
 
@@ -107,6 +117,8 @@ class SimplePullerSendReportsMessage(Message):
     Message used to trigger sending of message by a Simple Puller actor
     """
 
+    __slots__ = ('name',)
+
     def __init__(self, sender_name: str, name: str):
         """
             :param sender_name: name of the actor that send the message
@@ -124,6 +136,8 @@ class GetReceivedReportsSimplePusherMessage(Message):
     Message used to get the received reports of a simple pusher
     """
 
+    __slots__ = ()
+
     def __init__(self, sender_name: str):
         """
         :param str error_code: message associated to the error
@@ -139,6 +153,8 @@ class ReceivedReportsSimplePusherMessage(Message):
     Message used to send reports of a simple pusher
     """
 
+    __slots__ = ('reports',)
+
     def __init__(self, sender_name: str, reports: []):
         """
         :param str sender_name: name of the message sender
@@ -151,11 +167,60 @@ class ReceivedReportsSimplePusherMessage(Message):
         return "ReceivedReportsSimplePusherMessage : " + str(self.reports)
 
 
+class FormulaReportMessage(Message):
+    """
+    Message used to send a report to a formula hosted by a formula worker
+    """
+
+    __slots__ = ('formula_id', 'report')
+
+    def __init__(self, sender_name: str, formula_id: tuple, report):
+        """
+        :param str sender_name: name of the message sender
+        :param tuple formula_id: identifier of the formula that must handle the report
+        :param powerapi.report.Report report: report to handle
+        """
+        Message.__init__(self, sender_name)
+        self.formula_id = formula_id
+        self.report = report
+
+    def __str__(self):
+        return "FormulaReportMessage : " + str(self.formula_id) + " " + str(self.report)
+
+
+class ProfileMessage(Message):
+    """
+    Message that asks the actor to sample its call stacks during a given duration and to write them in a file in the
+    collapsed stack format, in the given directory
+
+    The actor answers on its control canal once the profiling is started and also profiles the actors it supervises
+    """
+
+    __slots__ = ('duration', 'output_directory', 'interval')
+
+    def __init__(self, sender_name: str, duration: float, output_directory: str, interval: float = 0.01):
+        """
+        :param str sender_name: name of the message sender
+        :param float duration: time (in seconds) during which the call stacks are sampled
+        :param str output_directory: directory where the profile is written
+        :param float interval: time (in seconds) between two samples of the call stacks
+        """
+        Message.__init__(self, sender_name)
+        self.duration = duration
+        self.output_directory = output_directory
+        self.interval = interval
+
+    def __str__(self):
+        return "ProfileMessage : " + str(self.duration) + "s in " + self.output_directory
+
+
 class PoisonPillMessage(Message):
     """
     Message which allow to kill an actor
     """
 
+    __slots__ = ('is_soft', 'is_hard')
+
     def __init__(self, soft: bool = True, sender_name: str = ''):
         Message.__init__(self, sender_name=sender_name)
         self.is_soft = soft
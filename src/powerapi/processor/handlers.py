@@ -28,6 +28,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from powerapi.handler import InitHandler
 from powerapi.report import Report
+from powerapi.report.report import PROCESSOR_STAGE
 
 
 class ProcessorReportHandler(InitHandler):
@@ -39,5 +40,6 @@ class ProcessorReportHandler(InitHandler):
         """
         Send the report to the actor target
         """
+        report.stamp(PROCESSOR_STAGE)
         for target in self.state.target_actors:
             target.send_data(report)
@@ -32,14 +32,15 @@ import asyncio
 import logging
 from threading import Thread
 
-from powerapi.actor import State
+from powerapi.actor import State, flush_batches
+from powerapi.actor.metrics import set_current_metrics
 from powerapi.message import Message
 from powerapi.exception import PowerAPIException, BadInputData
 from powerapi.filter import FilterUselessError
 from powerapi.handler import StartHandler, PoisonPillMessageHandler
 from powerapi.database import DBError
 from powerapi.message import ErrorMessage, PoisonPillMessage
-from powerapi.report.report import DeserializationFail
+from powerapi.report.report import DeserializationFail, PULLER_STAGE
 
 
 class NoReportExtractedException(PowerAPIException):
@@ -63,7 +64,6 @@ class DBPullerThread(Thread):
 
     def _connect(self):
         try:
-            self.state.database.connect()
             self.loop.run_until_complete(self.state.database.connect())
             self.state.database_it = self.state.database.iter(self.state.stream_mode)
         except DBError as error:
@@ -72,21 +72,50 @@ class DBPullerThread(Thread):
 
     def _pull_database(self):
         try:
-            if self.state.asynchrone:
-                report = self.loop.run_until_complete(self.state.database_it.__anext__())
-                if report is not None:
-                    return report
-                else:
-                    raise StopIteration()
-            else:
-                return next(self.state.database_it)
+            return next(self.state.database_it)
 
         except (StopIteration, BadInputData, DeserializationFail) as database_problem:
             raise NoReportExtractedException() from database_problem
 
+    async def _pull_database_async(self):
+        try:
+            report = await self.state.database_it.__anext__()
+        except (StopAsyncIteration, BadInputData, DeserializationFail) as database_problem:
+            raise NoReportExtractedException() from database_problem
+        if report is None:
+            raise NoReportExtractedException()
+        return report
+
     def _get_dispatchers(self, report):
         return self.state.report_filter.route(report)
 
+    def _send_report(self, raw_report):
+        if self.state.trace:
+            raw_report.start_trace(PULLER_STAGE)
+        dispatchers = self._get_dispatchers(raw_report)
+        for dispatcher in dispatchers:
+            dispatcher.send_data(raw_report)
+        metrics = self.state.actor.metrics
+        if metrics is not None:
+            # the reports pulled from the database are the messages received by the puller
+            metrics.message_received(raw_report)
+            metrics.publish(None)
+
+    def _no_report_extracted(self) -> bool:
+        """
+        Log that no report was extracted and kill the actor if stream mode is disabled
+
+        :return: True if the thread must keep pulling the database
+        """
+        self.state.actor.logger.debug('NoReportExtractedException with stream mode ' + str(self.state.stream_mode))
+        if not self.state.stream_mode:
+            self.handler.handle_internal_msg(PoisonPillMessage(soft=False, sender_name='system'))
+            return False
+        return True
+
+    def _stop_useless_filter(self):
+        self.handler.handle_internal_msg(PoisonPillMessage(soft=False, sender_name='system'))
+
     def run(self):
         """
         Read data from Database and send it to the dispatchers.
@@ -96,38 +125,51 @@ class DBPullerThread(Thread):
 
         :param None msg: None.
         """
+        set_current_metrics(self.state.actor.metrics)
         if self.state.asynchrone:
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
             self.state.loop = self.loop
-            self.loop.set_debug(enabled=True)
             logging.basicConfig(level=logging.DEBUG)
 
             self._connect()
+            # the loop keeps running while pulling, so the database serves its connections between two reports
+            self.loop.run_until_complete(self._run_async())
+            return
 
         while self.state.alive:
             try:
-                raw_report = self._pull_database()
-
-                dispatchers = self._get_dispatchers(raw_report)
-                for dispatcher in dispatchers:
-                    dispatcher.send_data(raw_report)
+                self._send_report(self._pull_database())
 
             except NoReportExtractedException:
+                # don't keep the reports already pulled waiting in a batch
+                flush_batches()
                 time.sleep(self.state.timeout_puller / 1000)
-                self.state.actor.logger.debug('NoReportExtractedException with stream mode ' +
-                                              str(self.state.stream_mode))
-                if not self.state.stream_mode:
-                    self.handler.handle_internal_msg(PoisonPillMessage(soft=False, sender_name='system'))
+                if not self._no_report_extracted():
                     return
 
             except FilterUselessError:
-                self.handler.handle_internal_msg(PoisonPillMessage(soft=False, sender_name='system'))
+                self._stop_useless_filter()
                 return
 
             except StopIteration:
                 continue
 
+    async def _run_async(self):
+        while self.state.alive:
+            try:
+                self._send_report(await self._pull_database_async())
+
+            except NoReportExtractedException:
+                flush_batches()
+                await asyncio.sleep(self.state.timeout_puller / 1000)
+                if not self._no_report_extracted():
+                    return
+
+            except FilterUselessError:
+                self._stop_useless_filter()
+                return
+
 
 class PullerPoisonPillMessageHandler(PoisonPillMessageHandler):
     """
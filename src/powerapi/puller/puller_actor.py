@@ -51,10 +51,11 @@ class PullerState(State):
     """
 
     def __init__(self, actor: Actor, database, report_filter, report_model, stream_mode, timeout_puller,
-                 asynchrone=False):
+                 asynchrone=False, trace=False):
         """
         :param BaseDB database: Allow to interact with a Database
         :param Filter report_filter: Filter of the Puller
+        :param bool trace: trace the pulled reports
         """
         super().__init__(actor)
 
@@ -81,6 +82,8 @@ class PullerState(State):
 
         #: (bool): enable asynchronous driver
         self.asynchrone = asynchrone
+        #: (bool): trace the pulled reports
+        self.trace = trace
 
         self.loop = None
 
@@ -95,7 +98,7 @@ class PullerActor(Actor):
 
     def __init__(self, name, database, report_filter, report_model, stream_mode=False,
                  level_logger=logging.WARNING,
-                 timeout=5000, timeout_puller=100):
+                 timeout=5000, timeout_puller=100, trace=False):
         """
         :param str name: Actor name.
         :param BaseDB database: Allow to interact with a Database.
@@ -103,12 +106,14 @@ class PullerActor(Actor):
         :param int level_logger: Define the level of the logger
         :param int tiemout_puller: (require stream mode) time (in ms) between two database reading
         :param bool asynchrone: use asynchrone driver
+        :param bool trace: trace the pulled reports, each stage of the pipeline stamps them
         """
 
         Actor.__init__(self, name, level_logger, timeout)
         #: (State): Actor State.
         self.state = PullerState(self, database=database, report_filter=report_filter, report_model=report_model,
-                                 stream_mode=stream_mode, timeout_puller=timeout_puller, asynchrone=database.asynchrone)
+                                 stream_mode=stream_mode, timeout_puller=timeout_puller, asynchrone=database.asynchrone,
+                                 trace=trace)
 
         self.low_exception += database.exceptions
 
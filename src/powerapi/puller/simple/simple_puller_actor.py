@@ -27,7 +27,7 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import logging
-from typing import Type
+from typing import Type, Callable
 
 from powerapi.actor import Actor, State
 from powerapi.message import StartMessage, \
@@ -47,17 +47,23 @@ class SimplePullerState(State):
       - the report filter
     """
 
-    def __init__(self, actor, number_of_reports_to_send: int, report_type_to_send: Type[Report], report_filter):
+    def __init__(self, actor, number_of_reports_to_send: int, report_type_to_send: Type[Report], report_filter,
+                 report_generator: Callable[[int], Report] = None, trace: bool = False):
         """
         :param Actor actor: The actor related to the state
         :param int number_of_reports_to_send: Number of reports to send
         :param Report report_type_to_send: Report type to be sent
         :param Filter report_filter: Filters and the associated dispatchers and rules
+        :param Callable report_generator: Function returning the i-th report to send, empty reports of the report
+                                          type are sent if None
+        :param bool trace: trace the sent reports
         """
         State.__init__(self, actor)
         self.number_of_reports_to_send = number_of_reports_to_send
         self.report_type_to_send = report_type_to_send
         self.report_filter = report_filter
+        self.report_generator = report_generator
+        self.trace = trace
 
 
 class SimplePullerActor(Actor):
@@ -66,16 +72,21 @@ class SimplePullerActor(Actor):
     """
 
     def __init__(self, name: str, number_of_reports_to_send: int, report_type_to_send: Type[Report], report_filter,
-                 level_logger: int = logging.WARNING):
+                 level_logger: int = logging.WARNING, report_generator: Callable[[int], Report] = None,
+                 trace: bool = False):
         """
         Create an actor with the given information
         :param str name: The actor's name
         :param int number_of_reports_to_send: Number of reports to send
         :param Report report_type_to_send: Report type to be sent
         :param Filter report_filter: Filters and the associated dispatchers and rules
+        :param Callable report_generator: Function returning the i-th report to send, empty reports of the report
+                                          type are sent if None
+        :param bool trace: trace the sent reports, each stage of the pipeline stamps them
         """
         Actor.__init__(self, name, level_logger=level_logger)
-        self.state = SimplePullerState(self, number_of_reports_to_send, report_type_to_send, report_filter)
+        self.state = SimplePullerState(self, number_of_reports_to_send, report_type_to_send, report_filter,
+                                       report_generator, trace)
 
     def setup(self):
         """
@@ -27,11 +27,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.actor import State
+from powerapi.actor import State, flush_batches
 from powerapi.handler import Handler, StartHandler
 from powerapi.message import Message, SimplePullerSendReportsMessage
 from powerapi.exception import UnknownMessageTypeException
 from powerapi.puller.handlers import PullerInitializationException
+from powerapi.report.report import PULLER_STAGE
 
 
 class SimplePullerStartHandler(StartHandler):
@@ -65,12 +66,19 @@ class SimplePullerHandler(Handler):
         if isinstance(msg, SimplePullerSendReportsMessage):
             sent = 0
             while sent < self.state.number_of_reports_to_send:
-                report = self.state.report_type_to_send.create_empty_report()
+                if self.state.report_generator is None:
+                    report = self.state.report_type_to_send.create_empty_report()
+                else:
+                    report = self.state.report_generator(sent)
+                if self.state.trace:
+                    report.start_trace(PULLER_STAGE)
                 dispatchers = self.state.report_filter.route(report)
                 for dispatcher in dispatchers:
                     self.state.actor.logger.debug('send report ' + str(report) + ' to ' + str(dispatcher))
                     dispatcher.send_data(report)
                 sent += 1
+            # don't keep the last reports waiting in a batch
+            flush_batches()
             self.state.actor.logger.debug('sent reports: ' + str(sent))
         else:
             raise UnknownMessageTypeException()
@@ -27,5 +27,8 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler
+from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler, \
+    BackgroundReportHandler
 from powerapi.pusher.pusher_actor import PusherActor, PusherState
+from powerapi.pusher.reorder_buffer import ReorderBuffer
+from powerapi.pusher.writer import PusherWriter, PusherWriterStats, PusherWriterStoppedException
@@ -51,14 +51,35 @@ class PusherStartHandler(StartHandler):
             self.state.alive = False
             return
 
+        if self.state.writer is not None:
+            self.state.writer.start()
+
 
 class PusherPoisonPillMessageHandler(PoisonPillMessageHandler):
     """
     Handler for PoisonPillMessage
     """
     def teardown(self, soft=False):
-        if len(self.state.buffer) > 0:
-            self.state.database.save_many(self.state.buffer)
+        if self.state.writer is not None:
+            self.state.writer.close()
+            self.state.actor.logger.info(str(self.state.writer.stats))
+        else:
+            if self.state.reorder_buffer is not None:
+                self.state.buffer.extend(self.state.reorder_buffer.pop_all())
+            if len(self.state.buffer) > 0:
+                self.state.database.save_many(self.state.buffer)
+                self.state.stage_latencies.observe_reports(self.state.buffer, time.time())
+
+        if self.state.reorder_buffer is not None:
+            self.state.actor.logger.info(str(self.state.reorder_buffer.late_reports) + ' late reports dropped')
+
+        if self.state.stage_latencies.windows:
+            self.state.actor.logger.info(str(self.state.stage_latencies))
+
+        try:
+            self.state.database.close()
+        except DBError as error:
+            self.state.actor.logger.error('cannot close the database: ' + error.msg)
 
 
 class ReportHandler(InitHandler):
@@ -67,6 +88,11 @@ class ReportHandler(InitHandler):
 
     the buffer is empty every *delay* ms or if its size exceed *max_size*
 
+    if the pusher has a reorder buffer, reports go through it before entering the buffer
+
+    the pusher calls :meth:`flush_expired` when it doesn't receive any report during its receive timeout, so the
+    buffered reports are written even if the report stream stops
+
     :param int delay: number of ms before message containing in the buffer will be writen in database
     :param int max_size: maximum of message that the buffer can store before write them in database
     """
@@ -84,15 +110,52 @@ class ReportHandler(InitHandler):
 
         :param powerapi.PowerReport msg: PowerReport to save.
         """
-        self.state.buffer.append(msg)
+        if self.state.reorder_buffer is None:
+            self.state.buffer.append(msg)
+        else:
+            self.state.reorder_buffer.push(msg)
+            self.state.buffer.extend(self.state.reorder_buffer.pop_ready())
+            if not self.state.buffer:
+                return
+
         if (time.time() - self.last_database_write_time > self.delay) or (len(self.state.buffer) > self.max_size):
-            self.last_database_write_time = time.time()
+            self._write_buffer()
+
+    def flush_expired(self):
+        """
+        Write the reports that waited more than the lateness in the reorder buffer, and the buffer if it waited more
+        than *delay* ms
+        """
+        if self.state.reorder_buffer is not None:
+            self.state.buffer.extend(self.state.reorder_buffer.pop_ready())
+
+        if self.state.buffer and time.time() - self.last_database_write_time > self.delay:
+            self._write_buffer()
 
+    def _write_buffer(self):
+        self.last_database_write_time = time.time()
+
+        if self.state.reorder_buffer is None:
             self.state.buffer.sort(key=lambda x: x.timestamp)
 
-            try:
-                self.state.database.save_many(self.state.buffer)
-                self.state.actor.logger.debug('save ' + str(len(self.state.buffer)) + ' reports in database')
-                self.state.buffer = []
-            except BadInputData as ex:
-                self.state.actor.logger.warning(f"The report cannot be saved: {ex.msg}")
+        try:
+            self.state.database.save_many(self.state.buffer)
+            self.state.actor.logger.debug('save ' + str(len(self.state.buffer)) + ' reports in database')
+            self.state.stage_latencies.observe_reports(self.state.buffer, time.time())
+            self.state.buffer = []
+        except BadInputData as ex:
+            self.state.actor.logger.warning(f"The report cannot be saved: {ex.msg}")
+
+
+class BackgroundReportHandler(InitHandler):
+    """
+    Put the received report in the buffer of the pusher writer, that write them in database from a background thread
+    """
+
+    def handle(self, msg):
+        """
+        Add the msg to the writer buffer
+
+        :param powerapi.PowerReport msg: PowerReport to save.
+        """
+        self.state.writer.add(msg)
@@ -28,10 +28,17 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import time
+
 from powerapi.actor import Actor, State
+from powerapi.actor.metrics import StageLatencies, current_trace
 from powerapi.message import PoisonPillMessage, StartMessage
 
-from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler
+from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler, \
+    BackgroundReportHandler
+from powerapi.pusher.reorder_buffer import ReorderBuffer
+from powerapi.pusher.writer import PusherWriter
+from powerapi.report.report import FORMULA_STAGE
 
 
 class PusherState(State):
@@ -57,16 +64,28 @@ class PusherState(State):
         #: (Dict): Buffer data.
         self.buffer = []
 
+        #: (PusherWriter): Writer of the reports in database, None if they are written by the actor
+        self.writer = None
+
+        #: (ReorderBuffer): Buffer that reorder the received reports by timestamp, None if they are not reordered
+        self.reorder_buffer = None
+
+        #: (StageLatencies): Latency added by each stage of the pipeline to the written traced reports
+        self.stage_latencies = StageLatencies()
+
 
 class PusherActor(Actor):
     """
     PusherActor class
 
     The Pusher allow to save Report sent by Formula.
+
+    Without writer thread, the receive timeout of the pusher is reduced to *delay* and *lateness*, so it wakes up to
+    write the waiting reports when it doesn't receive any report.
     """
 
     def __init__(self, name, report_model, database, level_logger=logging.WARNING, timeout=1000, delay=100,
-                 max_size=50):
+                 max_size=50, max_in_flight=None, lateness=None):
         """
         :param str name: Pusher name.
         :param Report report_model: ReportModel
@@ -74,6 +93,11 @@ class PusherActor(Actor):
         :param int level_logger: Define the level of the logger
         :param int delay: number of ms before message containing in the buffer will be writen in database
         :param int max_size: maximum of message that the buffer can store before write them in database
+        :param int max_in_flight: if defined, write the reports from a background thread, with at most max_in_flight
+                                  batches waiting to be written
+        :param int lateness: if defined, reorder the reports by timestamp before writing them. A report is written
+                             once a report newer by lateness ms is received, or after waiting lateness ms. Reports
+                             older than the last written one are dropped.
         """
         Actor.__init__(self, name, level_logger, timeout)
 
@@ -81,12 +105,58 @@ class PusherActor(Actor):
         self.state = PusherState(self, database, report_model)
         self.delay = delay
         self.max_size = max_size
+        self.max_in_flight = max_in_flight
+        self.lateness = lateness
+        #: (ReportHandler): Handler writing the reports from the actor, None if they are written by a writer thread
+        self.report_handler = None
 
     def setup(self):
         """
         Define StartMessage, PoisonPillMessage handlers and a handler for
         each report type
         """
+        # errors of the asynchronous writes are reported with the logger of the pusher
+        self.state.database.logger = self.logger
+        if self.metrics is not None:
+            self.metrics.stage_latencies = self.state.stage_latencies
         self.add_handler(PoisonPillMessage, PusherPoisonPillMessageHandler(self.state))
-        self.add_handler(self.state.report_model, ReportHandler(self.state, self.delay, self.max_size))
+        if self.lateness is not None:
+            self.state.reorder_buffer = ReorderBuffer(self.lateness)
+        if self.max_in_flight is None:
+            self.report_handler = ReportHandler(self.state, self.delay, self.max_size)
+            self.add_handler(self.state.report_model, self.report_handler)
+            wake_up_periods = [period for period in (self.socket_interface.timeout, self.delay, self.lateness) if period]
+            if wake_up_periods:
+                self.socket_interface.timeout = min(wake_up_periods)
+        else:
+            self.state.writer = PusherWriter(self.state.database, self.logger, self.delay / 1000, self.max_size,
+                                             self.max_in_flight, name=self.name + '-writer',
+                                             reorder_buffer=self.state.reorder_buffer,
+                                             stage_latencies=self.state.stage_latencies)
+            self.add_handler(self.state.report_model, BackgroundReportHandler(self.state))
         self.add_handler(StartMessage, PusherStartHandler(self.state))
+
+    def receive(self):
+        """
+        Receive a message, and write the reports that waited too long in the buffers when no message was received
+        before the receive timeout
+
+        :return: the received message or None if timeout
+        """
+        msg = Actor.receive(self)
+        if msg is None and self.report_handler is not None:
+            self.report_handler.flush_expired()
+        return msg
+
+    def send_data(self, msg):
+        """
+        Send a msg to this actor using the data canal
+
+        A report sent by a formula while it handles a traced report inherits its trace, with a stamp of the formula
+
+        :param Object msg: the message to send to this actor
+        """
+        trace = current_trace()
+        if trace is not None and getattr(msg, 'trace', False) is None:
+            msg.trace = trace + ((FORMULA_STAGE, time.time()),)
+        Actor.send_data(self, msg)
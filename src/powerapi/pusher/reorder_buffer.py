@@ -0,0 +1,116 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import heapq
+import itertools
+import time
+from datetime import datetime
+from typing import List
+
+from powerapi.report import Report
+from powerapi.utils import datetime_to_timestamp
+
+
+def _event_time(report: Report) -> int:
+    """
+    :return: the timestamp of the report in milliseconds
+    """
+    if isinstance(report.timestamp, datetime):
+        return datetime_to_timestamp(report.timestamp)
+    return report.timestamp
+
+
+class ReorderBuffer:
+    """
+    Reorder reports by timestamp
+
+    Reports are kept in a heap and released in timestamp order once they are older than the watermark, which is the
+    newest timestamp received minus the allowed *lateness*. A report also is released when it waited more than
+    *lateness* in the buffer, so reports are not kept when the report stream stops.
+
+    A report older than the last released one is late: it is dropped and counted in :attr:`late_reports`.
+    """
+
+    def __init__(self, lateness: int):
+        """
+        :param int lateness: maximum delay (in ms) of a report behind the newest received report
+        """
+        self.lateness = lateness
+        self._max_wait = lateness / 1000
+        self._heap = []
+        # break ties between reports with the same timestamp, in reception order
+        self._counter = itertools.count()
+
+        #: (int): newest timestamp received (in ms)
+        self.max_timestamp = None
+        #: (int): timestamp of the last released report (in ms)
+        self.last_released_timestamp = None
+        #: (int): number of dropped late reports
+        self.late_reports = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, report: Report) -> bool:
+        """
+        Add a report to the buffer
+
+        :param Report report: the received report
+        :return: False if the report is late and was dropped
+        """
+        timestamp = _event_time(report)
+        if self.last_released_timestamp is not None and timestamp < self.last_released_timestamp:
+            self.late_reports += 1
+            return False
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+        heapq.heappush(self._heap, (timestamp, next(self._counter), time.monotonic(), report))
+        return True
+
+    def _pop(self) -> Report:
+        timestamp, _, _, report = heapq.heappop(self._heap)
+        self.last_released_timestamp = timestamp
+        return report
+
+    def pop_ready(self) -> List[Report]:
+        """
+        :return: the reports older than the watermark or that waited more than the lateness, in timestamp order
+        """
+        watermark = None if self.max_timestamp is None else self.max_timestamp - self.lateness
+        oldest_arrival = time.monotonic() - self._max_wait
+        reports = []
+        while self._heap and (self._heap[0][0] <= watermark or self._heap[0][2] <= oldest_arrival):
+            reports.append(self._pop())
+        return reports
+
+    def pop_all(self) -> List[Report]:
+        """
+        :return: all the reports of the buffer, in timestamp order
+        """
+        return [self._pop() for _ in range(len(self._heap))]
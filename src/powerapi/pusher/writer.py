@@ -0,0 +1,254 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import queue
+import threading
+import time
+
+from powerapi.actor.metrics import StageLatencies
+from powerapi.exception import PowerAPIException
+from powerapi.pusher.reorder_buffer import ReorderBuffer
+from powerapi.report import BadInputData
+
+#: (float): minimum time (in seconds) the writer thread waits for a batch
+MIN_WAIT_TIME = 0.001
+
+# Put in the batch queue to stop the writer thread
+_STOP = object()
+
+
+class PusherWriterStoppedException(PowerAPIException):
+    """
+    Exception raised when a report is added to a writer whose thread is stopped
+    """
+
+
+class PusherWriterStats:
+    """
+    Statistics on the batches written by a PusherWriter
+    """
+
+    def __init__(self):
+        #: (int): number of written batches
+        self.batches = 0
+        #: (int): number of written reports
+        self.reports = 0
+        #: (int): size of the biggest written batch
+        self.max_batch_size = 0
+        #: (float): time spent writing batches (in seconds)
+        self.flush_time = 0.0
+        #: (float): longest time spent writing a batch (in seconds)
+        self.max_flush_time = 0.0
+
+    def add_batch(self, batch_size: int, flush_time: float):
+        """
+        Add a written batch to the statistics
+
+        :param int batch_size: number of reports of the batch
+        :param float flush_time: time spent writing the batch (in seconds)
+        """
+        self.batches += 1
+        self.reports += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.flush_time += flush_time
+        self.max_flush_time = max(self.max_flush_time, flush_time)
+
+    def __str__(self):
+        if self.batches == 0:
+            return 'no batch written'
+        return (f'{self.batches} batches written, {self.reports} reports, '
+                f'batch size mean/max: {self.reports / self.batches:.1f}/{self.max_batch_size}, '
+                f'flush latency mean/max: {self.flush_time / self.batches * 1000:.2f}/'
+                f'{self.max_flush_time * 1000:.2f} ms')
+
+
+class PusherWriter:
+    """
+    Write the reports received by a pusher in its database from a background thread
+
+    The actor thread puts the reports in a buffer. The buffer is handed over to the writer thread when it holds more
+    than *max_size* reports, or when the last hand over is older than *delay*. The writer thread also hands the
+    buffer over when no report is received, so buffered reports are written even when the report stream stops.
+
+    At most *max_in_flight* batches wait to be written, :meth:`add` blocks when this limit is reached.
+
+    If a reorder buffer is given, reports go through it before entering the buffer. The writer thread also releases
+    the reports that waited too long in the reorder buffer.
+    """
+
+    def __init__(self, database, logger, delay: float = 0.1, max_size: int = 50, max_in_flight: int = 2,
+                 name: str = 'pusher-writer', reorder_buffer: ReorderBuffer = None,
+                 stage_latencies: StageLatencies = None):
+        """
+        :param BaseDB database: Database where the reports are written
+        :param logging.Logger logger: Logger of the pusher
+        :param float delay: maximum time (in seconds) a report stays in the buffer
+        :param int max_size: maximum number of reports in the buffer before handing it over to the writer thread
+        :param int max_in_flight: maximum number of batches waiting to be written
+        :param str name: name of the writer thread
+        :param ReorderBuffer reorder_buffer: if defined, reorder the reports by timestamp with this buffer
+        :param StageLatencies stage_latencies: if defined, add the stage latencies of the written traced reports to it
+        """
+        self.database = database
+        self.logger = logger
+        self.delay = delay
+        self.max_size = max_size
+        self.reorder_buffer = reorder_buffer
+        self.stage_latencies = stage_latencies
+
+        #: (PusherWriterStats): statistics on the written batches
+        self.stats = PusherWriterStats()
+
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._last_hand_over = time.time()
+        self._batches = queue.Queue(max_in_flight)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        """
+        Start the writer thread
+        """
+        self._thread.start()
+
+    def _raise_error(self):
+        # the writer thread is stopped once a batch couldn't be written, the error is raised until the writer is
+        # closed
+        if self._error is not None:
+            raise self._error
+
+    def _hand_over(self, force: bool):
+        """
+        :return: the content of the buffer if it must be written, None otherwise
+        """
+        with self._buffer_lock:
+            if self.reorder_buffer is not None:
+                self._buffer.extend(self.reorder_buffer.pop_all() if force else self.reorder_buffer.pop_ready())
+            if not self._buffer:
+                return None
+            if not force and len(self._buffer) <= self.max_size and time.time() - self._last_hand_over < self.delay:
+                return None
+            batch, self._buffer = self._buffer, []
+            self._last_hand_over = time.time()
+            return batch
+
+    def _put(self, batch):
+        while True:
+            try:
+                self._batches.put(batch, timeout=0.1)
+                return
+            except queue.Full:
+                self._raise_error()
+                if not self._thread.is_alive():
+                    raise PusherWriterStoppedException()
+
+    def add(self, report):
+        """
+        Add a report to the buffer
+
+        :param Report report: the report to write
+        :raise: the last exception raised by the database if a batch couldn't be written
+        """
+        self._raise_error()
+        with self._buffer_lock:
+            if self.reorder_buffer is None:
+                self._buffer.append(report)
+            else:
+                self.reorder_buffer.push(report)
+        batch = self._hand_over(force=False)
+        if batch is not None:
+            self._put(batch)
+
+    def _write(self, batch):
+        if self.reorder_buffer is None:
+            batch.sort(key=lambda x: x.timestamp)
+        begin = time.perf_counter()
+        try:
+            self.database.save_many(batch)
+        except BadInputData as ex:
+            self.logger.warning(f"The report cannot be saved: {ex.msg}")
+            return
+        self.stats.add_batch(len(batch), time.perf_counter() - begin)
+        if self.stage_latencies is not None:
+            self.stage_latencies.observe_reports(batch, time.time())
+        self.logger.debug('save ' + str(len(batch)) + ' reports in database')
+
+    def _run(self):
+        while True:
+            # the buffer is handed over at each report when there is no delay
+            timeout = None if self.delay <= 0 else max(self._last_hand_over + self.delay - time.time(), MIN_WAIT_TIME)
+            try:
+                batch = self._batches.get(timeout=timeout)
+            except queue.Empty:
+                batch = self._hand_over(force=False)
+            if batch is _STOP:
+                return
+            if batch is None:
+                continue
+            try:
+                self._write(batch)
+            except Exception as exn:  # pylint: disable=broad-exception-caught
+                self._error = exn
+                return
+
+    def _unwritten_reports(self) -> int:
+        """
+        :return: the number of reports still waiting in the buffers and in the batch queue
+        """
+        unwritten = len(self._buffer)
+        if self.reorder_buffer is not None:
+            unwritten += len(self.reorder_buffer)
+        while True:
+            try:
+                batch = self._batches.get_nowait()
+            except queue.Empty:
+                return unwritten
+            if batch is not _STOP:
+                unwritten += len(batch)
+
+    def close(self):
+        """
+        Write the reports still in the buffer and stop the writer thread
+
+        If the writer thread was stopped by an error, the reports that were not written are dropped
+
+        :raise: the last exception raised by the database if a batch couldn't be written
+        """
+        if self._thread.is_alive():
+            batch = self._hand_over(force=True)
+            if batch is not None:
+                self._put(batch)
+            self._put(_STOP)
+            self._thread.join()
+
+        unwritten = self._unwritten_reports()
+        if unwritten > 0:
+            self.logger.error(str(unwritten) + ' reports were not written, the writer thread is stopped')
+        self._raise_error()
@@ -33,3 +33,4 @@ from powerapi.report.hwpc_report import HWPCReport
 from powerapi.report.control_report import ControlReport
 from powerapi.report.procfs_report import ProcfsReport
 from powerapi.report.formula_report import FormulaReport
+from powerapi.report.columnar_hwpc_report import ColumnarHWPCReport, HWPCGroupCounters
@@ -0,0 +1,299 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+import logging
+from array import array
+from datetime import datetime
+from typing import Dict, Any, Tuple
+
+try:
+    import numpy
+except ImportError:
+    logging.getLogger().info("numpy is not installed.")
+
+from powerapi.message import Message
+from powerapi.report.report import Report, BadInputData, CsvLines
+from powerapi.report.hwpc_report import HWPCReport
+
+#: (str): array typecode of integer counter values (signed 64 bits integers)
+COUNTER_TYPECODE = 'q'
+#: (str): array typecode of integer counter values when a group holds values above 2**63 (unsigned 64 bits integers)
+UNSIGNED_COUNTER_TYPECODE = 'Q'
+#: (str): array typecode of counter values when a group holds float values (64 bits floats)
+FLOAT_COUNTER_TYPECODE = 'd'
+
+#: (int): maximum number of layouts kept in the layout cache
+MAX_CACHED_LAYOUTS = 1024
+
+# Layouts (event names, (socket, core) rows) already seen, shared by the groups that use the same layout
+_LAYOUTS = {}
+
+
+def _intern_layout(events: Tuple[str, ...], rows: Tuple[Tuple[str, str], ...]):
+    """
+    Return the layout stored in the layout cache equal to the given one, so that reports with the same layout don't
+    keep their own copy of the event names and row indexes
+    """
+    layout = (events, rows)
+    if len(_LAYOUTS) >= MAX_CACHED_LAYOUTS:
+        return _LAYOUTS.get(layout, layout)
+    return _LAYOUTS.setdefault(layout, layout)
+
+
+class HWPCGroupCounters:
+    """
+    Counters of a HWPC group stored as a matrix with one row per (socket, core) and one column per event
+
+    The counter values are stored in a contiguous :class:`array.array` in row major order, as 64 bits integers
+    (unsigned if a hardware counter exceeds the signed range) or as 64 bits floats if the group was built from float
+    values
+    """
+
+    __slots__ = ('events', 'rows', 'values', '_row_index', '_event_index')
+
+    def __init__(self, events: Tuple[str, ...], rows: Tuple[Tuple[str, str], ...], values: array):
+        """
+        :param events: name of the events (columns of the matrix)
+        :param rows: (socket, core) corresponding to each row of the matrix
+        :param values: counter values, in row major order
+        :raise ValueError: if the number of values doesn't match the matrix dimensions
+        """
+        if len(values) != len(events) * len(rows):
+            raise ValueError('%d counter values given for %d events and %d cores' %
+                             (len(values), len(events), len(rows)))
+        self.events, self.rows = _intern_layout(tuple(events), tuple(tuple(row) for row in rows))
+        self.values = values
+        self._row_index = None
+        self._event_index = None
+
+    @staticmethod
+    def from_dict(group: Dict[str, Dict[str, Dict[str, int]]]) -> HWPCGroupCounters:
+        """
+        Build the counters of a group from its dictionary form (``{socket: {core: {event: value}}}``)
+
+        :raise ValueError: if all the cores of the group don't report the same events or if a counter value doesn't
+                           fit in 64 bits
+        """
+        events = None
+        rows = []
+        values = []
+        for socket, cores in group.items():
+            for core, counters in cores.items():
+                if events is None:
+                    events = tuple(counters)
+                elif len(counters) != len(events) or any(event not in counters for event in events):
+                    raise ValueError('cores of the group don\'t report the same events')
+                rows.append((socket, core))
+                values.extend(counters[event] for event in events)
+        if all(type(value) is int for value in values):
+            typecodes = (COUNTER_TYPECODE, UNSIGNED_COUNTER_TYPECODE)
+        else:
+            typecodes = (FLOAT_COUNTER_TYPECODE,)
+        for typecode in typecodes:
+            try:
+                return HWPCGroupCounters(events or (), rows, array(typecode, values))
+            except OverflowError:
+                continue
+        raise ValueError('counter values don\'t fit in 64 bits')
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        :return: the dictionary form (``{socket: {core: {event: value}}}``) of the group
+        """
+        group = {}
+        width = len(self.events)
+        values = self.values.tolist()
+        for i, (socket, core) in enumerate(self.rows):
+            group.setdefault(socket, {})[core] = dict(zip(self.events, values[i * width:(i + 1) * width]))
+        return group
+
+    def get(self, socket: str, core: str, event: str) -> int:
+        """
+        :return: the value of the given event counter on the given core
+        :raise KeyError: if the core or the event is not part of the group
+        """
+        if self._row_index is None:
+            self._row_index = {row: i for i, row in enumerate(self.rows)}
+            self._event_index = {event: i for i, event in enumerate(self.events)}
+        return self.values[self._row_index[(socket, core)] * len(self.events) + self._event_index[event]]
+
+    def layout(self) -> Dict[str, Dict[str, None]]:
+        """
+        :return: the sockets and cores of the group, as a ``{socket: {core: None}}`` dictionary
+        """
+        layout = {}
+        for socket, core in self.rows:
+            layout.setdefault(socket, {})[core] = None
+        return layout
+
+    def column(self, event: str) -> array:
+        """
+        :return: the values of the given event counter on each core, in the order of the rows
+        :raise ValueError: if the event is not part of the group
+        """
+        return self.values[self.events.index(event)::len(self.events)]
+
+    def to_numpy(self):
+        """
+        :return: a (cores x events) numpy matrix sharing the memory of the counter values
+        """
+        return numpy.frombuffer(self.values, dtype=self.values.typecode).reshape(len(self.rows), len(self.events))
+
+    def __eq__(self, other):
+        return (isinstance(other, HWPCGroupCounters) and self.events == other.events and self.rows == other.rows and
+                self.values == other.values)
+
+    def __repr__(self):
+        return 'HWPCGroupCounters(%s, %s)' % (self.events, self.rows)
+
+    def __reduce__(self):
+        return HWPCGroupCounters, (self.events, self.rows, self.values)
+
+
+# Slots of a ColumnarHWPCReport saved when it is pickled
+_PICKLED_SLOTS = Message.__slots__ + Report.__slots__ + ('counters',)
+
+
+class ColumnarHWPCReport(HWPCReport):
+    """
+    HWPCReport storing the counters of each group as a :class:`HWPCGroupCounters` matrix instead of nested
+    dictionaries
+
+    The :attr:`groups` attribute is computed on demand from the counter matrices, so the report can be used where a
+    HWPCReport is expected, but code that process many reports should use :attr:`counters` directly
+    """
+
+    __slots__ = ('counters',)
+
+    def __init__(self, timestamp: datetime, sensor: str, target: str, counters: Dict[str, HWPCGroupCounters],
+                 metadata: Dict[str, Any] = {}):
+        """
+        :param datetime timestamp: Timestamp of the report
+        :param str sensor: Sensor name
+        :param str target: Target name
+        :param Dict counters: Counters of each events group
+        """
+        Report.__init__(self, timestamp, sensor, target, metadata)
+
+        #: (dict): Counters of each events group
+        self.counters = counters
+
+    @property
+    def groups(self) -> Dict[str, Dict]:
+        """
+        (dict): Events groups in the dictionary form of a HWPCReport
+        """
+        return {group_name: counters.to_dict() for group_name, counters in self.counters.items()}
+
+    def __getstate__(self):
+        # the groups slot inherited from HWPCReport is hidden by the groups property and is not pickled
+        return None, {name: getattr(self, name) for name in _PICKLED_SLOTS}
+
+    def __repr__(self) -> str:
+        return 'ColumnarHWPCReport(%s, %s, %s, %s)' % (
+            self.timestamp, self.sensor, self.target, sorted(self.counters.keys()))
+
+    def __eq__(self, other):
+        return Report.__eq__(self, other) and self.counters == other.counters
+
+    @staticmethod
+    def from_hwpc_report(report: HWPCReport) -> ColumnarHWPCReport:
+        """
+        :return: a ColumnarHWPCReport holding the values of the given HWPCReport
+        :raise ValueError: if all the cores of a group don't report the same events or if a counter value doesn't fit
+                           in 64 bits
+        """
+        counters = {group_name: HWPCGroupCounters.from_dict(group) for group_name, group in report.groups.items()}
+        columnar_report = ColumnarHWPCReport(report.timestamp, report.sensor, report.target, counters,
+                                             report.metadata)
+        columnar_report.sender_name = report.sender_name
+        columnar_report.dispatcher_report_id = report.dispatcher_report_id
+        columnar_report.trace = report.trace
+        return columnar_report
+
+    def to_hwpc_report(self) -> HWPCReport:
+        """
+        :return: a HWPCReport holding the values of this report
+        """
+        report = HWPCReport(self.timestamp, self.sensor, self.target, self.groups, self.metadata)
+        report.sender_name = self.sender_name
+        report.dispatcher_report_id = self.dispatcher_report_id
+        report.trace = self.trace
+        return report
+
+    @staticmethod
+    def _from_hwpc_report(report: HWPCReport, data) -> ColumnarHWPCReport:
+        try:
+            return ColumnarHWPCReport.from_hwpc_report(report)
+        except ValueError as exn:
+            raise BadInputData(exn.args[0], data) from exn
+
+    @staticmethod
+    def from_json(data: Dict) -> ColumnarHWPCReport:
+        """
+        Generate a report using the given data.
+        :param data: Dictionary containing the report attributes
+        :return: The columnar HWPC report initialized with the given data
+        """
+        return ColumnarHWPCReport._from_hwpc_report(HWPCReport.from_json(data), data)
+
+    @staticmethod
+    def to_json(report: ColumnarHWPCReport) -> Dict:
+        return HWPCReport.to_json(report.to_hwpc_report())
+
+    @staticmethod
+    def from_mongodb(data: Dict) -> ColumnarHWPCReport:
+        """
+        :return: a ColumnarHWPCReport from a dictionary pulled from mongodb
+        """
+        return ColumnarHWPCReport.from_json(data)
+
+    @staticmethod
+    def to_mongodb(report: ColumnarHWPCReport) -> Dict:
+        """
+        :return: a dictionary, that can be stored into a mongodb, from a given ColumnarHWPCReport
+        """
+        return ColumnarHWPCReport.to_json(report)
+
+    @staticmethod
+    def from_csv_lines(lines: CsvLines) -> ColumnarHWPCReport:
+        """
+        :param lines: list of pre-parsed lines (see :meth:`HWPCReport.from_csv_lines`)
+        :return: a ColumnarHWPCReport that contains value from the given lines
+        """
+        return ColumnarHWPCReport._from_hwpc_report(HWPCReport.from_csv_lines(lines), lines)
+
+    @staticmethod
+    def create_empty_report():
+        """
+        Creates an empty report
+        """
+        return ColumnarHWPCReport(None, None, None, {})
@@ -33,7 +33,8 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List
 
-from powerapi.report.report import Report, CSV_HEADER_COMMON
+from powerapi.report.report import Report, CSV_HEADER_COMMON, BadInputData
+from powerapi.utils.influx_line_protocol import format_line, datetime_to_ns
 
 CSV_HEADER_FORMULA_REPORT = CSV_HEADER_COMMON + ['metadata']
 
@@ -44,6 +45,8 @@ class FormulaReport(Report):
     This is useful to gather information about a running formula in order to debug or compute statistics.
     """
 
+    __slots__ = ()
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, metadata: Dict[str, Any]):
         """
         Initialize a Formula report using the given parameters.
@@ -101,3 +104,18 @@ class FormulaReport(Report):
         }
 
         return document
+
+    @staticmethod
+    def to_influxdb_line(report: FormulaReport, *_, **__) -> str:
+        """
+        Convert a Formula report into an influxdb line protocol entry (with a nanosecond timestamp).
+        :param report: Formula report that will be converted
+        :return: the line protocol entry of the report
+        :raise BadInputData: if the report has no metadata, as a line protocol entry needs at least one field
+        """
+        # read only access, the metadata don't need to be copied
+        metadata = report._metadata  # pylint: disable=protected-access
+        if not metadata:
+            raise BadInputData('no metadata in formula report', report)
+        return format_line('formula_report', {'sensor': report.sensor, 'target': report.target}, metadata,
+                           datetime_to_ns(report.timestamp))
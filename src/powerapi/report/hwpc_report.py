@@ -69,6 +69,8 @@ class HWPCReport(Report):
         }
     """
 
+    __slots__ = ('groups',)
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, groups: Dict[str, Dict],
                  metadata: Dict[str, Any] = {}):
         """
@@ -103,10 +105,6 @@ class HWPCReport(Report):
         except ValueError as exn:
             raise BadInputData(exn.args[0], data) from exn
 
-    @staticmethod
-    def to_json(report: HWPCReport) -> Dict:
-        return report.__dict__
-
     @staticmethod
     def from_mongodb(data: Dict) -> HWPCReport:
         """
@@ -33,6 +33,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Tuple
 
 from powerapi.report.report import Report, CSV_HEADER_COMMON, BadInputData, CsvLines
+from powerapi.utils.influx_line_protocol import format_line, datetime_to_ns
 
 CSV_HEADER_POWER = CSV_HEADER_COMMON + ['power', 'socket']
 
@@ -42,6 +43,8 @@ class PowerReport(Report):
     PowerReport stores the power estimation information.
     """
 
+    __slots__ = ('power',)
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, power: float, metadata: Dict[str, Any] = {}):
         """
         Initialize a Power report using the given parameters.
@@ -172,6 +175,20 @@ class PowerReport(Report):
             }
         }
 
+    @staticmethod
+    def to_influxdb_line(report: PowerReport, tags: List[str]) -> str:
+        """
+        :return: the influxdb line protocol entry (with a nanosecond timestamp) of a given PowerReport
+        """
+        # read only access, the metadata don't need to be copied
+        metadata = report._metadata  # pylint: disable=protected-access
+        tag_values = {'sensor': report.sensor, 'target': report.target}
+        for tag in tags:
+            if tag not in metadata:
+                raise BadInputData('no tag ' + tag + ' in power report', report)
+            tag_values[tag] = metadata[tag]
+        return format_line('power_consumption', tag_values, {'power': report.power}, datetime_to_ns(report.timestamp))
+
     @staticmethod
     def to_prometheus(report: PowerReport, tags: List[str]) -> Dict:
         """
@@ -183,6 +200,19 @@ class PowerReport(Report):
             'value': report.power
         }
 
+    @staticmethod
+    def to_prometheus_sample(report: PowerReport, tags: List[str]) -> Tuple[tuple, float]:
+        """
+        :return: the label values (sensor, target then the given tags) and the value of the prometheus sample of a
+                 given PowerReport
+        """
+        # read only access, the metadata don't need to be copied
+        metadata = report._metadata  # pylint: disable=protected-access
+        try:
+            return (report.sensor, report.target, *[metadata[tag] for tag in tags]), report.power
+        except KeyError as exn:
+            raise BadInputData('no tag ' + str(exn.args[0]) + ' in power report', report) from exn
+
     @staticmethod
     def to_mongodb(report: PowerReport) -> Dict:
         """
@@ -53,6 +53,8 @@ class ProcfsReport(Report):
 
     """
 
+    __slots__ = ('usage', 'global_cpu_usage')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, usage: Dict, global_cpu_usage: float, metadata: Dict[str, Any] = {}):
         """
         Initialize an Procfs report using the given parameters.
@@ -87,10 +89,6 @@ class ProcfsReport(Report):
         except ValueError as exn:
             raise BadInputData(exn.args[0], data) from exn
 
-    @staticmethod
-    def to_json(report: ProcfsReport) -> Dict:
-        return report.__dict__
-
     @staticmethod
     def from_mongodb(data: Dict) -> ProcfsReport:
         """ Extract a PorcfsReport fropm a mongo DB"""
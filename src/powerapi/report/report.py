@@ -29,6 +29,7 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Dict, NewType, Tuple, List, Any
 from powerapi.exception import PowerAPIExceptionWithMessage, PowerAPIException
@@ -40,9 +41,19 @@ TARGET_KEY = 'target'
 METADATA_KEY = 'metadata'
 GROUPS_KEY = 'groups'
 
+# Stages of the pipeline that stamp the traced reports, in the order they handle them
+PULLER_STAGE = 'puller'
+PROCESSOR_STAGE = 'processor'
+DISPATCHER_STAGE = 'dispatcher'
+FORMULA_STAGE = 'formula'
+PUSHER_STAGE = 'pusher'
+
 CSV_HEADER_COMMON = [TIMESTAMP_KEY, SENSOR_KEY, TARGET_KEY]
 CsvLines = NewType('CsvLines', Tuple[List[str], Dict[str, str]])
 
+# Name of the attributes stored in the slots of each report class (see Report._field_names)
+_FIELD_NAMES = {}
+
 
 class BadInputData(PowerAPIExceptionWithMessage):
     """
@@ -64,8 +75,18 @@ class DeserializationFail(PowerAPIException):
 class Report(Message):
     """
     Report abtract class.
+
+    Report classes use ``__slots__`` to store their attributes. The metadata dictionary given to the constructor is
+    not copied when the report is created but the first time the :attr:`metadata` attribute is accessed, so the
+    dictionary given to the constructor is never modified and reports that are only forwarded never copy it. Until
+    this first access the report shares the dictionary with the caller, that must not modify it.
+
+    A report can be traced : each stage of the pipeline adds a (stage name, time) stamp to its :attr:`trace` when it
+    hands the report over to the next stage. Reports are not traced by default and carry no stamp.
     """
 
+    __slots__ = ('timestamp', 'sensor', 'target', '_metadata', '_metadata_owned', 'dispatcher_report_id', 'trace')
+
     def __init__(self, timestamp: datetime, sensor: str, target: str, metadata: Dict[str, Any] = {}):
         """
         Initialize a report using the given parameters.
@@ -77,11 +98,43 @@ class Report(Message):
         self.timestamp = timestamp
         self.sensor = sensor
         self.target = target
-        self.metadata = dict(metadata)
+        self._metadata = metadata
+        self._metadata_owned = False
 
         #: id given by the dispatcher actor in order manage report order
         self.dispatcher_report_id = None
 
+        #: (stage, time) stamps added by the stages of the pipeline, None if the report is not traced
+        self.trace = None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        (dict): Metadata of the report, copied from the dictionary given to the constructor on first access
+        """
+        if not self._metadata_owned:
+            self._metadata = dict(self._metadata)
+            self._metadata_owned = True
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._metadata = metadata
+        self._metadata_owned = True
+
+    def start_trace(self, stage: str):
+        """
+        Trace the report, starting with a stamp of the given stage
+        """
+        self.trace = ((stage, time.time()),)
+
+    def stamp(self, stage: str):
+        """
+        Add a stamp of the given stage to the trace of the report, do nothing if the report is not traced
+        """
+        if self.trace is not None:
+            self.trace += ((stage, time.time()),)
+
     def __str__(self):
         return '%s(%s, %s, %s)' % (self.__class__.__name__, self.timestamp, self.sensor, self.target)
 
@@ -93,17 +146,40 @@ class Report(Message):
                 self.timestamp == other.timestamp and
                 self.sensor == other.sensor and
                 self.target == other.target and
-                self.metadata == other.metadata)
+                self._metadata == other._metadata)
+
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        """
+        :return: the name of the attributes defined by the report subclasses, in definition order
+        """
+        field_names = _FIELD_NAMES.get(cls)
+        if field_names is None:
+            field_names = tuple(name for report_class in reversed(cls.__mro__)
+                                if issubclass(report_class, Report) and report_class is not Report
+                                for name in report_class.__dict__.get('__slots__', ()))
+            _FIELD_NAMES[cls] = field_names
+        return field_names
 
     @staticmethod
     def to_json(report: Report) -> Dict:
         """
         :return: a json dictionary, that can be converted into json format, from a given Report
+
+        The report is not modified. sender_name, dispatcher_report_id and trace are not exported
         """
-        json = report.__dict__
-        # sender_name and dispatcher_report_id are not used
-        json.pop('sender_name')
-        json.pop('dispatcher_report_id')
+        json = {
+            TIMESTAMP_KEY: report.timestamp,
+            SENSOR_KEY: report.sensor,
+            TARGET_KEY: report.target,
+            METADATA_KEY: report.metadata,
+        }
+        for name in report._field_names():
+            json[name] = getattr(report, name)
+
+        # attributes of report classes that don't define __slots__
+        for name, value in getattr(report, '__dict__', {}).items():
+            json[name] = value
 
         return json
 
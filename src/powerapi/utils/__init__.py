@@ -31,3 +31,6 @@ from powerapi.utils.utils import timestamp_to_datetime, datetime_to_timestamp, d
 from powerapi.utils.tree import Tree
 from powerapi.utils.stat_buffer import StatBuffer
 from .json_stream import JsonStream
+from powerapi.utils.hash_ring import ConsistentHashRing
+from powerapi.utils.influx_line_protocol import format_line, datetime_to_ns
+from powerapi.utils.profiler import SamplingProfiler, profile_path, DEFAULT_SAMPLING_INTERVAL
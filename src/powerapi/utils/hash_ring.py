@@ -0,0 +1,100 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import bisect
+import zlib
+from typing import Any, Hashable, Iterable
+
+
+def _hash(key: str) -> int:
+    """
+    Return a hash of the given key that is stable between processes (unlike
+    the builtin hash function)
+    """
+    return zlib.crc32(key.encode())
+
+
+class ConsistentHashRing:
+    """
+    Consistent hash ring that map keys on a set of nodes
+
+    Each node is placed several times on the ring (virtual nodes) to spread
+    the keys evenly. Adding or removing a node only move the keys of this
+    node, other keys stay on the same node
+    """
+
+    def __init__(self, nodes: Iterable[Hashable] = (), replicas: int = 100):
+        """
+        :param nodes: initial nodes of the ring
+        :param replicas: number of virtual nodes placed on the ring for each node
+        """
+        self.replicas = replicas
+        self._hashes = []
+        self._nodes = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def __len__(self):
+        return len(set(self._nodes.values()))
+
+    def add_node(self, node: Hashable):
+        """
+        Add a node to the ring
+
+        :param node: node to add
+        """
+        for replica in range(self.replicas):
+            node_hash = _hash(str(node) + '#' + str(replica))
+            if node_hash not in self._nodes:
+                bisect.insort(self._hashes, node_hash)
+            self._nodes[node_hash] = node
+
+    def remove_node(self, node: Hashable):
+        """
+        Remove a node from the ring
+
+        :param node: node to remove
+        """
+        for replica in range(self.replicas):
+            node_hash = _hash(str(node) + '#' + str(replica))
+            if self._nodes.get(node_hash) == node:
+                del self._nodes[node_hash]
+                del self._hashes[bisect.bisect_left(self._hashes, node_hash)]
+
+    def get_node(self, key: Any) -> Hashable:
+        """
+        Return the node the given key is mapped on
+
+        :param key: key to map, its string representation is hashed
+        :raise KeyError: if the ring is empty
+        """
+        if not self._hashes:
+            raise KeyError(key)
+        index = bisect.bisect(self._hashes, _hash(str(key))) % len(self._hashes)
+        return self._nodes[self._hashes[index]]
@@ -0,0 +1,94 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+_MEASUREMENT_ESCAPE = str.maketrans({',': '\\,', ' ': '\\ ', '\n': '\\n'})
+_TAG_ESCAPE = str.maketrans({',': '\\,', '=': '\\=', ' ': '\\ ', '\n': '\\n'})
+_STRING_FIELD_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def escape_measurement(measurement: str) -> str:
+    """
+    Escape the special characters of a measurement name
+    """
+    return measurement.translate(_MEASUREMENT_ESCAPE)
+
+
+def escape_tag(tag: Any) -> str:
+    """
+    Escape the special characters of a tag key, a tag value or a field key
+    """
+    return str(tag).translate(_TAG_ESCAPE)
+
+
+def format_field_value(value: Any) -> str:
+    """
+    Format a field value with the line protocol type suffix (i for integers, quotes for strings)
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value) + 'i'
+    if isinstance(value, float):
+        return repr(value)
+    return '"' + str(value).translate(_STRING_FIELD_ESCAPE) + '"'
+
+
+def datetime_to_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime into a number of nanoseconds since epoch, a naive datetime is considered as local time (as
+    the datetimes created by powerapi.utils.timestamp_to_datetime)
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+def format_line(measurement: str, tags: Dict[str, Any], fields: Dict[str, Any], timestamp_ns: int) -> str:
+    """
+    Build a line protocol entry, tags with an empty value are skipped as influxdb reject them
+
+    :param measurement: measurement name
+    :param tags: tag keys and values of the point
+    :param fields: field keys and values of the point, at least one field is needed
+    :param timestamp_ns: timestamp of the point in nanoseconds
+    :return: the line (without the trailing newline)
+    """
+    line = escape_measurement(measurement)
+    for key, value in tags.items():
+        value = escape_tag(value)
+        if value:
+            line += ',' + escape_tag(key) + '=' + value
+    line += ' ' + ','.join(escape_tag(key) + '=' + format_field_value(value) for key, value in fields.items())
+    return line + ' ' + str(timestamp_ns)
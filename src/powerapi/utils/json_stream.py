@@ -26,9 +26,217 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import json
+import logging
+import re
+from collections import deque
+from typing import List, Union
+
+try:
+    import orjson
+except ImportError:
+    logging.getLogger().info("orjson is not installed.")
+    orjson = None  # pylint: disable=invalid-name
 
 DEFAULT_BUFFER_SIZE = 4096
 
+BRACE_FRAMING = 'brace'
+NDJSON_FRAMING = 'ndjson'
+FRAMINGS = (BRACE_FRAMING, NDJSON_FRAMING)
+
+_SPECIAL_BYTES = re.compile(rb'[{}"\\]')
+_STRING_SPECIAL_BYTES = re.compile(rb'["\\]')
+_NOT_BLANK = re.compile(rb'\S')
+
+_OPENING_BRACE = 123
+_CLOSING_BRACE = 125
+_QUOTE = 34
+_BACKSLASH = 92
+
+
+class JsonSplitter:
+    """
+    Incremental splitter of a byte stream into json objects
+
+    Two framings are supported:
+      - brace: objects are delimited by balancing their braces (braces inside strings are ignored), the bytes between
+        two objects (whitespaces, newlines) are skipped
+      - ndjson: one object per line, blank lines are skipped
+
+    Only the new data is scanned when it is fed, the state of the scan (brace depth, string and escape) is kept
+    between two feeds. The returned objects are memoryview slices of the received data, the pieces of an object
+    received by several feeds are joined once, when the object is completed
+    """
+
+    def __init__(self, framing: str = BRACE_FRAMING):
+        """
+        :param framing: brace or ndjson
+        """
+        if framing not in FRAMINGS:
+            raise ValueError('unknown json framing ' + str(framing))
+        self.framing = framing
+        self._pieces = []
+        self._skip = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> List[memoryview]:
+        """
+        Add data received from the stream
+
+        :return: the json objects completed by the data
+        """
+        if not data:
+            return []
+        data = bytes(data)
+        view = memoryview(data)
+        if self.framing == NDJSON_FRAMING:
+            objects, start = self._split_lines(data, view)
+        else:
+            objects, start = self._split_braces(data, view)
+        if start < len(data):
+            self._pieces.append(view[start:])
+        return objects
+
+    def _complete(self, view: memoryview, start: int, end: int) -> memoryview:
+        """
+        :return: the object ending in the data, joined with its pieces received before
+        """
+        if not self._pieces:
+            return view[start:end]
+        self._pieces.append(view[start:end])
+        json_object = memoryview(b''.join(self._pieces))
+        self._pieces = []
+        return json_object
+
+    def _split_lines(self, data: bytes, view: memoryview):
+        objects = []
+        start = 0
+        end = data.find(b'\n')
+        while end != -1:
+            line = self._complete(view, start, end)
+            if _NOT_BLANK.search(line):
+                objects.append(line)
+            start = end + 1
+            end = data.find(b'\n', start)
+        return objects, start
+
+    def _split_braces(self, data: bytes, view: memoryview):
+        objects = []
+        start = 0
+        pos = self._skip
+        depth = self._depth
+        in_string = self._in_string
+        size = len(data)
+        while pos < size:
+            if depth == 0:
+                # skip the bytes between two objects
+                start = data.find(b'{', pos)
+                if start == -1:
+                    pos = size
+                    break
+                depth = 1
+                pos = start + 1
+            elif in_string:
+                match = _STRING_SPECIAL_BYTES.search(data, pos)
+                if match is None:
+                    pos = size
+                    break
+                pos = match.end()
+                if data[pos - 1] == _BACKSLASH:
+                    # skip the escaped byte, that can be in the next data
+                    pos += 1
+                else:
+                    in_string = False
+            else:
+                match = _SPECIAL_BYTES.search(data, pos)
+                if match is None:
+                    pos = size
+                    break
+                pos = match.end()
+                byte = data[pos - 1]
+                if byte == _QUOTE:
+                    in_string = True
+                elif byte == _OPENING_BRACE:
+                    depth += 1
+                elif byte == _CLOSING_BRACE:
+                    depth -= 1
+                    if depth == 0:
+                        objects.append(self._complete(view, start, pos))
+        if depth == 0:
+            start = size
+        self._skip = pos - size
+        self._depth = depth
+        self._in_string = in_string
+        return objects, start
+
+
+JSON_BACKEND = 'json'
+ORJSON_BACKEND = 'orjson'
+JSON_BACKENDS = (JSON_BACKEND, ORJSON_BACKEND)
+
+
+def check_json_backend(backend: str):
+    """
+    :raise ValueError: if the json backend is unknown or not installed
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError('unknown json backend ' + str(backend))
+    if backend == ORJSON_BACKEND and orjson is None:
+        raise ValueError('orjson is not installed')
+
+
+def decode_json_objects(json_objects: List[Union[bytes, memoryview]], backend: str = JSON_BACKEND) -> List:
+    """
+    Decode a batch of json objects. With the json backend, the batch is decoded as a single json array, with the
+    orjson backend, objects are decoded one by one. Objects that can't be decoded are logged and skipped
+
+    :param json_objects: encoded json objects
+    :param backend: json or orjson
+    :return: the decoded objects
+    """
+    if not json_objects:
+        return []
+    if backend == JSON_BACKEND:
+        try:
+            return json.loads(b'[' + b','.join(json_objects) + b']')
+        except ValueError:
+            pass
+    loads = orjson.loads if backend == ORJSON_BACKEND else lambda json_object: json.loads(bytes(json_object))
+    documents = []
+    for json_object in json_objects:
+        try:
+            documents.append(loads(json_object))
+        except ValueError:
+            logging.getLogger().warning('invalid json object skipped: %s', bytes(json_object)[:100])
+    return documents
+
+
+class JsonStreamDecoder:
+    """
+    Incremental decoder of a byte stream of json objects
+
+    The objects are split with a JsonSplitter then decoded by batch, each object being decoded once it is completed
+    """
+
+    def __init__(self, framing: str = BRACE_FRAMING, backend: str = JSON_BACKEND):
+        """
+        :param framing: brace or ndjson
+        :param backend: json or orjson
+        :raise ValueError: if the framing or the backend is unknown, or if the backend is not installed
+        """
+        check_json_backend(backend)
+        self.splitter = JsonSplitter(framing)
+        self.backend = backend
+
+    def feed(self, data: bytes) -> List:
+        """
+        Add data received from the stream
+
+        :return: the decoded json objects completed by the data
+        """
+        return decode_json_objects(self.splitter.feed(data), self.backend)
+
 
 class JsonStream:
     """read data received from a input utf-8 byte stream socket as a json stream
@@ -37,66 +245,37 @@ class JsonStream:
     :param buffer_size: size of the buffer used to receive data from the socket,
                         it must match the average size of received json string
                         (default 4096 bytes)
+    :param framing: framing of the json objects in the stream (brace or ndjson)
+    :param backend: json backend used to decode the objects (json or orjson)
+
+    the objects must be read either as strings (read_json_object) or decoded (read_documents), not both
     """
 
-    def __init__(self, stream_reader, buffer_size=4096):
+    def __init__(self, stream_reader, buffer_size=DEFAULT_BUFFER_SIZE, framing=BRACE_FRAMING, backend=JSON_BACKEND):
         self.stream_reader = stream_reader
-        self.json_buffer = b''
         self.buffer_size = buffer_size
-        self.open_brackets = 0
+        self.splitter = JsonSplitter(framing)
+        self.decoder = JsonStreamDecoder(framing, backend)
+        self._pending = deque()
 
     async def _get_bytes(self):
         data = await self.stream_reader.read(n=self.buffer_size)
         return b'' if data is None else data
 
-    def _extract_json_end_position(self, first_new_byte):
+    async def read_documents(self) -> List:
         """
-        Find the first valable report in the stream
+        Read the connection once
+
+        :return: the decoded json objects completed by the received data
         """
-        i = first_new_byte
-        # print("buffer is ", self.json_buffer[first_new_byte:])
-        if len(self.json_buffer) == 0:
-            return -1
-        if self.json_buffer[0] != 123:   # ASCII code opening bracket
-            return -1
-
-        while i < len(self.json_buffer):
-            if self.json_buffer[i] == 125:  # ASCII code closing bracket
-                self.open_brackets -= 1
-                # print("opening : ", self.open_brackets)
-            elif self.json_buffer[i] == 123:  # ASCII code opening bracket
-                self.open_brackets += 1
-                # print("closing :",self.open_brackets)
-            if self.open_brackets == 0:
-                return i
-            i += 1
-
-        return -1
+        return self.decoder.feed(await self._get_bytes())
 
     async def read_json_object(self):
         """
-        return all the json object received from the connection as a iteration of string
+        return the next json object received from the connection as a string, None if no complete object was received
         """
-        if len(self.json_buffer) != 0 and self.open_brackets == 0:
-            # Last iteration _extract_json_end_position returned a json_object
-            # and breaked. If the buffer isn't empty wasn't treated, so we have
-            # to treat it
-            first_new_byte = 0
-        else:
-            first_new_byte = len(self.json_buffer)
-            self.json_buffer += await self._get_bytes()
-        i = self._extract_json_end_position(first_new_byte)
-
-        if i == -1:
-            return None
-        if i == len(self.json_buffer) - 1:
-            json_str = self.json_buffer[:]
-            self.json_buffer = b''
-            # print("buffer empty")
-            # print(self.open_brackets)
-        else:
-            json_str = self.json_buffer[:i + 1]
-            self.json_buffer = self.json_buffer[i + 1:]
-            # print("buffer non empty ")
-            # print(self.open_brackets)
-        return json_str.decode('utf-8')
+        if not self._pending:
+            self._pending.extend(self.splitter.feed(await self._get_bytes()))
+            if not self._pending:
+                return None
+        return bytes(self._pending.popleft()).decode('utf-8')
@@ -0,0 +1,142 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Sampling profiler of the current process
+
+A :class:`SamplingProfiler` periodically samples the call stacks of the threads of the current process and writes them
+in the collapsed stack format (one ``thread;frame;...;frame count`` line by stack) read by the flame graph tools
+(flamegraph.pl, speedscope, ...). It runs in its own thread, so a profiled actor keeps handling its messages while it is
+profiled.
+"""
+
+import collections
+import os
+import re
+import sys
+import threading
+import time
+
+#: (float): default time (in seconds) between two samples of the call stacks
+DEFAULT_SAMPLING_INTERVAL = 0.01
+#: (str): extension of the profile files
+PROFILE_FILE_EXTENSION = '.folded'
+
+
+def profile_path(output_directory: str, actor_name: str) -> str:
+    """
+    :return: path of the file where the profile of the given actor is written
+    """
+    return os.path.join(output_directory, re.sub(r'[^\w.-]+', '_', actor_name).strip('_') + PROFILE_FILE_EXTENSION)
+
+
+class SamplingProfiler(threading.Thread):
+    """
+    Thread sampling the call stacks of the threads of the process during a given duration, then writing them in a file
+    in the collapsed stack format
+    """
+
+    def __init__(self, output_path: str, duration: float, interval: float = DEFAULT_SAMPLING_INTERVAL,
+                 thread_ids=None, logger=None):
+        """
+        :param str output_path: path of the written profile
+        :param float duration: time (in seconds) during which the call stacks are sampled
+        :param float interval: time (in seconds) between two samples
+        :param set thread_ids: identifiers of the sampled threads, all the threads of the process if None
+        :param logging.Logger logger: logger where the profile writing is reported
+        """
+        threading.Thread.__init__(self, name='profiler', daemon=True)
+        self.output_path = output_path
+        self.duration = duration
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.logger = logger
+
+        #: (collections.Counter): number of samples of each collapsed stack
+        self.stacks = collections.Counter()
+        #: (int): number of times the call stacks were sampled
+        self.samples = 0
+        self._labels = {}
+        self._thread_names = {}
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = code.co_name + ' (' + code.co_filename + ':' + str(code.co_firstlineno) + ')'
+        return label
+
+    def _thread_name(self, ident: int) -> str:
+        name = self._thread_names.get(ident)
+        if name is None:
+            self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            name = self._thread_names.setdefault(ident, 'thread-' + str(ident))
+        return name
+
+    def sample(self):
+        """
+        Add the current call stacks of the sampled threads to the profile
+        """
+        own_ident = threading.get_ident()
+        for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+            if ident == own_ident or (self.thread_ids is not None and ident not in self.thread_ids):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+            labels.append(self._thread_name(ident))
+            labels.reverse()
+            self.stacks[';'.join(labels)] += 1
+        self.samples += 1
+
+    def write(self):
+        """
+        Write the profile in the output file, the file appears once completely written
+        """
+        temporary_path = self.output_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as output_file:
+            for stack, count in sorted(self.stacks.items()):
+                output_file.write(stack + ' ' + str(count) + '\n')
+        os.replace(temporary_path, self.output_path)
+
+    def run(self):
+        deadline = time.monotonic() + self.duration
+        next_sample = time.monotonic()
+        while next_sample < deadline:
+            self.sample()
+            next_sample += self.interval
+            time.sleep(max(next_sample - time.monotonic(), 0))
+        try:
+            self.write()
+        except OSError as exn:
+            if self.logger is not None:
+                self.logger.error('cannot write the profile ' + self.output_path + ': ' + str(exn))
+            return
+        if self.logger is not None:
+            self.logger.info(str(self.samples) + ' samples written in the profile ' + self.output_path)
@@ -0,0 +1,95 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import struct
+from datetime import datetime
+
+import pytest
+
+from powerapi.database import BinaryProtocolError, encode_hwpc_frame, BINARY_PROTOCOL_HEADER
+from powerapi.database.binary_protocol import BinaryStreamDecoder, decode_hwpc_frame, MAX_FRAME_SIZE
+from powerapi.report import HWPCReport
+
+REPORT = HWPCReport(datetime(2021, 7, 12, 11, 33, 13, 520000), 'sensor', 'target',
+                    {'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 87599611904.0, 'time_enabled': 1000120188.0}}},
+                     'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 2 ** 40, 'LLC_MISSES': 3},
+                                    '1': {'INSTRUCTIONS_RETIRED': 5, 'LLC_MISSES': 8}},
+                              '1': {'2': {'INSTRUCTIONS_RETIRED': 13, 'LLC_MISSES': 21}}}},
+                    {'scope': 'cpu'})
+
+
+def test_decode_encoded_frame_return_the_same_reports_with_the_same_value_types():
+    frame = encode_hwpc_frame([REPORT, REPORT])
+    reports = decode_hwpc_frame(frame[4:])
+
+    assert reports == [REPORT, REPORT]
+    assert reports[0].metadata == {'scope': 'cpu'}
+    assert isinstance(reports[0].groups['rapl']['0']['0']['RAPL_ENERGY_PKG'], float)
+    assert isinstance(reports[0].groups['core']['0']['0']['LLC_MISSES'], int)
+
+
+def test_encode_report_whose_cpus_hold_different_events_raise_ValueError():
+    report = HWPCReport(datetime(2021, 7, 12), 'sensor', 'target', {'core': {'0': {'0': {'a': 1}, '1': {'b': 1}}}}, {})
+    with pytest.raises(ValueError):
+        encode_hwpc_frame([report])
+
+
+def test_stream_decoder_rebuild_frames_received_byte_by_byte():
+    data = BINARY_PROTOCOL_HEADER + encode_hwpc_frame([REPORT]) + encode_hwpc_frame([REPORT, REPORT])
+    decoder = BinaryStreamDecoder()
+    reports = []
+    for i in range(len(data)):
+        reports += decoder.feed(data[i:i + 1])
+    assert reports == [REPORT] * 3
+
+
+def test_stream_decoder_with_unsupported_version_raise_BinaryProtocolError():
+    with pytest.raises(BinaryProtocolError):
+        BinaryStreamDecoder().feed(b'PAPI\x02' + encode_hwpc_frame([REPORT]))
+
+
+def test_stream_decoder_with_truncated_frame_payload_raise_BinaryProtocolError():
+    frame = encode_hwpc_frame([REPORT])
+    payload = frame[4:-3]
+    with pytest.raises(BinaryProtocolError):
+        BinaryStreamDecoder().feed(BINARY_PROTOCOL_HEADER + struct.pack('!I', len(payload)) + payload)
+
+
+def test_stream_decoder_with_too_big_frame_raise_BinaryProtocolError():
+    with pytest.raises(BinaryProtocolError):
+        BinaryStreamDecoder().feed(BINARY_PROTOCOL_HEADER + struct.pack('!I', MAX_FRAME_SIZE + 1))
+
+
+def test_decode_frame_with_reports_of_different_targets_and_layouts_keep_the_reports_order():
+    other_target = HWPCReport(REPORT.timestamp, 'sensor', 'other', REPORT.groups, {'scope': 'cpu'})
+    other_layout = HWPCReport(datetime(2021, 7, 12, 11, 33, 14), 'sensor', 'target',
+                              {'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 42}}}}, {})
+    reports = [REPORT, other_target, other_layout, REPORT]
+
+    assert decode_hwpc_frame(encode_hwpc_frame(reports)[4:]) == reports
@@ -36,6 +36,8 @@ import csv
 from powerapi.report import PowerReport, HWPCReport
 from powerapi.database import CsvDB
 from powerapi.database import CsvBadFilePathError, CsvBadCommonKeysError, HeaderAreNotTheSameError
+from powerapi.database import CsvCompressionError
+from powerapi.database.csvdb import read_segment_index
 from powerapi.utils import timestamp_to_datetime
 from tests.utils.db.csv import ROOT_PATH
 
@@ -328,3 +330,205 @@ class TestCsvDB():
 
         for i in range(4):
             assert power_reports[i] == reading_power_reports[i]
+
+    def test_csvdb_save_many_with_less_open_files_than_targets(self, clean_csv_files):
+        """
+        Save a batch of PowerReport of several targets with a CsvDB that can only keep one file open
+        """
+        csvdb = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE, max_open_files=1)
+        csvdb.connect()
+
+        targets = ['target1', 'target2', 'target3']
+        power_reports = [PowerReport(timestamp_to_datetime(timestamp), SENSOR, target, 0.11,
+                                     {'mdt_socket': '-1', 'metadata1': 'truc', 'metadata2': 'oui'})
+                         for timestamp in range(1, 4) for target in targets]
+        csvdb.save_many(power_reports[:4])
+        csvdb.save_many(power_reports[4:])
+        assert len(csvdb.file_cache._files) == 1
+        csvdb.close()
+
+        for target in targets:
+            csvdb_read = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE)
+            csvdb_read.add_file(PATH_TO_SAVE + SENSOR + "-" + target + "/PowerReport.csv")
+            assert list(csvdb_read.iter(False)) == [report for report in power_reports if report.target == target]
+
+    def test_csvdb_save_header_error_with_a_file_already_written(self, clean_csv_files):
+        """
+        Save a PowerReport, then a PowerReport with other metadata in the same file
+        """
+        csvdb = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE)
+        csvdb.save(gen_power_report())
+
+        power_report = gen_power_report()
+        power_report.metadata = {'mdt_socket': '-1', 'metadata3': 'non'}
+        with pytest.raises(HeaderAreNotTheSameError):
+            csvdb.save(power_report)
+
+
+class TestCsvDBChunked(TestCsvDB):
+    """
+    Test class of CsvDB class when the files are read by blocks
+    """
+
+    @pytest.fixture(params=[False, True], ids=['read', 'mmap'])
+    def power_csvdb(self, request):
+        return CsvDB(PowerReport, ['socket'], current_path=os.getcwd(), chunk_size=64, use_mmap=request.param)
+
+    @pytest.fixture(params=[False, True], ids=['read', 'mmap'])
+    def hwpc_csvdb(self, request):
+        return CsvDB(HWPCReport, ['socket'], current_path=os.getcwd(), chunk_size=64, use_mmap=request.param)
+
+    @pytest.mark.parametrize('files', [BASIC_FILES, FIRST_PRIMARY_MISSING, SECOND_PRIMARY_MISSING,
+                                       FIRST_RAPL_MISSING, SECOND_RAPL_MISSING])
+    def test_csvdb_chunked_reader_create_the_same_reports_than_the_line_reader(self, hwpc_csvdb, files):
+        """
+        Compare the reports created by the chunked reader and the line by line reader
+        """
+        hwpc_csvdb.add_files(files)
+        line_csvdb = CsvDB(HWPCReport, ['socket'], current_path=os.getcwd(), files=files)
+
+        reports = list(hwpc_csvdb.iter(False))
+        expected_reports = list(line_csvdb.iter(False))
+
+        assert [report.groups for report in reports] == [report.groups for report in expected_reports]
+        assert reports == expected_reports
+
+    def test_csvdb_chunked_reader_create_one_report_per_target(self, clean_csv_files):
+        """
+        Rows of different targets with the same timestamp give different reports
+        """
+        os.makedirs(PATH_TO_SAVE)
+        with open(PATH_TO_SAVE + 'core.csv', 'w') as csvfile:
+            csvfile.write('timestamp,sensor,target,socket,cpu,INSTRUCTIONS_RETIRED\n'
+                          '1000,sensor,app1,0,0,1\n'
+                          '1000,sensor,app2,0,0,2\n'
+                          '1000,sensor,app1,0,1,3\n'
+                          '2000,sensor,app1,0,0,4\n')
+        with open(PATH_TO_SAVE + 'rapl.csv', 'w') as csvfile:
+            csvfile.write('timestamp,sensor,target,socket,cpu,RAPL_ENERGY_PKG\n'
+                          '1000,sensor,app2,0,0,20\n'
+                          '1000,sensor,app1,0,0,10\n'
+                          '1500,sensor,app1,0,0,15\n'
+                          '2000,sensor,app1,0,0,40\n')
+        csvdb = CsvDB(HWPCReport, [], files=[PATH_TO_SAVE + 'core.csv', PATH_TO_SAVE + 'rapl.csv'], chunk_size=16)
+
+        reports = [(report.timestamp, report.target, report.groups) for report in csvdb.iter(False)]
+
+        assert reports == [
+            (timestamp_to_datetime(1000), 'app1', {'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 1},
+                                                                  '1': {'INSTRUCTIONS_RETIRED': 3}}},
+                                                   'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 10}}}}),
+            (timestamp_to_datetime(1000), 'app2', {'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 2}}},
+                                                   'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 20}}}}),
+            (timestamp_to_datetime(2000), 'app1', {'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 4}}},
+                                                   'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 40}}}}),
+        ]
+
+    def test_csvdb_chunked_reader_read_the_rows_after_blank_lines_longer_than_a_block(self, clean_csv_files):
+        """
+        A block holding only blank lines doesn't end the file
+        """
+        os.makedirs(PATH_TO_SAVE)
+        with open(PATH_TO_SAVE + 'core.csv', 'w') as csvfile:
+            csvfile.write('timestamp,sensor,target,socket,cpu,INSTRUCTIONS_RETIRED\n'
+                          '1000,sensor,app1,0,0,1\n' + '\n' * 64 +
+                          '2000,sensor,app1,0,0,2\n')
+        with open(PATH_TO_SAVE + 'rapl.csv', 'w') as csvfile:
+            csvfile.write('timestamp,sensor,target,socket,cpu,RAPL_ENERGY_PKG\n'
+                          '1000,sensor,app1,0,0,10\n'
+                          '2000,sensor,app1,0,0,20\n')
+        csvdb = CsvDB(HWPCReport, [], files=[PATH_TO_SAVE + 'core.csv', PATH_TO_SAVE + 'rapl.csv'], chunk_size=16)
+
+        reports = [(report.timestamp, report.groups['core']) for report in csvdb.iter(False)]
+
+        assert reports == [(timestamp_to_datetime(1000), {'0': {'0': {'INSTRUCTIONS_RETIRED': 1}}}),
+                           (timestamp_to_datetime(2000), {'0': {'0': {'INSTRUCTIONS_RETIRED': 2}}})]
+
+    def test_csvdb_chunked_reader_build_reports_by_batch(self, hwpc_csvdb):
+        """
+        next_batch return at most report_batch_size reports
+        """
+        hwpc_csvdb.add_files(BASIC_FILES)
+        csvdb_iter = hwpc_csvdb.iter(False)
+        csvdb_iter.report_batch_size = 1
+
+        assert len(csvdb_iter.next_batch()) == 1
+        assert len(csvdb_iter.next_batch()) == 1
+        assert csvdb_iter.next_batch() == []
+
+
+def gen_power_reports(timestamps):
+    return [PowerReport(timestamp_to_datetime(timestamp), SENSOR, TARGET, 0.11,
+                        {'mdt_socket': '-1', 'metadata1': 'truc', 'metadata2': 'oui'}) for timestamp in timestamps]
+
+
+class TestCsvDBRotation:
+    """
+    Test class of CsvDB class when the output files are rotated
+    """
+
+    output_file = PATH_TO_SAVE + SENSOR + "-" + TARGET + "/PowerReport.csv"
+
+    @pytest.mark.parametrize('compression', [None, 'gzip', 'zstd'])
+    def test_csvdb_rotation_by_interval_index_segments(self, clean_csv_files, compression):
+        """
+        Save 30 seconds of PowerReport with a rotation every 10 seconds
+        """
+        if compression == 'zstd':
+            pytest.importorskip('zstandard')
+        csvdb = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE, rotation_interval=10,
+                      compression=compression)
+        power_reports = gen_power_reports(range(1000, 31000, 1000))
+        csvdb.save_many(power_reports[:15])
+        csvdb.save_many(power_reports[15:])
+        csvdb.close()
+
+        segments = read_segment_index(self.output_file)
+        assert [(first, last) for _, first, last in segments] == [(1000, 10000), (11000, 20000)]
+        for path, _, _ in segments:
+            assert path.endswith('.csv' + {None: '', 'gzip': '.gz', 'zstd': '.zst'}[compression])
+            assert os.path.exists(path)
+
+        # the reports of the last 10 seconds are in the current segment
+        assert list(csvdb.iter_segments(self.output_file)) == power_reports
+
+    def test_csvdb_rotation_by_size(self, clean_csv_files):
+        """
+        Save PowerReport with a rotation when the files reach 200 bytes
+        """
+        csvdb = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE, rotation_size=200)
+        power_reports = gen_power_reports(range(1000, 21000, 1000))
+        for power_report in power_reports:
+            csvdb.save(power_report)
+        csvdb.close()
+
+        segments = read_segment_index(self.output_file)
+        assert len(segments) > 1
+        for path, _, _ in segments:
+            assert 200 <= os.path.getsize(path) < 300
+        assert list(csvdb.iter_segments(self.output_file)) == power_reports
+
+    def test_csvdb_iter_segments_between_two_dates_only_read_the_overlapping_segments(self, clean_csv_files):
+        """
+        Read the PowerReport of a time range from a file rotated every 10 seconds
+        """
+        csvdb = CsvDB(PowerReport, ['mdt_socket'], current_path=PATH_TO_SAVE, rotation_interval=10)
+        power_reports = gen_power_reports(range(1000, 41000, 1000))
+        csvdb.save_many(power_reports)
+        csvdb.close()
+
+        # a segment that doesn't overlap the range is never opened
+        first_segment, _, _ = read_segment_index(self.output_file)[0]
+        os.remove(first_segment)
+
+        reports = list(csvdb.iter_segments(self.output_file, timestamp_to_datetime(15000),
+                                           timestamp_to_datetime(25000)))
+        assert reports == power_reports[14:25]
+
+    def test_csvdb_with_compression_without_rotation_raise_CsvCompressionError(self):
+        with pytest.raises(CsvCompressionError):
+            CsvDB(PowerReport, [], current_path=PATH_TO_SAVE, compression='gzip')
+
+    def test_csvdb_with_an_unknown_compression_raise_CsvCompressionError(self):
+        with pytest.raises(CsvCompressionError):
+            CsvDB(PowerReport, [], current_path=PATH_TO_SAVE, rotation_size=500, compression='lz4')
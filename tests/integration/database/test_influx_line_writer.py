@@ -0,0 +1,108 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+
+import pytest
+
+from powerapi.database import InfluxDB, InfluxLineWriter, InfluxWriteError, CantConnectToInfluxDBException
+from powerapi.report import PowerReport
+# noinspection PyUnresolvedReferences
+from tests.utils.db.http import stand_in
+
+
+def written_lines(server):
+    return [line for body in server.bodies('/write') for line in body.decode().split('\n')]
+
+
+def gen_lines(count):
+    return ['power_consumption,sensor=s,target=t power=' + str(i) + ' ' + str(i) for i in range(count)]
+
+
+def test_writer_send_gzipped_lines_in_batches(stand_in):
+    writer = InfluxLineWriter(stand_in.url + '/write?db=test', batch_lines=10, max_concurrency=2)
+    writer.write(gen_lines(25))
+    writer.close()
+
+    assert len(stand_in.requests) == 3
+    assert all(headers['Content-Encoding'] == 'gzip' for _, _, headers, _, _, _ in stand_in.requests)
+    assert sorted(written_lines(stand_in)) == sorted(gen_lines(25))
+
+
+def test_writer_retry_request_that_failed_with_retryable_status(stand_in):
+    stand_in.failures = [503, 429]
+    writer = InfluxLineWriter(stand_in.url + '/write?db=test', retry_backoff=0.01)
+    writer.write(gen_lines(3))
+    writer.close()
+
+    assert [status for _, _, _, _, status, _ in stand_in.requests] == [503, 429, 204]
+    assert writer.retries == 2
+    assert written_lines(stand_in) == gen_lines(3)
+
+
+def test_writer_raise_InfluxWriteError_on_next_call_when_status_is_not_retryable(stand_in):
+    stand_in.failures = [400]
+    writer = InfluxLineWriter(stand_in.url + '/write?db=test', retry_backoff=0.01)
+    writer.write(gen_lines(3))
+    with pytest.raises(InfluxWriteError):
+        writer.flush()
+    writer.close()
+    assert len(stand_in.requests) == 1
+
+
+def test_writer_raise_InfluxWriteError_when_retries_are_exhausted(stand_in):
+    stand_in.failures = [500, 500, 500]
+    writer = InfluxLineWriter(stand_in.url + '/write?db=test', max_retries=2, retry_backoff=0.01)
+    writer.write(gen_lines(3))
+    with pytest.raises(InfluxWriteError):
+        writer.close()
+    assert len(stand_in.requests) == 3
+
+
+def test_influxdb_in_line_protocol_mode_create_database_and_write_reports(stand_in):
+    db = InfluxDB(PowerReport, 'localhost', stand_in.port, 'powerapi', ['socket'], line_protocol=True)
+    db.connect()
+    reports = [PowerReport(datetime.datetime(1970, 1, 1, 0, 0, i), 'sensor', 'target', 10.0 * i, {'socket': 0})
+               for i in range(3)]
+    db.save(reports[0])
+    db.save_many(reports[1:])
+    db.close()
+
+    ping, query = stand_in.requests[:2]
+    assert ping[:2] == ('GET', '/ping')
+    assert query[:2] == ('POST', '/query')
+    assert b'CREATE+DATABASE' in query[3]
+    assert all(path == '/write?db=powerapi&precision=ns' for _, path, _, _, _, _ in stand_in.requests[2:])
+    assert sorted(written_lines(stand_in)) == sorted(PowerReport.to_influxdb_line(report, ['socket']) for report in reports)
+
+
+def test_influxdb_in_line_protocol_mode_with_invalid_port_raise_CantConnectToInfluxDBException():
+    db = InfluxDB(PowerReport, 'localhost', 1, 'powerapi', ['socket'], line_protocol=True)
+    with pytest.raises(CantConnectToInfluxDBException):
+        db.connect()
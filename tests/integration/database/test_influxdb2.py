@@ -27,9 +27,11 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import datetime
+import logging
+
 import pytest
 
-from powerapi.database.influxdb2 import InfluxDB2
+from powerapi.database.influxdb2 import InfluxDB2, InfluxWriteModeError, BATCHING_WRITE_MODE
 from powerapi.report import PowerReport
 # noinspection PyUnresolvedReferences
 from tests.utils.db.influx2 import INFLUX2_ORG, INFLUX2_TOKEN, INFLUX2_URL, INFLUX2_BUCKET_NAME, \
@@ -209,3 +211,52 @@ def test_write_many_report_in_non_empty_db(influx_database, database):
     database.save_many([POWER_REPORT_1, POWER_REPORT_2])
 
     check_db_reports(database, [POWER_REPORT_0, POWER_REPORT_1, POWER_REPORT_2])
+
+
+#################
+# BATCHING MODE #
+#################
+def gen_batching_database(**kwargs):
+    return InfluxDB2(report_type=PowerReport, url=INFLUX2_URL, org=INFLUX2_ORG, bucket_name=INFLUX2_BUCKET_NAME,
+                     token=INFLUX2_TOKEN, tags=['socket'], write_mode=BATCHING_WRITE_MODE, **kwargs)
+
+
+def test_create_database_with_unknown_write_mode_raise_InfluxWriteModeError():
+    with pytest.raises(InfluxWriteModeError):
+        InfluxDB2(report_type=PowerReport, url=INFLUX2_URL, org=INFLUX2_ORG, bucket_name=INFLUX2_BUCKET_NAME,
+                  token=INFLUX2_TOKEN, tags=['socket'], write_mode='unknown')
+
+
+def test_batching_mode_use_the_given_write_options():
+    db = gen_batching_database(write_batch_size=10, flush_interval=200, jitter_interval=5, max_retries=1)
+    options = db._write_options()
+
+    assert options.write_type.name == 'batching'
+    assert options.batch_size == 10
+    assert options.flush_interval == 200
+    assert options.jitter_interval == 5
+    assert options.max_retries == 1
+
+
+def test_batching_mode_log_write_errors_with_the_database_logger(caplog):
+    db = gen_batching_database()
+    db.logger = logging.getLogger('test-pusher')
+    db._write_error((INFLUX2_BUCKET_NAME, INFLUX2_ORG, 'ns'), '', Exception('server unavailable'))
+
+    assert 'test-pusher' in [record.name for record in caplog.records]
+    assert 'server unavailable' in caplog.text
+
+
+def test_write_many_report_in_batching_mode_write_them_when_the_database_is_closed(influx_database, database):
+    """
+     call the save_many method on a database in batching mode, with a batch size bigger than the number of reports
+
+     test if the reports were writen in the database once it is closed
+     """
+    batching_database = gen_batching_database(write_batch_size=100, flush_interval=60000)
+    batching_database.connect()
+    batching_database.save_many([POWER_REPORT_1, POWER_REPORT_2, POWER_REPORT_3])
+    batching_database.close()
+
+    database.connect()
+    check_db_reports(database, [POWER_REPORT_1, POWER_REPORT_2, POWER_REPORT_3])
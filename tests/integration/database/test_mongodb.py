@@ -127,3 +127,90 @@ def test_mongodb_save_basic_db(mongo_database):
     for report in gen_HWPCReports(2):
         mongodb.save(report)
     assert mongodb.collection.count_documents({}) == basic_count + 2
+
+
+def test_mongodb_read_db_by_batch_return_reports_ordered_by_timestamp(mongo_database):
+    """
+    Test read mongodb collection by batches of 3 documents
+    """
+    mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME, batch_size=3)
+    mongodb.connect()
+    mongodb_iter = mongodb.iter(False)
+
+    timestamps = [next(mongodb_iter).timestamp for _ in range(10)]
+    assert timestamps == sorted(timestamps)
+
+    with pytest.raises(StopIteration):
+        next(mongodb_iter)
+    assert mongodb.collection.count_documents({}) == 10
+
+
+def test_mongodb_read_db_by_batch_in_stream_mode_delete_the_read_documents(mongo_database):
+    """
+    Test read mongodb collection in stream mode by batches of 3 documents
+    """
+    mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME, batch_size=3)
+    mongodb.connect()
+    mongodb_iter = mongodb.iter(True)
+
+    for _ in range(10):
+        report = next(mongodb_iter)
+    with pytest.raises(StopIteration):
+        next(mongodb_iter)
+    assert mongodb.collection.count_documents({}) == 0
+
+    # the iterator return the documents added after a StopIteration
+    mongodb.save(report)
+    assert next(mongodb_iter).timestamp == report.timestamp
+
+
+def test_mongodb_read_db_with_change_stream_resume_after_restart(mongo_database):
+    """
+    Test read mongodb collection in stream mode with a change stream (if the server support them), then read it
+    again with a new MongoDB instance
+    """
+    mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME, batch_size=3,
+                      change_stream=True)
+    mongodb.connect()
+    mongodb.collection.delete_many({})
+    mongodb_iter = mongodb.iter(True)
+
+    reports = gen_HWPCReports(4)
+    mongodb.save_many(reports[:2])
+    assert [next(mongodb_iter).timestamp for _ in range(2)] == [report.timestamp for report in reports[:2]]
+    # the next call hand off the returned reports
+    with pytest.raises(StopIteration):
+        next(mongodb_iter)
+
+    mongodb.save_many(reports[2:])
+    restarted_mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME,
+                                batch_size=3, change_stream=True)
+    restarted_mongodb.connect()
+    restarted_mongodb_iter = restarted_mongodb.iter(True)
+    assert [next(restarted_mongodb_iter).timestamp for _ in range(2)] == [report.timestamp for report in reports[2:]]
+    with pytest.raises(StopIteration):
+        next(restarted_mongodb_iter)
+
+
+def test_mongodb_read_db_with_change_stream_read_again_the_reports_not_handed_off_after_restart(mongo_database):
+    """
+    Test that the reports of a batch read from a change stream are read again after a restart if they were not all
+    handed off (at-least-once delivery)
+    """
+    mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME, batch_size=3,
+                      change_stream=True)
+    mongodb.connect()
+    mongodb.collection.delete_many({})
+    mongodb_iter = mongodb.iter(True)
+    if mongodb_iter.change_stream is None:
+        pytest.skip('change streams are not supported by the mongodb server')
+
+    reports = gen_HWPCReports(2)
+    mongodb.save_many(reports)
+    assert next(mongodb_iter).timestamp == reports[0].timestamp
+
+    restarted_mongodb = MongoDB(HWPCReport, MONGO_URI, MONGO_DATABASE_NAME, MONGO_INPUT_COLLECTION_NAME,
+                                batch_size=3, change_stream=True)
+    restarted_mongodb.connect()
+    restarted_mongodb_iter = restarted_mongodb.iter(True)
+    assert [next(restarted_mongodb_iter).timestamp for _ in range(2)] == [report.timestamp for report in reports]
@@ -0,0 +1,100 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+import json
+
+import pytest
+
+from powerapi.database import OpenTSDB, OpenTSDBWriteError, CantConnectToOpenTSDBException
+from powerapi.report import PowerReport
+# noinspection PyUnresolvedReferences
+from tests.utils.db.http import stand_in
+
+METRIC = 'powerapi_power'
+
+
+def gen_reports(count):
+    return [PowerReport(datetime.datetime.fromtimestamp(i), 'sensor', 'target' + str(i % 3), 10.0 * i, {})
+            for i in range(count)]
+
+
+def posted_datapoints(server):
+    return [datapoint for body in server.bodies('/api/put') for datapoint in json.loads(body)]
+
+
+@pytest.fixture
+def database(stand_in):
+    db = OpenTSDB(PowerReport, 'localhost', stand_in.port, METRIC, http_bulk=True, bulk_size=10)
+    db.connect()
+    yield db
+    db.close()
+
+
+def test_connect_in_http_bulk_mode_check_the_api_version(stand_in, database):
+    assert stand_in.requests[0][:2] == ('GET', '/api/version')
+
+
+def test_connect_in_http_bulk_mode_to_invalid_port_raise_CantConnectToOpenTSDBException():
+    db = OpenTSDB(PowerReport, 'localhost', 1, METRIC, http_bulk=True)
+    with pytest.raises(CantConnectToOpenTSDBException):
+        db.connect()
+
+
+def test_save_many_in_http_bulk_mode_post_datapoints_by_chunks_on_one_connection(stand_in, database):
+    reports = gen_reports(25)
+    database.save_many(reports)
+
+    posts = [request for request in stand_in.requests if request[0] == 'POST']
+    assert len(posts) == 3
+    assert len({client_address for _, _, _, _, _, client_address in stand_in.requests}) == 1
+    assert posted_datapoints(stand_in) == [{'metric': METRIC, 'timestamp': int(report.timestamp.timestamp()),
+                                            'value': report.power, 'tags': {'host': report.target}}
+                                           for report in reports]
+
+
+def test_save_in_http_bulk_mode_post_one_datapoint(stand_in, database):
+    database.save(gen_reports(1)[0])
+    assert len(posted_datapoints(stand_in)) == 1
+
+
+def test_save_many_in_http_bulk_mode_with_compression_post_gzipped_bodies(stand_in):
+    db = OpenTSDB(PowerReport, 'localhost', stand_in.port, METRIC, http_bulk=True, compress=True)
+    db.connect()
+    db.save_many(gen_reports(5))
+    db.close()
+
+    assert stand_in.requests[-1][2]['Content-Encoding'] == 'gzip'
+    assert len(posted_datapoints(stand_in)) == 5
+
+
+def test_save_many_in_http_bulk_mode_raise_OpenTSDBWriteError_when_datapoints_are_rejected(stand_in, database):
+    stand_in.failures = [400]
+    with pytest.raises(OpenTSDBWriteError):
+        database.save_many(gen_reports(5))
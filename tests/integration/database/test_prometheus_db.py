@@ -34,7 +34,8 @@ import time
 import requests
 import pytest
 
-from powerapi.database import PrometheusDB
+from powerapi.database import PrometheusDB, PrometheusCollectorDB
+from powerapi.database.prometheus_db import SeriesCollector
 from powerapi.report import PowerReport
 
 PORT = 9999
@@ -78,18 +79,28 @@ def extract_metrics(metric_prefix, url):
 
 
 class PrometheusServer(multiprocessing.Process):
-    def __init__(self, q, port):
+    def __init__(self, q, port, collector=False):
         multiprocessing.Process.__init__(self)
         self.port = port
         self.q = q
+        self.collector = collector
 
     def run(self):
-        db = PrometheusDB(report_type=PowerReport,
-                          port=self.port,
-                          address=ADDR,
-                          metric_name=METRIC,
-                          metric_description=DESC,
-                          tags=['socket'])
+        if self.collector:
+            db = PrometheusCollectorDB(report_type=PowerReport,
+                                       port=self.port,
+                                       address=ADDR,
+                                       metric_name=METRIC,
+                                       metric_description=DESC,
+                                       tags=['socket'],
+                                       series_ttl=1)
+        else:
+            db = PrometheusDB(report_type=PowerReport,
+                              port=self.port,
+                              address=ADDR,
+                              metric_name=METRIC,
+                              metric_description=DESC,
+                              tags=['socket'])
         db.connect()
         self.q.put('ok')
         while True:
@@ -97,10 +108,10 @@ class PrometheusServer(multiprocessing.Process):
             db.save_many(report_list)
 
 
-def _gen_serv():
+def _gen_serv(collector=False):
     port = PORT
     q = multiprocessing.Queue()
-    p = PrometheusServer(q, port)
+    p = PrometheusServer(q, port, collector)
     p.start()
     return port, q, p
 
@@ -120,6 +131,21 @@ def db_info():
     p.terminate()
 
 
+@pytest.fixture
+def collector_db_info():
+    """
+    start a PrometheusCollectorDB (with a series ttl of 1 second) in a process and return a q to send report to the DB
+    """
+    port, q, p = _gen_serv(collector=True)
+    if q.get(timeout=1) == 'ok':
+        yield q, _gen_url(port)
+    else:
+        p.terminate()
+        port, q, p = _gen_serv(collector=True)
+        yield q, _gen_url(port)
+    p.terminate()
+
+
 def _gen_url(port):
     return 'http://' + ADDR + ':' + str(port) + '/metrics'
 
@@ -205,3 +231,34 @@ def test_save_report_from_two_target_and_then_report_from_one_target_must_finaly
     data = extract_metrics(METRIC, url)
     assert TARGET1 in data
     assert TARGET2 not in data
+
+
+def test_collector_db_save_reports_with_different_target_must_expose_last_value_of_each_target(collector_db_info):
+    db, url = collector_db_info
+    db.put([REPORTA_1, REPORTB_1, REPORTA_2])
+
+    data = extract_metrics(METRIC, url)
+    assert data[TARGET1] == [{'socket': '0', 'sensor': '0', 'value': 20}]
+    assert data[TARGET2] == [{'socket': '0', 'sensor': '0', 'value': 40}]
+
+
+def test_collector_db_must_remove_series_not_updated_for_series_ttl(collector_db_info):
+    db, url = collector_db_info
+    db.put([REPORTA_1, REPORTB_1])
+    time.sleep(1)
+    db.put([REPORTA_2])
+
+    data = extract_metrics(METRIC, url)
+    assert TARGET1 in data
+    assert TARGET2 not in data
+
+
+def test_series_collector_build_metric_with_the_last_value_of_each_series():
+    collector = SeriesCollector(METRIC, DESC, ['sensor', 'target', 'socket'])
+    collector.update([(('sensor', TARGET1, 0), 10), (('sensor', TARGET2, 0), 40)])
+    collector.update([(('sensor', TARGET1, 0), 20)])
+
+    [metric] = list(collector.collect())
+    assert sorted((sample.labels['target'], sample.value) for sample in metric.samples) == [(TARGET1, 20),
+                                                                                           (TARGET2, 40)]
+    assert metric.samples[0].labels == {'sensor': 'sensor', 'target': TARGET1, 'socket': '0'}
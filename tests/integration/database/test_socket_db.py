@@ -27,31 +27,34 @@ import json
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from socket import socket
 from threading import Thread
 
 import pytest
 import pytest_asyncio
 
-from powerapi.database import SocketDB
-from powerapi.report import HWPCReport
+from powerapi.database import SocketDB, DBError
+from powerapi.report import HWPCReport, PowerReport
 from tests.utils.report.hwpc import extract_rapl_reports_with_2_sockets
+from tests.utils.db.socket import BinarySensorEmulator
 
 
 class ClientThread(Thread):
 
-    def __init__(self, msg_list, port):
+    def __init__(self, msg_list, port, separator=''):
         Thread.__init__(self)
 
         self.msg_list = msg_list
         self.socket = socket()
         self.port = port
+        self.separator = separator
 
     def run(self):
         self.socket.connect(('localhost', self.port))
         for msg in self.msg_list:
-            self.socket.send(bytes(json.dumps(msg), 'utf-8'))
+            self.socket.send(bytes(json.dumps(msg) + self.separator, 'utf-8'))
         self.socket.close()
 
 
@@ -98,3 +101,147 @@ async def test_read_two_json_object_received_from_the_socket(socket_db, unused_t
 
     report = await iterator.__anext__()
     assert_report_equals(report, json_reports[1])
+
+
+@pytest_asyncio.fixture
+async def ndjson_socket_db(unused_tcp_port):
+    socket_db = SocketDB(HWPCReport, unused_tcp_port, framing='ndjson')
+    await socket_db.connect()
+    yield socket_db
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_read_two_json_object_received_one_per_line_from_the_socket(ndjson_socket_db, unused_tcp_port):
+    json_reports = extract_rapl_reports_with_2_sockets(2)
+    client = ClientThread(json_reports, unused_tcp_port, separator='\n')
+    client.start()
+
+    iterator = ndjson_socket_db.iter(False)
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[0])
+
+    report = await iterator.__anext__()
+    assert_report_equals(report, json_reports[1])
+
+
+def test_create_socket_db_with_unknown_framing_raise_DBError():
+    with pytest.raises(DBError):
+        SocketDB(HWPCReport, 0, framing='xml')
+
+
+async def read_reports(iterator, count):
+    reports = []
+    for _ in range(count):
+        report = await iterator.__anext__()
+        if report is None:
+            break
+        reports.append(report)
+    return reports
+
+
+@pytest.mark.asyncio
+async def test_read_reports_received_with_the_binary_protocol_by_small_chunks(socket_db, unused_tcp_port):
+    reports = [HWPCReport.from_json(json_report) for json_report in extract_rapl_reports_with_2_sockets(30)]
+    sensor = BinarySensorEmulator(reports, unused_tcp_port, batch_size=7, chunk_size=100)
+    sensor.start()
+
+    assert await read_reports(socket_db.iter(False), 30) == reports
+
+
+@pytest.mark.asyncio
+async def test_read_reports_from_a_json_connection_and_a_binary_connection_on_the_same_port(socket_db,
+                                                                                         unused_tcp_port):
+    json_reports = extract_rapl_reports_with_2_sockets(10)
+    reports = [HWPCReport.from_json(json_report) for json_report in json_reports]
+    ClientThread(json_reports[:5], unused_tcp_port).start()
+    BinarySensorEmulator(reports[5:], unused_tcp_port).start()
+
+    received = await read_reports(socket_db.iter(False), 10)
+    assert sorted(received, key=lambda report: report.timestamp) == sorted(reports, key=lambda report: report.timestamp)
+
+
+@pytest.mark.asyncio
+async def test_binary_connection_with_unsupported_version_is_closed_without_reading_reports(socket_db,
+                                                                                          unused_tcp_port):
+    reports = [HWPCReport.from_json(json_report) for json_report in extract_rapl_reports_with_2_sockets(2)]
+    BinarySensorEmulator(reports, unused_tcp_port, header=b'PAPI\x7f').start()
+
+    assert await read_reports(socket_db.iter(False), 2) == []
+
+
+@pytest_asyncio.fixture
+async def power_socket_db(unused_tcp_port):
+    socket_db = SocketDB(PowerReport, unused_tcp_port)
+    await socket_db.connect()
+    yield socket_db
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_binary_connection_to_a_socket_db_that_does_not_read_hwpc_reports_is_refused(power_socket_db,
+                                                                                          unused_tcp_port):
+    reports = [HWPCReport.from_json(json_report) for json_report in extract_rapl_reports_with_2_sockets(2)]
+    BinarySensorEmulator(reports, unused_tcp_port).start()
+
+    assert await read_reports(power_socket_db.iter(False), 2) == []
+
+
+def gen_reports(count, target):
+    template = HWPCReport.from_json(extract_rapl_reports_with_2_sockets(1)[0])
+    return [HWPCReport(template.timestamp + timedelta(seconds=i), template.sensor, target, template.groups)
+            for i in range(count)]
+
+
+@pytest_asyncio.fixture
+async def bounded_socket_db(unused_tcp_port):
+    socket_db = SocketDB(HWPCReport, unused_tcp_port, queue_size=5)
+    await socket_db.connect()
+    yield socket_db
+    await socket_db.stop()
+
+
+@pytest.mark.asyncio
+async def test_connection_is_not_read_when_the_queue_is_full(bounded_socket_db, unused_tcp_port):
+    reports = gen_reports(50, 'target')
+    BinarySensorEmulator(reports, unused_tcp_port).start()
+    await asyncio.sleep(0.5)
+
+    assert bounded_socket_db.queue.qsize() == 5
+    stats, = bounded_socket_db.connection_stats
+    assert stats.protocol == 'binary'
+    assert stats.reports < 50
+
+    assert await read_reports(bounded_socket_db.iter(False), 50) == reports
+    assert stats.reports == 50
+    assert stats.blocked_time > 0
+
+
+@pytest.mark.asyncio
+async def test_connections_take_turns_to_fill_a_full_queue(bounded_socket_db, unused_tcp_port):
+    BinarySensorEmulator(gen_reports(100, 'target1'), unused_tcp_port).start()
+    BinarySensorEmulator(gen_reports(100, 'target2'), unused_tcp_port).start()
+    await asyncio.sleep(0.5)
+
+    iterator = bounded_socket_db.iter(False)
+    received = await read_reports(iterator, 50)
+    assert {report.target for report in received} == {'target1', 'target2'}
+    received += await read_reports(iterator, 150)
+    assert len(received) == 200
+
+
+@pytest.mark.asyncio
+async def test_next_batch_return_all_the_received_reports(socket_db, unused_tcp_port):
+    reports = gen_reports(20, 'target')
+    BinarySensorEmulator(reports, unused_tcp_port, batch_size=20).start()
+    await asyncio.sleep(0.5)
+
+    iterator = socket_db.iter(False)
+    assert await iterator.next_batch() == reports
+    assert not socket_db.connection_stats
+
+
+def test_create_socket_db_with_negative_queue_size_raise_DBError():
+    with pytest.raises(DBError):
+        SocketDB(HWPCReport, 0, queue_size=-1)
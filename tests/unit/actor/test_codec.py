@@ -0,0 +1,174 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime, timezone
+
+import pytest
+
+from powerapi.actor import SocketInterface, PickleCodec, ReportCodec, UnknownCodecException, get_codec
+from powerapi.message import StartMessage, PoisonPillMessage
+from powerapi.report import Report, HWPCReport, PowerReport, ProcfsReport, FormulaReport, ColumnarHWPCReport
+
+HWPC_GROUPS = {
+    'rapl': {'0': {'7': {'RAPL_ENERGY_PKG': 2151940096, 'time_enabled': 503899405, 'time_running': 503899405}}},
+    'core': {'0': {'0': {'CPU_CLK_THREAD_UNHALTED:REF_P': 5965287, 'INSTRUCTIONS_RETIRED': 8454620},
+                   '1': {'CPU_CLK_THREAD_UNHALTED:REF_P': 2210547, 'INSTRUCTIONS_RETIRED': 1887346}}}
+}
+TIMESTAMP = datetime(2023, 6, 1, 12, 37, 37, 168817)
+
+
+@pytest.fixture
+def codec():
+    """
+    Return a report codec
+    """
+    return ReportCodec()
+
+
+@pytest.fixture(params=[
+    HWPCReport(TIMESTAMP, 'sensor', 'target', HWPC_GROUPS, {'scope': 'cpu'}),
+    PowerReport(TIMESTAMP, 'sensor', 'target', 42.42, {'socket': '0'}),
+    ProcfsReport(TIMESTAMP, 'sensor', ['firefox', 'emacs'], {'firefox': 8.36, 'emacs': 5.52}, 27.61),
+    PowerReport(None, 'sensor', 'target', 0.0),
+    ColumnarHWPCReport.from_hwpc_report(HWPCReport(TIMESTAMP, 'sensor', 'target', HWPC_GROUPS, {'scope': 'cpu'})),
+    ColumnarHWPCReport.from_hwpc_report(HWPCReport(TIMESTAMP, 'sensor', 'target',
+                                                   {'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 2 ** 64 - 1}}}}))
+])
+def report(request):
+    """
+    Return reports handled by the report codec schemas
+    """
+    return request.param
+
+
+def report_attributes(report):
+    attributes = Report.to_json(report)
+    attributes['sender_name'] = report.sender_name
+    attributes['dispatcher_report_id'] = report.dispatcher_report_id
+    attributes['trace'] = report.trace
+    return attributes
+
+
+def message_attributes(msg):
+    names = {name for cls in type(msg).__mro__ for name in getattr(cls, '__slots__', ())}
+    return {name: getattr(msg, name) for name in names}
+
+
+def check_report(decoded, report):
+    assert type(decoded) is type(report)
+    assert report_attributes(decoded) == report_attributes(report)
+
+
+def test_report_codec_encode_and_decode_report(codec, report):
+    report.dispatcher_report_id = 12
+    report.sender_name = 'dispatcher'
+
+    check_report(codec.decode(codec.encode(report)), report)
+
+
+def test_report_codec_encode_and_decode_the_trace_of_a_report(codec, report):
+    report.trace = (('puller', 1685623057.5), ('dispatcher', 1685623057.75))
+
+    check_report(codec.decode(codec.encode(report)), report)
+    report.trace = None
+
+
+def test_report_codec_encode_report_with_schema(codec, report):
+    assert codec.encode(report)[0] != 0
+
+
+def test_report_codec_encoded_report_is_smaller_than_pickle(codec):
+    report = PowerReport(TIMESTAMP, 'sensor', 'target', 42.42, {'socket': '0'})
+
+    assert len(codec.encode(report)) < len(PickleCodec().encode(report))
+
+
+@pytest.mark.parametrize('msg', [StartMessage('system'), PoisonPillMessage(soft=False, sender_name='system'),
+                                 FormulaReport(TIMESTAMP, 'sensor', 'target', {'formula': 'rapl'}), 'toto'])
+def test_report_codec_use_pickle_for_other_messages(codec, msg):
+    data = codec.encode(msg)
+
+    assert data[0] == 0
+    decoded = codec.decode(data)
+    assert type(decoded) is type(msg)
+    assert decoded == msg or (isinstance(msg, Report) and report_attributes(decoded) == report_attributes(msg)) or message_attributes(decoded) == message_attributes(msg)
+
+
+@pytest.mark.parametrize('report', [
+    PowerReport(1, 'sensor', 'target', 42.42),
+    PowerReport(TIMESTAMP.replace(tzinfo=timezone.utc), 'sensor', 'target', 42.42),
+    PowerReport(TIMESTAMP, 'sensor', 'target', 42.42, {'date': TIMESTAMP}),
+    HWPCReport(TIMESTAMP, 'sensor', 'target', {'core': {'0': {'0': {'LLC_MISSES': object}}}}),
+])
+def test_report_codec_use_pickle_for_report_that_does_not_fit_the_schema(codec, report):
+    data = codec.encode(report)
+
+    assert data[0] == 0
+    check_report(codec.decode(data), report)
+
+
+class ExtendedPowerReport(PowerReport):
+    """
+    PowerReport subclass without __slots__, that can hold extra attributes
+    """
+
+
+def test_report_codec_use_pickle_for_report_subclass(codec):
+    report = ExtendedPowerReport(TIMESTAMP, 'sensor', 'target', 42.42)
+    report.extra = 'extra'
+
+    data = codec.encode(report)
+
+    assert data[0] == 0
+    check_report(codec.decode(data), report)
+
+
+def test_get_codec_return_a_new_codec_instance():
+    assert isinstance(get_codec('pickle'), PickleCodec)
+    assert isinstance(get_codec('report'), ReportCodec)
+
+
+def test_get_codec_with_unknown_name_raise_UnknownCodecException():
+    with pytest.raises(UnknownCodecException):
+        get_codec('json')
+
+
+def test_socket_interface_send_and_receive_report_with_report_codec(report):
+    socket_interface = SocketInterface('dummy_actor', 100, codec=ReportCodec())
+    socket_interface.setup()
+    socket_interface.connect_data()
+    socket_interface.connect_control()
+
+    socket_interface.send_data(report)
+    check_report(socket_interface.receive(), report)
+
+    socket_interface.send_control(StartMessage('system'))
+    assert isinstance(socket_interface.receive(), StartMessage)
+
+    socket_interface.close()
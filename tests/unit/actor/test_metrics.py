@@ -0,0 +1,183 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pylint: disable=redefined-outer-name
+import multiprocessing
+import queue
+import time
+import urllib.request
+from datetime import datetime
+
+import pytest
+
+from powerapi.actor import Actor, Supervisor, MetricsCollector, ActorMetrics
+from powerapi.actor.metrics import LATENCY_BUCKETS, StageLatencies, set_current_trace
+from powerapi.pusher import PusherActor
+from powerapi.report import PowerReport
+
+from tests.unit.actor.abstract_test_actor import recv_from_pipe
+from tests.utils.actor.dummy_actor import DummyActor
+
+
+@pytest.fixture
+def collector():
+    metrics_collector = MetricsCollector()
+    yield metrics_collector
+    metrics_collector.stop()
+
+
+def test_actor_metrics_count_the_messages_by_type_and_histogram_the_handling_time():
+    metrics = ActorMetrics('actor', queue.Queue())
+    report = PowerReport(1, 'sensor', 'target', 42)
+    metrics.message_handled(report, 0.0003)
+    metrics.message_handled(report, 10)
+    metrics.message_sent(report)
+
+    snapshot = metrics.snapshot(backlog=3)
+
+    assert snapshot['received'] == {'PowerReport': 2}
+    assert snapshot['sent'] == {'PowerReport': 1}
+    counts, total = snapshot['handling_time']['PowerReport']
+    assert counts[LATENCY_BUCKETS.index(0.0005)] == 1
+    assert counts[-1] == 1
+    assert total == pytest.approx(10.0003)
+    assert snapshot['backlog'] == 3
+
+
+def test_actor_metrics_are_published_once_per_interval():
+    metrics_queue = queue.Queue()
+    metrics = ActorMetrics('actor', metrics_queue, interval=60)
+
+    metrics.publish(None)
+    assert metrics_queue.empty()
+
+    metrics.publish(None, force=True)
+    metrics.publish(None)
+    assert metrics_queue.qsize() == 1
+
+
+def test_collector_render_the_metrics_in_the_prometheus_text_format(collector):
+    metrics = ActorMetrics('pusher "1"', collector.queue)
+    metrics.message_handled(PowerReport(1, 'sensor', 'target', 42), 0.002)
+    metrics.receive_wait = 1.5
+    collector.add(metrics.snapshot(backlog=7))
+
+    text = collector.render()
+
+    assert 'powerapi_actor_messages_received_total{actor="pusher \\"1\\"",type="PowerReport"} 1' in text
+    assert 'powerapi_actor_handling_seconds_bucket{actor="pusher \\"1\\"",type="PowerReport",le="0.001"} 0' in text
+    assert 'powerapi_actor_handling_seconds_bucket{actor="pusher \\"1\\"",type="PowerReport",le="0.0025"} 1' in text
+    assert 'powerapi_actor_handling_seconds_bucket{actor="pusher \\"1\\"",type="PowerReport",le="+Inf"} 1' in text
+    assert 'powerapi_actor_handling_seconds_count{actor="pusher \\"1\\"",type="PowerReport"} 1' in text
+    assert 'powerapi_actor_receive_wait_seconds_total{actor="pusher \\"1\\""} 1.5' in text
+    assert 'powerapi_actor_backlog{actor="pusher \\"1\\""} 7' in text
+
+
+def traced_report(sensor_time, *trace):
+    report = PowerReport(datetime.fromtimestamp(sensor_time), 'sensor', 'target', 42)
+    report.trace = trace
+    return report
+
+
+def test_stage_latencies_measure_the_time_between_the_stamps_of_the_traced_reports():
+    stage_latencies = StageLatencies()
+    reports = [traced_report(100.0, ('puller', 100.5), ('dispatcher', 100.75), ('formula', 101.0)),
+               PowerReport(datetime.fromtimestamp(100), 'sensor', 'target', 42)]
+
+    stage_latencies.observe_reports(reports, 102.0)
+
+    snapshot = stage_latencies.snapshot()
+    assert list(snapshot) == ['puller', 'dispatcher', 'formula', 'pusher', 'end_to_end']
+    assert snapshot['puller'] == ([0.5, 0.5, 0.5], 1, 0.5)
+    assert snapshot['dispatcher'][0] == [0.25, 0.25, 0.25]
+    assert snapshot['pusher'][0] == [1.0, 1.0, 1.0]
+    assert snapshot['end_to_end'] == ([2.0, 2.0, 2.0], 1, 2.0)
+
+
+def test_stage_latencies_percentiles_are_computed_on_the_last_latencies():
+    stage_latencies = StageLatencies(window_size=100)
+    stage_latencies.observe_reports([traced_report(0, ('puller', 10))], 10)
+    stage_latencies.observe_reports([traced_report(0, ('puller', latency / 1000)) for latency in range(100)], 1)
+
+    latencies, count, _ = stage_latencies.snapshot()['puller']
+
+    assert latencies == [0.05, 0.09, 0.099]
+    assert count == 101
+
+
+def test_collector_render_the_stage_latencies_of_a_pusher_as_a_summary(collector):
+    metrics = ActorMetrics('pusher', collector.queue)
+    metrics.stage_latencies = StageLatencies()
+    metrics.stage_latencies.observe_reports([traced_report(100.0, ('puller', 100.5))], 101.0)
+    collector.add(metrics.snapshot(backlog=0))
+
+    text = collector.render()
+
+    assert '# TYPE powerapi_report_stage_latency_seconds summary' in text
+    assert 'powerapi_report_stage_latency_seconds{actor="pusher",stage="puller",quantile="0.99"} 0.5' in text
+    assert 'powerapi_report_stage_latency_seconds_count{actor="pusher",stage="end_to_end"} 1' in text
+
+
+def test_report_sent_to_a_pusher_while_a_traced_report_is_handled_inherit_its_trace(monkeypatch):
+    sent = []
+    monkeypatch.setattr(Actor, 'send_data', lambda actor, msg: sent.append(msg))
+    pusher = PusherActor('pusher_trace', PowerReport, None)
+    set_current_trace((('puller', 1.0),))
+    try:
+        pusher.send_data(PowerReport(1, 'sensor', 'target', 42))
+    finally:
+        set_current_trace(None)
+    pusher.send_data(PowerReport(2, 'sensor', 'target', 42))
+
+    assert [stage for stage, _ in sent[0].trace] == ['puller', 'formula']
+    assert sent[1].trace is None
+
+
+def test_metrics_of_a_running_actor_are_exposed_on_the_collector_endpoint(collector):
+    pipe_in, pipe_out = multiprocessing.Pipe()
+    actor = DummyActor('metrics_actor', pipe_in, PowerReport)
+    actor.enable_metrics(collector.queue, interval=0.05)
+    collector.start(0)
+    supervisor = Supervisor()
+    supervisor.launch_actor(actor)
+
+    for value in range(3):
+        actor.send_data(PowerReport(value, 'sensor', 'target', value))
+        recv_from_pipe(pipe_out, 2)
+
+    deadline = time.monotonic() + 5
+    while collector.snapshots.get('metrics_actor', {}).get('received', {}).get('PowerReport') != 3:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    supervisor.kill_actors()
+
+    with urllib.request.urlopen('http://127.0.0.1:' + str(collector.port) + '/metrics') as response:
+        text = response.read().decode()
+    assert 'powerapi_actor_messages_received_total{actor="metrics_actor",type="PowerReport"} 3' in text
+    assert 'powerapi_actor_handling_seconds_count{actor="metrics_actor",type="PowerReport"} 3' in text
@@ -27,11 +27,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import time
+from threading import Thread
+
 import pytest
 import platform
 import zmq
 
-from powerapi.actor import SocketInterface
+from powerapi.actor import SocketInterface, UnknownOverloadPolicyException
 
 
 ACTOR_NAME = 'dummy_actor'
@@ -192,3 +195,173 @@ def test_multiple_receive(fully_connected_interface):
 
     fully_connected_interface.send_control(push_msg)
     assert fully_connected_interface.receive() == push_msg
+
+
+@pytest.fixture()
+def batching_interface():
+    """ Return an initialized socket interface with batching enabled and an
+    open connection to the control and the push socket
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 100, batch_size=3, batch_delay=20)
+    socket_interface.setup()
+    socket_interface.connect_data()
+    socket_interface.connect_control()
+    yield socket_interface
+    socket_interface.close()
+
+
+def test_batch_is_sent_when_full(batching_interface):
+    """test that messages are sent in a single frame when the batch is full and
+    received one by one in the sending order
+
+    """
+    batching_interface.send_data('msg1')
+    batching_interface.send_data('msg2')
+    assert batching_interface.pull_socket.poll(50) == 0
+
+    batching_interface.send_data('msg3')
+    assert batching_interface.receive() == 'msg1'
+    assert batching_interface.receive() == 'msg2'
+    assert batching_interface.receive() == 'msg3'
+
+
+def test_batch_is_sent_when_its_deadline_expire(batching_interface):
+    """test that a batch that is not full is sent by receive when its delay
+    expire
+
+    """
+    batching_interface.timeout = 1000
+    batching_interface.send_data('msg1')
+
+    assert batching_interface.receive() == 'msg1'
+
+
+def test_control_message_has_the_priority_on_received_batch(batching_interface):
+    """test that a control message is received before the remaining messages
+    of a received batch
+
+    """
+    for msg in ['msg1', 'msg2', 'msg3']:
+        batching_interface.send_data(msg)
+    assert batching_interface.receive() == 'msg1'
+
+    batching_interface.send_control('control')
+    time.sleep(0.05)
+    assert batching_interface.receive() == 'control'
+    assert batching_interface.receive() == 'msg2'
+
+
+def test_flush_send_the_current_batch(batching_interface):
+    """test that flush send the messages waiting in the batch
+
+    """
+    batching_interface.send_data('msg1')
+    batching_interface.flush()
+
+    assert batching_interface.pull_socket.poll(100) != 0
+    assert batching_interface.receive() == 'msg1'
+
+
+#: message big enough to fill the zmq and tcp buffers with a few messages
+BIG_MESSAGE = 'x' * 1000000
+
+
+def bounded_interface(overload_policy, sample_rate=10):
+    """ Return an initialized socket interface with a high water mark of one
+    message and an open connection to the push socket
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 500, hwm=1, overload_policy=overload_policy,
+                                       sample_rate=sample_rate)
+    socket_interface.setup()
+    socket_interface.connect_data()
+    return socket_interface
+
+
+def receive_all(socket_interface):
+    messages = []
+    msg = socket_interface.receive()
+    while msg is not None:
+        messages.append(msg)
+        msg = socket_interface.receive()
+    return messages
+
+
+def test_drop_oldest_policy_drop_the_oldest_messages_when_the_actor_queue_is_full():
+    """test that sending to a full actor queue doesn't block with the
+    drop_oldest policy, and that the newest messages are received in order
+
+    """
+    socket_interface = bounded_interface('drop_oldest')
+    for i in range(100):
+        socket_interface.send_data((i, BIG_MESSAGE))
+
+    assert socket_interface.stats.dropped > 0
+    received = []
+    while len(received) + socket_interface.stats.dropped < 100:
+        received += [i for i, _ in receive_all(socket_interface)]
+        socket_interface.flush()
+    socket_interface.close()
+
+    assert received == sorted(received)
+    assert received[-1] == 99
+
+
+def test_sample_policy_send_one_message_out_of_sample_rate_when_the_actor_queue_is_full():
+    """test that the sample policy drops messages when the actor queue is full
+    and that the other messages are received in order
+
+    """
+    socket_interface = bounded_interface('sample', sample_rate=4)
+    sender = Thread(target=lambda: [socket_interface.send_data((i, BIG_MESSAGE)) for i in range(100)], daemon=True)
+    sender.start()
+
+    received = []
+    while sender.is_alive() or len(received) + socket_interface.stats.dropped < 100:
+        received += [i for i, _ in receive_all(socket_interface)]
+    sender.join()
+    socket_interface.close()
+
+    assert socket_interface.stats.dropped > 0
+    assert len(received) + socket_interface.stats.dropped == 100
+    assert received == sorted(received)
+
+
+def test_block_policy_block_the_sender_until_the_actor_has_room():
+    """test that the sender is blocked while the actor queue is full with the
+    block policy, and that all the messages are received
+
+    """
+    socket_interface = bounded_interface('block')
+    sender = Thread(target=lambda: [socket_interface.send_data((i, BIG_MESSAGE)) for i in range(50)], daemon=True)
+    sender.start()
+    time.sleep(0.5)
+    assert sender.is_alive()
+
+    received = []
+    while sender.is_alive() or len(received) < 50:
+        received += [i for i, _ in receive_all(socket_interface)]
+    sender.join()
+    socket_interface.close()
+
+    assert received == list(range(50))
+    assert socket_interface.stats.dropped == 0
+
+
+def test_queue_depth_count_the_messages_not_yet_received(batching_interface):
+    """test that the queue depth is the number of messages sent and not yet
+    received, including the messages of a received batch
+
+    """
+    for msg in ['msg1', 'msg2', 'msg3', 'msg4']:
+        batching_interface.send_data(msg)
+    assert batching_interface.queue_depth == 3
+
+    batching_interface.receive()
+    assert batching_interface.queue_depth == 0
+
+
+def test_create_socket_interface_with_unknown_overload_policy_raise_UnknownOverloadPolicyException():
+    with pytest.raises(UnknownOverloadPolicyException):
+        SocketInterface(ACTOR_NAME, 100, hwm=10, overload_policy='drop_everything')
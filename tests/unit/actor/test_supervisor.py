@@ -27,11 +27,18 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import multiprocessing
+import os
+import time
+
 import pytest
 import zmq
 from mock import Mock
-from powerapi.actor import Actor, Supervisor, ActorInitError, State
-from powerapi.message import OKMessage, ErrorMessage, StartMessage
+from powerapi.actor import Actor, Supervisor, ActorInitError, ActorNotSupervisedException, State, flush_batches
+from powerapi.message import OKMessage, ErrorMessage, StartMessage, ProfileMessage
+from powerapi.report import PowerReport
+
+from tests.utils.actor.dummy_actor import DummyActor
 
 
 #########
@@ -155,3 +162,81 @@ def test_kill_actors_methods_all_actor_in_supervised_list_not_alive(supervisor):
     supervisor.kill_actors()
     for actor in supervisor.supervised_actors:
         assert not actor.is_alive()
+
+
+################
+# TEST PROFILE #
+################
+def test_profile_actors_send_a_profile_message_to_the_supervised_actors_and_return_the_profile_paths(tmp_path):
+    supervisor = Supervisor()
+    actor = FakeActor()
+    supervisor.launch_actor(actor, start_message=False)
+
+    paths = supervisor.profile_actors(2, str(tmp_path))
+
+    assert paths == {'test_supervisor': str(tmp_path / 'test_supervisor.folded')}
+    msg = actor.send_msg.pop()
+    assert isinstance(msg, ProfileMessage)
+    assert msg.duration == 2
+    assert msg.output_directory == str(tmp_path)
+
+
+def test_profile_actors_ignore_the_actors_that_answer_with_an_error(tmp_path):
+    supervisor = Supervisor()
+    supervisor.launch_actor(FakeActorInitError(), start_message=False)
+
+    assert supervisor.profile_actors(2, str(tmp_path)) == {}
+
+
+def test_profile_an_actor_that_is_not_supervised_raise_ActorNotSupervisedException(tmp_path):
+    supervisor = Supervisor()
+    supervisor.launch_actor(FakeActor(), start_message=False)
+
+    with pytest.raises(ActorNotSupervisedException):
+        supervisor.profile_actors(2, str(tmp_path), actor_name='unknown')
+
+
+def test_profiled_actor_write_its_call_stacks_in_the_output_directory(tmp_path):
+    pipe_in, _ = multiprocessing.Pipe()
+    actor = DummyActor('profiled_actor', pipe_in, PowerReport)
+    supervisor = Supervisor()
+    supervisor.launch_actor(actor)
+
+    try:
+        paths = supervisor.profile_actors(0.2, str(tmp_path), actor_name='profiled_actor', interval=0.005)
+        deadline = time.monotonic() + 5
+        while not os.path.exists(paths['profiled_actor']):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        supervisor.kill_actors()
+
+    with open(paths['profiled_actor'], encoding='utf-8') as profile_file:
+        profile = profile_file.read()
+    assert '_initial_behaviour (' in profile
+
+
+def test_launch_a_batching_actor_while_another_actor_has_a_pending_batch_dont_crash_the_new_actor():
+    pipe_in, pipe_out = multiprocessing.Pipe()
+    first_actor = DummyActor('first_actor', pipe_in, PowerReport)
+    first_actor.set_batching(10, batch_delay=50)
+    second_actor = DummyActor('second_actor', pipe_in, PowerReport)
+    second_actor.set_batching(10, batch_delay=50)
+    supervisor = Supervisor()
+    supervisor.launch_actor(first_actor)
+
+    try:
+        report = PowerReport.create_empty_report()
+        first_actor.send_data(report)
+        supervisor.launch_actor(second_actor)
+        time.sleep(0.3)
+        assert second_actor.is_alive()
+
+        second_actor.send_data(report)
+        flush_batches()
+        received = set()
+        while len(received) < 2 and pipe_out.poll(2):
+            received.add(pipe_out.recv()[0])
+        assert received == {'first_actor', 'second_actor'}
+    finally:
+        supervisor.kill_actors()
@@ -0,0 +1,129 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pylint: disable=redefined-outer-name
+import multiprocessing
+import select
+import threading
+
+import pytest
+
+from powerapi.actor import Supervisor, UnknownRuntimeException, THREAD_RUNTIME
+from powerapi.message import PoisonPillMessage
+from powerapi.report import PowerReport
+
+from tests.unit.actor.abstract_test_actor import AbstractTestActor, recv_from_pipe, join_actor
+from tests.utils.actor.dummy_actor import DummyActor
+
+ACTOR_NAME = 'dummy_thread_actor'
+
+
+class TestDummyActorThreadRuntime(AbstractTestActor):
+    """
+    Run the actor test suite on an actor running in a thread
+    """
+
+    @pytest.fixture
+    def actor(self, dummy_pipe_in):
+        actor = DummyActor(ACTOR_NAME, dummy_pipe_in, PowerReport)
+        actor.set_runtime(THREAD_RUNTIME)
+        yield actor
+        actor.close()
+
+    def test_actor_run_in_a_thread_of_the_current_process(self, init_actor):
+        assert init_actor.pid is None
+        assert any(thread.name == ACTOR_NAME for thread in threading.enumerate())
+
+    def test_actor_thread_use_its_own_socket_interface(self, init_actor):
+        assert init_actor.socket_interface.pull_socket is None
+        assert init_actor._thread_socket_interface.pull_socket is not None
+
+    def test_send_data_to_started_actor(self, started_actor, dummy_pipe_out):
+        report = PowerReport(1, 'sensor', 'target', 42)
+        started_actor.send_data(report)
+
+        assert recv_from_pipe(dummy_pipe_out, 2) == (ACTOR_NAME, report)
+
+    def test_sentinel_is_ready_when_actor_end(self, started_actor):
+        assert select.select([started_actor.sentinel], [], [], 0)[0] == []
+
+        started_actor.send_control(PoisonPillMessage(sender_name='test'))
+        join_actor(started_actor)
+
+        assert not started_actor.is_alive()
+        assert multiprocessing.connection.wait([started_actor.sentinel], 1) == [started_actor.sentinel]
+
+    def test_terminate_stop_the_actor_thread(self, started_actor):
+        started_actor.terminate()
+        join_actor(started_actor)
+
+        assert not started_actor.is_alive()
+
+
+def test_set_unknown_runtime_raise_UnknownRuntimeException(dummy_pipe_in):
+    actor = DummyActor(ACTOR_NAME, dummy_pipe_in, PowerReport)
+
+    with pytest.raises(UnknownRuntimeException):
+        actor.set_runtime('coroutine')
+
+
+def test_thread_actors_can_send_data_to_the_same_actor_from_several_threads(dummy_pipe_in, dummy_pipe_out):
+    actor = DummyActor(ACTOR_NAME, dummy_pipe_in, PowerReport)
+    actor.set_runtime(THREAD_RUNTIME)
+    supervisor = Supervisor()
+    supervisor.launch_actor(actor)
+
+    def send(value):
+        actor.send_data(PowerReport(value, 'sensor', 'target', value))
+
+    senders = [threading.Thread(target=send, args=(i,)) for i in range(4)]
+    for sender in senders:
+        sender.start()
+        sender.join()
+
+    received = sorted(recv_from_pipe(dummy_pipe_out, 2)[1].power for _ in range(4))
+    assert received == [0, 1, 2, 3]
+
+    supervisor.kill_actors()
+    actor.close()
+
+
+@pytest.fixture
+def dummy_pipe_in_out():
+    return multiprocessing.Pipe()
+
+
+@pytest.fixture
+def dummy_pipe_in(dummy_pipe_in_out):
+    return dummy_pipe_in_out[0]
+
+
+@pytest.fixture
+def dummy_pipe_out(dummy_pipe_in_out):
+    return dummy_pipe_in_out[1]
@@ -0,0 +1,54 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from powerapi.bench.bench_actors import BenchmarkResultMessage, BenchPusherHandler, BenchPusherState
+from powerapi.report import PowerReport
+
+
+def sent_results(actor):
+    return [call.args[0] for call in actor.send_control.call_args_list if isinstance(call.args[0], BenchmarkResultMessage)]
+
+
+def test_bench_pusher_send_results_once_and_stay_alive_when_expected_reports_are_received():
+    actor = Mock()
+    actor.name = 'bench_pusher'
+    state = BenchPusherState(actor, 2)
+    handler = BenchPusherHandler(state)
+
+    for _ in range(3):
+        handler.handle(PowerReport(datetime(2026, 1, 1), 'sensor', 'target', 42.0))
+
+    results = sent_results(actor)
+    assert len(results) == 1
+    assert results[0].reports == 2
+    # the results would be dropped if the actor closed its control socket right after sending them
+    assert state.alive
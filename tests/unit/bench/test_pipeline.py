@@ -0,0 +1,67 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+
+import pytest
+
+from powerapi.actor import PROCESS_RUNTIME, THREAD_RUNTIME
+from powerapi.bench import PipelineBenchmark, ReportGenerator
+from powerapi.bench.cli import main
+from powerapi.report import HWPCReport, ProcfsReport
+
+
+@pytest.mark.parametrize('runtime', [THREAD_RUNTIME, PROCESS_RUNTIME])
+def test_run_hwpc_benchmark_deliver_one_report_by_socket_and_generated_report(runtime):
+    result = PipelineBenchmark(ReportGenerator(HWPCReport, sockets=2), reports=200, runtime=runtime, timeout=60).run()
+
+    assert result['received_reports'] == 400
+    assert result['throughput_reports_per_s'] > 0
+    assert set(result['stage_latency_s']) == {'puller', 'dispatcher', 'formula', 'pusher', 'end_to_end'}
+    assert result['latency_s']['p50'] <= result['latency_s']['p99']
+    assert result['peak_rss_kb']
+
+
+def test_run_procfs_benchmark_deliver_each_generated_report():
+    result = PipelineBenchmark(ReportGenerator(ProcfsReport), reports=200, runtime=THREAD_RUNTIME, timeout=60).run()
+
+    assert result['received_reports'] == 200
+
+
+def test_main_with_json_option_print_one_json_result_by_run(capsys):
+    assert main(['--reports', '50', '--runtime', THREAD_RUNTIME, '--repeat', '2', '--json']) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    for line in lines:
+        assert json.loads(line)['config']['reports'] == 50
+
+
+def test_main_with_non_positive_parameter_return_2():
+    assert main(['--sockets', '0']) == 2
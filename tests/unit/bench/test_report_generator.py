@@ -0,0 +1,77 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from powerapi.bench import ReportGenerator, RAPL_EVENT, HWPC_EVENTS
+from powerapi.report import HWPCReport, ProcfsReport, PowerReport
+
+
+def test_create_generator_with_unhandled_report_type_raise_ValueError():
+    with pytest.raises(ValueError):
+        ReportGenerator(PowerReport)
+
+
+def test_create_generator_with_zero_socket_raise_ValueError():
+    with pytest.raises(ValueError):
+        ReportGenerator(HWPCReport, sockets=0)
+
+
+def test_generated_hwpc_report_have_the_shape_of_the_generator_parameters():
+    generator = ReportGenerator(HWPCReport, sockets=2, cores=3, events=6, targets=4, sensors=2)
+    report = generator(5)
+
+    assert isinstance(report, HWPCReport)
+    assert report.sensor == 'sensor-1'
+    assert report.target == 'target-1'
+    assert set(report.groups['rapl']) == {'0', '1'}
+    for socket_counters in report.groups['rapl'].values():
+        assert len(socket_counters) == 1
+        assert RAPL_EVENT in list(socket_counters.values())[0]
+    assert set(report.groups['core']) == {'0', '1'}
+    for socket_counters in report.groups['core'].values():
+        assert len(socket_counters) == 3
+        for core_counters in socket_counters.values():
+            assert set(HWPC_EVENTS) <= set(core_counters)
+            assert {'EVENT_4', 'EVENT_5', 'time_enabled', 'time_running'} <= set(core_counters)
+
+
+def test_generated_procfs_report_monitor_all_the_targets():
+    generator = ReportGenerator(ProcfsReport, targets=3)
+    report = generator(0)
+
+    assert isinstance(report, ProcfsReport)
+    assert set(report.usage) == {'target-0', 'target-1', 'target-2'}
+
+
+def test_two_generators_with_same_seed_generate_same_counters():
+    first = ReportGenerator(HWPCReport, seed=4)
+    second = ReportGenerator(HWPCReport, seed=4)
+
+    assert first(0).groups == second(0).groups
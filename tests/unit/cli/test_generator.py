@@ -32,9 +32,12 @@ from re import compile, Pattern
 
 import pytest
 
+from powerapi.actor import ReportCodec, PickleCodec, get_metrics_collector, PROCESS_RUNTIME, THREAD_RUNTIME, \
+    UnknownRuntimeException
 from powerapi.cli.generator import PullerGenerator, DBActorGenerator, PusherGenerator, \
     MonitorGenerator, MONITOR_NAME_SUFFIX, LISTENER_ACTOR_KEY, PreProcessorGenerator
-from powerapi.cli.generator import ModelNameDoesNotExist
+from powerapi.cli.generator import ModelNameDoesNotExist, configure_dispatcher
+from powerapi.dispatcher import DispatcherActor, RouteTable
 from powerapi.processor.pre.k8s.k8s_monitor import K8sMonitorAgent
 from powerapi.processor.pre.k8s.k8s_pre_processor_actor import K8sPreProcessorActor, TIME_INTERVAL_DEFAULT_VALUE, \
     TIMEOUT_QUERY_DEFAULT_VALUE
@@ -80,6 +83,18 @@ def test_generate_puller_from_mongo_basic_config(mongodb_input_output_stream_con
     assert db.collection_name == mongodb_input_output_stream_config['input']['one_puller']['collection']
 
 
+def test_generate_puller_with_trace_enabled_trace_the_pulled_reports(mongodb_input_output_stream_config):
+    """
+    Test that the trace option is given to the generated pullers
+    """
+    mongodb_input_output_stream_config['trace'] = True
+    generator = PullerGenerator(report_filter=None)
+
+    pullers = generator.generate(mongodb_input_output_stream_config)
+
+    assert pullers['one_puller'].state.trace
+
+
 def test_generate_several_pullers_from_config(several_inputs_outputs_stream_config):
     """
     Test that several inputs are correctly used to generate the related actors
@@ -238,6 +253,88 @@ def test_generate_pusher_from_mongo_basic_config(mongodb_input_output_stream_con
     assert db.collection_name == mongodb_input_output_stream_config['output']['one_pusher']['collection']
 
 
+def test_generate_pusher_with_codec_set_the_actor_codec(mongodb_input_output_stream_config):
+    """
+    Test that the codec given in the output config is used by the generated pusher
+    """
+    mongodb_input_output_stream_config['output']['one_pusher']['codec'] = 'report'
+    generator = PusherGenerator()
+
+    pushers = generator.generate(mongodb_input_output_stream_config)
+
+    assert isinstance(pushers['one_pusher'].socket_interface.codec, ReportCodec)
+
+
+def test_generate_pusher_without_codec_use_pickle(mongodb_input_output_stream_config):
+    """
+    Test that the generated pusher use the pickle codec when no codec is given in the output config
+    """
+    generator = PusherGenerator()
+
+    pushers = generator.generate(mongodb_input_output_stream_config)
+
+    assert isinstance(pushers['one_pusher'].socket_interface.codec, PickleCodec)
+
+
+def test_generate_pusher_with_batch_size_enable_batching(mongodb_input_output_stream_config):
+    """
+    Test that the batch size and delay given in the output config are used by the generated pusher
+    """
+    mongodb_input_output_stream_config['output']['one_pusher']['batch_size'] = 50
+    mongodb_input_output_stream_config['output']['one_pusher']['batch_delay'] = 5
+    generator = PusherGenerator()
+
+    pushers = generator.generate(mongodb_input_output_stream_config)
+
+    assert pushers['one_pusher'].socket_interface.batch_size == 50
+    assert pushers['one_pusher'].socket_interface.batch_delay == 5
+
+
+def test_generate_pusher_with_hwm_bound_its_queue_with_the_given_overload_policy(mongodb_input_output_stream_config):
+    """
+    Test that the high water mark and the overload policy given in the output config are used by the generated pusher
+    """
+    mongodb_input_output_stream_config['output']['one_pusher']['hwm'] = 100
+    mongodb_input_output_stream_config['output']['one_pusher']['overload_policy'] = 'sample'
+    mongodb_input_output_stream_config['output']['one_pusher']['sample_rate'] = 5
+    generator = PusherGenerator()
+
+    pushers = generator.generate(mongodb_input_output_stream_config)
+
+    assert pushers['one_pusher'].socket_interface.hwm == 100
+    assert pushers['one_pusher'].socket_interface.overload_policy == 'sample'
+    assert pushers['one_pusher'].socket_interface.sample_rate == 5
+
+
+def test_generate_pusher_with_metrics_port_enable_the_pusher_metrics(mongodb_input_output_stream_config):
+    """
+    Test that the generated pusher publishes its metrics to the collector exposed on the metrics port
+    """
+    mongodb_input_output_stream_config['metrics_port'] = 0
+    generator = PusherGenerator()
+
+    pushers = generator.generate(mongodb_input_output_stream_config)
+
+    metrics_collector = get_metrics_collector()
+    try:
+        assert pushers['one_pusher'].metrics.queue is metrics_collector.queue
+        assert metrics_collector.port is not None
+    finally:
+        metrics_collector.stop()
+
+
+def test_generate_pusher_with_unknown_overload_policy_raise_PowerAPIException(mongodb_input_output_stream_config):
+    """
+    Test that an unknown overload policy in the output config is rejected
+    """
+    mongodb_input_output_stream_config['output']['one_pusher']['hwm'] = 100
+    mongodb_input_output_stream_config['output']['one_pusher']['overload_policy'] = 'drop_everything'
+    generator = PusherGenerator()
+
+    with pytest.raises(PowerAPIException):
+        generator.generate(mongodb_input_output_stream_config)
+
+
 def test_generate_several_pushers_from_config(several_inputs_outputs_stream_config):
     """
     Test that several outputs are correctly used to generate the related actors
@@ -630,3 +727,68 @@ def test_generate_several_k8s_monitors_from_processors(several_k8s_pre_processor
         monitor = monitors[monitor_name]
 
         check_k8s_monitor_infos(monitor=monitor, associated_processor=processor)
+
+
+def create_dispatcher():
+    """
+    Create a dispatcher as a formula would do
+    """
+    return DispatcherActor(name='dispatcher', formula_init_function=None, pushers={}, route_table=RouteTable())
+
+
+def test_configure_dispatcher_with_formula_codec_set_the_codec_of_the_formulas():
+    """
+    Test that the formula codec given in the config is used for the reports sent by the dispatcher to the formulas
+    """
+    dispatcher = create_dispatcher()
+
+    configure_dispatcher(dispatcher, {'formula_codec': 'report'})
+
+    assert isinstance(dispatcher.formula_codec, ReportCodec)
+
+
+def test_configure_dispatcher_with_formula_batch_size_enable_the_batching_of_the_formulas():
+    """
+    Test that the formula batch size and delay given in the config are used for the reports sent by the dispatcher to
+    the formulas
+    """
+    dispatcher = create_dispatcher()
+
+    configure_dispatcher(dispatcher, {'formula_batch_size': 50, 'formula_batch_delay': 5})
+
+    assert dispatcher.formula_batch_size == 50
+    assert dispatcher.formula_batch_delay == 5
+
+
+def test_configure_dispatcher_with_thread_runtime_run_the_dispatcher_and_the_formulas_in_threads():
+    """
+    Test that the runtime given in the config is used by the dispatcher and by the formulas it creates
+    """
+    dispatcher = create_dispatcher()
+
+    configure_dispatcher(dispatcher, {'runtime': THREAD_RUNTIME})
+
+    assert dispatcher.runtime == THREAD_RUNTIME
+    assert dispatcher.formula_runtime == THREAD_RUNTIME
+
+
+def test_configure_dispatcher_with_unknown_runtime_raise_UnknownRuntimeException():
+    """
+    Test that an unknown runtime in the config is rejected
+    """
+    with pytest.raises(UnknownRuntimeException):
+        configure_dispatcher(create_dispatcher(), {'runtime': 'fiber'})
+
+
+def test_configure_dispatcher_without_option_keep_the_default_configuration():
+    """
+    Test that a dispatcher configured without option keep its default configuration
+    """
+    dispatcher = create_dispatcher()
+
+    configure_dispatcher(dispatcher, {})
+
+    assert dispatcher.runtime == PROCESS_RUNTIME
+    assert dispatcher.formula_runtime == PROCESS_RUNTIME
+    assert dispatcher.formula_codec is None
+    assert dispatcher.formula_batch_size is None
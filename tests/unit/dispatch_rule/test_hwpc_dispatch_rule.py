@@ -256,3 +256,33 @@ def test_get_formula_id_cpu_rule_report_3(report_3):
     ids = HWPCDispatchRule(HWPCDepthLevel.CORE).get_formula_id(report_3)
     validate_formula_id(ids, [('toto', '1', '1'), ('toto', '1', '2'),
                               ('toto', '2', '3'), ('toto', '2', '4')])
+
+
+################
+# ROUTING KEYS #
+################
+def test_get_routing_key_socket_rule_report_3(report_3):
+    """
+    the routing key of a rule that dispatch by socket must be the sensor and the sockets of the report
+    """
+    assert HWPCDispatchRule(HWPCDepthLevel.SOCKET).get_routing_key(report_3) == ('toto', ('1', '2'))
+
+
+def test_get_routing_key_cpu_rule_report_3(report_3):
+    """
+    the routing key of a rule that dispatch by cpu must be the sensor and the cores of each socket of the report
+    """
+    key = HWPCDispatchRule(HWPCDepthLevel.CORE).get_routing_key(report_3)
+    assert key == ('toto', (('1', ('1', '2')), ('2', ('3', '4'))))
+
+
+def test_reports_with_same_topology_have_same_routing_key():
+    """
+    reports with different counter values but the same sensor and topology must have the same routing key
+    """
+    rule = HWPCDispatchRule(HWPCDepthLevel.CORE)
+    other_report = deepcopy(REPORT_3_RAPL)
+    other_report.groups['1']['1']['1']['e0'] = '42'
+
+    assert rule.get_routing_key(REPORT_3_RAPL) == rule.get_routing_key(other_report)
+    assert rule.get_routing_key(REPORT_3_RAPL) != rule.get_routing_key(REPORT_2_RAPL)
@@ -30,11 +30,15 @@
 # pylint: disable=arguments-differ,redefined-outer-name,unused-argument,unused-import,no-self-use
 from datetime import datetime
 from time import sleep
+from unittest.mock import Mock
 
 import pytest
 
-from powerapi.dispatch_rule import DispatchRule
+from powerapi.actor import THREAD_RUNTIME, ReportCodec, Supervisor
+from powerapi.dispatch_rule import DispatchRule, HWPCDispatchRule, HWPCDepthLevel, PowerDispatchRule, PowerDepthLevel
 from powerapi.dispatcher import DispatcherActor, RouteTable, extract_formula_id
+from powerapi.dispatcher.dispatcher_actor import DispatcherState
+from powerapi.dispatcher.handlers import FormulaDispatcherReportHandler
 from powerapi.message import PoisonPillMessage
 from powerapi.report import Report, HWPCReport, PowerReport
 
@@ -513,3 +517,212 @@ def test_extract_formula_id_with_pgb_DispatchRule1AB_gb_DispatchRule2AC_on_REPOR
     pgb = DispatchRule1AB(primary=True)
     gen_test_extract_formula_id(pgb, DispatchRule2AC(), REPORT_2, [('a',)])
     gen_test_extract_formula_id(pgb, DispatchRule2AC(), REPORT_2_C2, [('a',)])
+
+
+class TestDispatcherWithThreadFormulas(TestDispatcher):
+    """
+        Class for testing DispatcherActor when the formulas run in threads of the dispatcher process
+    """
+
+    @pytest.fixture
+    def actor(self, dispatch_rules, started_fake_pusher_power_report):
+
+        route_table = RouteTable()
+        for report_type, gbr in dispatch_rules:
+            route_table.dispatch_rule(report_type, gbr)
+        actor = DispatcherActor(name='test-dispatcher',
+                                formula_init_function=lambda name, pushers: DummyFormulaActor(name=name,
+                                                                                              pushers=pushers, socket=0,
+                                                                                              core=0),
+                                route_table=route_table,
+                                pushers={PUSHER_NAME_POWER_REPORT: started_fake_pusher_power_report},
+                                formula_runtime=THREAD_RUNTIME)
+
+        return actor
+
+
+class TestDispatcherWithFormulaWorkers(TestDispatcher):
+    """
+        Class for testing DispatcherActor when the formulas are hosted by a pool of workers
+    """
+
+    @pytest.fixture
+    def actor(self, dispatch_rules, started_fake_pusher_power_report):
+
+        route_table = RouteTable()
+        for report_type, gbr in dispatch_rules:
+            route_table.dispatch_rule(report_type, gbr)
+        actor = DispatcherActor(name='test-dispatcher',
+                                formula_init_function=lambda name, pushers: DummyFormulaActor(name=name,
+                                                                                              pushers=pushers, socket=0,
+                                                                                              core=0),
+                                route_table=route_table,
+                                pushers={PUSHER_NAME_POWER_REPORT: started_fake_pusher_power_report},
+                                sharded=True, formula_workers=2)
+
+        return actor
+
+
+class TestDispatcherWithBatchedFormulaWorkers(TestDispatcher):
+    """
+        Class for testing DispatcherActor when the reports are sent by batches to a pool of workers, a worker being
+        launched while batches to the other ones are pending
+    """
+
+    @pytest.fixture
+    def actor(self, dispatch_rules, started_fake_pusher_power_report):
+
+        route_table = RouteTable()
+        for report_type, gbr in dispatch_rules:
+            route_table.dispatch_rule(report_type, gbr)
+        actor = DispatcherActor(name='test-dispatcher',
+                                formula_init_function=lambda name, pushers: DummyFormulaActor(name=name,
+                                                                                              pushers=pushers, socket=0,
+                                                                                              core=0),
+                                route_table=route_table,
+                                pushers={PUSHER_NAME_POWER_REPORT: started_fake_pusher_power_report},
+                                sharded=True, formula_workers=2)
+        actor.set_formula_batching(4, 5)
+
+        return actor
+
+
+#################
+# ROUTING CACHE #
+#################
+class FakeRoutedFormula:
+    """
+        Formula that store the reports sent to it
+    """
+
+    def __init__(self, formula_id):
+        self.formula_id = formula_id
+        self.received = []
+
+    def is_alive(self):
+        return True
+
+    def send_data(self, report):
+        self.received.append(report)
+
+
+@pytest.fixture
+def routing_state():
+    """
+        Dispatcher state routing HWPC reports by socket and power reports by sensor to fake formulas
+    """
+    route_table = RouteTable()
+    route_table.dispatch_rule(HWPCReport, HWPCDispatchRule(HWPCDepthLevel.SOCKET, primary=True))
+    route_table.dispatch_rule(PowerReport, PowerDispatchRule(PowerDepthLevel.SENSOR))
+    return DispatcherState(None, FakeRoutedFormula, route_table)
+
+
+def create_hwpc_report(sockets):
+    """
+        Create a HWPC report monitoring one core on each of the given sockets
+    """
+    return HWPCReport(datetime.now(), 'sensor', 'target', {'core': {socket: {'0': {'e0': 1}} for socket in sockets}})
+
+
+def test_route_same_topology_reports_use_cached_route_without_creating_formula(routing_state):
+    handler = FormulaDispatcherReportHandler(routing_state)
+    handler.handle(create_hwpc_report(['0', '1']))
+    cached_routes = dict(routing_state.routing_cache)
+
+    handler.handle(create_hwpc_report(['0', '1']))
+
+    assert routing_state.routing_cache == cached_routes
+    assert len(routing_state.formula_dict) == 2
+    for formula in routing_state.formula_dict.values():
+        assert len(formula.received) == 2
+
+
+def test_create_formula_invalidate_cached_routes_of_partial_formula_ids(routing_state):
+    handler = FormulaDispatcherReportHandler(routing_state)
+    handler.handle(create_hwpc_report(['0']))
+    handler.handle(PowerReport(datetime.now(), 'sensor', 'target', 42, {}))
+
+    handler.handle(create_hwpc_report(['1']))
+    handler.handle(PowerReport(datetime.now(), 'sensor', 'target', 42, {}))
+
+    first_socket_formula = routing_state.formula_dict[('sensor', '0')]
+    second_socket_formula = routing_state.formula_dict[('sensor', '1')]
+    assert len([r for r in first_socket_formula.received if isinstance(r, PowerReport)]) == 2
+    assert len([r for r in second_socket_formula.received if isinstance(r, PowerReport)]) == 1
+
+
+def test_route_report_with_rule_without_routing_key_is_not_cached():
+    route_table = RouteTable()
+    route_table.dispatch_rule(Report1, DispatchRule1AB(primary=True))
+    state = DispatcherState(None, FakeRoutedFormula, route_table)
+
+    FormulaDispatcherReportHandler(state).handle(Report1('a', 'b', 'b2'))
+
+    assert not state.routing_cache
+    assert set(state.formula_dict) == {('a', 'b'), ('a', 'b2')}
+
+
+def test_get_dispatch_rule_of_report_subclass_return_rule_of_parent_class():
+    route_table = RouteTable()
+    rule = DispatchRule1A(primary=True)
+    route_table.dispatch_rule(Report, rule)
+
+    assert route_table.get_dispatch_rule(REPORT_1) is rule
+    assert route_table.get_dispatch_rule(REPORT_1) is rule
+    assert route_table.dispatch_rule_cache == {Report1: rule}
+
+
+def create_dispatcher_with_fake_supervisor(sharded=False, formula_workers=1):
+    """
+        Create a DispatcherActor whose formulas are created but not launched
+    """
+    dispatcher = DispatcherActor(name='test-dispatcher',
+                                 formula_init_function=lambda name, pushers: DummyFormulaActor(name=name,
+                                                                                               pushers=pushers,
+                                                                                               socket=0, core=0),
+                                 route_table=RouteTable(), pushers={}, sharded=sharded,
+                                 formula_workers=formula_workers)
+    dispatcher.state.supervisor = Mock()
+    return dispatcher
+
+
+@pytest.mark.parametrize('sharded', [False, True])
+def test_formula_factory_set_the_formula_codec_of_the_created_formulas(sharded):
+    dispatcher = create_dispatcher_with_fake_supervisor(sharded)
+    dispatcher.set_formula_codec(ReportCodec())
+
+    dispatcher.state.formula_factory(('sensor', '0'))
+
+    formula = dispatcher.state.supervisor.launch_actor.call_args.args[0]
+    assert isinstance(formula.socket_interface.codec, ReportCodec)
+
+
+@pytest.mark.parametrize('sharded', [False, True])
+def test_formula_factory_set_the_formula_batching_of_the_created_formulas(sharded):
+    dispatcher = create_dispatcher_with_fake_supervisor(sharded)
+    dispatcher.set_formula_batching(32, 5)
+
+    dispatcher.state.formula_factory(('sensor', '0'))
+
+    formula = dispatcher.state.supervisor.launch_actor.call_args.args[0]
+    assert formula.socket_interface.batch_size == 32
+    assert formula.socket_interface.batch_delay == 5
+
+
+def test_sharded_formula_factory_launch_a_worker_while_a_batch_to_another_worker_is_pending():
+    dispatcher = create_dispatcher_with_fake_supervisor(sharded=True, formula_workers=2)
+    dispatcher.set_formula_batching(32, 50)
+    dispatcher.state.supervisor = Supervisor()
+    first_id = ('sensor', '0')
+    second_id = next(('sensor', str(i)) for i in range(1, 100)
+                     if dispatcher.formula_workers_ring.get_node(('sensor', str(i))) !=
+                     dispatcher.formula_workers_ring.get_node(first_id))
+
+    try:
+        dispatcher.state.formula_factory(first_id).send_data(PowerReport.create_empty_report())
+        dispatcher.state.formula_factory(second_id)
+        sleep(0.3)
+        assert len(dispatcher.formula_workers) == 2
+        assert all(worker.is_alive() for worker in dispatcher.formula_workers.values())
+    finally:
+        dispatcher.state.supervisor.kill_actors()
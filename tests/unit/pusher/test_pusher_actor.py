@@ -32,11 +32,14 @@
 import logging
 import time
 from queue import Empty
+from unittest.mock import Mock
 
 import pytest
 
+from powerapi.message import PoisonPillMessage
 from powerapi.report import Report
-from powerapi.pusher import PusherActor
+from powerapi.pusher import PusherActor, PusherState, ReorderBuffer
+from powerapi.pusher.handlers import ReportHandler
 from tests.utils.db.db import REPORT2, REPORT1, FakeDB
 
 from tests.unit.actor.abstract_test_actor import AbstractTestActorWithDB, pytest_generate_tests_abstract
@@ -121,14 +124,26 @@ class TestPusher(AbstractTestActorWithDB):
         assert fake_db.q.get(timeout=1) == [REPORT1]
 
     @define_buffer_size(1)
+    @define_delay(2000)
     def test_send_one_report_to_pusher_with_1_sized_buffer_make_it_not_save_the_report(self, started_actor, fake_db):
         """
-            Check that the pusher actor does not save a report when the buffer size is 1
+            Check that the pusher actor does not save a report when the buffer size is 1, before the end of the delay
         """
         started_actor.send_data(REPORT1)
         with pytest.raises(Empty):
             fake_db.q.get(timeout=1)
 
+    @define_buffer_size(1)
+    def test_send_PoisonPillMessage_to_pusher_make_it_save_the_buffer_then_close_the_database(self, started_actor,
+                                                                                              fake_db):
+        """
+            Check that the pusher actor saves the buffered reports and closes the database when it is stopped
+        """
+        started_actor.send_data(REPORT1)
+        started_actor.send_control(PoisonPillMessage(sender_name='system-test'))
+        assert fake_db.q.get(timeout=1) == [REPORT1]
+        assert fake_db.q.get(timeout=1) == 'closed'
+
     @define_buffer_size(1)
     def test_send_two_report_to_pusher_with_1_sized_buffer_make_it_save_the_reports_in_one_call(self, started_actor,
                                                                                                 fake_db):
@@ -161,13 +176,14 @@ class TestPusher(AbstractTestActorWithDB):
     def test_send_two_report__with_two_second_between_messages_to_pusher_with_2_seconds_delay_make_it_save_the_report(
             self, started_actor, fake_db):
         """
-            Check that the pusher actor saves the 2 reports when delay is 2 seconds
-            and there is a 2 second sleep time between the 2 reports
+            Check that the pusher actor saves the first report after 2 seconds without waiting for the next report
         """
         started_actor.send_data(REPORT1)
         time.sleep(2)
+        # the pusher wakes up every second (its receive timeout) to write the waiting reports
+        assert fake_db.q.get(timeout=2) == [REPORT1]
         started_actor.send_data(REPORT2)
-        assert fake_db.q.get(timeout=1) == [REPORT1, REPORT2]
+        assert fake_db.q.get(timeout=3) == [REPORT2]
 
     @define_buffer_size(1)
     def test_send_two_report_in_wrong_time_order_to_a_pusher_make_it_save_them_in_good_order(self, started_actor,
@@ -179,3 +195,58 @@ class TestPusher(AbstractTestActorWithDB):
         started_actor.send_data(REPORT2)
         started_actor.send_data(REPORT1)
         assert fake_db.q.get(timeout=1) == [REPORT1, REPORT2]
+
+
+class TestPusherWithBackgroundWriter(TestPusher):
+    """
+        Class for testing PusherActor when the reports are written from a background thread
+    """
+
+    @pytest.fixture
+    def actor(self, fake_db, buffer_size, delay):
+        report_model = Report
+        return PusherActor('pusher_test', report_model, fake_db, level_logger=logging.DEBUG, max_size=buffer_size,
+                           delay=delay, max_in_flight=2)
+
+
+class TestPusherWithReorderBuffer(TestPusher):
+    """
+        Class for testing PusherActor when the reports are reordered before being written
+    """
+
+    @pytest.fixture
+    def actor(self, fake_db, buffer_size, delay):
+        report_model = Report
+        return PusherActor('pusher_test', report_model, fake_db, level_logger=logging.DEBUG, max_size=buffer_size,
+                           delay=delay, lateness=0)
+
+    @define_buffer_size(0)
+    def test_send_two_report_in_wrong_time_order_to_a_pusher_make_it_save_them_in_good_order(self, started_actor,
+                                                                                             fake_db):
+        """
+            Check that the pusher actor drops a report older than an already saved report
+        """
+        started_actor.send_data(REPORT2)
+        started_actor.send_data(REPORT1)
+        assert fake_db.q.get(timeout=1) == [REPORT2]
+        with pytest.raises(Empty):
+            fake_db.q.get(timeout=1)
+
+
+def test_report_handler_write_the_report_held_by_the_reorder_buffer_once_it_waited_more_than_the_lateness():
+    """
+        Check that a report held by the reorder buffer is written without waiting for the next report
+    """
+    fake_db = FakeDB()
+    state = PusherState(Mock(), fake_db, Report)
+    state.reorder_buffer = ReorderBuffer(200)
+    handler = ReportHandler(state, delay=0)
+
+    handler.handle(REPORT1)
+    handler.flush_expired()
+    with pytest.raises(Empty):
+        fake_db.q.get(timeout=0.1)
+
+    time.sleep(0.2)
+    handler.flush_expired()
+    assert fake_db.q.get(timeout=1) == [REPORT1]
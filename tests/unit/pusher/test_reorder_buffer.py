@@ -0,0 +1,101 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import time
+
+from powerapi.pusher import ReorderBuffer, PusherWriter
+from powerapi.report import Report
+from powerapi.utils import timestamp_to_datetime
+from tests.unit.pusher.test_writer import RecordingDB
+
+
+def gen_report(timestamp):
+    return Report(timestamp_to_datetime(timestamp), 'sensor', 'target')
+
+
+def timestamps(reports):
+    return [report.timestamp for report in reports]
+
+
+def test_reorder_buffer_release_the_reports_older_than_the_watermark_in_timestamp_order():
+    reorder_buffer = ReorderBuffer(lateness=1000)
+    for timestamp in [3000, 1000, 2000, 2500]:
+        reorder_buffer.push(gen_report(timestamp))
+
+    assert timestamps(reorder_buffer.pop_ready()) == timestamps([gen_report(1000), gen_report(2000)])
+    assert len(reorder_buffer) == 2
+
+    reorder_buffer.push(gen_report(5000))
+    assert timestamps(reorder_buffer.pop_ready()) == timestamps([gen_report(2500), gen_report(3000)])
+
+
+def test_reorder_buffer_keep_the_reception_order_of_reports_with_the_same_timestamp():
+    reorder_buffer = ReorderBuffer(lateness=0)
+    reports = [Report(timestamp_to_datetime(1000), 'sensor', target) for target in ['a', 'b', 'c']]
+    for report in reports:
+        reorder_buffer.push(report)
+
+    assert reorder_buffer.pop_ready() == reports
+
+
+def test_reorder_buffer_drop_and_count_the_late_reports():
+    reorder_buffer = ReorderBuffer(lateness=1000)
+    reorder_buffer.push(gen_report(1000))
+    reorder_buffer.push(gen_report(3000))
+    assert len(reorder_buffer.pop_ready()) == 1
+
+    assert not reorder_buffer.push(gen_report(500))
+    assert reorder_buffer.push(gen_report(1500))
+    assert reorder_buffer.late_reports == 1
+    assert timestamps(reorder_buffer.pop_all()) == timestamps([gen_report(1500), gen_report(3000)])
+
+
+def test_reorder_buffer_release_the_reports_that_waited_more_than_the_lateness():
+    reorder_buffer = ReorderBuffer(lateness=100)
+    reorder_buffer.push(gen_report(1000))
+    assert reorder_buffer.pop_ready() == []
+
+    time.sleep(0.15)
+    assert timestamps(reorder_buffer.pop_ready()) == timestamps([gen_report(1000)])
+
+
+def test_writer_with_a_reorder_buffer_write_reports_in_timestamp_order_across_batches():
+    database = RecordingDB()
+    writer = PusherWriter(database, logging.getLogger('test_reorder_buffer'), delay=10, max_size=1,
+                          reorder_buffer=ReorderBuffer(lateness=10000))
+    writer.start()
+    for timestamp in [4000, 2000, 3000, 1000]:
+        writer.add(gen_report(timestamp))
+    writer.close()
+
+    written = []
+    while not database.batches.empty():
+        written += database.batches.get()
+    assert timestamps(written) == timestamps([gen_report(timestamp) for timestamp in [1000, 2000, 3000, 4000]])
@@ -0,0 +1,197 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+from powerapi.pusher import PusherWriter, PusherWriterStoppedException
+from powerapi.report import Report, BadInputData
+
+
+class RecordingDB:
+    """
+    Database that records the written batches, and wait for an event before writing them if one is given
+    """
+
+    def __init__(self, event=None, exception=None):
+        self.batches = queue.Queue()
+        self.event = event
+        self.exception = exception
+
+    def save_many(self, reports):
+        if self.event is not None:
+            self.event.wait()
+        if self.exception is not None:
+            raise self.exception
+        self.batches.put(list(reports))
+
+
+def gen_reports(number):
+    return [Report(timestamp, 'sensor', 'target') for timestamp in range(number)]
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger('test_writer')
+
+
+def test_writer_hand_over_the_buffer_when_it_exceed_max_size(logger):
+    database = RecordingDB()
+    writer = PusherWriter(database, logger, delay=10, max_size=2)
+    writer.start()
+    reports = gen_reports(3)
+    for report in reports:
+        writer.add(report)
+
+    assert database.batches.get(timeout=1) == reports
+    writer.close()
+
+
+def test_writer_write_the_buffer_after_delay_without_receiving_a_new_report(logger):
+    database = RecordingDB()
+    writer = PusherWriter(database, logger, delay=0.1, max_size=50)
+    writer.start()
+    writer.add(gen_reports(1)[0])
+
+    assert database.batches.get(timeout=1) == gen_reports(1)
+    writer.close()
+
+
+def test_writer_sort_the_reports_of_a_batch_by_timestamp(logger):
+    database = RecordingDB()
+    writer = PusherWriter(database, logger, delay=10, max_size=50)
+    writer.start()
+    reports = gen_reports(3)
+    for report in reversed(reports):
+        writer.add(report)
+    writer.close()
+
+    assert database.batches.get(timeout=1) == reports
+
+
+def test_writer_block_when_max_in_flight_batches_wait_to_be_written(logger):
+    event = threading.Event()
+    database = RecordingDB(event)
+    writer = PusherWriter(database, logger, delay=10, max_size=0, max_in_flight=1)
+    writer.start()
+
+    # the first batch is being written, the second one wait in the queue
+    writer.add(gen_reports(1)[0])
+    time.sleep(0.1)
+    writer.add(gen_reports(1)[0])
+    adder = threading.Thread(target=writer.add, args=(gen_reports(1)[0],))
+    adder.start()
+    adder.join(0.3)
+    assert adder.is_alive()
+
+    event.set()
+    adder.join(1)
+    assert not adder.is_alive()
+    writer.close()
+    assert writer.stats.batches == 3
+
+
+def test_writer_compute_stats_on_written_batches(logger):
+    database = RecordingDB()
+    writer = PusherWriter(database, logger, delay=10, max_size=1)
+    writer.start()
+    for report in gen_reports(5):
+        writer.add(report)
+    writer.close()
+
+    assert writer.stats.batches == 3
+    assert writer.stats.reports == 5
+    assert writer.stats.max_batch_size == 2
+    assert writer.stats.max_flush_time >= 0
+    assert '3 batches written, 5 reports' in str(writer.stats)
+
+
+def test_writer_ignore_a_batch_that_raise_BadInputData(logger):
+    database = RecordingDB(exception=BadInputData('bad report', None))
+    writer = PusherWriter(database, logger, delay=10, max_size=0)
+    writer.start()
+    writer.add(gen_reports(1)[0])
+    writer.close()
+
+    assert writer.stats.batches == 0
+
+
+def test_writer_raise_database_error_in_the_actor_thread(logger):
+    database = RecordingDB(exception=ValueError('database crashed'))
+    writer = PusherWriter(database, logger, delay=10, max_size=0)
+    writer.start()
+    writer.add(gen_reports(1)[0])
+    time.sleep(0.1)
+
+    with pytest.raises(ValueError):
+        writer.add(gen_reports(1)[0])
+    with pytest.raises(ValueError):
+        writer.close()
+
+
+def test_writer_keep_raising_database_error_when_the_batch_queue_is_full(logger):
+    database = RecordingDB(exception=ValueError('database crashed'))
+    writer = PusherWriter(database, logger, delay=10, max_size=0, max_in_flight=1)
+    writer.start()
+    writer.add(gen_reports(1)[0])
+    time.sleep(0.1)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            writer.add(gen_reports(1)[0])
+
+
+def test_writer_put_on_a_stopped_writer_thread_raise_PusherWriterStoppedException(logger):
+    writer = PusherWriter(RecordingDB(), logger, delay=10, max_size=0, max_in_flight=1)
+    writer.start()
+    writer.close()
+    writer._batches.put([])
+
+    with pytest.raises(PusherWriterStoppedException):
+        writer.add(gen_reports(1)[0])
+
+
+def test_writer_close_log_the_reports_that_were_not_written(logger, caplog):
+    event = threading.Event()
+    database = RecordingDB(event, exception=ValueError('database crashed'))
+    writer = PusherWriter(database, logger, delay=10, max_size=2)
+    writer.start()
+    # the first three reports are being written, the last two stay in the buffer
+    for report in gen_reports(5):
+        writer.add(report)
+    event.set()
+    time.sleep(0.1)
+
+    with pytest.raises(ValueError):
+        writer.close()
+    assert '2 reports were not written' in caplog.text
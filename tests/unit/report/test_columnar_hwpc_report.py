@@ -0,0 +1,165 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pickle
+from array import array
+from datetime import datetime
+
+import pytest
+
+from powerapi.report import HWPCReport, ColumnarHWPCReport, HWPCGroupCounters, BadInputData
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+
+from tests.utils.report.hwpc import extract_rapl_reports_with_2_sockets
+
+CORE_GROUP = {
+    '0': {'0': {'CPU_CLK_THREAD_UNHALTED:REF_P': 5965287, 'INSTRUCTIONS_RETIRED': 8454620},
+          '1': {'CPU_CLK_THREAD_UNHALTED:REF_P': 2210547, 'INSTRUCTIONS_RETIRED': 1887346}},
+    '1': {'2': {'CPU_CLK_THREAD_UNHALTED:REF_P': 1142381, 'INSTRUCTIONS_RETIRED': 3362142}}
+}
+GROUPS = {
+    'rapl': {'0': {'7': {'RAPL_ENERGY_PKG': 2151940096, 'time_enabled': 503899405, 'time_running': 503899405}}},
+    'core': CORE_GROUP
+}
+
+
+@pytest.fixture
+def hwpc_report():
+    """
+    Return a HWPCReport with two groups
+    """
+    return HWPCReport(datetime(2023, 6, 1, 12, 37, 37), 'sensor', 'target', GROUPS, {'scope': 'cpu'})
+
+
+def test_group_counters_from_dict_store_values_in_row_major_order():
+    counters = HWPCGroupCounters.from_dict(CORE_GROUP)
+    assert counters.events == ('CPU_CLK_THREAD_UNHALTED:REF_P', 'INSTRUCTIONS_RETIRED')
+    assert counters.rows == (('0', '0'), ('0', '1'), ('1', '2'))
+    assert counters.values == array('q', [5965287, 8454620, 2210547, 1887346, 1142381, 3362142])
+
+
+def test_group_counters_to_dict_return_the_dictionary_form():
+    assert HWPCGroupCounters.from_dict(CORE_GROUP).to_dict() == CORE_GROUP
+
+
+def test_group_counters_get_and_column_return_counter_values():
+    counters = HWPCGroupCounters.from_dict(CORE_GROUP)
+    assert counters.get('0', '1', 'INSTRUCTIONS_RETIRED') == 1887346
+    assert list(counters.column('INSTRUCTIONS_RETIRED')) == [8454620, 1887346, 3362142]
+    with pytest.raises(KeyError):
+        counters.get('1', '0', 'INSTRUCTIONS_RETIRED')
+
+
+def test_group_counters_from_dict_with_cores_reporting_different_events_raise_ValueError():
+    with pytest.raises(ValueError):
+        HWPCGroupCounters.from_dict({'0': {'0': {'a': 1, 'b': 2}, '1': {'a': 1, 'c': 2}}})
+
+
+def test_group_counters_with_the_same_layout_share_their_event_names_and_rows():
+    counters1 = HWPCGroupCounters.from_dict(CORE_GROUP)
+    counters2 = HWPCGroupCounters.from_dict(CORE_GROUP)
+    assert counters1.events is counters2.events
+    assert counters1.rows is counters2.rows
+
+
+def test_group_counters_to_numpy_share_the_counter_values():
+    numpy = pytest.importorskip('numpy')
+    counters = HWPCGroupCounters.from_dict(CORE_GROUP)
+    matrix = counters.to_numpy()
+    assert matrix.shape == (3, 2)
+    assert numpy.array_equal(matrix.sum(axis=0), [5965287 + 2210547 + 1142381, 8454620 + 1887346 + 3362142])
+    counters.values[0] = 0
+    assert matrix[0, 0] == 0
+
+
+def test_columnar_report_convert_to_and_from_hwpc_report(hwpc_report):
+    hwpc_report.dispatcher_report_id = 3
+    columnar_report = ColumnarHWPCReport.from_hwpc_report(hwpc_report)
+    assert isinstance(columnar_report, HWPCReport)
+    assert columnar_report.groups == GROUPS
+    assert columnar_report.dispatcher_report_id == 3
+
+    report = columnar_report.to_hwpc_report()
+    assert type(report) is HWPCReport
+    assert report == hwpc_report
+    assert report.groups == GROUPS
+
+
+def test_group_counters_from_dict_with_float_values_store_floats():
+    counters = HWPCGroupCounters.from_dict({'0': {'0': {'a': 1.5, 'b': 2}}})
+    assert counters.values == array('d', [1.5, 2.0])
+
+
+def test_group_counters_from_dict_with_counter_above_2_pow_63_store_unsigned_integers():
+    counters = HWPCGroupCounters.from_dict({'0': {'0': {'a': 2 ** 64 - 1, 'b': 2 ** 63}}})
+    assert counters.values.typecode == 'Q'
+    assert counters.to_dict() == {'0': {'0': {'a': 2 ** 64 - 1, 'b': 2 ** 63}}}
+
+
+def test_create_columnar_report_from_json_with_counter_above_2_pow_64_raise_BadInputData():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    json_input['groups'] = {'core': {'0': {'0': {'INSTRUCTIONS_RETIRED': 2 ** 64, 'LLC_MISSES': 42}}}}
+    with pytest.raises(BadInputData):
+        _ = ColumnarHWPCReport.from_json(json_input)
+
+
+def test_columnar_report_pickle_counters_as_contiguous_buffers():
+    groups = {'core': {str(socket): {str(core): {'CPU_CLK_THREAD_UNHALTED:REF_P': 5965287 + core,
+                                                 'INSTRUCTIONS_RETIRED': 8454620 + core,
+                                                 'LLC_MISSES': 12345 + core}
+                                     for core in range(32)}
+                       for socket in range(2)}}
+    hwpc_report = HWPCReport(datetime(2023, 6, 1, 12, 37, 37), 'sensor', 'target', groups)
+    columnar_report = ColumnarHWPCReport.from_hwpc_report(hwpc_report)
+    pickled_report = pickle.loads(pickle.dumps(columnar_report))
+    assert pickled_report == columnar_report
+    assert pickled_report.counters['core'].values.typecode == 'q'
+
+
+def test_create_columnar_report_from_json_create_a_ColumnarHWPCReport():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    report = ColumnarHWPCReport.from_json(json_input)
+    assert isinstance(report, ColumnarHWPCReport)
+    assert report.groups == json_input['groups']
+    assert ColumnarHWPCReport.to_json(report)['groups'] == json_input['groups']
+
+
+def test_create_columnar_report_from_json_without_groups_field_raise_BadInputData():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    del json_input['groups']
+    with pytest.raises(BadInputData):
+        _ = ColumnarHWPCReport.from_json(json_input)
+
+
+@pytest.mark.parametrize('depth', [HWPCDepthLevel.TARGET, HWPCDepthLevel.ROOT, HWPCDepthLevel.SOCKET,
+                                   HWPCDepthLevel.CORE])
+def test_dispatch_rule_return_the_same_formula_ids_for_columnar_report(hwpc_report, depth):
+    rule = HWPCDispatchRule(depth)
+    columnar_report = ColumnarHWPCReport.from_hwpc_report(hwpc_report)
+    assert rule.get_formula_id(columnar_report) == rule.get_formula_id(hwpc_report)
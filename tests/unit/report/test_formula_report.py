@@ -27,9 +27,13 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
-from powerapi.report import FormulaReport
+import pytest
+
+from powerapi.report import FormulaReport, PowerReport, BadInputData
+from powerapi.utils import timestamp_to_datetime
 
 
 def test_formula_report_to_csv_lines_with_empty_metadata():
@@ -118,3 +122,47 @@ def test_formula_report_to_influxdb_with_metadata():
     assert document['tags'] == {'sensor': 'pytest', 'target': 'formula'}
     assert document['time'] == int(ts.timestamp() * 1000)
     assert document['fields'] == {'string': 'value', 'int': 1, 'float': 1.0, 'bool': True}
+
+
+def test_formula_report_to_influxdb_line_with_metadata():
+    """
+    Test if the report with metadata is correctly converted to an influxdb line protocol entry.
+    """
+    ts = datetime(1970, 1, 1, 0, 0, 1, 500, tzinfo=timezone.utc)
+    report = FormulaReport(ts, 'pytest', 'formula', {'string': 'a "value"', 'int': 1, 'float': 1.5, 'bool': True})
+    line = FormulaReport.to_influxdb_line(report)
+
+    assert line == 'formula_report,sensor=pytest,target=formula string="a \\"value\\"",int=1i,float=1.5,bool=true ' + \
+        '1000500000'
+
+
+def test_formula_report_to_influxdb_line_with_empty_metadata_raise_BadInputData():
+    """
+    Test if the report without metadata, that has no field to write, is rejected.
+    """
+    report = FormulaReport(datetime.fromtimestamp(0), 'pytest', 'formula', {})
+    with pytest.raises(BadInputData):
+        FormulaReport.to_influxdb_line(report)
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    """
+    Set a local timezone that is not UTC
+    """
+    monkeypatch.setenv('TZ', 'Asia/Tokyo')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_formula_report_and_power_report_influxdb_lines_have_the_timestamp_of_the_report(local_timezone):
+    """
+    Naive timestamps are considered as local time by both report types, as the timestamps read by the pullers
+    """
+    ts = timestamp_to_datetime(1685623057168)
+    formula_line = FormulaReport.to_influxdb_line(FormulaReport(ts, 'pytest', 'formula', {'a': 1}))
+    power_line = PowerReport.to_influxdb_line(PowerReport(ts, 'pytest', 'formula', 42.5), [])
+
+    assert formula_line.rsplit(' ', 1)[1] == power_line.rsplit(' ', 1)[1] == '1685623057168000000'
@@ -189,3 +189,13 @@ def test_create_report_from_csv_with_events():
     assert 'RAPL_ENERGY_PKG' in report.groups['rapl']['0']['7']
     assert report.groups['rapl']['0']['7']['RAPL_VALUE'] == 1234
     assert report.groups['rapl']['0']['7']['RAPL_ENERGY_PKG'] == 1
+
+
+def test_hwpc_report_to_json_export_the_report_fields():
+    json_input = extract_rapl_reports_with_2_sockets(1)[0]
+    report = HWPCReport.from_json(json_input)
+
+    json = HWPCReport.to_json(report)
+
+    assert set(json) == {'timestamp', 'sensor', 'target', 'metadata', 'groups'}
+    assert json['groups'] == json_input['groups']
@@ -30,7 +30,7 @@
 import pytest
 
 from powerapi.report import PowerReport, BadInputData
-from datetime import datetime
+from datetime import datetime, timezone
 
 from tests.utils.report.power import gen_json_power_report
 
@@ -155,3 +155,21 @@ def test_create_report_from_csv_with_metadata():
                  ]
     report = PowerReport.from_csv_lines(csv_lines)
     assert report.metadata["tag"] == 1
+
+
+def test_power_report_to_influxdb_line_escape_tags_and_use_nanoseconds_timestamp():
+    report = PowerReport(datetime(1970, 1, 1, 0, 0, 1, 500, tzinfo=timezone.utc), 'sensor 1', 'target,1', 42.5, {'socket': 0, 'core': 'a=b'})
+    line = PowerReport.to_influxdb_line(report, ['socket', 'core'])
+    assert line == 'power_consumption,sensor=sensor\\ 1,target=target\\,1,socket=0,core=a\\=b power=42.5 1000500000'
+
+
+def test_power_report_to_influxdb_line_skip_empty_tags():
+    report = PowerReport(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc), 'sensor', '', 42.5, {'socket': 0, 'core': ''})
+    line = PowerReport.to_influxdb_line(report, ['socket', 'core'])
+    assert line == 'power_consumption,sensor=sensor,socket=0 power=42.5 1000000000'
+
+
+def test_power_report_to_influxdb_line_with_missing_tag_raise_BadInputData():
+    report = PowerReport(datetime(1970, 1, 1), 'sensor', 'target', 42.5, {'socket': 0})
+    with pytest.raises(BadInputData):
+        PowerReport.to_influxdb_line(report, ['core'])
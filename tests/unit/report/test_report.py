@@ -30,6 +30,7 @@
 import pytest
 
 from powerapi.report import Report
+from powerapi.report.report import PULLER_STAGE, DISPATCHER_STAGE
 from datetime import datetime
 
 
@@ -80,3 +81,56 @@ def test_to_json_with_dispatcher_report_id(basic_report, expected_json_report):
     assert 'sender_name' not in json
     assert 'dispatcher_report_id' not in json
     assert json == expected_json_report
+
+
+def test_to_json_does_not_modify_the_report(basic_report):
+    basic_report.sender_name = 'puller'
+    basic_report.dispatcher_report_id = 10
+
+    json = Report.to_json(report=basic_report)
+    json['timestamp'] = None
+
+    assert basic_report.sender_name == 'puller'
+    assert basic_report.dispatcher_report_id == 10
+    assert basic_report.timestamp is not None
+
+
+def test_modifying_report_metadata_does_not_modify_the_dict_given_to_the_constructor():
+    metadata = {'tag': 1}
+    report = Report(0, 'toto', 'all', metadata)
+
+    report.metadata['tag'] = 2
+
+    assert metadata == {'tag': 1}
+    assert report.metadata == {'tag': 2}
+
+
+def test_report_share_the_dict_given_to_the_constructor_until_its_metadata_is_accessed():
+    metadata = {'tag': 1}
+    report = Report(0, 'toto', 'all', metadata)
+
+    metadata['tag'] = 2
+    assert report.metadata == {'tag': 2}
+
+    metadata['tag'] = 3
+    assert report.metadata == {'tag': 2}
+
+
+def test_report_attributes_are_stored_in_slots(basic_report):
+    assert not hasattr(basic_report, '__dict__')
+    with pytest.raises(AttributeError):
+        basic_report.extra = 'extra'
+
+
+def test_report_is_not_traced_by_default_and_stamp_does_nothing(basic_report):
+    basic_report.stamp(DISPATCHER_STAGE)
+
+    assert basic_report.trace is None
+
+
+def test_stamp_a_traced_report_add_the_stamps_in_order(basic_report):
+    basic_report.start_trace(PULLER_STAGE)
+    basic_report.stamp(DISPATCHER_STAGE)
+
+    assert [stage for stage, _ in basic_report.trace] == [PULLER_STAGE, DISPATCHER_STAGE]
+    assert basic_report.trace[0][1] <= basic_report.trace[1][1]
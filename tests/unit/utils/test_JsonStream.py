@@ -27,12 +27,16 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # pylint: disable=no-self-use
+import json
 import time
 import asyncio
 
+import pytest
 from mock import Mock
 
-from powerapi.utils import JsonStream
+from powerapi.utils import JsonStream, json_stream
+from powerapi.utils.json_stream import JsonSplitter, JsonStreamDecoder, BRACE_FRAMING, NDJSON_FRAMING, JSON_BACKEND, \
+    ORJSON_BACKEND
 
 SOCKET_TIMEOUT = 0.2
 
@@ -127,3 +131,59 @@ def test_read_json_object_twice_from_a_socket_with_two_json_object_must_return_t
     future = asyncio.ensure_future(stream.read_json_object())
     asyncio.get_event_loop().run_until_complete(future)
     assert future.result() is None
+
+
+def test_splitter_return_objects_whose_strings_contain_braces_and_escaped_quotes():
+    splitter = JsonSplitter()
+    objects = splitter.feed(b'{"a":"}{"}\n {"b":"\\"}","c":{"d":1}}')
+    assert [bytes(obj) for obj in objects] == [b'{"a":"}{"}', b'{"b":"\\"}","c":{"d":1}}']
+
+
+def test_splitter_resume_an_object_split_between_two_feeds():
+    splitter = JsonSplitter()
+    payload = b'{"a":"x\\"}","b":{"c":2}}{"d":3}'
+    for cut in range(1, len(payload)):
+        splitter = JsonSplitter()
+        objects = [bytes(obj) for obj in splitter.feed(payload[:cut])]
+        objects += [bytes(obj) for obj in splitter.feed(payload[cut:])]
+        assert objects == [b'{"a":"x\\"}","b":{"c":2}}', b'{"d":3}']
+
+
+@pytest.mark.parametrize('framing', [BRACE_FRAMING, NDJSON_FRAMING])
+def test_splitter_rebuild_objects_received_byte_by_byte(framing):
+    payload = b'{"a":"x\\"}{","b":{"c":[1,2]}}\n\n{"d":3}\n'
+    splitter = JsonSplitter(framing)
+    objects = [bytes(obj) for byte in range(len(payload)) for obj in splitter.feed(payload[byte:byte + 1])]
+    assert objects == [b'{"a":"x\\"}{","b":{"c":[1,2]}}', b'{"d":3}']
+
+
+def test_splitter_with_ndjson_framing_return_one_object_per_non_blank_line():
+    splitter = JsonSplitter(NDJSON_FRAMING)
+    assert [bytes(obj) for obj in splitter.feed(b'{"a":1}\n\n{"b":"{"}\n{"c"')] == [b'{"a":1}', b'{"b":"{"}']
+    assert [bytes(obj) for obj in splitter.feed(b':3}\n')] == [b'{"c":3}']
+
+
+@pytest.mark.parametrize('framing,backend', [(BRACE_FRAMING, JSON_BACKEND), (NDJSON_FRAMING, JSON_BACKEND),
+                                             (BRACE_FRAMING, ORJSON_BACKEND), (NDJSON_FRAMING, ORJSON_BACKEND)])
+def test_decoder_decode_objects_split_between_feeds(framing, backend):
+    if backend == ORJSON_BACKEND and json_stream.orjson is None:
+        pytest.skip('orjson is not installed')
+    documents = [{'a': 'é{', 'b': [1, 2]}, {'c': {'d': '"}'}}]
+    payload = ''.join(json.dumps(document, ensure_ascii=False) + '\n' for document in documents).encode()
+    for cut in range(1, len(payload)):
+        decoder = JsonStreamDecoder(framing, backend)
+        assert decoder.feed(payload[:cut]) + decoder.feed(payload[cut:]) == documents
+
+
+def test_decoder_skip_invalid_objects():
+    decoder = JsonStreamDecoder()
+    assert decoder.feed(b'{"a":1}{"b":}{"c":3}') == [{'a': 1}, {'c': 3}]
+
+
+def test_read_documents_from_a_socket_with_two_json_objects_must_return_two_documents():
+    socket = MockedStreamReader('{"a":1}{"b":2}')
+    stream = JsonStream(socket)
+
+    future = asyncio.ensure_future(stream.read_documents())
+    asyncio.get_event_loop().run_until_complete(future)
+    assert future.result() == [{'a': 1}, {'b': 2}]
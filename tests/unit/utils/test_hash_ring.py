@@ -0,0 +1,80 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from powerapi.utils import ConsistentHashRing
+
+
+def test_get_node_on_empty_ring_raise_KeyError():
+    """
+    Test that a key can't be mapped on an empty ring
+    """
+    with pytest.raises(KeyError):
+        ConsistentHashRing().get_node(('a', 'b'))
+
+
+def test_get_node_always_return_the_same_node_for_a_key():
+    """
+    Test that a key is always mapped on the same node, even by another ring with the same nodes
+    """
+    ring = ConsistentHashRing(range(4))
+    other_ring = ConsistentHashRing(range(4))
+    for i in range(100):
+        key = ('sensor', str(i))
+        assert ring.get_node(key) == ring.get_node(key) == other_ring.get_node(key)
+
+
+def test_keys_are_spread_on_all_nodes():
+    """
+    Test that every node receive a part of the keys
+    """
+    ring = ConsistentHashRing(range(4))
+    nodes = [ring.get_node(('sensor', str(i))) for i in range(1000)]
+    for node in range(4):
+        assert nodes.count(node) > 100
+
+
+def test_adding_a_node_only_move_keys_to_the_new_node():
+    """
+    Test that keys that are not mapped on a new node stay on their previous node
+    """
+    ring = ConsistentHashRing(range(4))
+    keys = [('sensor', str(i)) for i in range(1000)]
+    before = {key: ring.get_node(key) for key in keys}
+
+    ring.add_node(4)
+    assert len(ring) == 5
+    for key in keys:
+        assert ring.get_node(key) in (before[key], 4)
+
+    ring.remove_node(4)
+    assert len(ring) == 4
+    for key in keys:
+        assert ring.get_node(key) == before[key]
@@ -0,0 +1,76 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+
+from powerapi.utils.profiler import SamplingProfiler, profile_path
+
+
+def busy_function(stop_event):
+    while not stop_event.is_set():
+        sum(range(100))
+
+
+def test_profile_path_replace_the_characters_of_the_actor_name_that_does_not_fit_a_file_name():
+    assert profile_path('/tmp/profiles', "('dispatcher', 'sensor', 0)") == '/tmp/profiles/dispatcher_sensor_0.folded'
+
+
+def test_profiler_write_the_sampled_call_stacks_in_the_collapsed_stack_format(tmp_path):
+    stop_event = threading.Event()
+    busy_thread = threading.Thread(target=busy_function, args=(stop_event,), name='busy')
+    busy_thread.start()
+    output_path = str(tmp_path / 'profile.folded')
+    profiler = SamplingProfiler(output_path, duration=0.2, interval=0.005, thread_ids={busy_thread.ident})
+
+    profiler.start()
+    profiler.join()
+    stop_event.set()
+    busy_thread.join()
+
+    with open(output_path, encoding='utf-8') as profile_file:
+        lines = profile_file.read().splitlines()
+    assert profiler.samples > 10
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) == profiler.samples
+    assert all(line.startswith('busy;') for line in lines)
+    assert any('busy_function (' + __file__ + ':' in line for line in lines)
+
+
+def test_profiler_sample_all_the_threads_of_the_process_but_its_own_by_default(tmp_path):
+    stop_event = threading.Event()
+    waiting_thread = threading.Thread(target=stop_event.wait, name='waiting')
+    waiting_thread.start()
+    profiler = SamplingProfiler(str(tmp_path / 'profile.folded'), duration=0)
+
+    profiler.sample()
+    stop_event.set()
+    waiting_thread.join()
+
+    assert profiler.samples == 1
+    assert any(stack.startswith('waiting;') for stack in profiler.stacks)
+    assert not any(stack.startswith(threading.current_thread().name + ';') for stack in profiler.stacks)
@@ -75,6 +75,9 @@ class FakeDB(BaseDB):
     def save_many(self, reports):
         self.q.put(reports, block=False)
 
+    def close(self):
+        self.q.put('closed', block=False)
+
 
 class SilentFakeDB(BaseDB):
     """
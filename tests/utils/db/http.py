@@ -0,0 +1,116 @@
+# Copyright (c) 2026, INRIA
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class HTTPStandIn(ThreadingHTTPServer):
+    """
+    Local HTTP server that stands in for the HTTP api of a time series database
+
+    Each request is recorded as a (method, path, headers, body, status, client_address) tuple, with its body
+    decompressed. POST requests are answered with the status codes of the failures list (in order), then with
+    success_status. GET requests are always answered with 200
+    """
+
+    def __init__(self, failures=(), success_status=204):
+        ThreadingHTTPServer.__init__(self, ('localhost', 0), HTTPStandInHandler)
+        self.failures = list(failures)
+        self.success_status = success_status
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    @property
+    def url(self):
+        return 'http://localhost:' + str(self.port)
+
+    def bodies(self, path_prefix):
+        """
+        :return: the bodies of the successful POST requests whose path starts with path_prefix
+        """
+        return [body for method, path, _, body, status, _ in self.requests
+                if method == 'POST' and path.startswith(path_prefix) and status == self.success_status]
+
+
+class HTTPStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the stand-in, keep the connections alive
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def _answer(self, status, body=b''):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self, method, body, status):
+        with self.server.lock:
+            self.server.requests.append((method, self.path, dict(self.headers), body, status, self.client_address))
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._record('GET', b'', 200)
+        self._answer(200, b'{}')
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        with self.server.lock:
+            status = self.server.failures.pop(0) if self.server.failures else self.server.success_status
+        self._record('POST', body, status)
+        if status == 204:
+            self._answer(status)
+        else:
+            self._answer(status, b'{"error":"stand-in answer"}')
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    """
+    Start a HTTP stand-in server in a thread
+    """
+    server = HTTPStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
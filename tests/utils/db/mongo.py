@@ -29,6 +29,8 @@
 import pytest
 import pymongo
 
+from powerapi.database.mongodb import RESUME_TOKEN_COLLECTION
+
 
 MONGO_URI = "mongodb://127.0.0.1:27017/"
 MONGO_INPUT_COLLECTION_NAME = 'test_input'
@@ -70,4 +72,5 @@ def _clean_base_db_test(uri):
     db = mongo[MONGO_DATABASE_NAME]
     db[MONGO_INPUT_COLLECTION_NAME].drop()
     db[MONGO_OUTPUT_COLLECTION_NAME].drop()
+    db[RESUME_TOKEN_COLLECTION].drop()
     mongo.close()
@@ -31,6 +31,8 @@ import time
 from threading import Thread
 from socket import socket
 
+from powerapi.database.binary_protocol import BINARY_PROTOCOL_HEADER, encode_hwpc_frame
+
 
 class ClientThread(Thread):
     """
@@ -75,3 +77,32 @@ class ClientThreadDelay(Thread):
         for msg in self.msg_list[midle:]:
             self.socket.send(bytes(json.dumps(msg), 'utf-8'))
         self.socket.close()
+
+
+class BinarySensorEmulator(Thread):
+    """
+    Thread that emulates a sensor using the binary protocol: open a connection to a socket, send the protocol header
+    then the reports by frames of batch_size reports. The bytes are sent by chunks of chunk_size bytes to check that
+    frames split between several reads are rebuilt
+    """
+
+    def __init__(self, reports, port, batch_size=10, chunk_size=None, header=BINARY_PROTOCOL_HEADER):
+        Thread.__init__(self)
+
+        self.reports = reports
+        self.socket = socket()
+        self.port = port
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.header = header
+
+    def run(self):
+        data = self.header + b''.join(encode_hwpc_frame(self.reports[i:i + self.batch_size])
+                                      for i in range(0, len(self.reports), self.batch_size))
+        chunk_size = self.chunk_size or len(data)
+        self.socket.connect(('127.0.0.1', self.port))
+        for i in range(0, len(data), chunk_size):
+            self.socket.send(data[i:i + chunk_size])
+            if self.chunk_size is not None:
+                time.sleep(0.001)
+        self.socket.close()